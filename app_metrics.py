@@ -13,6 +13,7 @@ from byceps.metrics.application import create_metrics_app
 
 
 ENV_VAR_NAME_DATABASE_URI = 'DATABASE_URI'
+ENV_VAR_NAME_REDIS_URL = 'REDIS_URL'
 
 
 database_uri = os.environ.get(ENV_VAR_NAME_DATABASE_URI)
@@ -22,4 +23,6 @@ if not database_uri:
         "environment variable.",
     )
 
-app = create_metrics_app(database_uri)
+redis_url = os.environ.get(ENV_VAR_NAME_REDIS_URL)
+
+app = create_metrics_app(database_uri, redis_url)
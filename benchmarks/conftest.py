@@ -0,0 +1,203 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+from flask import Flask
+import pytest
+from sqlalchemy import select
+
+from byceps.cli.commands.create_demo_data import create_demo_data
+from byceps.database import db
+from byceps.services.authorization import authz_service
+from byceps.services.authorization.models import PermissionID, RoleID
+from byceps.services.board.dbmodels.topic import DbTopic
+from byceps.services.brand import brand_service
+from byceps.services.language import language_service
+from byceps.services.user.models.user import User
+from byceps.util.query_stats import collect_query_stats
+
+from tests.helpers import (
+    create_admin_app,
+    create_role_with_permissions_assigned,
+    create_site_app,
+    create_user,
+    generate_token,
+    http_client,
+    log_in_user,
+)
+from tests.integration.database import set_up_database, tear_down_database
+
+from .helpers import BRAND_ID, SITE_ID
+
+
+# The size of the full dataset, to be scaled by the `--dataset-scale`
+# option.
+FULL_DATASET_SIZE = {
+    'users': 50_000,
+    'tickets': 5_000,
+    'board-postings': 100_000,
+    'orders': 20_000,
+}
+
+
+def pytest_addoption(parser) -> None:
+    group = parser.getgroup('BYCEPS benchmarks')
+    group.addoption(
+        '--dataset-scale',
+        type=float,
+        default=1.0,
+        help='Fraction of the full benchmark dataset to generate '
+        '(default: 1.0)',
+    )
+    group.addoption(
+        '--reuse-dataset',
+        action='store_true',
+        help='Keep the dataset already in the database instead of '
+        'generating it again',
+    )
+
+
+@dataclass(frozen=True)
+class Dataset:
+    scale: float
+    busiest_topic_id: str
+
+
+@pytest.fixture(scope='session')
+def data_path() -> Iterator[Path]:
+    with TemporaryDirectory() as d:
+        yield Path(d)
+
+
+def _get_config_overrides(data_path: Path) -> dict[str, Any]:
+    return {
+        'PATH_DATA': data_path,
+        # Statements are counted per benchmark instead.
+        'QUERY_BUDGET': None,
+    }
+
+
+@pytest.fixture(scope='session')
+def admin_app(data_path: Path) -> Iterator[Flask]:
+    config_overrides = _get_config_overrides(data_path)
+    config_overrides['METRICS_ENABLED'] = True
+    app = create_admin_app(config_overrides)
+    with app.app_context():
+        yield app
+
+
+@pytest.fixture(scope='session')
+def dataset(request, admin_app: Flask) -> Dataset:
+    scale = request.config.getoption('--dataset-scale')
+    reuse = request.config.getoption('--reuse-dataset')
+
+    if not reuse or (brand_service.find_brand(BRAND_ID) is None):
+        _generate_dataset(admin_app, scale)
+
+    busiest_topic_id = db.session.scalar(
+        select(DbTopic.id).order_by(DbTopic.posting_count.desc()).limit(1)
+    )
+
+    return Dataset(scale=scale, busiest_topic_id=str(busiest_topic_id))
+
+
+def _generate_dataset(app: Flask, scale: float) -> None:
+    tear_down_database()
+    set_up_database()
+
+    for code in 'en', 'de':
+        language_service.create_language(code)
+
+    args = []
+    for option_name, full_size in FULL_DATASET_SIZE.items():
+        args += [f'--{option_name}', str(round(full_size * scale))]
+
+    result = app.test_cli_runner().invoke(create_demo_data, args)
+    if result.exit_code != 0:
+        raise RuntimeError(f'Generating the dataset failed:\n{result.output}')
+
+
+@pytest.fixture(scope='session')
+def site_app(data_path: Path, dataset: Dataset) -> Iterator[Flask]:
+    app = create_site_app(SITE_ID, _get_config_overrides(data_path))
+    with app.app_context():
+        yield app
+
+
+@pytest.fixture(scope='session')
+def admin(admin_app: Flask, dataset: Dataset) -> User:
+    user = create_user()
+
+    role_id = RoleID(f'benchmark_admin_{generate_token()}')
+    permission_ids = [
+        PermissionID(permission_id)
+        for permission_id in [
+            'admin.access',
+            'shop_order.view',
+            'ticketing.checkin',
+        ]
+    ]
+    create_role_with_permissions_assigned(role_id, permission_ids)
+    authz_service.assign_role_to_user(role_id, user.id)
+
+    log_in_user(user.id)
+
+    return user
+
+
+@pytest.fixture(scope='session')
+def admin_client(admin_app: Flask, admin: User):
+    with http_client(admin_app, user_id=admin.id) as client:
+        yield client
+
+
+@pytest.fixture(scope='session')
+def site_client(site_app: Flask):
+    with http_client(site_app) as client:
+        yield client
+
+
+@pytest.fixture(scope='session')
+def orderer(site_app: Flask) -> User:
+    user = create_user()
+    log_in_user(user.id)
+    return user
+
+
+@pytest.fixture(scope='session')
+def orderer_client(site_app: Flask, orderer: User):
+    with http_client(site_app, user_id=orderer.id) as client:
+        yield client
+
+
+@pytest.fixture()
+def measure(benchmark, dataset: Dataset) -> Callable[..., Any]:
+    """Benchmark the function, and record the number of SQL statements
+    it executes (in a single call) in the report.
+    """
+
+    def _wrapper(func: Callable[[], Any], **pedantic_kwargs) -> Any:
+        with collect_query_stats() as stats:
+            func()
+
+        benchmark.extra_info['dataset_scale'] = dataset.scale
+        benchmark.extra_info['query_count'] = stats.query_count
+        benchmark.extra_info['query_duration_ms'] = round(
+            stats.duration * 1000, 3
+        )
+
+        if pedantic_kwargs:
+            return benchmark.pedantic(func, **pedantic_kwargs)
+
+        return benchmark(func)
+
+    return _wrapper
@@ -0,0 +1,24 @@
+"""
+benchmarks.helpers
+~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.shop.shop.models import ShopID
+from byceps.services.site.models import SiteID
+from byceps.typing import BrandID, PartyID
+
+
+# IDs as assigned by the demo data command
+BRAND_ID = BrandID('cozylan')
+PARTY_ID = PartyID('cozylan-2023')
+SITE_ID = SiteID('cozylan')
+SHOP_ID = ShopID('cozylan')
+SEATING_AREA_SLUG = 'main-hall'
+
+
+def get_successfully(client, url: str) -> None:
+    response = client.get(url)
+    assert response.status_code == 200
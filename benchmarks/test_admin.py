@@ -0,0 +1,27 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from .helpers import get_successfully, PARTY_ID, SHOP_ID
+
+
+def test_checkin_search(measure, admin_client):
+    url = f'/admin/ticketing/checkin/for_party/{PARTY_ID}/search'
+    # Matches many of the generated users.
+    query_string = {'search_term': 'DemoUser0001'}
+
+    def search():
+        response = admin_client.get(url, query_string=query_string)
+        assert response.status_code == 200
+
+    measure(search)
+
+
+def test_order_list(measure, admin_client):
+    url = f'/admin/shop/orders/for_shop/{SHOP_ID}'
+    measure(lambda: get_successfully(admin_client, url))
+
+
+def test_metrics_scrape(measure, admin_client):
+    measure(lambda: get_successfully(admin_client, '/metrics'))
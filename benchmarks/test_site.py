@@ -0,0 +1,62 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from unittest.mock import patch
+
+from byceps.services.shop.article import article_service
+from byceps.services.shop.article.models import Article
+
+from .helpers import get_successfully, SEATING_AREA_SLUG, SHOP_ID
+
+
+def test_board_topic_view(measure, dataset, site_client):
+    url = f'/board/topics/{dataset.busiest_topic_id}'
+    measure(lambda: get_successfully(site_client, url))
+
+
+def test_news_index(measure, site_client):
+    measure(lambda: get_successfully(site_client, '/news/'))
+
+
+def test_seating_area_view(measure, site_client):
+    url = f'/seating/areas/{SEATING_AREA_SLUG}'
+    measure(lambda: get_successfully(site_client, url))
+
+
+@patch('byceps.signals.shop.order_placed.send')
+@patch('byceps.blueprints.site.shop.order.views.order_email_service')
+def test_order_placement(
+    order_email_service_mock, order_placed_mock, measure, orderer_client
+):
+    article = _get_sticker_pack_article()
+    form_data = {
+        'first_name': 'Hiro',
+        'last_name': 'Protagonist',
+        'country': 'State of Mind',
+        'zip_code': '31337',
+        'city': 'Atrocity',
+        'street': 'L33t Street 101',
+        f'article_{article.id}': 1,
+    }
+
+    def place_order():
+        response = orderer_client.post('/shop/order', data=form_data)
+        assert response.status_code == 302
+
+    # Every round places an order and reduces the article stock, so
+    # limit the number of rounds.
+    measure(place_order, rounds=50, iterations=1)
+
+
+def _get_sticker_pack_article() -> Article:
+    compilation = (
+        article_service.get_article_compilation_for_orderable_articles(SHOP_ID)
+    )
+
+    for item in compilation:
+        if item.article.description == 'Sticker Pack':
+            return item.article
+
+    raise Exception('Sticker pack article not found')
@@ -18,7 +18,7 @@ import requests
 from byceps.events.base import _BaseEvent
 from byceps.services.webhooks import webhook_service
 from byceps.services.webhooks.models import AnnouncementRequest, OutgoingWebhook
-from byceps.util.jobqueue import enqueue, enqueue_at
+from byceps.util.jobqueue import ANNOUNCE_QUEUE_NAME, enqueue, enqueue_at
 
 from .connections import get_signals, registry
 
@@ -42,7 +42,7 @@ def _receive_signal(sender, *, event: _BaseEvent | None = None) -> None:
     event_name = get_name_for_event(event)
     webhooks = _get_webhooks(event_name)
     for webhook in webhooks:
-        enqueue(_handle_event, event, webhook)
+        enqueue(_handle_event, event, webhook, queue=ANNOUNCE_QUEUE_NAME)
 
 
 def get_event_names() -> set[str]:
@@ -154,7 +154,12 @@ def announce(announcement_request: AnnouncementRequest) -> None:
     announce_at = announcement_request.announce_at
     if announce_at is not None:
         # Schedule job to announce later.
-        enqueue_at(announce_at, call_webhook, announcement_request)
+        enqueue_at(
+            announce_at,
+            call_webhook,
+            announcement_request,
+            queue=ANNOUNCE_QUEUE_NAME,
+        )
     else:
         # Announce now.
         call_webhook(announcement_request)
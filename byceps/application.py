@@ -22,16 +22,19 @@ import structlog
 
 from byceps import config, config_defaults
 from byceps.announce.announce import enable_announcements
+from byceps.blueprints.api.revisions import enable_revision_tracking
 from byceps.blueprints.blueprints import register_blueprints
 from byceps.config import ConfigurationError
 from byceps.database import db
-from byceps.util import templatefilters
+from byceps.services.metrics import query_metrics_service
+from byceps.util import query_instrumentation, templatefilters
 from byceps.util.authorization import (
     has_current_user_permission,
     load_permissions,
 )
-from byceps.util.l10n import get_current_user_locale
-from byceps.util.templating import SiteTemplateOverridesLoader
+from byceps.util.l10n import get_current_user_locale, load_locales
+from byceps.util.query_stats import QueryStats
+from byceps.util.templating import TemplateIndexLoader, warm_up_templates
 
 
 log = structlog.get_logger()
@@ -54,6 +57,9 @@ def create_admin_app(
 
     _enable_rq_dashboard(app)
 
+    if app.config['TEMPLATE_WARM_UP_ENABLED']:
+        warm_up_templates(app)
+
     return app
 
 
@@ -72,7 +78,8 @@ def create_site_app(
         config_overrides=config_overrides,
     )
 
-    _init_site_app(app)
+    if app.config['TEMPLATE_WARM_UP_ENABLED']:
+        warm_up_templates(app)
 
     return app
 
@@ -117,7 +124,15 @@ def _create_app(
     #      environment too early.
     app.jinja_options['undefined'] = jinja2.StrictUndefined
 
+    # Look up templates in an index instead of probing the template
+    # folders of all blueprints. Incorporate site-specific template
+    # overrides on sites.
+    app.jinja_options['loader'] = TemplateIndexLoader(
+        app, site_overrides=app.byceps_app_mode.is_site()
+    )
+
     app.babel_instance = Babel(app, locale_selector=get_current_user_locale)
+    load_locales(app)
 
     # Initialize database.
     db.init_app(app)
@@ -125,15 +140,24 @@ def _create_app(
     # Initialize Redis client.
     app.redis_client = Redis.from_url(app.config['REDIS_URL'])
 
-    load_permissions()
-
-    register_blueprints(app)
+    # Command-line tools and job queue workers don't serve HTTP
+    # requests, so spare them from importing permissions and views.
+    if _serves_http(app):
+        load_permissions()
+        register_blueprints(app)
 
     templatefilters.register(app)
 
     _add_static_file_url_rules(app)
 
     enable_announcements()
+    enable_revision_tracking()
+
+    query_instrumentation.init_app(app)
+    if app.config['QUERY_METRICS_ENABLED']:
+        query_instrumentation.request_queries_collected.connect(
+            _observe_request_queries, app
+        )
 
     if app.debug and app.config.get('DEBUG_TOOLBAR_ENABLED', False):
         _enable_debug_toolbar(app)
@@ -147,6 +171,17 @@ def _create_app(
     return app
 
 
+def _observe_request_queries(
+    sender: Flask, *, endpoint: str, stats: QueryStats
+) -> None:
+    query_metrics_service.observe_request(endpoint, stats)
+
+
+def _serves_http(app: Flask) -> bool:
+    app_mode = app.byceps_app_mode
+    return not (app_mode.is_cli() or app_mode.is_worker())
+
+
 def _configure(
     app: Flask,
     config_filename: Path | str | None = None,
@@ -224,12 +259,6 @@ def _add_static_file_url_rules(app: Flask) -> None:
     )
 
 
-def _init_site_app(app: Flask) -> None:
-    """Initialize site application."""
-    # Incorporate site-specific template overrides.
-    app.jinja_loader = SiteTemplateOverridesLoader()
-
-
 def _enable_debug_toolbar(app: Flask) -> None:
     try:
         from flask_debugtoolbar import DebugToolbarExtension
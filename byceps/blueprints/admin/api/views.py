@@ -16,7 +16,6 @@ from byceps.util.framework.flash import flash_success
 from byceps.util.framework.templating import templated
 from byceps.util.views import (
     permission_required,
-    redirect_to,
     respond_no_content,
 )
 
@@ -59,8 +58,9 @@ def create_api_token_form(erroneous_form=None):
 
 @blueprint.post('/api_tokens')
 @permission_required('api.administrate')
+@templated
 def create_api_token():
-    """Create an API token."""
+    """Create an API token, and show it (once)."""
     form = CreateForm(request.form)
 
     if not form.validate():
@@ -70,13 +70,16 @@ def create_api_token():
     permissions = set(form.permissions.data)
     description = form.description.data.strip()
 
-    authn_api_service.create_api_token(
+    api_token, token = authn_api_service.create_api_token(
         creator_id, permissions, description=description
     )
 
     flash_success(gettext('API token has been created.'))
 
-    return redirect_to('.index')
+    return {
+        'api_token': api_token,
+        'token': token,
+    }
 
 
 @blueprint.post('/api_tokens/<uuid:api_token_id>/suspend')
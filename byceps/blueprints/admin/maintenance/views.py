@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 from flask_babel import gettext
 
 from byceps.services.authentication.session import authn_session_service
+from byceps.services.periodic_task import periodic_task_service
 from byceps.services.user import user_log_service
 from byceps.services.verification_token import verification_token_service
 from byceps.util.framework.blueprint import create_blueprint
@@ -46,6 +47,20 @@ def index():
     }
 
 
+@blueprint.get('/periodic_tasks')
+@permission_required('admin.maintain')
+@templated
+def periodic_tasks():
+    """Show periodic tasks and their last runs."""
+    tasks = periodic_task_service.get_tasks()
+    last_runs = periodic_task_service.get_last_runs()
+
+    return {
+        'tasks': tasks,
+        'last_runs': last_runs,
+    }
+
+
 @blueprint.post('/delete_old_login_log_entries')
 @permission_required('admin.maintain')
 @respond_no_content
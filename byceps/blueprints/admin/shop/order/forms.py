@@ -30,6 +30,13 @@ class CancelForm(LocalizedForm):
     )
 
 
+class CancelOrdersForm(CancelForm):
+    order_numbers = TextAreaField(
+        lazy_gettext('Order numbers (one per line)'),
+        validators=[InputRequired()],
+    )
+
+
 class MarkAsPaidForm(LocalizedForm):
     payment_method = RadioField(
         lazy_gettext('Payment type'),
@@ -52,6 +59,13 @@ class MarkAsPaidForm(LocalizedForm):
         self.payment_method.choices = choices
 
 
+class MarkOrdersAsPaidForm(MarkAsPaidForm):
+    order_numbers = TextAreaField(
+        lazy_gettext('Order numbers (one per line)'),
+        validators=[InputRequired()],
+    )
+
+
 class OrderNumberSequenceCreateForm(LocalizedForm):
     prefix = StringField(
         lazy_gettext('Static prefix'), validators=[InputRequired()]
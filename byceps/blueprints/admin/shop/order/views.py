@@ -21,6 +21,7 @@ from byceps.services.shop.order.errors import (
     OrderAlreadyMarkedAsPaidError,
 )
 from byceps.services.shop.order.export import order_export_service
+from byceps.services.shop.order.models.number import OrderNumber
 from byceps.services.shop.order.models.order import PaymentState
 from byceps.services.shop.shop import shop_service
 from byceps.services.ticketing import ticket_service
@@ -38,7 +39,9 @@ from . import service
 from .forms import (
     AddNoteForm,
     CancelForm,
+    CancelOrdersForm,
     MarkAsPaidForm,
+    MarkOrdersAsPaidForm,
     OrderNumberSequenceCreateForm,
 )
 from .models import OrderStateFilter
@@ -382,6 +385,187 @@ def mark_as_paid(order_id):
     return redirect_to('.view', order_id=order.id)
 
 
+@blueprint.get('/for_shop/<shop_id>/mark_as_paid')
+@permission_required('shop_order.mark_as_paid')
+@templated
+def mark_orders_as_paid_form(shop_id, erroneous_form=None):
+    """Show form to mark several orders as paid at once."""
+    shop = _get_shop_or_404(shop_id)
+
+    brand = brand_service.get_brand(shop.brand_id)
+
+    form = erroneous_form if erroneous_form else MarkOrdersAsPaidForm()
+    form.set_payment_method_choices()
+
+    return {
+        'shop': shop,
+        'brand': brand,
+        'form': form,
+    }
+
+
+@blueprint.post('/for_shop/<shop_id>/mark_as_paid')
+@permission_required('shop_order.mark_as_paid')
+def mark_orders_as_paid(shop_id):
+    """Set the payment state of several orders to 'paid'.
+
+    The orders are looked up at once, but are marked as paid one by one
+    as each of them gets its own payment, log entry, and event.
+
+    The e-mails to the orderers are assembled and sent by a single
+    background job.
+    """
+    shop = _get_shop_or_404(shop_id)
+
+    form = MarkOrdersAsPaidForm(request.form)
+    form.set_payment_method_choices()
+    if not form.validate():
+        return mark_orders_as_paid_form(shop_id, form)
+
+    order_numbers = _parse_order_numbers(form.order_numbers.data)
+    payment_method = form.payment_method.data
+    updated_by_id = g.user.id
+
+    orders_by_number = _get_open_orders_by_number(shop.id, order_numbers)
+
+    events = []
+    rejected_order_numbers = []
+    for order_number in order_numbers:
+        order = orders_by_number.get(order_number)
+        if order is None:
+            rejected_order_numbers.append(order_number)
+            continue
+
+        mark_as_paid_result = order_service.mark_order_as_paid(
+            order.id, payment_method, updated_by_id
+        )
+        if mark_as_paid_result.is_err():
+            rejected_order_numbers.append(order_number)
+            continue
+
+        events.append(mark_as_paid_result.unwrap())
+
+    if events:
+        flash_success(
+            gettext(
+                '%(count)s order(s) have been marked as paid.',
+                count=len(events),
+            )
+        )
+
+    if rejected_order_numbers:
+        flash_error(
+            gettext(
+                'These orders are unknown or have already been paid or '
+                'canceled: %(order_numbers)s',
+                order_numbers=', '.join(rejected_order_numbers),
+            )
+        )
+
+    order_email_service.enqueue_emails_for_paid_orders_to_orderers(
+        {event.order_id for event in events}
+    )
+
+    for event in events:
+        shop_signals.order_paid.send(None, event=event)
+
+    return redirect_to('.index_for_shop', shop_id=shop.id)
+
+
+# -------------------------------------------------------------------- #
+# bulk cancel
+
+
+@blueprint.get('/for_shop/<shop_id>/cancel')
+@permission_required('shop_order.cancel')
+@templated
+def cancel_orders_form(shop_id, erroneous_form=None):
+    """Show form to cancel several orders at once."""
+    shop = _get_shop_or_404(shop_id)
+
+    brand = brand_service.get_brand(shop.brand_id)
+
+    form = erroneous_form if erroneous_form else CancelOrdersForm()
+
+    return {
+        'shop': shop,
+        'brand': brand,
+        'form': form,
+    }
+
+
+@blueprint.post('/for_shop/<shop_id>/cancel')
+@permission_required('shop_order.cancel')
+def cancel_orders(shop_id):
+    """Set the payment state of several orders to 'canceled' and
+    release the respective article quantities.
+
+    The orders are looked up at once, but are canceled one by one as
+    each of them gets its own log entry and event.
+
+    The e-mails to the orderers are assembled and sent by a single
+    background job.
+    """
+    shop = _get_shop_or_404(shop_id)
+
+    form = CancelOrdersForm(request.form)
+    if not form.validate():
+        return cancel_orders_form(shop_id, form)
+
+    order_numbers = _parse_order_numbers(form.order_numbers.data)
+    reason = form.reason.data.strip()
+    send_email = form.send_email.data
+    initiator_id = g.user.id
+
+    orders_by_number = _get_orders_by_number(shop.id, order_numbers)
+
+    events = []
+    rejected_order_numbers = []
+    for order_number in order_numbers:
+        order = orders_by_number.get(order_number)
+        if (order is None) or order.is_canceled:
+            rejected_order_numbers.append(order_number)
+            continue
+
+        cancelation_result = order_service.cancel_order(
+            order.id, initiator_id, reason
+        )
+        if cancelation_result.is_err():
+            rejected_order_numbers.append(order_number)
+            continue
+
+        events.append(cancelation_result.unwrap())
+
+    if events:
+        flash_success(
+            gettext(
+                '%(count)s order(s) have been canceled.',
+                count=len(events),
+            )
+        )
+
+    if rejected_order_numbers:
+        flash_error(
+            gettext(
+                'These orders are unknown or have already been canceled: '
+                '%(order_numbers)s',
+                order_numbers=', '.join(rejected_order_numbers),
+            )
+        )
+
+    if send_email:
+        order_email_service.enqueue_emails_for_canceled_orders_to_orderers(
+            {event.order_id for event in events}
+        )
+    elif events:
+        flash_notice(gettext('No email has been sent to the orderers.'))
+
+    for event in events:
+        shop_signals.order_canceled.send(None, event=event)
+
+    return redirect_to('.index_for_shop', shop_id=shop.id)
+
+
 # -------------------------------------------------------------------- #
 # email
 
@@ -470,6 +654,36 @@ def create_number_sequence(shop_id):
 # helpers
 
 
+def _parse_order_numbers(text):
+    """Return the order numbers, one per line, without duplicates."""
+    order_numbers = (OrderNumber(line.strip()) for line in text.splitlines())
+    return list(dict.fromkeys(filter(None, order_numbers)))
+
+
+def _get_orders_by_number(shop_id, order_numbers):
+    """Return the shop's orders with those numbers, in a single query."""
+    orders = order_service.get_orders_for_order_numbers(set(order_numbers))
+
+    return {
+        order.order_number: order
+        for order in orders
+        if order.shop_id == shop_id
+    }
+
+
+def _get_open_orders_by_number(shop_id, order_numbers):
+    """Return the shop's open orders with those numbers, in a single
+    query.
+    """
+    orders_by_number = _get_orders_by_number(shop_id, order_numbers)
+
+    return {
+        order_number: order
+        for order_number, order in orders_by_number.items()
+        if order.is_open
+    }
+
+
 def _get_shop_or_404(shop_id):
     shop = shop_service.find_shop(shop_id)
 
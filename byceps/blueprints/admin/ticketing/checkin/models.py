@@ -0,0 +1,17 @@
+"""
+byceps.blueprints.admin.ticketing.checkin.models
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from pydantic import BaseModel, Field
+
+
+MAXIMUM_SCANS_PER_REQUEST = 100
+
+
+class ScansRequest(BaseModel):
+    codes: list[str] = Field(min_length=1, max_length=MAXIMUM_SCANS_PER_REQUEST)
+    check_in: bool = True
@@ -7,22 +7,27 @@ byceps.blueprints.admin.ticketing.checkin.views
 """
 
 from collections.abc import Iterator
-from datetime import date
+from datetime import date, datetime
+from typing import Any
 
-from flask import abort, g, request, url_for
+from flask import abort, g, jsonify, request, url_for
 from flask_babel import gettext
+from pydantic import ValidationError
 
 from byceps.services.party import party_service
 from byceps.services.party.models import Party
+from byceps.services.search import search_service
 from byceps.services.shop.order import order_service
 from byceps.services.shop.order.models.order import AdminOrderListItem
 from byceps.services.shop.shop import shop_service
 from byceps.services.ticketing import (
     errors as ticketing_errors,
+    ticket_code_index_service,
     ticket_service,
     ticket_user_checkin_service,
 )
 from byceps.services.ticketing.dbmodels.ticket import DbTicket
+from byceps.services.ticketing.models.checkin import TicketCodeIndexEntry
 from byceps.services.ticketing.models.ticket import TicketID
 from byceps.services.user import user_service
 from byceps.services.user.models.user import User
@@ -31,7 +36,13 @@ from byceps.typing import BrandID, PartyID
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.framework.flash import flash_error, flash_notice, flash_success
 from byceps.util.framework.templating import templated
-from byceps.util.views import permission_required, respond_no_content
+from byceps.util.views import (
+    jsonified,
+    permission_required,
+    respond_no_content,
+)
+
+from .models import ScansRequest
 
 
 blueprint = create_blueprint('ticketing_checkin_admin', __name__)
@@ -74,6 +85,39 @@ def index(party_id):
     }
 
 
+@blueprint.get('/for_party/<party_id>/search')
+@permission_required('ticketing.checkin')
+@jsonified
+def search(party_id):
+    """Return the users, tickets, and orders that match the search
+    term best, as JSON.
+
+    Intended to be queried while the search term is being typed.
+    """
+    party = _get_party_or_404(party_id)
+
+    search_term = request.args.get('search_term', default='').strip()
+
+    shop = shop_service.find_shop_for_brand(party.brand_id)
+    shop_id = shop.id if (shop is not None) else None
+
+    results = search_service.search(
+        search_term, party_id=party.id, shop_id=shop_id
+    )
+
+    return {
+        'results': [
+            {
+                'type': result.type.name,
+                'id': str(result.id),
+                'label': result.label,
+                'score': result.score,
+            }
+            for result in results
+        ],
+    }
+
+
 def _get_latest_date_of_birth_for_checkin() -> date:
     today = date.today()
     return today.replace(year=today.year - MINIMUM_AGE_IN_YEARS)
@@ -212,6 +256,167 @@ def revert_user_check_in(ticket_id):
     flash_success(gettext('Check-in has been reverted.'))
 
 
+# -------------------------------------------------------------------- #
+# kiosk API
+
+
+@blueprint.post('/for_party/<party_id>/scans')
+@permission_required('ticketing.checkin')
+@jsonified
+def scans(party_id):
+    """Look up scanned ticket codes and, unless requested otherwise,
+    check in the tickets' users.
+
+    Expects a JSON object with a list of `codes` and an optional
+    `check_in` flag. Returns a result per code, in the given order.
+    A ticket scanned more than once is only checked in once.
+    """
+    party = _get_party_or_404(party_id)
+
+    if not request.is_json:
+        abort(415)
+
+    try:
+        req = ScansRequest.model_validate(request.get_json())
+    except ValidationError as e:
+        abort(400, e.json())
+
+    entries_by_code = ticket_code_index_service.find_entries(
+        party.id, req.codes
+    )
+
+    if req.check_in:
+        # Check in each ticket only once, even if it has been scanned
+        # repeatedly.
+        ticket_ids = list(
+            dict.fromkeys(
+                entry.ticket_id
+                for entry in entries_by_code.values()
+                if entry is not None
+            )
+        )
+        check_in_results = ticket_user_checkin_service.check_in_users(
+            party.id, ticket_ids, g.user.id
+        )
+    else:
+        check_in_results = {}
+
+    results = []
+    results_by_ticket_id: dict[TicketID, dict[str, Any]] = {}
+    for code in req.codes:
+        entry = entries_by_code[code]
+        if entry is None:
+            results.append({'code': code, 'status': 'unknown'})
+            continue
+
+        earlier_result = results_by_ticket_id.get(entry.ticket_id)
+        if earlier_result is not None:
+            # The ticket has been scanned before in this request.
+            result = earlier_result.copy()
+            if result['status'] == 'checked_in':
+                result['status'] = 'already_checked_in'
+            results.append(result)
+            continue
+
+        result = _serialize_index_entry(entry)
+
+        check_in_result = check_in_results.get(entry.ticket_id)
+        if check_in_result is None:
+            result['status'] = _get_status_from_index_entry(entry)
+        elif check_in_result.is_ok():
+            event = check_in_result.unwrap()
+            ticketing_signals.ticket_checked_in.send(None, event=event)
+            result['status'] = 'checked_in'
+            result['user_checked_in'] = True
+        else:
+            err = check_in_result.unwrap_err()
+            result['status'] = _get_status_from_error(err)
+            result['message'] = err.message
+
+        results_by_ticket_id[entry.ticket_id] = result
+        results.append(result)
+
+    return {'results': results}
+
+
+@blueprint.get('/for_party/<party_id>/tickets/snapshot.json')
+@permission_required('ticketing.checkin')
+def snapshot(party_id):
+    """Return all of the party's tickets, indexed by code, as a JSON
+    document to download.
+
+    Meant to let kiosks validate ticket codes locally in case they
+    cannot reach the server.
+    """
+    party = _get_party_or_404(party_id)
+
+    index = ticket_code_index_service.get_index(party.id)
+
+    created_at = datetime.utcnow()
+
+    response = jsonify(
+        {
+            'party_id': party.id,
+            'created_at': created_at.isoformat(),
+            'tickets': [
+                _serialize_index_entry(entry)
+                for entry in sorted(index.values(), key=lambda e: e.code)
+            ],
+        }
+    )
+
+    filename = f'tickets_{party.id}_{created_at:%Y-%m-%d_%H-%M-%S}.json'
+    response.headers['Content-Disposition'] = f'attachment; filename={filename}'
+
+    return response
+
+
+def _serialize_index_entry(entry: TicketCodeIndexEntry) -> dict[str, Any]:
+    return {
+        'code': entry.code,
+        'ticket_id': str(entry.ticket_id),
+        'category': entry.category_title,
+        'user': {
+            'id': str(entry.used_by_id),
+            'screen_name': entry.used_by_screen_name,
+        }
+        if entry.used_by_id is not None
+        else None,
+        'revoked': entry.revoked,
+        'user_checked_in': entry.user_checked_in,
+    }
+
+
+def _get_status_from_index_entry(entry: TicketCodeIndexEntry) -> str:
+    if entry.revoked:
+        return 'revoked'
+    elif entry.used_by_id is None:
+        return 'no_user'
+    elif entry.user_checked_in:
+        return 'already_checked_in'
+    else:
+        return 'valid'
+
+
+def _get_status_from_error(err: ticketing_errors.TicketingError) -> str:
+    if isinstance(err, ticketing_errors.TicketIsRevokedError):
+        return 'revoked'
+    elif isinstance(err, ticketing_errors.TicketLacksUserError):
+        return 'no_user'
+    elif isinstance(err, ticketing_errors.UserAlreadyCheckedInError):
+        return 'already_checked_in'
+    elif isinstance(err, ticketing_errors.UserAccountDeletedError):
+        return 'user_deleted'
+    elif isinstance(err, ticketing_errors.UserAccountSuspendedError):
+        return 'user_suspended'
+    else:
+        return 'error'
+
+
+# -------------------------------------------------------------------- #
+# helpers
+
+
 def _get_party_or_404(party_id: PartyID) -> Party:
     party = party_service.find_party(party_id)
 
@@ -6,7 +6,7 @@ byceps.blueprints.admin.ticketing.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from flask import abort, g, request
+from flask import abort, g, request, send_file
 from flask_babel import gettext
 
 from byceps.services.party import party_service
@@ -17,6 +17,7 @@ from byceps.services.ticketing import (
     ticket_service,
     ticket_user_management_service,
 )
+from byceps.services.ticketing.printing import ticket_printing_service
 from byceps.services.ticketing.ticket_service import FilterMode
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.framework.flash import flash_error, flash_success
@@ -291,6 +292,63 @@ def view_bundle(bundle_id):
     }
 
 
+# -------------------------------------------------------------------- #
+# printable sheets
+
+
+@blueprint.get('/tickets/for_party/<party_id>/sheets')
+@permission_required('ticketing.administrate')
+@templated
+def index_sheets_for_party(party_id):
+    """List printable ticket sheets files for that party."""
+    party = _get_party_or_404(party_id)
+
+    files = ticket_printing_service.get_ticket_sheets_files(party.id)
+
+    return {
+        'party': party,
+        'files': files,
+    }
+
+
+@blueprint.post('/tickets/for_party/<party_id>/sheets')
+@permission_required('ticketing.administrate')
+def create_sheets(party_id):
+    """Have printable sheets for all tickets of the party be created."""
+    party = _get_party_or_404(party_id)
+
+    ticket_printing_service.enqueue_ticket_sheets_creation(party.id)
+
+    flash_success(
+        gettext(
+            'The ticket sheets are being created. '
+            'Reload this page in a moment to download them.'
+        )
+    )
+
+    return redirect_to('.index_sheets_for_party', party_id=party.id)
+
+
+@blueprint.get('/tickets/for_party/<party_id>/sheets/<filename>')
+@permission_required('ticketing.administrate')
+def download_sheets(party_id, filename):
+    """Download a printable ticket sheets file."""
+    party = _get_party_or_404(party_id)
+
+    path = ticket_printing_service.find_ticket_sheets_file_path(
+        party.id, filename
+    )
+    if path is None:
+        abort(404)
+
+    return send_file(
+        path.resolve(),
+        mimetype='text/html',
+        as_attachment=True,
+        download_name=f'tickets_{party.id}_{filename}',
+    )
+
+
 # -------------------------------------------------------------------- #
 # helpers
 
@@ -6,19 +6,29 @@ byceps.blueprints.admin.user.service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
+
 from collections import defaultdict
 from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+import heapq
 from operator import attrgetter
-from typing import Any
+from typing import Any, Callable, Optional
 from uuid import UUID
 
 from byceps.services.consent import consent_service, consent_subject_service
+from byceps.services.consent.models import ConsentSubject, ConsentSubjectID
 from byceps.services.newsletter import newsletter_service
 from byceps.services.newsletter.models import List as NewsletterList
 from byceps.services.party import party_service
 from byceps.services.party.models import Party
 from byceps.services.shop.order import order_log_service, order_service
+from byceps.services.shop.order.models.number import OrderNumber
+from byceps.services.shop.order.models.order import OrderID
 from byceps.services.site import site_service
+from byceps.services.site.models import Site
 from byceps.services.ticketing import ticket_attendance_service, ticket_service
 from byceps.services.ticketing.dbmodels.ticket import DbTicket
 from byceps.services.user import user_log_service, user_service
@@ -28,6 +38,7 @@ from byceps.services.user.dbmodels.avatar import (
 from byceps.services.user.models.log import UserLogEntry, UserLogEntryData
 from byceps.services.user.models.user import User
 from byceps.services.user_badge import user_badge_service
+from byceps.services.user_badge.models import Badge, BadgeID
 from byceps.typing import PartyID, UserID
 
 
@@ -64,8 +75,7 @@ def _group_tickets_by_party_id(
 
 
 def _get_parties_by_id(party_ids: set[PartyID]) -> dict[PartyID, Party]:
-    parties = party_service.get_parties(party_ids)
-    return {p.id: p for p in parties}
+    return party_service.load_parties(party_ids)
 
 
 def get_attended_parties(user_id: UserID) -> list[Party]:
@@ -79,93 +89,153 @@ def get_newsletter_subscription_states(
     user_id: UserID,
 ) -> Iterator[tuple[NewsletterList, bool]]:
     lists = newsletter_service.get_all_lists()
+    subscribed_list_ids = newsletter_service.get_subscribed_list_ids(user_id)
     for list_ in lists:
-        is_subscribed = newsletter_service.is_subscribed(user_id, list_.id)
+        is_subscribed = list_.id in subscribed_list_ids
         yield list_, is_subscribed
 
 
-def get_log_entries(user_id: UserID) -> Iterator[UserLogEntryData]:
-    log_entries = user_log_service.get_entries_for_user(user_id)
-    log_entries.extend(_fake_consent_log_entries(user_id))
-    log_entries.extend(
-        _fake_newsletter_subscription_update_log_entries(user_id)
+LOG_ENTRIES_PER_PAGE = 100
+
+
+@dataclass(frozen=True)
+class LogEntriesPage:
+    log_entries: list[UserLogEntryData]
+    # The point in time to continue from to obtain the next (older)
+    # page, or `None` if there are no older log entries.
+    next_before: datetime | None
+
+
+LogEntrySource = Callable[[Optional[datetime], int], list[UserLogEntry]]
+
+
+def get_log_entries(
+    user_id: UserID,
+    *,
+    include_logins: bool = True,
+    before: datetime | None = None,
+    limit: int = LOG_ENTRIES_PER_PAGE,
+) -> LogEntriesPage:
+    """Return a page of the user's log entries, latest first.
+
+    Log entries are merged from several sources. Each source only
+    provides the latest entries (before the given point in time), so
+    the cost per page does not grow with the user's history.
+    """
+    sources: list[LogEntrySource] = [
+        partial(_get_user_log_entries, user_id, include_logins),
+        partial(_fake_consent_log_entries, user_id),
+        partial(_fake_newsletter_subscription_update_log_entries, user_id),
+        partial(_get_order_log_entries, user_id),
+    ]
+
+    # Fetch one more entry than needed per source to learn whether
+    # older entries exist.
+    streams = [source(before, limit + 1) for source in sources]
+    merged_entries = list(
+        heapq.merge(*streams, key=attrgetter('occurred_at'), reverse=True)
     )
-    log_entries.extend(_get_order_log_entries(user_id))
 
-    user_ids = {
-        entry.data['initiator_id']
-        for entry in log_entries
-        if 'initiator_id' in entry.data
-    }
-    users = user_service.get_users(user_ids, include_avatars=True)
-    users_by_id = {str(user.id): user for user in users}
+    log_entries = _take_page(merged_entries, limit)
 
-    for entry in log_entries:
-        data = {
-            'event_type': entry.event_type,
-            'occurred_at': entry.occurred_at,
-            'data': entry.data,
-        }
+    has_more = len(merged_entries) > len(log_entries)
+    next_before = log_entries[-1].occurred_at if has_more else None
 
-        additional_data = _get_additional_data(entry, users_by_id)
-        data.update(additional_data)
+    return LogEntriesPage(
+        log_entries=list(_assemble_log_entry_data(log_entries)),
+        next_before=next_before,
+    )
 
-        yield data
 
+def _take_page(
+    log_entries: list[UserLogEntry], limit: int
+) -> list[UserLogEntry]:
+    """Take up to `limit` entries.
 
-def _fake_consent_log_entries(user_id: UserID) -> Iterator[UserLogEntry]:
-    """Yield the user's consents as volatile log entries."""
-    consents = consent_service.get_consents_by_user(user_id)
+    Entries that occurred at the same time as the last one are included
+    as well so that the next page, which continues with entries that
+    occurred before that time, does not skip any.
+    """
+    page = log_entries[:limit]
+    if not page:
+        return page
 
-    subject_ids = {consent.subject_id for consent in consents}
-    subjects = consent_subject_service.get_subjects(subject_ids)
-    subjects_titles_by_id = {subject.id: subject.title for subject in subjects}
+    last_occurred_at = page[-1].occurred_at
+    for entry in log_entries[limit:]:
+        if entry.occurred_at != last_occurred_at:
+            break
+        page.append(entry)
 
-    for consent in consents:
-        data = {
-            'initiator_id': str(user_id),
-            'subject_title': subjects_titles_by_id[consent.subject_id],
-        }
+    return page
 
-        yield UserLogEntry(
+
+def _get_user_log_entries(
+    user_id: UserID,
+    include_logins: bool,
+    before: datetime | None,
+    limit: int,
+) -> list[UserLogEntry]:
+    exclude_event_types = set() if include_logins else {'user-logged-in'}
+    return user_log_service.get_latest_entries_for_user(
+        user_id,
+        limit,
+        before=before,
+        exclude_event_types=exclude_event_types,
+    )
+
+
+def _fake_consent_log_entries(
+    user_id: UserID, before: datetime | None, limit: int
+) -> list[UserLogEntry]:
+    """Return the user's consents as volatile log entries."""
+    consents = consent_service.get_consents_by_user(user_id)
+
+    log_entries = [
+        UserLogEntry(
             id=UUID('00000000-0000-0000-0000-000000000001'),
             occurred_at=consent.expressed_at,
             event_type='consent-expressed',
             user_id=user_id,
-            data=data,
+            data={
+                'initiator_id': str(user_id),
+                'subject_id': str(consent.subject_id),
+            },
         )
+        for consent in consents
+    ]
 
+    return _select_latest(log_entries, before, limit)
 
-def _fake_newsletter_subscription_update_log_entries(
-    user_id: UserID,
-) -> Iterator[UserLogEntry]:
-    """Yield the user's newsletter subscription updates as volatile log entries."""
-    lists = newsletter_service.get_all_lists()
-    lists_by_id = {list_.id: list_ for list_ in lists}
 
+def _fake_newsletter_subscription_update_log_entries(
+    user_id: UserID, before: datetime | None, limit: int
+) -> list[UserLogEntry]:
+    """Return the user's newsletter subscription updates as volatile log
+    entries.
+    """
     updates = newsletter_service.get_subscription_updates_for_user(user_id)
 
-    for update in updates:
-        event_type = f'newsletter-{update.state.name}'
-
-        list_ = lists_by_id[update.list_id]
-
-        data = {
-            'list_': list_,
-            'initiator_id': str(user_id),
-        }
-
-        yield UserLogEntry(
+    log_entries = [
+        UserLogEntry(
             id=UUID('00000000-0000-0000-0000-000000000001'),
             occurred_at=update.expressed_at,
-            event_type=event_type,
+            event_type=f'newsletter-{update.state.name}',
             user_id=user_id,
-            data=data,
+            data={
+                'initiator_id': str(user_id),
+                'list_id': update.list_id,
+            },
         )
+        for update in updates
+    ]
+
+    return _select_latest(log_entries, before, limit)
 
 
-def _get_order_log_entries(initiator_id: UserID) -> Iterator[UserLogEntry]:
-    """Yield orders log entries initiated by the user."""
+def _get_order_log_entries(
+    initiator_id: UserID, before: datetime | None, limit: int
+) -> list[UserLogEntry]:
+    """Return orders log entries initiated by the user."""
     event_types = frozenset(
         [
             'order-canceled-after-paid',
@@ -174,33 +244,160 @@ def _get_order_log_entries(initiator_id: UserID) -> Iterator[UserLogEntry]:
             'order-placed',
         ]
     )
-    log_entries = order_log_service.get_entries_by_initiator(
-        initiator_id, event_types
+    log_entries = order_log_service.get_latest_entries_by_initiator(
+        initiator_id, event_types, limit, before=before
     )
 
-    order_ids = frozenset([entry.order_id for entry in log_entries])
-    orders = order_service.get_orders(order_ids)
-    orders_by_id = {order.id: order for order in orders}
+    return [
+        UserLogEntry(
+            id=UUID('00000000-0000-0000-0000-000000000001'),
+            occurred_at=entry.occurred_at,
+            event_type=entry.event_type,
+            user_id=initiator_id,
+            data={
+                'initiator_id': str(initiator_id),
+                'order_id': str(entry.order_id),
+            },
+        )
+        for entry in log_entries
+    ]
+
+
+def _select_latest(
+    log_entries: list[UserLogEntry], before: datetime | None, limit: int
+) -> list[UserLogEntry]:
+    if before is not None:
+        log_entries = [e for e in log_entries if e.occurred_at < before]
+
+    log_entries.sort(key=attrgetter('occurred_at'), reverse=True)
+
+    return log_entries[:limit]
+
+
+def _assemble_log_entry_data(
+    log_entries: list[UserLogEntry],
+) -> Iterator[UserLogEntryData]:
+    """Resolve the objects referenced by the log entries, in bulk."""
+    references = _LogEntryReferences.load(log_entries)
 
     for entry in log_entries:
-        order = orders_by_id[entry.order_id]
         data = {
-            'initiator_id': str(initiator_id),
-            'order_id': str(order.id),
-            'order_number': order.order_number,
+            'event_type': entry.event_type,
+            'occurred_at': entry.occurred_at,
+            'data': _complete_data(entry, references),
         }
 
-        yield UserLogEntry(
-            id=UUID('00000000-0000-0000-0000-000000000001'),
-            occurred_at=entry.occurred_at,
-            event_type=entry.event_type,
-            user_id=initiator_id,
-            data=data,
+        additional_data = _get_additional_data(entry, references)
+        data.update(additional_data)
+
+        yield data
+
+
+@dataclass(frozen=True)
+class _LogEntryReferences:
+    users_by_id: dict[str, User]
+    badges_by_id: dict[str, Badge]
+    sites_by_id: dict[str, Site]
+    order_numbers_by_order_id: dict[str, OrderNumber]
+    consent_subjects_by_id: dict[str, ConsentSubject]
+    newsletter_lists_by_id: dict[str, NewsletterList]
+
+    @classmethod
+    def load(cls, log_entries: list[UserLogEntry]) -> _LogEntryReferences:
+        def collect(event_types: set[str], key: str) -> set[str]:
+            return {
+                entry.data[key]
+                for entry in log_entries
+                if (entry.event_type in event_types) and (key in entry.data)
+            }
+
+        user_ids = {
+            entry.data['initiator_id']
+            for entry in log_entries
+            if 'initiator_id' in entry.data
+        }
+        users = user_service.get_users(user_ids, include_avatars=True)
+
+        badge_ids = collect({'user-badge-awarded'}, 'badge_id')
+        badges = user_badge_service.load_badges(
+            {BadgeID(UUID(badge_id)) for badge_id in badge_ids}
+        ).values()
+
+        site_ids = collect({'user-logged-in'}, 'site_id')
+        sites = site_service.load_sites(site_ids).values()
+
+        order_ids = collect(_ORDER_EVENT_TYPES, 'order_id')
+        orders = order_service.get_orders(
+            frozenset(OrderID(UUID(order_id)) for order_id in order_ids)
         )
 
+        subject_ids = collect({'consent-expressed'}, 'subject_id')
+        subjects = (
+            consent_subject_service.get_subjects(
+                {
+                    ConsentSubjectID(UUID(subject_id))
+                    for subject_id in subject_ids
+                }
+            )
+            if subject_ids
+            else set()
+        )
+
+        list_ids = collect(_NEWSLETTER_EVENT_TYPES, 'list_id')
+        lists = newsletter_service.load_lists(list_ids).values()
+
+        return cls(
+            users_by_id={str(user.id): user for user in users},
+            badges_by_id={str(badge.id): badge for badge in badges},
+            sites_by_id={str(site.id): site for site in sites},
+            order_numbers_by_order_id={
+                str(order.id): order.order_number for order in orders
+            },
+            consent_subjects_by_id={
+                str(subject.id): subject for subject in subjects
+            },
+            newsletter_lists_by_id={str(list_.id): list_ for list_ in lists},
+        )
+
+
+_NEWSLETTER_EVENT_TYPES = {'newsletter-declined', 'newsletter-requested'}
+
+
+_ORDER_EVENT_TYPES = {
+    'order-canceled-after-paid',
+    'order-canceled-before-paid',
+    'order-paid',
+    'order-placed',
+}
+
+
+def _complete_data(
+    log_entry: UserLogEntry, references: _LogEntryReferences
+) -> UserLogEntryData:
+    """Add details of referenced objects to the data of volatile log
+    entries.
+    """
+    if log_entry.event_type == 'consent-expressed':
+        subject = references.consent_subjects_by_id[
+            log_entry.data['subject_id']
+        ]
+        return {**log_entry.data, 'subject_title': subject.title}
+
+    if log_entry.event_type in _NEWSLETTER_EVENT_TYPES:
+        list_ = references.newsletter_lists_by_id[log_entry.data['list_id']]
+        return {**log_entry.data, 'list_': list_}
+
+    if log_entry.event_type in _ORDER_EVENT_TYPES:
+        order_number = references.order_numbers_by_order_id[
+            log_entry.data['order_id']
+        ]
+        return {**log_entry.data, 'order_number': order_number}
+
+    return log_entry.data
+
 
 def _get_additional_data(
-    log_entry: UserLogEntry, users_by_id: dict[str, User]
+    log_entry: UserLogEntry, references: _LogEntryReferences
 ) -> Iterator[tuple[str, Any]]:
     if log_entry.event_type in {
         'user-avatar-removed',
@@ -230,7 +427,7 @@ def _get_additional_data(
         'user-badge-awarded',
     }:
         yield from _get_additional_data_for_user_initiated_log_entry(
-            log_entry, users_by_id
+            log_entry, references.users_by_id
         )
 
     if log_entry.event_type in {'user-avatar-removed', 'user-avatar-updated'}:
@@ -238,7 +435,7 @@ def _get_additional_data(
         yield 'url_path', url_path
 
     if log_entry.event_type == 'user-badge-awarded':
-        badge = user_badge_service.find_badge(log_entry.data['badge_id'])
+        badge = references.badges_by_id.get(log_entry.data['badge_id'])
         yield 'badge', badge
 
     if log_entry.event_type == 'user-details-updated':
@@ -252,7 +449,7 @@ def _get_additional_data(
     if log_entry.event_type == 'user-logged-in':
         site_id = log_entry.data.get('site_id')
         if site_id:
-            site = site_service.find_site(site_id)
+            site = references.sites_by_id.get(site_id)
             if site is not None:
                 yield 'site', site
 
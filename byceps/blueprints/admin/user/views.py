@@ -837,20 +837,20 @@ def view_events(user_id):
     """Show user's events."""
     user = _get_user_for_admin_or_404(user_id)
 
-    log_entries = list(service.get_log_entries(user.id))
-
     include_logins = request.args.get('include_logins', default='yes') == 'yes'
-    if not include_logins:
-        log_entries = [
-            entry
-            for entry in log_entries
-            if entry['event_type'] != 'user-logged-in'
-        ]
+
+    before = _parse_before_arg()
+
+    log_entries_page = service.get_log_entries(
+        user.id, include_logins=include_logins, before=before
+    )
 
     return {
         'profile_user': user,
         'user': user,
-        'log_entries': log_entries,
+        'log_entries': log_entries_page.log_entries,
+        'next_before': log_entries_page.next_before,
+        'before': before,
         'logins_included': include_logins,
     }
 
@@ -859,6 +859,17 @@ def view_events(user_id):
 # helpers
 
 
+def _parse_before_arg() -> datetime | None:
+    value = request.args.get('before')
+    if not value:
+        return None
+
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        abort(400)
+
+
 def _get_user_for_admin_or_404(user_id) -> UserForAdmin:
     user = user_service.find_user_for_admin(user_id)
 
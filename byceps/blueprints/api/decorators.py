@@ -8,9 +8,12 @@ byceps.blueprints.api.decorators
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from functools import wraps
+from hashlib import sha256
+from typing import Any
 
-from flask import abort, request
+from flask import abort, make_response, request, Response
 from werkzeug.datastructures import WWWAuthenticate
 
 from byceps.services.authentication.api import authn_api_service
@@ -37,6 +40,8 @@ def api_token_required(func):
             www_authenticate['error'] = 'invalid_token'
             abort(401, www_authenticate=www_authenticate)
 
+        authn_api_service.count_request(api_token.id)
+
         return func(*args, **kwargs)
 
     return wrapper
@@ -52,3 +57,81 @@ def _extract_token_from_request() -> str | None:
         return None
 
     return token
+
+
+def conditional(
+    get_version: Callable[..., Any] | None = None,
+    *,
+    max_age: int | None = None,
+):
+    """Support conditional requests (via `If-None-Match`) and allow
+    responses to be cached.
+
+    If a version function is given, it is called with the view's
+    arguments and has to return a value that changes whenever the
+    resource changes. If the client already has that version, `304 Not
+    Modified` is returned without calling the view. Without a version
+    function, the entity tag is derived from the response body.
+
+    Caches may keep a response for `max_age` seconds. If no maximum age
+    is given, caches have to revalidate each time before reusing a
+    response (which also ensures that authentication is still checked).
+
+    Apply below authentication decorators.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if get_version is not None:
+                version = get_version(*args, **kwargs)
+                etag = _create_etag(request.endpoint, args, kwargs, version)
+
+                if request.if_none_match.contains(etag):
+                    response = Response(status=304)
+                    response.set_etag(etag)
+                    _set_cache_control(response, max_age)
+                    return response
+            else:
+                etag = None
+
+            response = make_response(func(*args, **kwargs))
+
+            if response.status_code != 200:
+                return response
+
+            if etag is not None:
+                response.set_etag(etag)
+            else:
+                response.add_etag()
+
+            _set_cache_control(response, max_age)
+
+            return response.make_conditional(request)
+
+        return wrapper
+
+    return decorator
+
+
+def _create_etag(
+    endpoint: str | None,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    version: Any,
+) -> str:
+    """Derive an entity tag from the endpoint, its arguments, and the
+    resource's version.
+    """
+    kwargs_str = ','.join(f'{k}={v}' for k, v in sorted(kwargs.items()))
+    value = f'{endpoint}|{args}|{kwargs_str}|{version}'
+    return sha256(value.encode()).hexdigest()
+
+
+def _set_cache_control(response: Response, max_age: int | None) -> None:
+    response.cache_control.public = True
+
+    if max_age is not None:
+        response.cache_control.max_age = max_age
+    else:
+        response.cache_control.no_cache = True
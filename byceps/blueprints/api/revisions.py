@@ -0,0 +1,86 @@
+"""
+byceps.blueprints.api.revisions
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Revision numbers of resources exposed via the API, incremented on
+changes signaled by the application.
+
+They serve as cheap version keys for HTTP conditional requests.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from byceps.events.base import _BaseEvent
+from byceps.signals import snippet as snippet_signals, user as user_signals
+from byceps.typing import UserID
+from byceps.util.caching import (
+    get_expiring_revision,
+    get_revision,
+    increment_expiring_revision,
+    increment_revision,
+)
+
+
+SNIPPETS_REVISION_NAME = 'api_snippets'
+
+# There is a revision per user, so let those of users whose profile
+# has not been requested or changed in a while expire.
+USER_PROFILE_REVISION_TTL = 24 * 60 * 60  # 1 day
+
+
+def get_snippets_revision() -> int:
+    return get_revision(SNIPPETS_REVISION_NAME)
+
+
+def get_user_profile_revision(user_id: UserID) -> int:
+    return get_expiring_revision(
+        _get_user_profile_revision_name(user_id), USER_PROFILE_REVISION_TTL
+    )
+
+
+def _get_user_profile_revision_name(user_id: UserID) -> str:
+    return f'api_user_profile:{user_id}'
+
+
+def _on_snippet_changed(sender, *, event: _BaseEvent | None = None) -> None:
+    increment_revision(SNIPPETS_REVISION_NAME)
+
+
+def _on_user_changed(
+    sender,
+    *,
+    event: _BaseEvent | None = None,
+    user_id: UserID | None = None,
+) -> None:
+    if (user_id is None) and (event is not None):
+        user_id = getattr(event, 'user_id', None)
+
+    if user_id is None:
+        return
+
+    increment_expiring_revision(
+        _get_user_profile_revision_name(user_id), USER_PROFILE_REVISION_TTL
+    )
+
+
+def enable_revision_tracking() -> None:
+    for signal in [
+        snippet_signals.snippet_created,
+        snippet_signals.snippet_deleted,
+        snippet_signals.snippet_updated,
+    ]:
+        signal.connect(_on_snippet_changed)
+
+    for signal in [
+        user_signals.account_deleted,
+        user_signals.account_suspended,
+        user_signals.account_unsuspended,
+        user_signals.avatar_removed,
+        user_signals.avatar_updated,
+        user_signals.email_address_confirmed,
+        user_signals.screen_name_changed,
+    ]:
+        signal.connect(_on_user_changed)
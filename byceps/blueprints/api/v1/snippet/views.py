@@ -8,7 +8,8 @@ byceps.blueprints.api.v1.snippet.views
 
 from flask import jsonify
 
-from byceps.blueprints.api.decorators import api_token_required
+from byceps.blueprints.api.decorators import api_token_required, conditional
+from byceps.blueprints.api.revisions import get_snippets_revision
 from byceps.blueprints.site.snippet.templating import get_rendered_snippet_body
 from byceps.services.snippet import snippet_service
 from byceps.services.snippet.models import SnippetScope
@@ -23,6 +24,7 @@ blueprint = create_blueprint('snippet_api', __name__)
     '/by_name/<scope_type>/<scope_name>/<snippet_name>/<language_code>'
 )
 @api_token_required
+@conditional(lambda **kwargs: get_snippets_revision())
 def get_snippet_by_name(scope_type, scope_name, snippet_name, language_code):
     """Return the current version of the snippet with that name in that
     scope.
@@ -8,7 +8,7 @@ byceps.blueprints.api.v1.ticketing
 
 from flask import abort, jsonify
 
-from byceps.blueprints.api.decorators import api_token_required
+from byceps.blueprints.api.decorators import api_token_required, conditional
 from byceps.services.party import party_service
 from byceps.services.party.models import Party
 from byceps.services.ticketing import ticket_service
@@ -21,6 +21,7 @@ blueprint = create_blueprint('ticketing_api', __name__)
 
 @blueprint.get('/sale_stats/<party_id>')
 @api_token_required
+@conditional()
 def get_sale_stats(party_id):
     """Return the number of maximum and sold tickets, respectively, for
     that party.
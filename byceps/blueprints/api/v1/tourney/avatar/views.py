@@ -6,7 +6,7 @@ byceps.blueprints.api.v1.tourney.avatar.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from flask import abort, request
+from flask import abort, jsonify, request, url_for
 
 from byceps.blueprints.api.decorators import api_token_required
 from byceps.services.party import party_service
@@ -14,7 +14,7 @@ from byceps.services.tourney.avatar import tourney_avatar_service
 from byceps.services.user import user_service
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.image.models import ImageType
-from byceps.util.views import respond_created, respond_no_content
+from byceps.util.views import respond_accepted, respond_no_content
 
 from .forms import CreateForm
 
@@ -31,11 +31,36 @@ ALLOWED_IMAGE_TYPES = frozenset(
 )
 
 
+@blueprint.get('/<uuid:avatar_id>')
+@api_token_required
+def view(avatar_id):
+    """Return the avatar image's state.
+
+    The image can be retrieved from its URL path once it is ready.
+    """
+    avatar = tourney_avatar_service.find_avatar(avatar_id)
+    if avatar is None:
+        abort(404)
+
+    return jsonify(
+        {
+            'id': avatar.id,
+            'ready': tourney_avatar_service.is_avatar_image_ready(avatar),
+            'url_path': avatar.url_path,
+        }
+    )
+
+
 @blueprint.post('')
 @api_token_required
-@respond_created
+@respond_accepted
 def create():
-    """Create an avatar image."""
+    """Create an avatar image.
+
+    The uploaded image is processed in the background. Until that is
+    done, the avatar is reported as not ready. If processing fails, the
+    avatar is removed.
+    """
     # Make `InputRequired` work on `FileField`.
     form_fields = request.form.copy()
     if request.files:
@@ -56,7 +81,7 @@ def create():
 
     avatar = _create(party.id, creator_id, image)
 
-    return avatar.url_path
+    return url_for('.view', avatar_id=avatar.id)
 
 
 def _create(party_id, creator_id, image):
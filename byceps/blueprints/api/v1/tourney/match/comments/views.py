@@ -16,7 +16,7 @@ from typing import Any
 from flask import abort, jsonify, request, url_for
 from pydantic import BaseModel, ValidationError
 
-from byceps.blueprints.api.decorators import api_token_required
+from byceps.blueprints.api.decorators import api_token_required, conditional
 from byceps.services.orga_team import orga_team_service
 from byceps.services.tourney import (
     tourney_match_comment_service,
@@ -47,6 +47,7 @@ blueprint = create_blueprint('tourney_match_comments_api', __name__)
 
 @blueprint.get('/match_comments/<uuid:comment_id>')
 @api_token_required
+@conditional()
 def get_comment(comment_id):
     """Return the comment."""
     comment = _get_comment_or_404(comment_id)
@@ -65,6 +66,7 @@ def get_comment(comment_id):
 
 @blueprint.get('/matches/<uuid:match_id>/comments')
 @api_token_required
+@conditional()
 def get_comments_for_match(match_id):
     """Return the comments on the match."""
     match = _get_match_or_404(match_id)
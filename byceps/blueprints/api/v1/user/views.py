@@ -9,7 +9,8 @@ byceps.blueprints.api.v1.user.views
 from flask import abort, jsonify, request
 from pydantic import ValidationError
 
-from byceps.blueprints.api.decorators import api_token_required
+from byceps.blueprints.api.decorators import api_token_required, conditional
+from byceps.blueprints.api.revisions import get_user_profile_revision
 from byceps.services.user import user_email_address_service, user_service
 from byceps.signals import user as user_signals
 from byceps.util.framework.blueprint import create_blueprint
@@ -22,6 +23,7 @@ blueprint = create_blueprint('user_api', __name__)
 
 
 @blueprint.get('/<uuid:user_id>/profile')
+@conditional(get_user_profile_revision, max_age=60)
 def get_profile(user_id):
     """Return (part of) user's profile as JSON."""
     user = user_service.find_active_user(user_id, include_avatar=True)
@@ -6,9 +6,12 @@ byceps.blueprints.site.page.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
+
 from flask import abort, g
 
 from byceps.services.page import page_service
+from byceps.services.page.models import PageRoute
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.l10n import get_default_locale, get_locale_str
 
@@ -27,19 +30,19 @@ def view(url_path):
     """
     url_path = '/' + url_path
 
-    version = _get_page_version(url_path, get_locale_str())
-    if version is None:
-        version = _get_page_version(url_path, get_default_locale())
+    route = _find_route(url_path, get_locale_str())
+    if route is None:
+        route = _find_route(url_path, get_default_locale())
 
-    if version is None:
+    if route is None:
         abort(404)
 
-    page = page_service.get_page(version.page_id)
+    version = page_service.get_version(route.current_version_id)
 
-    return render_page(page, version)
+    return render_page(route.page, version)
 
 
-def _get_page_version(url_path: str, language_code: str):
-    return page_service.find_current_version_for_url_path(
+def _find_route(url_path: str, language_code: str) -> PageRoute | None:
+    return page_service.find_route_for_url_path(
         g.site_id, url_path, language_code
     )
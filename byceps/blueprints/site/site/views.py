@@ -41,7 +41,7 @@ def get_nav_menu_items_for_menu_id(
     menu_id: NavMenuID,
 ) -> list[NavItemForRendering]:
     """Make navigation menus accessible to templates."""
-    items = site_navigation_service.get_items_for_menu_id(menu_id)
+    items = site_navigation_service.get_items_for_menu_id(g.site_id, menu_id)
     return _to_items_for_rendering(g.site_id, items)
 
 
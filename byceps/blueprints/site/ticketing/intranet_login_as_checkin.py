@@ -19,7 +19,7 @@ from byceps.services.ticketing import (
 )
 from byceps.signals.auth import user_logged_in
 from byceps.typing import PartyID, UserID
-from byceps.util.jobqueue import enqueue
+from byceps.util.jobqueue import CRITICAL_QUEUE_NAME, enqueue
 
 
 @user_logged_in.connect
@@ -30,7 +30,12 @@ def _on_user_logged_in(sender, *, event: UserLoggedInEvent) -> None:
     site = site_service.get_site(event.site_id)
 
     if site.party_id and site.check_in_on_login:
-        enqueue(_check_in_users_tickets, event.initiator_id, site.party_id)
+        enqueue(
+            _check_in_users_tickets,
+            event.initiator_id,
+            site.party_id,
+            queue=CRITICAL_QUEUE_NAME,
+        )
 
 
 def _check_in_users_tickets(user_id: UserID, party_id: PartyID) -> None:
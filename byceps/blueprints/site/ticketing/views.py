@@ -115,18 +115,7 @@ def view_printable_html(ticket_id):
     party = party_service.get_party(ticket_category.party_id)
 
     barcode_svg = barcode_service.render_svg(ticket.code)
-
-    # Encode SVG to be used inline as part of a data URI.
-    # Replacements are not complete, but sufficient for this case.
-    #
-    # See https://codepen.io/tigt/post/optimizing-svgs-in-data-uris
-    # for details.
-    barcode_svg_inline = barcode_svg \
-            .replace('\n', '%0A') \
-            .replace('#', '%23') \
-            .replace('<', '%3C') \
-            .replace('>', '%3E') \
-            .replace('"', "'")
+    barcode_svg_inline = barcode_service.encode_svg_for_data_uri(barcode_svg)
 
     return {
         'party_title': party.title,
@@ -11,7 +11,6 @@ from flask_babel import gettext
 
 from byceps.services.image import image_service
 from byceps.services.user import user_avatar_service
-from byceps.signals import user as user_signals
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.framework.flash import flash_notice, flash_success
 from byceps.util.framework.templating import templated
@@ -69,8 +68,10 @@ def update():
 
     _update(user.id, image)
 
-    flash_success(gettext('Avatar image has been updated.'), icon='upload')
-    user_signals.avatar_updated.send(None, user_id=user.id)
+    flash_success(
+        gettext('Avatar image has been uploaded and will be shown shortly.'),
+        icon='upload',
+    )
 
     return redirect_to('user_settings.view')
 
@@ -11,6 +11,7 @@ Command-line interface
 import click
 from flask.cli import AppGroup
 
+from .commands.benchmark_password_hashing import benchmark_password_hashing
 from .commands.create_database_tables import create_database_tables
 from .commands.create_demo_data import create_demo_data
 from .commands.create_superuser import create_superuser
@@ -20,7 +21,10 @@ from .commands.import_roles import import_roles
 from .commands.import_seats import import_seats
 from .commands.import_users import import_users
 from .commands.initialize_database import initialize_database
+from .commands.maintain_log_partitions import maintain_log_partitions
+from .commands.profile_imports import profile_imports
 from .commands.shell import shell
+from .commands.sweep_blobs import sweep_blobs
 
 
 @click.group(cls=AppGroup)
@@ -29,6 +33,7 @@ def cli():
 
 
 for func in [
+    benchmark_password_hashing,
     create_database_tables,
     create_demo_data,
     create_superuser,
@@ -38,6 +43,9 @@ for func in [
     import_seats,
     import_users,
     initialize_database,
+    maintain_log_partitions,
+    profile_imports,
     shell,
+    sweep_blobs,
 ]:
     cli.add_command(func)
@@ -0,0 +1,88 @@
+"""
+byceps.cli.command.benchmark_password_hashing
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Measure how many password hashes per second can be generated on the
+current machine with a hashing method.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import os
+import secrets
+from time import perf_counter
+
+import click
+from flask.cli import with_appcontext
+
+from byceps.services.authentication.password import (
+    authn_password_service,
+    password_hashing,
+)
+
+
+@click.command()
+@click.option(
+    '--method',
+    help='Hashing method (algorithm and parameters) [default: configured]',
+)
+@click.option(
+    '--rounds',
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help='Number of hashes to generate',
+)
+@click.option(
+    '--processes',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='Number of processes to generate hashes in',
+)
+@with_appcontext
+def benchmark_password_hashing(
+    method: str | None, rounds: int, processes: int
+) -> None:
+    """Measure password hashing throughput."""
+    if method is None:
+        method = authn_password_service.get_password_hash_method()
+    else:
+        try:
+            method = password_hashing.normalize_method(method)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint='--method') from e
+
+    passwords = [secrets.token_urlsafe(24) for _ in range(rounds)]
+
+    click.echo(
+        f'Generating {rounds} hashes with method "{method}" '
+        f'in {processes} process(es) (CPU cores: {os.cpu_count()}) ... ',
+        nl=False,
+    )
+    elapsed = _measure(passwords, method, processes)
+    click.secho('done.', fg='green')
+
+    click.echo(f'Hashes per second: {rounds / elapsed:.2f}')
+    click.echo(f'Seconds per hash:  {elapsed / rounds:.3f}')
+
+
+def _measure(passwords: list[str], method: str, processes: int) -> float:
+    """Return the number of seconds it took to hash the passwords."""
+    generate = partial(password_hashing.generate_hash, method=method)
+
+    if processes == 1:
+        start = perf_counter()
+        for password in passwords:
+            generate(password)
+        return perf_counter() - start
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        start = perf_counter()
+        list(executor.map(generate, passwords))
+        return perf_counter() - start
@@ -8,19 +8,35 @@ Populate the database with data for demonstration purposes.
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from datetime import datetime
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta
 from decimal import Decimal
+from random import Random
 
 import click
 from flask.cli import with_appcontext
 from moneyed import EUR, Money
 
+from byceps.database import db
 from byceps.services.authorization import authz_service
-from byceps.services.board import board_category_command_service, board_service
+from byceps.services.board import (
+    board_aggregation_service,
+    board_category_command_service,
+    board_category_query_service,
+    board_service,
+)
+from byceps.services.board.dbmodels.category import DbBoardCategory
+from byceps.services.board.dbmodels.posting import (
+    DbInitialTopicPostingAssociation,
+    DbPosting,
+)
+from byceps.services.board.dbmodels.topic import DbTopic
 from byceps.services.board.models import Board, BoardID
 from byceps.services.brand import brand_service
 from byceps.services.brand.models import Brand
 from byceps.services.email import email_config_service, email_footer_service
+from byceps.services.news import news_channel_service, news_item_service
+from byceps.services.news.models import BodyFormat, NewsChannelID
 from byceps.services.page import page_service
 from byceps.services.party import party_service
 from byceps.services.party.models import Party
@@ -28,8 +44,15 @@ from byceps.services.shop.article import (
     article_sequence_service,
     article_service,
 )
-from byceps.services.shop.article.models import ArticleType
-from byceps.services.shop.order import order_sequence_service
+from byceps.services.seating import seat_service, seating_area_service
+from byceps.services.shop.article.models import Article, ArticleType
+from byceps.services.shop.cart.models import Cart
+from byceps.services.shop.order import (
+    order_checkout_service,
+    order_sequence_service,
+    order_service,
+)
+from byceps.services.shop.order.models.order import Orderer
 from byceps.services.shop.shop import shop_service
 from byceps.services.shop.shop.models import Shop, ShopID
 from byceps.services.shop.storefront import storefront_service
@@ -38,17 +61,72 @@ from byceps.services.site import site_service
 from byceps.services.site.models import Site, SiteID
 from byceps.services.site_navigation import site_navigation_service
 from byceps.services.site_navigation.models import NavItemTargetType
-from byceps.services.ticketing import ticket_category_service
-from byceps.services.ticketing.models.ticket import TicketCategory
+from byceps.services.ticketing import (
+    ticket_category_service,
+    ticket_code_index_service,
+    ticket_code_service,
+)
+from byceps.services.ticketing.dbmodels.ticket import DbTicket
+from byceps.services.ticketing.models.ticket import (
+    TicketCategory,
+    TicketCategoryID,
+)
 from byceps.services.user import user_command_service, user_creation_service
+from byceps.services.user.dbmodels.detail import DbUserDetail
+from byceps.services.user.dbmodels.user import DbUser
 from byceps.services.user.models.user import User
 from byceps.typing import BrandID, PartyID, UserID
 
 
+# Number of generated entities to insert per transaction
+BATCH_SIZE = 1000
+
+
 @click.command()
+@click.option(
+    '--users',
+    'user_count',
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help='Number of additional users to generate.',
+)
+@click.option(
+    '--tickets',
+    'ticket_count',
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help='Number of tickets to generate.',
+)
+@click.option(
+    '--board-postings',
+    'board_posting_count',
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help='Number of board postings to generate.',
+)
+@click.option(
+    '--orders',
+    'order_count',
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help='Number of shop orders to generate.',
+)
 @with_appcontext
-def create_demo_data() -> None:
-    """Generate data for demonstration purposes."""
+def create_demo_data(
+    user_count: int,
+    ticket_count: int,
+    board_posting_count: int,
+    order_count: int,
+) -> None:
+    """Generate data for demonstration purposes.
+
+    Optionally, generate users, tickets, board postings, and shop orders
+    in bulk, e.g. to try out BYCEPS with realistic amounts of data.
+    """
     admin = _create_admin()
     brand = _create_brand()
     _create_email_config(brand.id)
@@ -56,11 +134,40 @@ def create_demo_data() -> None:
     party = _create_party(brand.id)
     board = _create_board(brand.id)
     ticket_category = _create_ticket_category(party.id)
+    _create_seating_area(party.id, ticket_category.id)
     shop = _create_shop(brand.id)
-    _create_shop_articles(shop.id, ticket_category)
+    merch_article = _create_shop_articles(
+        shop.id, ticket_category, 300 + order_count * 3
+    )
     storefront = _create_shop_storefront(shop.id)
     site = _create_site(brand.id, party.id, board.id, storefront.id)
     _create_pages(site.id, admin.id)
+    _create_news(brand.id, site.id, admin.id)
+
+    # Use a fixed seed to generate the same data on every run.
+    random = Random(0)  # noqa: S311
+
+    user_ids = _create_users(user_count, random) if user_count else []
+    if not user_ids:
+        user_ids = [admin.id]
+
+    if ticket_count:
+        _create_tickets(
+            party.id, ticket_category.id, user_ids, ticket_count, random
+        )
+
+    if board_posting_count:
+        _create_board_postings(board.id, user_ids, board_posting_count, random)
+
+    if order_count:
+        _create_orders(
+            storefront.id,
+            merch_article,
+            admin.id,
+            user_ids,
+            order_count,
+            random,
+        )
 
 
 def _create_admin() -> User:
@@ -146,9 +253,28 @@ def _create_shop(brand_id: BrandID) -> Shop:
     return shop
 
 
-def _create_shop_articles(
-    shop_id: ShopID, ticket_category: TicketCategory
+def _create_seating_area(
+    party_id: PartyID, ticket_category_id: TicketCategoryID
 ) -> None:
+    click.echo('Creating seating area ... ', nl=False)
+    area = seating_area_service.create_area(party_id, 'main-hall', 'Main Hall')
+
+    for row in range(10):
+        for column in range(12):
+            seat_service.create_seat(
+                area.id,
+                40 + column * 30,
+                40 + row * 40,
+                ticket_category_id,
+                label=f'Row {row + 1}, Seat {column + 1}',
+            )
+
+    click.secho('done. ', fg='green')
+
+
+def _create_shop_articles(
+    shop_id: ShopID, ticket_category: TicketCategory, merch_quantity: int
+) -> Article:
     click.echo('Creating shop articles ... ', nl=False)
 
     article_number_sequence = (
@@ -174,20 +300,22 @@ def _create_shop_articles(
     article_number_merch = article_sequence_service.generate_article_number(
         article_number_sequence.id
     ).unwrap()
-    article_service.create_article(
+    merch_article = article_service.create_article(
         shop_id,
         article_number_merch,
         ArticleType.physical,
         'Sticker Pack',
         Money('5.00', EUR),
         Decimal('0.19'),
-        300,
+        merch_quantity,
         10,
         True,
     )
 
     click.secho('done. ', fg='green')
 
+    return merch_article
+
 
 def _create_shop_storefront(shop_id: ShopID) -> Storefront:
     click.echo('Creating shop storefront ... ', nl=False)
@@ -262,3 +390,197 @@ def _create_pages(site_id: SiteID, creator_id: UserID) -> None:
         'Impressum',
         'imprint',
     ).unwrap()
+
+
+def _create_news(
+    brand_id: BrandID, site_id: SiteID, creator_id: UserID
+) -> None:
+    click.echo('Creating news ... ', nl=False)
+
+    channel = news_channel_service.create_channel(
+        brand_id, NewsChannelID('cozylan-news'), announcement_site_id=site_id
+    )
+    site_service.add_news_channel(site_id, channel.id)
+
+    for number in range(1, 13):
+        item = news_item_service.create_item(
+            channel.id,
+            f'update-{number}',
+            creator_id,
+            f'Update #{number}',
+            f'Here is what happened since the last update ({number}).',
+            BodyFormat.html,
+        )
+        news_item_service.publish_item(item.id)
+
+    click.secho('done. ', fg='green')
+
+
+def _create_users(count: int, random: Random) -> list[UserID]:
+    click.echo(f'Creating {count} users ... ', nl=False)
+
+    first_names = ['Alice', 'Bob', 'Carol', 'Dave', 'Erin', 'Frank', 'Grace']
+    last_names = ['Anderson', 'Baker', 'Clark', 'Davis', 'Evans', 'Fisher']
+    now = datetime.utcnow()
+
+    user_ids = []
+    for batch_start in range(0, count, BATCH_SIZE):
+        db_users = []
+        for number in range(batch_start, min(batch_start + BATCH_SIZE, count)):
+            db_user = DbUser(
+                now - timedelta(minutes=random.randrange(2 * 365 * 24 * 60)),
+                f'DemoUser{number:06d}',
+                f'user{number:06d}@demo.example',
+                locale='en',
+            )
+            db_user.email_address_verified = True
+            db_user.initialized = True
+            db_user.detail = DbUserDetail(
+                first_name=random.choice(first_names),
+                last_name=random.choice(last_names),
+                date_of_birth=date(1980, 1, 1)
+                + timedelta(days=random.randrange(25 * 365)),
+                country='Germany',
+                zip_code=f'{random.randrange(10000, 99999)}',
+                city='Demotown',
+                street=f'Demo Street {random.randrange(1, 200)}',
+            )
+            db_users.append(db_user)
+
+        db.session.add_all(db_users)
+        db.session.commit()
+
+        user_ids.extend(db_user.id for db_user in db_users)
+
+    click.secho('done. ', fg='green')
+
+    return user_ids
+
+
+def _create_tickets(
+    party_id: PartyID,
+    category_id: TicketCategoryID,
+    user_ids: Sequence[UserID],
+    count: int,
+    random: Random,
+) -> None:
+    click.echo(f'Creating {count} tickets ... ', nl=False)
+
+    codes = list(ticket_code_service.generate_ticket_codes(count))
+
+    for batch_start in range(0, count, BATCH_SIZE):
+        db_tickets = []
+        for code in codes[batch_start : batch_start + BATCH_SIZE]:
+            owner_id = random.choice(user_ids)
+            db_tickets.append(
+                DbTicket(
+                    party_id, code, category_id, owner_id, used_by_id=owner_id
+                )
+            )
+
+        db.session.add_all(db_tickets)
+        db.session.commit()
+
+    ticket_code_index_service.invalidate_index(party_id)
+
+    click.secho('done. ', fg='green')
+
+
+def _create_board_postings(
+    board_id: BoardID, user_ids: Sequence[UserID], count: int, random: Random
+) -> None:
+    click.echo(f'Creating {count} board postings ... ', nl=False)
+
+    categories = board_category_query_service.get_categories(board_id)
+    postings_per_topic = 25
+    started_at = datetime.utcnow() - timedelta(days=365)
+    interval = timedelta(days=365) / count
+
+    created_count = 0
+    while created_count < count:
+        db_objects: list[object] = []
+
+        while (len(db_objects) < BATCH_SIZE) and (created_count < count):
+            topic_created_at = started_at + interval * created_count
+            posting_count = min(postings_per_topic, count - created_count)
+
+            db_topic = DbTopic(
+                random.choice(categories).id,
+                random.choice(user_ids),
+                f'Demo topic #{created_count // postings_per_topic + 1}',
+            )
+            db_topic.created_at = topic_created_at
+            db_topic.posting_count = posting_count
+            db_objects.append(db_topic)
+
+            for number in range(posting_count):
+                db_posting = DbPosting(
+                    db_topic,
+                    random.choice(user_ids),
+                    f'This is demo posting #{created_count + 1}.',
+                )
+                db_posting.created_at = topic_created_at + interval * number
+                db_objects.append(db_posting)
+
+                if number == 0:
+                    db_objects.append(
+                        DbInitialTopicPostingAssociation(db_topic, db_posting)
+                    )
+
+                created_count += 1
+
+            db_topic.last_updated_at = db_posting.created_at
+            db_topic.last_updated_by_id = db_posting.creator_id
+
+        db.session.add_all(db_objects)
+        db.session.commit()
+
+    for category in categories:
+        db_category = db.session.get(DbBoardCategory, category.id)
+        board_aggregation_service.aggregate_category(db_category)
+
+    click.secho('done. ', fg='green')
+
+
+def _create_orders(
+    storefront_id: StorefrontID,
+    article: Article,
+    admin_id: UserID,
+    user_ids: Sequence[UserID],
+    count: int,
+    random: Random,
+) -> None:
+    click.echo(f'Creating {count} shop orders ... ', nl=False)
+
+    started_at = datetime.utcnow() - timedelta(days=90)
+    interval = timedelta(days=90) / count
+
+    for number in range(count):
+        orderer = Orderer(
+            user_id=random.choice(user_ids),
+            company=None,
+            first_name='Demo',
+            last_name=f'Orderer {number + 1}',
+            country='Germany',
+            zip_code='12345',
+            city='Demotown',
+            street='Demo Street 1',
+        )
+
+        cart = Cart(article.price.currency)
+        cart.add_item(article, random.randint(1, 3))
+
+        order, _ = order_checkout_service.place_order(
+            storefront_id,
+            orderer,
+            cart,
+            created_at=started_at + interval * number,
+        ).unwrap()
+
+        # Mark about half of the orders as paid.
+        if random.random() < 0.5:
+            order_service.mark_order_as_paid(
+                order.id, 'bank_transfer', admin_id
+            ).unwrap()
+
+    click.secho('done. ', fg='green')
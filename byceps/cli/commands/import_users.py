@@ -8,21 +8,43 @@ Import user accounts from JSON lines.
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
+
 from pathlib import Path
 
 import click
 from flask.cli import with_appcontext
 
 from byceps.services.user import user_import_service
+from byceps.services.user.user_import_service import UserToImport
 
 
 @click.command()
+@click.option(
+    '--bulk',
+    is_flag=True,
+    help='Validate all lines first, then import in chunks (faster).',
+)
+@click.option(
+    '--chunk-size',
+    type=click.IntRange(min=1),
+    default=user_import_service.DEFAULT_BULK_CHUNK_SIZE,
+    show_default=True,
+    help='Number of users to insert per statement in bulk mode.',
+)
 @click.argument(
     'data_file', type=click.Path(exists=True, dir_okay=False, path_type=Path)
 )
 @with_appcontext
-def import_users(data_file: Path) -> None:
+def import_users(data_file: Path, bulk: bool, chunk_size: int) -> None:
     """Import user accounts."""
+    if bulk:
+        _import_users_in_bulk(data_file, chunk_size)
+    else:
+        _import_users_one_by_one(data_file)
+
+
+def _import_users_one_by_one(data_file: Path) -> None:
     with data_file.open() as f:
         lines = user_import_service.parse_lines(f)
         for line_number, line in enumerate(lines, start=1):
@@ -37,3 +59,43 @@ def import_users(data_file: Path) -> None:
                 click.secho(
                     f'[line {line_number}] Could not import user: {e}', fg='red'
                 )
+
+
+def _import_users_in_bulk(data_file: Path, chunk_size: int) -> None:
+    line_numbers: list[int] = []
+    users_to_import: list[UserToImport] = []
+    erroneous_line_numbers: set[int] = set()
+
+    with data_file.open() as f:
+        lines = user_import_service.parse_lines(f)
+        for line_number, line in enumerate(lines, start=1):
+            try:
+                user_to_import = user_import_service.parse_user_json(line)
+            except Exception as e:
+                erroneous_line_numbers.add(line_number)
+                click.secho(f'[line {line_number}] {e}', fg='red')
+                continue
+
+            line_numbers.append(line_number)
+            users_to_import.append(user_to_import)
+
+    errors = user_import_service.validate_users_to_import(users_to_import)
+    for index, error_str in errors.items():
+        line_number = line_numbers[index]
+        erroneous_line_numbers.add(line_number)
+        click.secho(f'[line {line_number}] {error_str}', fg='red')
+
+    if erroneous_line_numbers:
+        line_numbers_str = ', '.join(map(str, sorted(erroneous_line_numbers)))
+        click.secho(
+            '\nNot attempting actual importing of users due to errors '
+            f'in these lines: {line_numbers_str}',
+            fg='red',
+        )
+        return
+
+    click.echo(f'Importing {len(users_to_import)} users ... ', nl=False)
+    users = user_import_service.import_users(
+        users_to_import, chunk_size=chunk_size
+    )
+    click.secho(f'done. Imported {len(users)} users.', fg='green')
@@ -0,0 +1,42 @@
+"""
+byceps.cli.command.maintain_log_partitions
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Create upcoming monthly partitions of the log tables, and drop those
+beyond the configured retention periods.
+
+The worker runs this daily as a periodic task.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+from flask.cli import with_appcontext
+
+from byceps.services.log_retention import log_retention_service
+
+
+@click.command()
+@click.option(
+    '--months-ahead',
+    type=int,
+    default=log_retention_service.DEFAULT_MONTHS_AHEAD,
+    show_default=True,
+    help='number of upcoming months to create partitions for',
+)
+@with_appcontext
+def maintain_log_partitions(months_ahead: int) -> None:
+    """Create upcoming log partitions and apply retention policies."""
+    click.echo('Creating upcoming log partitions ... ', nl=False)
+    created_partition_names = log_retention_service.create_upcoming_partitions(
+        months_ahead=months_ahead
+    )
+    click.secho(
+        f'done. Created {len(created_partition_names)} partitions.', fg='green'
+    )
+
+    click.echo('Applying log retention policies ... ', nl=False)
+    num_deleted_by_table_name = log_retention_service.apply_retention_policies()
+    num_deleted = sum(num_deleted_by_table_name.values())
+    click.secho(f'done. Deleted {num_deleted} entries.', fg='green')
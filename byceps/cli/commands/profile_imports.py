@@ -0,0 +1,158 @@
+"""
+byceps.cli.command.profile_imports
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Measure the time it takes to import the modules needed to create an
+application, grouped by subsystem.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+import subprocess
+import sys
+
+import click
+
+
+APP_MODES = ['admin', 'cli', 'site', 'worker']
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    module_name: str
+    self_us: int  # in microseconds
+    cumulative_us: int  # in microseconds
+
+
+@dataclass(frozen=True)
+class SubsystemImportTime:
+    name: str
+    self_us: int  # in microseconds
+    module_count: int
+
+
+@click.command()
+@click.option(
+    '--app-mode',
+    type=click.Choice(APP_MODES),
+    default='cli',
+    show_default=True,
+    help='Mode of the application to create',
+)
+@click.option(
+    '--limit',
+    type=click.IntRange(min=1),
+    default=25,
+    show_default=True,
+    help='Number of subsystems to list',
+)
+def profile_imports(app_mode: str, limit: int) -> None:
+    """Measure module import times per subsystem."""
+    click.echo(
+        f'Creating {app_mode} application in a separate process ... ',
+        nl=False,
+    )
+    output = _create_app_with_import_times(app_mode)
+    click.secho('done.', fg='green')
+
+    import_times = list(parse_import_times(output.splitlines()))
+    total_us = sum(import_time.self_us for import_time in import_times)
+
+    click.echo(
+        f'Imported {len(import_times)} modules in {total_us / 1000:.0f} ms.'
+    )
+    click.echo()
+
+    click.echo(f'{"Subsystem":<48} {"Modules":>7} {"ms":>8} {"%":>6}')
+    for subsystem in group_by_subsystem(import_times)[:limit]:
+        share = subsystem.self_us / total_us * 100 if total_us else 0
+        click.echo(
+            f'{subsystem.name:<48} {subsystem.module_count:>7} '
+            f'{subsystem.self_us / 1000:>8.1f} {share:>6.1f}'
+        )
+
+
+def _create_app_with_import_times(app_mode: str) -> str:
+    """Create an application in a fresh interpreter (so that no module
+    has been imported yet) and return Python's import time report.
+
+    The configuration is taken from the environment, as usual.
+    """
+    code = (
+        f'from byceps.application import create_{app_mode}_app; '
+        f'create_{app_mode}_app()'
+    )
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    if result.returncode != 0:
+        click.secho('failed.', fg='red')
+        raise click.ClickException(result.stderr.strip())
+
+    return result.stderr
+
+
+def parse_import_times(lines: Iterable[str]) -> Iterator[ImportTime]:
+    """Parse the output of `python -X importtime`."""
+    for line in lines:
+        if not line.startswith('import time:'):
+            continue
+
+        self_us, cumulative_us, module_name = (
+            field.strip() for field in line[len('import time:') :].split('|')
+        )
+
+        if not self_us.isdigit():
+            # header
+            continue
+
+        yield ImportTime(module_name, int(self_us), int(cumulative_us))
+
+
+def group_by_subsystem(
+    import_times: Iterable[ImportTime],
+) -> list[SubsystemImportTime]:
+    """Sum up the import times per subsystem, slowest first."""
+    self_us_by_name: dict[str, int] = {}
+    module_count_by_name: dict[str, int] = {}
+
+    for import_time in import_times:
+        name = get_subsystem_name(import_time.module_name)
+        self_us_by_name[name] = (
+            self_us_by_name.get(name, 0) + import_time.self_us
+        )
+        module_count_by_name[name] = module_count_by_name.get(name, 0) + 1
+
+    subsystems = [
+        SubsystemImportTime(name, self_us, module_count_by_name[name])
+        for name, self_us in self_us_by_name.items()
+    ]
+
+    subsystems.sort(key=lambda subsystem: subsystem.self_us, reverse=True)
+
+    return subsystems
+
+
+def get_subsystem_name(module_name: str) -> str:
+    """Return the subsystem the module belongs to.
+
+    For BYCEPS, that is the package below `byceps.services`,
+    `byceps.blueprints`, etc. For third-party code, it is the top-level
+    package.
+    """
+    parts = module_name.split('.')
+
+    if parts[0] == 'byceps':
+        return '.'.join(parts[:3])
+
+    return parts[0]
@@ -0,0 +1,29 @@
+"""
+byceps.cli.command.sweep_blobs
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Delete stored blobs of uploaded files that are no longer referenced.
+
+The worker runs this daily as a periodic task.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+from flask.cli import with_appcontext
+
+from byceps.util import upload
+
+
+@click.command()
+@with_appcontext
+def sweep_blobs() -> None:
+    """Delete blobs of uploaded files that are no longer referenced."""
+    click.echo('Sweeping unreferenced blobs ... ', nl=False)
+    report = upload.sweep_blobs()
+    click.secho(
+        f'done. Deleted {report.num_deleted} blobs, '
+        f'reclaimed {report.bytes_reclaimed / 1024 / 1024:.1f} MiB.',
+        fg='green',
+    )
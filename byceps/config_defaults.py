@@ -28,10 +28,23 @@ API_ENABLED = True
 # metrics
 METRICS_ENABLED = False
 
+# SQL query instrumentation
+QUERY_METRICS_ENABLED = False
+QUERY_BUDGET = None  # maximum number of statements per request
+SLOW_REQUEST_THRESHOLD = None  # in seconds
+SLOW_REQUEST_LOGGED_STATEMENTS = 5
+
+# templates
+TEMPLATE_WARM_UP_ENABLED = False
+
 # RQ dashboard (for job queue)
 RQ_DASHBOARD_POLL_INTERVAL = 2500
 RQ_DASHBOARD_WEB_BACKGROUND = 'white'
 
+# password hashing
+PASSWORD_HASH_METHOD = 'pbkdf2:sha256:600000'  # noqa: S105
+PASSWORD_VERIFICATION_THREADS = 0
+
 # login sessions
 PERMANENT_SESSION_LIFETIME = timedelta(14)
 SESSION_COOKIE_SAMESITE = 'Lax'
@@ -52,3 +65,8 @@ MAX_CONTENT_LENGTH = 4000000
 
 # shop
 SHOP_ORDER_EXPORT_TIMEZONE = 'Europe/Berlin'
+
+# log retention (in days; `None` keeps entries indefinitely)
+SHOP_ORDER_LOG_RETENTION_DAYS = None
+TICKET_LOG_RETENTION_DAYS = None
+USER_LOGIN_LOG_RETENTION_DAYS = None
@@ -16,6 +16,7 @@ import uuid
 
 from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.pagination import Pagination
+from sqlalchemy import DDL, event
 from sqlalchemy.dialects.postgresql import insert, JSONB, UUID
 from sqlalchemy.sql import Select
 from sqlalchemy.sql.dml import Insert
@@ -32,6 +33,13 @@ Mapper = Callable[[F], T]
 db = SQLAlchemy()
 
 
+# Trigram indexes (used to speed up substring searches) require the
+# `pg_trgm` extension to be available before tables are created.
+event.listen(
+    db.metadata, 'before_create', DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+)
+
+
 db.JSONB = JSONB
 
 
@@ -9,19 +9,25 @@ Run like this (inside a virtual environment)::
 
     $ DATABASE_URI=your-database-uri-here FLASK_APP=app_metrics flask run --port 8090
 
+Metrics that are kept in Redis (like API token request counts) are
+only included if a Redis URL is specified as well (via `REDIS_URL`).
+
 Metrics then become available at `http://127.0.0.1/metrics`.
 
 :Copyright: 2014-2023 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
+
 from flask import Flask
+from redis import Redis
 
 from byceps.database import db
 from byceps.util.framework.blueprint import get_blueprint
 
 
-def create_metrics_app(database_uri):
+def create_metrics_app(database_uri, redis_url: str | None = None):
     """Create the actual Flask application."""
     app = Flask(__name__)
 
@@ -30,6 +36,10 @@ def create_metrics_app(database_uri):
     # Initialize database.
     db.init_app(app)
 
+    # Initialize Redis client, if configured.
+    if redis_url:
+        app.redis_client = Redis.from_url(redis_url)
+
     blueprint = get_blueprint('monitoring.metrics')
     app.register_blueprint(blueprint, url_prefix='/metrics')
 
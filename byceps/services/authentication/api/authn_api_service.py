@@ -8,48 +8,80 @@ byceps.services.authentication.api.authn_api_service
 
 from __future__ import annotations
 
+from hashlib import sha256
 from secrets import token_urlsafe
 from uuid import UUID
 
+from flask import current_app
 from sqlalchemy import delete, select
 
 from byceps.database import db
 from byceps.services.authorization.models import PermissionID
 from byceps.typing import UserID
+from byceps.util.caching import Cache
 
 from .dbmodels import DbApiToken
 from .models import ApiToken
 
 
+# Map token hashes to API tokens.
+_cache: Cache[str, ApiToken] = Cache('api_tokens', ttl=60)
+
+
+_REQUEST_COUNTS_KEY = 'byceps:api_tokens:request_counts'
+
+
 def create_api_token(
     creator_id: UserID,
     permissions: set[PermissionID],
     *,
     description: str | None = None,
-) -> ApiToken:
-    """Create an API token."""
+) -> tuple[ApiToken, str]:
+    """Create an API token.
+
+    Only a hash of the token is stored, so the token itself is returned
+    along with the API token object, and it is not retrievable later.
+    """
     num_bytes = 40
     token = token_urlsafe(num_bytes)
+    token_hash = _hash_token(token)
 
     db_api_token = DbApiToken(
-        creator_id, token, permissions, description=description
+        creator_id, token_hash, permissions, description=description
     )
     db.session.add(db_api_token)
     db.session.commit()
 
-    return _db_entity_to_api_token(db_api_token)
+    api_token = _db_entity_to_api_token(db_api_token)
+
+    return api_token, token
 
 
 def find_api_token_by_token(token: str) -> ApiToken | None:
-    """Return the API token for that token, or nothing if not found."""
-    db_api_token = db.session.execute(
-        select(DbApiToken).filter_by(token=token)
-    ).scalar_one_or_none()
+    """Return the API token for that token, or nothing if not found.
 
-    if db_api_token is None:
-        return None
+    API tokens are cached for a short time.
+    """
+    token_hash = _hash_token(token)
+
+    api_tokens_by_hash = _cache.get_many_or_load([token_hash], _load_api_tokens)
+    return api_tokens_by_hash.get(token_hash)
+
+
+def _load_api_tokens(token_hashes: set[str]) -> dict[str, ApiToken]:
+    db_api_tokens = db.session.scalars(
+        select(DbApiToken).filter(DbApiToken.token_hash.in_(token_hashes))
+    ).all()
+
+    return {
+        db_api_token.token_hash: _db_entity_to_api_token(db_api_token)
+        for db_api_token in db_api_tokens
+    }
 
-    return _db_entity_to_api_token(db_api_token)
+
+def _hash_token(token: str) -> str:
+    # As tokens are long and random, a fast, unsalted hash suffices.
+    return sha256(token.encode()).hexdigest()
 
 
 def get_all_api_tokens() -> list[ApiToken]:
@@ -67,6 +99,8 @@ def suspend_api_token(api_token_id: UUID) -> None:
     db_api_token.suspended = True
     db.session.commit()
 
+    _cache.invalidate()
+
 
 def unsuspend_api_token(api_token_id: UUID) -> None:
     """Unsuspend the API token."""
@@ -74,6 +108,8 @@ def unsuspend_api_token(api_token_id: UUID) -> None:
     db_api_token.suspended = False
     db.session.commit()
 
+    _cache.invalidate()
+
 
 def _get_db_api_token(api_token_id: UUID) -> DbApiToken:
     db_api_token = db.session.get(DbApiToken, api_token_id)
@@ -93,13 +129,31 @@ def delete_api_token(api_token_id: UUID) -> None:
     )
     db.session.commit()
 
+    _cache.invalidate()
+
+    current_app.redis_client.hdel(_REQUEST_COUNTS_KEY, str(api_token_id))
+
+
+def count_request(api_token_id: UUID) -> None:
+    """Increment the number of requests made with the API token."""
+    current_app.redis_client.hincrby(_REQUEST_COUNTS_KEY, str(api_token_id))
+
+
+def get_request_counts() -> dict[UUID, int]:
+    """Return the number of requests made with each API token."""
+    counts = current_app.redis_client.hgetall(_REQUEST_COUNTS_KEY)
+
+    return {
+        UUID(api_token_id.decode()): int(count)
+        for api_token_id, count in counts.items()
+    }
+
 
 def _db_entity_to_api_token(db_api_token: DbApiToken) -> ApiToken:
     return ApiToken(
         id=db_api_token.id,
         created_at=db_api_token.created_at,
         creator_id=db_api_token.creator_id,
-        token=db_api_token.token,
         permissions=frozenset(db_api_token.permissions),
         description=db_api_token.description,
         suspended=db_api_token.suspended,
@@ -25,7 +25,7 @@ class DbApiToken(db.Model):
     id = db.Column(db.Uuid, default=generate_uuid4, primary_key=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     creator_id = db.Column(db.Uuid, db.ForeignKey('users.id'), nullable=False)
-    token = db.Column(db.UnicodeText, nullable=False)
+    token_hash = db.Column(db.UnicodeText, unique=True, nullable=False)
     permissions = db.Column(MutableList.as_mutable(db.JSONB), nullable=False)
     description = db.Column(db.UnicodeText, nullable=True)
     suspended = db.Column(db.Boolean, default=False, nullable=False)
@@ -33,12 +33,12 @@ class DbApiToken(db.Model):
     def __init__(
         self,
         creator_id: UserID,
-        token: str,
+        token_hash: str,
         permissions: set[PermissionID],
         *,
         description: str | None,
     ) -> None:
         self.creator_id = creator_id
-        self.token = token
+        self.token_hash = token_hash
         self.permissions = list(permissions)
         self.description = description
@@ -21,7 +21,6 @@ class ApiToken:
     id: UUID
     created_at: datetime
     creator_id: UserID
-    token: str
     permissions: frozenset[PermissionID]
     description: str | None
     suspended: bool
@@ -8,13 +8,13 @@ byceps.services.authentication.password.authn_password_service
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import cache, partial
 
+from flask import current_app
 from sqlalchemy import delete
-from werkzeug.security import (
-    check_password_hash as _check_password_hash,
-    generate_password_hash as _generate_password_hash,
-)
 
 from byceps.database import db
 from byceps.events.auth import PasswordUpdatedEvent
@@ -23,17 +23,46 @@ from byceps.services.user import user_log_service
 from byceps.services.user.models.user import User
 from byceps.typing import UserID
 
+from . import password_hashing
 from .dbmodels import DbCredential
 
 
-# https://cheatsheetseries.owasp.org/cheatsheets/Password_Storage_Cheat_Sheet.html#pbkdf2
-PASSWORD_HASH_ITERATIONS = 600000
-PASSWORD_HASH_METHOD = 'pbkdf2:sha256:%d' % PASSWORD_HASH_ITERATIONS
+def get_password_hash_method() -> str:
+    """Return the configured method (algorithm and parameters) to hash
+    passwords with.
+    """
+    return password_hashing.normalize_method(
+        current_app.config['PASSWORD_HASH_METHOD']
+    )
+
+
+def generate_password_hash(password: str, *, method: str | None = None) -> str:
+    """Generate a salted hash value based on the password.
+
+    Use the configured method unless a method is given.
+    """
+    if method is None:
+        method = get_password_hash_method()
 
+    return password_hashing.generate_hash(password, method)
+
+
+def generate_password_hashes(
+    passwords: Iterable[str], *, max_workers: int | None = None
+) -> list[str]:
+    """Generate salted hash values for many passwords.
+
+    As hashing is deliberately CPU-intensive, the work is spread across
+    a pool of processes (by default, one per CPU core).
+
+    The hashes are returned in the same order as the passwords.
+    """
+    generate = partial(
+        password_hashing.generate_hash, method=get_password_hash_method()
+    )
 
-def generate_password_hash(password: str) -> str:
-    """Generate a salted hash value based on the password."""
-    return _generate_password_hash(password, method=PASSWORD_HASH_METHOD)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(generate, passwords, chunksize=16))
 
 
 def create_password_hash(user_id: UserID, password: str) -> None:
@@ -101,8 +130,37 @@ def check_password_hash(password_hash: str, password: str) -> bool:
     """Hash the password and return `True` if the result matches the
     given hash, `False` otherwise.
     """
-    return (password_hash is not None) and _check_password_hash(
-        password_hash, password
+    if password_hash is None:
+        return False
+
+    executor = _get_verification_executor()
+    if executor is None:
+        return password_hashing.check_hash(password_hash, password)
+
+    future = executor.submit(
+        password_hashing.check_hash, password_hash, password
+    )
+    return future.result()
+
+
+def _get_verification_executor() -> ThreadPoolExecutor | None:
+    """Return the thread pool to verify passwords in, or `None` if
+    passwords are to be verified in the calling thread.
+
+    The pool bounds the number of password verifications (which are
+    CPU-intensive by design) that run concurrently in this process.
+    """
+    max_workers = current_app.config['PASSWORD_VERIFICATION_THREADS']
+    if not max_workers:
+        return None
+
+    return _create_verification_executor(max_workers)
+
+
+@cache
+def _create_verification_executor(max_workers: int) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix='password-verification'
     )
 
 
@@ -118,11 +176,17 @@ def migrate_password_hash_if_outdated(user_id: UserID, password: str) -> None:
     db.session.commit()
 
 
-def is_password_hash_current(password_hash: str) -> bool:
+def is_password_hash_current(
+    password_hash: str, *, method: str | None = None
+) -> bool:
     """Return `True` if the password hash was created with the currently
-    configured method (algorithm and parameters).
+    configured method (algorithm and parameters), or with the given
+    method.
     """
-    return password_hash.startswith(PASSWORD_HASH_METHOD + '$')
+    if method is None:
+        method = get_password_hash_method()
+
+    return password_hashing.is_hash_current(password_hash, method)
 
 
 def _find_credential_for_user(user_id: UserID) -> DbCredential | None:
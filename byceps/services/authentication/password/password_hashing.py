@@ -0,0 +1,143 @@
+"""
+byceps.services.authentication.password.password_hashing
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Generate and verify password hashes using a selectable method
+(algorithm and parameters).
+
+Supported methods:
+
+- ``pbkdf2:<hash name>:<iterations>``, e.g. ``pbkdf2:sha256:600000``
+- ``scrypt:<n>:<r>:<p>``, e.g. ``scrypt:32768:8:1``
+- ``argon2id:<time cost>:<memory cost in KiB>:<parallelism>``, e.g.
+  ``argon2id:3:65536:4`` (requires the `argon2-cffi` package)
+
+Omitted parameters are filled in with defaults.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from werkzeug.security import (
+    check_password_hash as _check_werkzeug_hash,
+    generate_password_hash as _generate_werkzeug_hash,
+)
+
+
+# https://cheatsheetseries.owasp.org/cheatsheets/Password_Storage_Cheat_Sheet.html#pbkdf2
+DEFAULT_METHOD = 'pbkdf2:sha256:600000'
+
+
+_DEFAULT_PARAMETERS_BY_ALGORITHM = {
+    'pbkdf2': ['sha256', '600000'],
+    'scrypt': ['32768', '8', '1'],
+    'argon2id': ['3', '65536', '4'],
+}
+
+
+_ARGON2_HASH_PREFIX = '$argon2id$'
+
+
+def normalize_method(method: str) -> str:
+    """Return the method with omitted parameters set to their defaults.
+
+    Raise an exception if the algorithm is not supported or too many
+    parameters are given.
+    """
+    algorithm, *parameters = method.split(':')
+
+    default_parameters = _DEFAULT_PARAMETERS_BY_ALGORITHM.get(algorithm)
+    if default_parameters is None:
+        raise ValueError(f"Unsupported password hash method: '{method}'")
+
+    if len(parameters) > len(default_parameters):
+        raise ValueError(f"Too many parameters for method: '{method}'")
+
+    parameters += default_parameters[len(parameters) :]
+
+    return ':'.join([algorithm, *parameters])
+
+
+def generate_hash(password: str, method: str) -> str:
+    """Generate a salted hash value based on the password."""
+    method = normalize_method(method)
+
+    if method.startswith('argon2id:'):
+        hasher = _create_argon2_hasher(method)
+        return hasher.hash(password)
+
+    return _generate_werkzeug_hash(password, method=method)
+
+
+def check_hash(password_hash: str, password: str) -> bool:
+    """Hash the password and return `True` if the result matches the
+    given hash, `False` otherwise.
+    """
+    if password_hash.startswith(_ARGON2_HASH_PREFIX):
+        return _check_argon2_hash(password_hash, password)
+
+    return _check_werkzeug_hash(password_hash, password)
+
+
+def is_hash_current(password_hash: str, method: str) -> bool:
+    """Return `True` if the password hash was created with that method
+    (algorithm and parameters).
+    """
+    method = normalize_method(method)
+
+    if method.startswith('argon2id:'):
+        return _get_argon2_method(password_hash) == method
+
+    return password_hash.startswith(method + '$')
+
+
+# argon2
+
+
+def _create_argon2_hasher(method: str):
+    try:
+        from argon2 import PasswordHasher
+    except ImportError as exc:
+        raise RuntimeError(
+            'Could not import argon2-cffi. '
+            '`pip install argon2-cffi` should make it available.'
+        ) from exc
+
+    _, time_cost, memory_cost, parallelism = method.split(':')
+
+    return PasswordHasher(
+        time_cost=int(time_cost),
+        memory_cost=int(memory_cost),
+        parallelism=int(parallelism),
+    )
+
+
+def _check_argon2_hash(password_hash: str, password: str) -> bool:
+    from argon2.exceptions import InvalidHashError, VerificationError
+
+    # Parameters are taken from the hash, not from the hasher.
+    hasher = _create_argon2_hasher(normalize_method('argon2id'))
+
+    try:
+        return hasher.verify(password_hash, password)
+    except (InvalidHashError, VerificationError):
+        return False
+
+
+def _get_argon2_method(password_hash: str) -> str | None:
+    """Derive the method from an Argon2id hash in PHC string format,
+    e.g. `$argon2id$v=19$m=65536,t=3,p=4$<salt>$<hash>`.
+    """
+    if not password_hash.startswith(_ARGON2_HASH_PREFIX):
+        return None
+
+    try:
+        parameters_str = password_hash.split('$')[3]
+        parameters = dict(
+            pair.split('=', 1) for pair in parameters_str.split(',')
+        )
+        return f"argon2id:{parameters['t']}:{parameters['m']}:{parameters['p']}"
+    except (IndexError, KeyError, ValueError):
+        return None
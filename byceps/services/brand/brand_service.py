@@ -13,6 +13,7 @@ from sqlalchemy import delete, select
 from byceps.database import db
 from byceps.typing import BrandID
 
+from . import brand_setting_service
 from .dbmodels.brand import DbBrand
 from .dbmodels.setting import DbSetting
 from .models import Brand
@@ -52,6 +53,8 @@ def delete_brand(brand_id: BrandID) -> None:
     db.session.execute(delete(DbBrand).where(DbBrand.id == brand_id))
     db.session.commit()
 
+    brand_setting_service.invalidate_cached_settings(brand_id)
+
 
 def find_brand(brand_id: BrandID) -> Brand | None:
     """Return the brand with that id, or `None` if not found."""
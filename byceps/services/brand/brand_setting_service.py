@@ -12,11 +12,16 @@ from sqlalchemy import delete, select
 
 from byceps.database import db, upsert
 from byceps.typing import BrandID
+from byceps.util.caching import Cache
 
 from .dbmodels.setting import DbSetting
 from .models import BrandSetting
 
 
+# Settings are read several times per request, but rarely change.
+_cache: Cache[BrandID, dict[str, str]] = Cache('brand_settings')
+
+
 def create_setting(brand_id: BrandID, name: str, value: str) -> BrandSetting:
     """Create a setting for that brand."""
     db_setting = DbSetting(brand_id, name, value)
@@ -24,6 +29,8 @@ def create_setting(brand_id: BrandID, name: str, value: str) -> BrandSetting:
     db.session.add(db_setting)
     db.session.commit()
 
+    _cache.invalidate_keys([brand_id])
+
     return _db_entity_to_brand_setting(db_setting)
 
 
@@ -44,6 +51,8 @@ def create_or_update_setting(
 
     upsert(table, identifier, replacement)
 
+    _cache.invalidate_keys([brand_id])
+
     return find_setting(brand_id, name)
 
 
@@ -59,42 +68,59 @@ def remove_setting(brand_id: BrandID, name: str) -> None:
     )
     db.session.commit()
 
+    _cache.invalidate_keys([brand_id])
+
 
 def find_setting(brand_id: BrandID, name: str) -> BrandSetting | None:
     """Return the setting for that brand and with that name, or `None`
     if not found.
     """
-    db_setting = db.session.get(DbSetting, (brand_id, name))
+    value = find_setting_value(brand_id, name)
 
-    if db_setting is None:
+    if value is None:
         return None
 
-    return _db_entity_to_brand_setting(db_setting)
+    return BrandSetting(brand_id, name, value)
 
 
 def find_setting_value(brand_id: BrandID, name: str) -> str | None:
     """Return the value of the setting for that brand and with that
     name, or `None` if not found.
     """
-    db_setting = find_setting(brand_id, name)
-
-    if db_setting is None:
-        return None
-
-    return db_setting.value
+    return _get_values_by_name(brand_id).get(name)
 
 
 def get_settings(brand_id: BrandID) -> set[BrandSetting]:
     """Return all settings for that brand."""
-    db_settings = db.session.scalars(
-        select(DbSetting).filter_by(brand_id=brand_id)
-    ).all()
-
     return {
-        _db_entity_to_brand_setting(db_setting) for db_setting in db_settings
+        BrandSetting(brand_id, name, value)
+        for name, value in _get_values_by_name(brand_id).items()
     }
 
 
+def _get_values_by_name(brand_id: BrandID) -> dict[str, str]:
+    """Return the brand's setting values by name, from the cache if
+    available.
+    """
+    return _cache.get_or_load(brand_id, _load_values_by_name)
+
+
+def _load_values_by_name(brand_id: BrandID) -> dict[str, str]:
+    rows = db.session.execute(
+        select(DbSetting.name, DbSetting.value).filter_by(brand_id=brand_id)
+    ).all()
+    return dict(rows)
+
+
+def invalidate_cached_settings(brand_id: BrandID) -> None:
+    """Drop the brand's cached settings (in all processes).
+
+    To be called after settings have been changed other than through
+    this module.
+    """
+    _cache.invalidate_keys([brand_id])
+
+
 def _db_entity_to_brand_setting(db_setting: DbSetting) -> BrandSetting:
     return BrandSetting(
         db_setting.brand_id,
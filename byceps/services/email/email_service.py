@@ -2,20 +2,69 @@
 byceps.services.email.email_service
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+Enqueued e-mails are collected in an outbox (in Redis). A job on the
+mail queue sends them in batches, over a connection to the SMTP server
+that is kept open.
+
+While being sent, e-mails are held in a processing list, from which
+they are only removed once they have been handled. E-mails left there
+by a job that has crashed are put back into the outbox by the next job.
+
 :Copyright: 2014-2023 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
 from email.message import EmailMessage
 from email.utils import parseaddr
-from smtplib import SMTP, SMTP_SSL
+import json
+from smtplib import SMTPDataError, SMTPRecipientsRefused, SMTPSenderRefused
+from time import perf_counter
+from typing import Any
 
 from flask import current_app
+import structlog
 
-from byceps.util.jobqueue import enqueue
+from byceps.util.jobqueue import enqueue, enqueue_at, MAIL_QUEUE_NAME
 from byceps.util.result import Err, Ok, Result
 
-from .models import Message, NameAndAddress
+from .models import DeliveryStats, Message, NameAndAddress
+from .smtp import SmtpConfig, SmtpConnection
+
+
+log = structlog.get_logger()
+
+
+_OUTBOX_KEY = 'byceps:email:outbox'
+_PROCESSING_KEY = 'byceps:email:processing'
+_FLUSH_PENDING_KEY = 'byceps:email:flush_pending'
+_SENDING_LOCK_KEY = 'byceps:email:sending'
+_STATS_KEY = 'byceps:email:stats'
+
+BATCH_SIZE = 100
+
+# Should a flush job get lost, e-mails are held back no longer than
+# this.
+FLUSH_PENDING_TIMEOUT = timedelta(minutes=5)
+
+# Only one job sends e-mails at a time. Should it get lost without
+# releasing the lock, another one takes over after this.
+SENDING_LOCK_TIMEOUT = timedelta(minutes=5)
+
+# The delay doubles with each attempt to send the same e-mail. After
+# the last attempt, it is given up on.
+RETRY_DELAY = timedelta(minutes=1)
+MAX_DELIVERY_ATTEMPTS = 8
+
+# Errors that concern a single message, rather than the connection
+_MESSAGE_ERRORS = (SMTPDataError, SMTPRecipientsRefused, SMTPSenderRefused)
+
+
+# connections kept open by this process, by configuration
+_smtp_connections: dict[SmtpConfig, SmtpConnection] = {}
 
 
 def parse_address(address_str: str) -> Result[NameAndAddress, str]:
@@ -42,14 +91,236 @@ def enqueue_email(
     body: str,
 ) -> None:
     """Enqueue e-mail to be sent asynchronously."""
-    sender_str = sender.format()
-    enqueue(send_email, sender_str, recipients, subject, body)
+    _add_to_outbox([_serialize(sender, recipients, subject, body)])
+
+
+def enqueue_messages(messages: Iterable[Message]) -> None:
+    """Enqueue e-mails to be sent asynchronously, all at once."""
+    items = [
+        _serialize(
+            message.sender, message.recipients, message.subject, message.body
+        )
+        for message in messages
+    ]
+
+    _add_to_outbox(items)
+
+
+def _serialize(
+    sender: NameAndAddress, recipients: list[str], subject: str, body: str
+) -> str:
+    return json.dumps(
+        {
+            'sender': sender.format(),
+            'recipients': recipients,
+            'subject': subject,
+            'body': body,
+        }
+    )
+
+
+def _add_to_outbox(items: list[str]) -> None:
+    if not items:
+        return
+
+    current_app.redis_client.rpush(_OUTBOX_KEY, *items)
+
+    _request_flush()
+
+
+def _request_flush() -> None:
+    """Enqueue a job to send the e-mails in the outbox."""
+    # Only enqueue a job if none is pending already, so that a surge of
+    # e-mails is sent by a single job.
+    if current_app.redis_client.set(
+        _FLUSH_PENDING_KEY, 1, nx=True, ex=FLUSH_PENDING_TIMEOUT
+    ):
+        enqueue(send_queued_emails, queue=MAIL_QUEUE_NAME)
+
+
+def send_queued_emails() -> None:
+    """Send the e-mails in the outbox, in batches."""
+    redis_client = current_app.redis_client
+
+    # E-mails enqueued from now on have to be sent by another job, as
+    # this one might have finished before they arrive.
+    redis_client.delete(_FLUSH_PENDING_KEY)
+
+    if not redis_client.set(
+        _SENDING_LOCK_KEY, 1, nx=True, ex=SENDING_LOCK_TIMEOUT
+    ):
+        # Another job is sending already. It checks for e-mails that
+        # have been enqueued in the meantime when it is done.
+        return
+
+    try:
+        # Whatever is still being processed has been left behind by a
+        # job that has crashed.
+        pipeline = redis_client.pipeline()
+        _return_to_outbox(pipeline, redis_client.llen(_PROCESSING_KEY))
+        pipeline.execute()
+
+        while items := _take_batch():
+            _send_batch(items)
+            redis_client.expire(_SENDING_LOCK_KEY, SENDING_LOCK_TIMEOUT)
+    finally:
+        redis_client.delete(_SENDING_LOCK_KEY)
+
+    # A job for e-mails enqueued since the last batch might have
+    # returned early because this one still held the lock.
+    if redis_client.llen(_OUTBOX_KEY) > 0:
+        _request_flush()
+
+
+def _take_batch() -> list[bytes]:
+    """Move the next batch of e-mails from the outbox to the processing
+    list, and return them.
+    """
+    pipeline = current_app.redis_client.pipeline()
+    for _ in range(BATCH_SIZE):
+        pipeline.lmove(_OUTBOX_KEY, _PROCESSING_KEY, 'LEFT', 'RIGHT')
+    items = pipeline.execute()
+
+    return [item for item in items if item is not None]
+
+
+def _acknowledge(item: bytes) -> None:
+    """Remove the handled e-mail from the processing list."""
+    current_app.redis_client.lrem(_PROCESSING_KEY, 1, item)
+
+
+def _return_to_outbox(pipeline, count: int) -> None:
+    """Move the last e-mails in the processing list back to the front of
+    the outbox, keeping their order.
+    """
+    for _ in range(count):
+        pipeline.lmove(_PROCESSING_KEY, _OUTBOX_KEY, 'RIGHT', 'LEFT')
+
+
+def _send_batch(items: list[bytes]) -> None:
+    sent_count = 0
+    failed_count = 0
+    started_at = perf_counter()
+
+    try:
+        for index, item in enumerate(items):
+            try:
+                data = json.loads(item)
+                send(
+                    data['sender'],
+                    data['recipients'],
+                    data['subject'],
+                    data['body'],
+                )
+            except _MESSAGE_ERRORS as exc:
+                log.warning(
+                    'Could not send email',
+                    recipients=data['recipients'],
+                    error=str(exc),
+                )
+                failed_count += 1
+            except OSError as exc:
+                # The server seems to be unavailable (SMTP errors are
+                # `OSError`s, too). Put the unsent e-mails back and try
+                # again later.
+                if _handle_connection_error(
+                    item, data, len(items) - index - 1, exc
+                ):
+                    failed_count += 1
+                raise
+            except Exception as exc:
+                # The message could not be built (e.g. because of an
+                # invalid address or header). Trying again will not
+                # help.
+                log.warning('Could not build email', error=str(exc))
+                failed_count += 1
+            else:
+                sent_count += 1
+
+            _acknowledge(item)
+    finally:
+        duration = perf_counter() - started_at
+        _record_batch(sent_count, failed_count, duration)
+
+    log.info(
+        'Emails sent',
+        sent_count=sent_count,
+        failed_count=failed_count,
+        duration_ms=round(duration * 1000, 1),
+    )
+
+
+def _handle_connection_error(
+    item: bytes, data: dict[str, Any], remaining_count: int, exc: OSError
+) -> bool:
+    """Put the failed e-mail (unless it has been given up on) and those
+    not yet attempted back into the outbox, and schedule another
+    attempt.
+
+    Return `True` if the failed e-mail has been given up on.
+    """
+    attempts = data.get('attempts', 0) + 1
+
+    given_up = attempts >= MAX_DELIVERY_ATTEMPTS
+    if given_up:
+        log.error(
+            'Giving up on sending email',
+            recipients=data['recipients'],
+            attempts=attempts,
+            error=str(exc),
+        )
+        retry_delay = RETRY_DELAY
+    else:
+        retry_delay = RETRY_DELAY * 2 ** (attempts - 1)
+
+    pipeline = current_app.redis_client.pipeline()
+    pipeline.lrem(_PROCESSING_KEY, 1, item)
+    _return_to_outbox(pipeline, remaining_count)
+    if not given_up:
+        pipeline.lpush(_OUTBOX_KEY, json.dumps({**data, 'attempts': attempts}))
+    pipeline.execute()
+
+    enqueue_at(
+        datetime.utcnow() + retry_delay,
+        send_queued_emails,
+        queue=MAIL_QUEUE_NAME,
+    )
+
+    return given_up
+
+
+def _record_batch(sent_count: int, failed_count: int, duration: float) -> None:
+    pipeline = current_app.redis_client.pipeline(transaction=False)
+    pipeline.hincrby(_STATS_KEY, 'sent', sent_count)
+    pipeline.hincrby(_STATS_KEY, 'failed', failed_count)
+    pipeline.hincrby(_STATS_KEY, 'batches', 1)
+    pipeline.hincrbyfloat(_STATS_KEY, 'duration', duration)
+    pipeline.execute()
+
+
+def get_delivery_stats() -> DeliveryStats:
+    """Return the number of e-mails sent so far, and how long that took."""
+    redis_client = current_app.redis_client
+
+    values = redis_client.hgetall(_STATS_KEY)
+    outbox_length = redis_client.llen(_OUTBOX_KEY)
+
+    return DeliveryStats(
+        sent_count=int(values.get(b'sent', 0)),
+        failed_count=int(values.get(b'failed', 0)),
+        batch_count=int(values.get(b'batches', 0)),
+        duration=float(values.get(b'duration', 0)),
+        outbox_length=outbox_length,
+    )
 
 
 def send_email(
     sender: str, recipients: list[str], subject: str, body: str
 ) -> None:
-    """Send e-mail."""
+    """Send e-mail.
+
+    Kept for jobs enqueued before e-mails were sent in batches.
+    """
     send(sender, recipients, subject, body)
 
 
@@ -79,27 +350,31 @@ def _build_message(
 
 def _send_via_smtp(message: EmailMessage) -> None:
     """Send email via SMTP."""
-    config = current_app.config
+    _get_smtp_connection().send(message)
 
-    host = config.get('MAIL_HOST', 'localhost')
-    port = config.get('MAIL_PORT', 25)
-    starttls = config.get('MAIL_STARTTLS', False)
-    use_ssl = config.get('MAIL_USE_SSL', False)
-    username = config.get('MAIL_USERNAME', None)
-    password = config.get('MAIL_PASSWORD', None)
 
-    if use_ssl:
-        with SMTP_SSL(host, port) as smtp:
-            if username and password:
-                smtp.login(username, password)
+def _get_smtp_connection() -> SmtpConnection:
+    """Return this process' connection for the current SMTP
+    configuration.
+    """
+    config = _get_smtp_config()
 
-            smtp.send_message(message)
-    else:
-        with SMTP(host, port) as smtp:
-            if starttls:
-                smtp.starttls()
+    connection = _smtp_connections.get(config)
+    if connection is None:
+        connection = SmtpConnection(config)
+        _smtp_connections[config] = connection
 
-            if username and password:
-                smtp.login(username, password)
+    return connection
 
-            smtp.send_message(message)
+
+def _get_smtp_config() -> SmtpConfig:
+    config = current_app.config
+
+    return SmtpConfig(
+        host=config.get('MAIL_HOST', 'localhost'),
+        port=config.get('MAIL_PORT', 25),
+        starttls=config.get('MAIL_STARTTLS', False),
+        use_ssl=config.get('MAIL_USE_SSL', False),
+        username=config.get('MAIL_USERNAME', None),
+        password=config.get('MAIL_PASSWORD', None),
+    )
@@ -39,3 +39,12 @@ class Message:
     recipients: list[str]
     subject: str
     body: str
+
+
+@dataclass(frozen=True)
+class DeliveryStats:
+    sent_count: int
+    failed_count: int
+    batch_count: int
+    duration: float  # in seconds, spent on sending
+    outbox_length: int
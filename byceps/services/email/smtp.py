@@ -0,0 +1,105 @@
+"""
+byceps.services.email.smtp
+~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A connection to an SMTP server that is kept open to send many messages
+without connecting, doing the TLS handshake, and logging in for each
+of them.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from email.message import EmailMessage
+from smtplib import SMTP, SMTP_SSL, SMTPException, SMTPServerDisconnected
+from time import monotonic
+
+
+# A connection that has been idle for longer than this is checked
+# before use, as the server might have closed it in the meantime.
+HEALTH_CHECK_IDLE_SECONDS = 10
+
+
+@dataclass(frozen=True)
+class SmtpConfig:
+    host: str
+    port: int
+    starttls: bool
+    use_ssl: bool
+    username: str | None
+    password: str | None
+
+
+class SmtpConnection:
+    def __init__(self, config: SmtpConfig) -> None:
+        self.config = config
+        self._smtp: SMTP | None = None
+        self._last_used_at = 0.0
+
+    def send(self, message: EmailMessage) -> None:
+        """Send the message, (re)connecting if necessary."""
+        smtp = self._get_smtp()
+
+        try:
+            smtp.send_message(message)
+        except SMTPServerDisconnected:
+            # The server might have closed the connection right after
+            # the health check. Try once more.
+            self.close()
+            smtp = self._get_smtp()
+            smtp.send_message(message)
+
+        self._last_used_at = monotonic()
+
+    def _get_smtp(self) -> SMTP:
+        if (self._smtp is not None) and not self._is_healthy(self._smtp):
+            self.close()
+
+        if self._smtp is None:
+            self._smtp = self._connect()
+            self._last_used_at = monotonic()
+
+        return self._smtp
+
+    def _is_healthy(self, smtp: SMTP) -> bool:
+        # Checking each time would add a round trip to every message.
+        if monotonic() - self._last_used_at < HEALTH_CHECK_IDLE_SECONDS:
+            return True
+
+        try:
+            status, _ = smtp.noop()
+        except (SMTPException, OSError):
+            return False
+
+        return status == 250
+
+    def _connect(self) -> SMTP:
+        config = self.config
+
+        smtp: SMTP
+        if config.use_ssl:
+            smtp = SMTP_SSL(config.host, config.port)
+        else:
+            smtp = SMTP(config.host, config.port)
+            if config.starttls:
+                smtp.starttls()
+
+        if config.username and config.password:
+            smtp.login(config.username, config.password)
+
+        return smtp
+
+    def close(self) -> None:
+        """Close the connection, if open."""
+        if self._smtp is None:
+            return
+
+        try:
+            self._smtp.quit()
+        except (SMTPException, OSError):
+            self._smtp.close()
+
+        self._smtp = None
@@ -9,10 +9,17 @@ byceps.services.image.image_service
 from __future__ import annotations
 
 from collections.abc import Iterable
+import dataclasses
+from pathlib import Path
 from typing import BinaryIO
 
-from byceps.util.image import read_dimensions
-from byceps.util.image.models import Dimensions, ImageType
+from byceps.util import upload
+from byceps.util.image import (
+    create_square_variants,
+    read_dimensions,
+    verify,
+)
+from byceps.util.image.models import Dimensions, ImageType, ImageVariant
 from byceps.util.image.typeguess import guess_type
 from byceps.util.result import Err, Ok, Result
 
@@ -46,8 +53,124 @@ def _get_image_type_prohibited_error_message(
     )
 
 
+def check_image(stream: BinaryIO) -> Result[None, str]:
+    """Check that the image in the stream is not broken.
+
+    This is a cheap check that does not decode the image, so decoding
+    it later might still fail.
+    """
+    try:
+        verify(stream)
+    except Exception:
+        return Err('Image could not be read.')
+    finally:
+        stream.seek(0)
+
+    return Ok(None)
+
+
 def determine_dimensions(stream: BinaryIO) -> Dimensions:
     """Extract image dimensions from stream."""
     dimensions = read_dimensions(stream)
     stream.seek(0)
     return dimensions
+
+
+# Edge lengths of the smaller versions of square images
+VARIANT_EDGE_LENGTHS = (256, 64)
+
+
+def get_square_variants(
+    path: Path, image_type: ImageType, maximum_dimensions: Dimensions
+) -> list[ImageVariant]:
+    """Return the variants to create of a square image (e.g. an avatar)
+    whose main version is stored at the path.
+
+    Besides the main version, smaller versions are created. Each of
+    them is stored in the original format as well as in WebP format.
+    """
+    maximum_edge_length = min(maximum_dimensions)
+    image_types = dict.fromkeys([image_type, ImageType.webp])
+
+    variants = [
+        ImageVariant(maximum_dimensions, t, get_variant_path(path, None, t))
+        for t in image_types
+    ]
+
+    for edge_length in VARIANT_EDGE_LENGTHS:
+        if edge_length >= maximum_edge_length:
+            continue
+
+        dimensions = Dimensions(edge_length, edge_length)
+        variants.extend(
+            ImageVariant(dimensions, t, get_variant_path(path, edge_length, t))
+            for t in image_types
+        )
+
+    return variants
+
+
+def get_variant_path(
+    path: Path, edge_length: int | None, image_type: ImageType
+) -> Path:
+    """Return the path of a variant of the image stored at the path.
+
+    Without an edge length, that is the main version of the image.
+    """
+    suffix = '.' + image_type.name
+
+    if edge_length is None:
+        return path.with_suffix(suffix)
+
+    return path.with_name(f'{path.stem}_{edge_length}{suffix}')
+
+
+def store_square_variants(
+    source_path: Path,
+    path: Path,
+    image_type: ImageType,
+    maximum_dimensions: Dimensions,
+) -> None:
+    """Create the variants of the square image at the source path, and
+    store them alongside the path of the main version.
+
+    Identical images are processed only once.
+    """
+    variants_by_name = {
+        _get_variant_name(variant): variant
+        for variant in get_square_variants(path, image_type, maximum_dimensions)
+    }
+
+    def create(paths_by_name: dict[str, Path]) -> None:
+        variants = [
+            dataclasses.replace(variants_by_name[name], path=derived_path)
+            for name, derived_path in paths_by_name.items()
+        ]
+        create_square_variants(source_path, variants)
+
+    # Publish the main version last, so that its presence indicates that
+    # all variants are available.
+    target_paths_by_name = {
+        name: variant.path
+        for name, variant in reversed(variants_by_name.items())
+    }
+
+    upload.store_derived(source_path, target_paths_by_name, create)
+
+
+def _get_variant_name(variant: ImageVariant) -> str:
+    dimensions = variant.dimensions
+    return f'{dimensions.width}x{dimensions.height}.{variant.image_type.name}'
+
+
+def delete_square_variants(path: Path) -> None:
+    """Delete all variants of the square image whose main version is
+    stored at the path.
+    """
+    variant_paths = [
+        *path.parent.glob(f'{path.stem}.*'),
+        *path.parent.glob(f'{path.stem}_*'),
+    ]
+
+    for variant_path in variant_paths:
+        upload.delete(variant_path)
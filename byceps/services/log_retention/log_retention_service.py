@@ -0,0 +1,152 @@
+"""
+byceps.services.log_retention.log_retention_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Keep log tables partitioned by month, and drop partitions that are
+older than the configured retention period.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import text
+import structlog
+
+from byceps.database import db
+from byceps.services.user.dbmodels.log import LOGIN_LOG_ENTRIES_TABLE_NAME
+
+from . import partitioning
+from .models import MonthlyPartition, PartitionedLogTable
+
+
+log = structlog.get_logger()
+
+
+PARTITIONED_LOG_TABLES = [
+    PartitionedLogTable(
+        name='shop_order_log_entries',
+        retention_config_key='SHOP_ORDER_LOG_RETENTION_DAYS',
+    ),
+    PartitionedLogTable(
+        name='ticket_log_entries',
+        retention_config_key='TICKET_LOG_RETENTION_DAYS',
+    ),
+    PartitionedLogTable(
+        name=LOGIN_LOG_ENTRIES_TABLE_NAME,
+        retention_config_key='USER_LOGIN_LOG_RETENTION_DAYS',
+    ),
+]
+
+
+DEFAULT_MONTHS_AHEAD = 3
+
+
+def create_upcoming_partitions(
+    *, now: datetime | None = None, months_ahead: int = DEFAULT_MONTHS_AHEAD
+) -> list[str]:
+    """Create monthly partitions for the current and the upcoming months
+    for all partitioned log tables.
+
+    Return the names of the created partitions.
+    """
+    if now is None:
+        now = datetime.utcnow()
+
+    created_partition_names = []
+
+    for table in PARTITIONED_LOG_TABLES:
+        month_start = partitioning.get_month_start(now)
+        for _ in range(months_ahead + 1):
+            if partitioning.create_monthly_partition(table.name, month_start):
+                partition_name = partitioning.get_partition_name(
+                    table.name, month_start
+                )
+                created_partition_names.append(partition_name)
+                log.info('Log partition created', partition=partition_name)
+
+            month_start = partitioning.get_next_month_start(month_start)
+
+    return created_partition_names
+
+
+def get_retention_period(table: PartitionedLogTable) -> timedelta | None:
+    """Return the configured retention period for the table, or `None`
+    if entries are to be kept indefinitely.
+    """
+    days = current_app.config.get(table.retention_config_key)
+    if days is None:
+        return None
+
+    return timedelta(days=days)
+
+
+def apply_retention_policies(*, now: datetime | None = None) -> dict[str, int]:
+    """Delete entries that lie beyond the configured retention period of
+    their log table.
+
+    Return the number of deleted entries per table.
+    """
+    if now is None:
+        now = datetime.utcnow()
+
+    num_deleted_by_table_name = {}
+
+    for table in PARTITIONED_LOG_TABLES:
+        retention_period = get_retention_period(table)
+        if retention_period is None:
+            continue
+
+        occurred_before = now - retention_period
+        num_deleted = delete_entries(table.name, occurred_before)
+        num_deleted_by_table_name[table.name] = num_deleted
+
+    return num_deleted_by_table_name
+
+
+def delete_entries(table_name: str, occurred_before: datetime) -> int:
+    """Delete the table's entries which occurred before the given date.
+
+    Whole partitions are dropped where possible. Only the remaining
+    entries (in the partition for the month the date is in, and in the
+    default partition) are deleted one by one.
+
+    Return the number of deleted entries.
+    """
+    num_deleted = 0
+
+    for partition in _get_partitions_before(table_name, occurred_before):
+        num_deleted += partitioning.count_entries(partition.name)
+        _drop_partition(partition)
+
+    quoted_table_name = partitioning.quote_identifier(table_name)
+    result = db.session.execute(
+        text(
+            f'DELETE FROM {quoted_table_name} '  # noqa: S608
+            'WHERE occurred_at < :occurred_before'
+        ),
+        {'occurred_before': occurred_before},
+    )
+    db.session.commit()
+    num_deleted += result.rowcount
+
+    return num_deleted
+
+
+def _get_partitions_before(
+    table_name: str, occurred_before: datetime
+) -> list[MonthlyPartition]:
+    return [
+        partition
+        for partition in partitioning.get_monthly_partitions(table_name)
+        if partition.ends_at <= occurred_before
+    ]
+
+
+def _drop_partition(partition: MonthlyPartition) -> None:
+    partitioning.drop_partition(partition.name)
+    log.info('Log partition dropped', partition=partition.name)
@@ -0,0 +1,27 @@
+"""
+byceps.services.log_retention.models
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class PartitionedLogTable:
+    """A log table partitioned by month (on `occurred_at`)."""
+
+    name: str
+    retention_config_key: str
+
+
+@dataclass(frozen=True)
+class MonthlyPartition:
+    name: str
+    starts_at: datetime
+    ends_at: datetime
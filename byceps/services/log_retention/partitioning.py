@@ -0,0 +1,150 @@
+"""
+byceps.services.log_retention.partitioning
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Manage monthly range partitions of PostgreSQL tables.
+
+Partitions are named after the table they belong to and the month
+they cover, e.g. `ticket_log_entries_y2023m09`. Every partitioned table
+also has a default partition (`<table>_default`) to take entries for
+which no monthly partition exists.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+import re
+
+from sqlalchemy import text
+
+from byceps.database import db
+
+from .models import MonthlyPartition
+
+
+PARTITION_NAME_PATTERN = re.compile(r'^(.+)_y(\d{4})m(\d{2})$')
+
+
+def get_month_start(dt: date) -> datetime:
+    """Return the beginning of the month the date is in."""
+    return datetime(dt.year, dt.month, 1)
+
+
+def get_next_month_start(dt: date) -> datetime:
+    """Return the beginning of the month following the one the date is
+    in.
+    """
+    if dt.month == 12:
+        return datetime(dt.year + 1, 1, 1)
+    else:
+        return datetime(dt.year, dt.month + 1, 1)
+
+
+def quote_identifier(name: str) -> str:
+    """Quote the table or partition name for use in an SQL statement.
+
+    Names cannot be passed as bound parameters, so they have to be
+    inserted into the statement.
+    """
+    return db.engine.dialect.identifier_preparer.quote_identifier(name)
+
+
+def get_partition_name(table_name: str, month_start: date) -> str:
+    return f'{table_name}_y{month_start.year:04d}m{month_start.month:02d}'
+
+
+def get_default_partition_name(table_name: str) -> str:
+    return f'{table_name}_default'
+
+
+def get_monthly_partitions(table_name: str) -> list[MonthlyPartition]:
+    """Return the table's monthly partitions, ordered by time."""
+    partition_names = db.session.scalars(
+        text(
+            '''
+            SELECT child.relname
+            FROM pg_inherits
+              JOIN pg_class AS parent ON pg_inherits.inhparent = parent.oid
+              JOIN pg_class AS child ON pg_inherits.inhrelid = child.oid
+            WHERE parent.relname = :table_name
+            '''
+        ),
+        {'table_name': table_name},
+    ).all()
+
+    partitions = []
+    for partition_name in partition_names:
+        match = PARTITION_NAME_PATTERN.match(partition_name)
+        if (match is None) or (match.group(1) != table_name):
+            continue
+
+        starts_at = datetime(int(match.group(2)), int(match.group(3)), 1)
+        ends_at = get_next_month_start(starts_at)
+        partitions.append(MonthlyPartition(partition_name, starts_at, ends_at))
+
+    partitions.sort(key=lambda partition: partition.starts_at)
+
+    return partitions
+
+
+def create_monthly_partition(table_name: str, month_start: date) -> bool:
+    """Create the partition for the month, unless it already exists.
+
+    A partition cannot be created while the default partition holds
+    entries for that month. In that case, the partition is not created
+    and those entries remain in the default partition.
+
+    Return `True` if the partition has been created.
+    """
+    starts_at = get_month_start(month_start)
+    ends_at = get_next_month_start(starts_at)
+    partition_name = get_partition_name(table_name, starts_at)
+    default_partition_name = get_default_partition_name(table_name)
+
+    existing_names = {p.name for p in get_monthly_partitions(table_name)}
+    if partition_name in existing_names:
+        return False
+
+    default_partition_has_entries_for_month = db.session.scalar(
+        text(
+            f'''
+            SELECT EXISTS (
+              SELECT 1 FROM {quote_identifier(default_partition_name)}
+              WHERE occurred_at >= :starts_at AND occurred_at < :ends_at
+            )
+            '''  # noqa: S608
+        ),
+        {'starts_at': starts_at, 'ends_at': ends_at},
+    )
+    if default_partition_has_entries_for_month:
+        return False
+
+    db.session.execute(
+        text(
+            f'''
+            CREATE TABLE {quote_identifier(partition_name)}
+              PARTITION OF {quote_identifier(table_name)}
+              FOR VALUES FROM ('{starts_at.isoformat()}') TO ('{ends_at.isoformat()}')
+            '''
+        )
+    )
+    db.session.commit()
+
+    return True
+
+
+def count_entries(partition_name: str) -> int:
+    """Return the number of entries in the partition."""
+    sql = (
+        f'SELECT COUNT(*) FROM {quote_identifier(partition_name)}'  # noqa: S608
+    )
+    return db.session.scalar(text(sql))
+
+
+def drop_partition(partition_name: str) -> None:
+    """Drop the partition, including all its entries."""
+    db.session.execute(text(f'DROP TABLE {quote_identifier(partition_name)}'))
+    db.session.commit()
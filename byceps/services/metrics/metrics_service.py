@@ -7,7 +7,11 @@ byceps.metrics.metrics_service
 """
 
 from collections.abc import Iterator
+from datetime import timezone
 
+from flask import current_app
+
+from byceps.services.authentication.api import authn_api_service
 from byceps.services.board import (
     board_posting_query_service,
     board_service,
@@ -15,9 +19,12 @@ from byceps.services.board import (
 )
 from byceps.services.brand import brand_service
 from byceps.services.consent import consent_service
+from byceps.services.email import email_service
+from byceps.services.metrics import query_metrics_service
 from byceps.services.metrics.models import Label, Metric
 from byceps.services.party import party_service
 from byceps.services.party.models import Party
+from byceps.services.periodic_task import periodic_task_service
 from byceps.services.seating import seat_service
 from byceps.services.shop.article import article_service as shop_article_service
 from byceps.services.shop.order import order_service
@@ -26,6 +33,7 @@ from byceps.services.shop.shop.models import Shop, ShopID
 from byceps.services.ticketing import ticket_service
 from byceps.services.user import user_stats_service
 from byceps.typing import BrandID, PartyID
+from byceps.util import jobqueue
 
 
 def serialize(metrics: Iterator[Metric]) -> Iterator[str]:
@@ -43,8 +51,13 @@ def collect_metrics() -> Iterator[Metric]:
     active_shops = shop_service.get_active_shops()
     active_shop_ids = {shop.id for shop in active_shops}
 
+    yield from _collect_api_metrics()
     yield from _collect_board_metrics(brand_ids)
     yield from _collect_consent_metrics()
+    yield from _collect_email_metrics()
+    yield from _collect_job_queue_metrics()
+    yield from _collect_periodic_task_metrics()
+    yield from _collect_query_metrics()
     yield from _collect_shop_ordered_article_metrics(active_shop_ids)
     yield from _collect_shop_order_metrics(active_shops)
     yield from _collect_seating_metrics(active_party_ids)
@@ -52,6 +65,24 @@ def collect_metrics() -> Iterator[Metric]:
     yield from _collect_user_metrics()
 
 
+def _collect_api_metrics() -> Iterator[Metric]:
+    """Provide request counts per API token.
+
+    The counts are kept in Redis, so they are only available if the
+    application has a Redis client.
+    """
+    if not hasattr(current_app, 'redis_client'):
+        return
+
+    request_counts = authn_api_service.get_request_counts()
+    for api_token_id, request_count in request_counts.items():
+        yield Metric(
+            'api_token_request_count',
+            request_count,
+            labels=[Label('api_token', str(api_token_id))],
+        )
+
+
 def _collect_board_metrics(brand_ids: list[BrandID]) -> Iterator[Metric]:
     for brand_id in brand_ids:
         boards = board_service.get_boards_for_brand(brand_id)
@@ -81,6 +112,94 @@ def _collect_consent_metrics() -> Iterator[Metric]:
         )
 
 
+def _collect_email_metrics() -> Iterator[Metric]:
+    """Provide e-mail delivery counts and durations.
+
+    The numbers are kept in Redis, so they are only available if the
+    application has a Redis client.
+    """
+    if not hasattr(current_app, 'redis_client'):
+        return
+
+    stats = email_service.get_delivery_stats()
+
+    yield Metric('email_sent_total', stats.sent_count)
+    yield Metric('email_failed_total', stats.failed_count)
+    yield Metric('email_batches_total', stats.batch_count)
+    yield Metric('email_sending_duration_seconds_total', stats.duration)
+    yield Metric('email_outbox_length', stats.outbox_length)
+
+
+def _collect_job_queue_metrics() -> Iterator[Metric]:
+    """Provide the number of jobs per queue, and how long the oldest
+    waiting job has been waiting.
+
+    The queues are kept in Redis, so they are only available if the
+    application has a Redis client.
+    """
+    if not hasattr(current_app, 'redis_client'):
+        return
+
+    for stats in jobqueue.get_queue_stats(current_app):
+        labels = [Label('queue', stats.name)]
+
+        yield Metric('job_queue_length', stats.length, labels=labels)
+        yield Metric(
+            'job_queue_oldest_job_age_seconds',
+            stats.oldest_job_age,
+            labels=labels,
+        )
+        yield Metric(
+            'job_queue_started_jobs', stats.started_count, labels=labels
+        )
+        yield Metric('job_queue_failed_jobs', stats.failed_count, labels=labels)
+
+
+def _collect_periodic_task_metrics() -> Iterator[Metric]:
+    """Provide details on the last run of each periodic task.
+
+    The runs are recorded in Redis, so they are only available if the
+    application has a Redis client.
+    """
+    if not hasattr(current_app, 'redis_client'):
+        return
+
+    last_runs = periodic_task_service.get_last_runs()
+    for task_name, run in last_runs.items():
+        if run is None:
+            continue
+
+        labels = [Label('task', task_name)]
+
+        yield Metric(
+            'periodic_task_last_run_timestamp_seconds',
+            run.started_at.replace(tzinfo=timezone.utc).timestamp(),
+            labels=labels,
+        )
+        yield Metric(
+            'periodic_task_last_run_duration_seconds',
+            run.duration.total_seconds(),
+            labels=labels,
+        )
+        yield Metric(
+            'periodic_task_last_run_succeeded',
+            int(run.succeeded),
+            labels=labels,
+        )
+
+
+def _collect_query_metrics() -> Iterator[Metric]:
+    """Provide histograms of the SQL statements executed per request.
+
+    The histograms are kept in Redis, so they are only available if the
+    application has a Redis client.
+    """
+    if not hasattr(current_app, 'redis_client'):
+        return
+
+    yield from query_metrics_service.collect_metrics()
+
+
 def _collect_shop_ordered_article_metrics(
     shop_ids: set[ShopID],
 ) -> Iterator[Metric]:
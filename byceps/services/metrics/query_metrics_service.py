@@ -0,0 +1,138 @@
+"""
+byceps.services.metrics.query_metrics_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Histograms of the SQL statements executed per request, per endpoint
+and per service function.
+
+The observations are kept in Redis so that they are aggregated across
+all application processes.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from flask import current_app
+
+from byceps.util.query_stats import QueryStats
+
+from .models import Label, Metric
+
+
+_HISTOGRAMS_KEY = 'byceps:metrics:query_histograms'
+
+
+@dataclass(frozen=True)
+class Histogram:
+    name: str
+    label_name: str
+    buckets: tuple[float, ...]
+
+
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+
+REQUEST_QUERIES = Histogram(
+    'http_request_db_queries', 'endpoint', QUERY_COUNT_BUCKETS
+)
+REQUEST_QUERY_DURATION = Histogram(
+    'http_request_db_duration_seconds', 'endpoint', DURATION_BUCKETS
+)
+FUNCTION_QUERIES = Histogram(
+    'service_function_db_queries', 'function', QUERY_COUNT_BUCKETS
+)
+FUNCTION_QUERY_DURATION = Histogram(
+    'service_function_db_duration_seconds', 'function', DURATION_BUCKETS
+)
+
+
+HISTOGRAMS = [
+    REQUEST_QUERIES,
+    REQUEST_QUERY_DURATION,
+    FUNCTION_QUERIES,
+    FUNCTION_QUERY_DURATION,
+]
+
+
+def observe_request(endpoint: str, stats: QueryStats) -> None:
+    """Record the statements executed during a request."""
+    pipeline = current_app.redis_client.pipeline(transaction=False)
+
+    _observe(pipeline, REQUEST_QUERIES, endpoint, stats.query_count)
+    _observe(pipeline, REQUEST_QUERY_DURATION, endpoint, stats.duration)
+
+    for function, totals in stats.totals_by_function.items():
+        _observe(pipeline, FUNCTION_QUERIES, function, totals.count)
+        _observe(pipeline, FUNCTION_QUERY_DURATION, function, totals.duration)
+
+    pipeline.execute()
+
+
+def _observe(
+    pipeline, histogram: Histogram, label_value: str, value: float
+) -> None:
+    # Only the matching bucket is incremented. The counts are made
+    # cumulative when collected.
+    bucket = _format_bound(_find_upper_bound(histogram.buckets, value))
+    field_prefix = f'{histogram.name}|{label_value}|'
+
+    pipeline.hincrby(_HISTOGRAMS_KEY, field_prefix + bucket, 1)
+    pipeline.hincrbyfloat(_HISTOGRAMS_KEY, field_prefix + 'sum', value)
+    pipeline.hincrby(_HISTOGRAMS_KEY, field_prefix + 'count', 1)
+
+
+def _find_upper_bound(buckets: tuple[float, ...], value: float) -> float:
+    for bound in buckets:
+        if value <= bound:
+            return bound
+
+    return float('inf')
+
+
+def _format_bound(bound: float) -> str:
+    return '+Inf' if bound == float('inf') else str(bound)
+
+
+def collect_metrics() -> Iterator[Metric]:
+    """Provide the histograms in Prometheus' representation."""
+    values = current_app.redis_client.hgetall(_HISTOGRAMS_KEY)
+
+    values_by_series: defaultdict[
+        tuple[str, str], dict[str, float]
+    ] = defaultdict(dict)
+    for field, value in values.items():
+        name, label_value, suffix = field.decode().rsplit('|', 2)
+        values_by_series[name, label_value][suffix] = float(value)
+
+    for histogram in HISTOGRAMS:
+        for (name, label_value), series in sorted(values_by_series.items()):
+            if name == histogram.name:
+                yield from _serialize_histogram(histogram, label_value, series)
+
+
+def _serialize_histogram(
+    histogram: Histogram, label_value: str, series: dict[str, float]
+) -> Iterator[Metric]:
+    label = Label(histogram.label_name, label_value)
+
+    cumulative_count = 0.0
+    for bound in histogram.buckets + (float('inf'),):
+        bound_str = _format_bound(bound)
+        cumulative_count += series.get(bound_str, 0)
+        yield Metric(
+            f'{histogram.name}_bucket',
+            int(cumulative_count),
+            labels=[label, Label('le', bound_str)],
+        )
+
+    yield Metric(f'{histogram.name}_sum', series.get('sum', 0), labels=[label])
+    yield Metric(
+        f'{histogram.name}_count', int(series.get('count', 0)), labels=[label]
+    )
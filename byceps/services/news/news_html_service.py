@@ -16,7 +16,6 @@ from typing import Any
 from flask import current_app
 from flask_babel import gettext
 from markupsafe import Markup
-import mistletoe
 
 from byceps.util.iterables import find
 from byceps.util.result import Err, Ok, Result
@@ -33,12 +32,19 @@ def render_body_html(item: NewsItem) -> Result[str, str]:
     try:
         html = template.render(render_image=render_image)
         if item.body_format == BodyFormat.markdown:
-            html = mistletoe.markdown(html)
+            html = _render_markdown(html)
         return Ok(html)
     except Exception as exc:
         return Err(str(exc))
 
 
+def _render_markdown(text: str) -> str:
+    # Imported on first use as it takes a while to load.
+    import mistletoe
+
+    return mistletoe.markdown(text)
+
+
 def render_featured_image_html(image: NewsImage) -> Result[str, str]:
     """Render item's featured image to HTML."""
     try:
@@ -39,6 +39,8 @@ def delete_list(list_id: ListID) -> None:
     db.session.execute(delete(DbList).filter_by(id=list_id))
     db.session.commit()
 
+    newsletter_service.forget_loaded_lists()
+
 
 def subscribe(user_id: UserID, list_id: ListID, expressed_at: datetime) -> None:
     """Subscribe the user to that list."""
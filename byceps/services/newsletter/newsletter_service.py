@@ -8,13 +8,15 @@ byceps.services.newsletter.newsletter_service
 
 from __future__ import annotations
 
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from operator import attrgetter
 
 from sqlalchemy import select
 
 from byceps.database import db
 from byceps.services.user.dbmodels.user import DbUser
 from byceps.typing import UserID
+from byceps.util.dataloader import DataLoader
 
 from .dbmodels import DbList, DbSubscription, DbSubscriptionUpdate
 from .models import List, ListID, Subscriber
@@ -30,6 +32,42 @@ def find_list(list_id: ListID) -> List | None:
     return _db_entity_to_list(db_list)
 
 
+def get_lists(list_ids: set[ListID]) -> list[List]:
+    """Return the lists with those IDs."""
+    if not list_ids:
+        return []
+
+    db_lists = db.session.scalars(
+        select(DbList).filter(DbList.id.in_(list_ids))
+    ).all()
+
+    return [_db_entity_to_list(db_list) for db_list in db_lists]
+
+
+def index_lists_by_id(lists: Iterable[List]) -> dict[ListID, List]:
+    """Map the lists' IDs to the corresponding list objects."""
+    return {list_.id: list_ for list_ in lists}
+
+
+def load_lists(list_ids: set[ListID]) -> dict[ListID, List]:
+    """Return the lists with those IDs, indexed by ID.
+
+    Lists already loaded this way during the current request are
+    not fetched again.
+    """
+    return _list_loader.get_many(list_ids)
+
+
+_list_loader: DataLoader[ListID, List] = DataLoader(
+    'newsletter_list', get_lists, attrgetter('id')
+)
+
+
+def forget_loaded_lists() -> None:
+    """Forget the lists loaded during the current request."""
+    _list_loader.clear()
+
+
 def get_all_lists() -> list[List]:
     """Return all lists."""
     db_lists = db.session.scalars(select(DbList)).all()
@@ -92,6 +130,15 @@ def get_subscription_updates_for_user(
     ).all()
 
 
+def get_subscribed_list_ids(user_id: UserID) -> set[ListID]:
+    """Return the IDs of the lists the user is subscribed to."""
+    list_ids = db.session.scalars(
+        select(DbSubscription.list_id).filter_by(user_id=user_id)
+    ).all()
+
+    return set(list_ids)
+
+
 def is_subscribed(user_id: UserID, list_id: ListID) -> bool:
     """Return if the user is subscribed to the list or not."""
     return db.session.scalar(
@@ -55,3 +55,15 @@ class PageAggregate(Page):
     title: str
     head: str | None
     body: str
+
+
+@dataclass(frozen=True)
+class PageRoute:
+    page: Page
+    current_version_id: PageVersionID
+
+
+@dataclass(frozen=True)
+class PageRoutingTable:
+    routes_by_url_path: dict[tuple[str, str], PageRoute]  # (language, path)
+    url_paths_by_page_name: dict[str, str]
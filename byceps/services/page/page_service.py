@@ -24,17 +24,28 @@ from byceps.services.site_navigation.models import NavMenuID
 from byceps.services.user import user_service
 from byceps.services.user.models.user import User
 from byceps.typing import UserID
+from byceps.util.caching import Cache
 
 from .dbmodels import DbCurrentPageVersionAssociation, DbPage, DbPageVersion
 from .models import (
     Page,
     PageAggregate,
     PageID,
+    PageRoute,
+    PageRoutingTable,
     PageVersion,
     PageVersionID,
 )
 
 
+# Pages rarely change, but are resolved on every page request. Entries
+# expire as a safeguard against changes that do not invalidate the cache
+# (e.g. made directly in the database).
+_routing_table_cache: Cache[SiteID, PageRoutingTable] = Cache(
+    'page_routing_table', ttl=3600
+)
+
+
 def create_page(
     site_id: SiteID,
     name: str,
@@ -62,6 +73,8 @@ def create_page(
 
     db.session.commit()
 
+    _routing_table_cache.invalidate()
+
     event = PageCreatedEvent(
         occurred_at=db_version.created_at,
         initiator_id=creator.id,
@@ -99,6 +112,8 @@ def update_page(
 
     db.session.commit()
 
+    _routing_table_cache.invalidate()
+
     event = PageUpdatedEvent(
         occurred_at=db_version.created_at,
         initiator_id=creator.id,
@@ -154,6 +169,8 @@ def delete_page(
         db.session.rollback()
         return False, None
 
+    _routing_table_cache.invalidate()
+
     event = PageDeletedEvent(
         occurred_at=datetime.utcnow(),
         initiator_id=initiator.id if initiator else None,
@@ -173,6 +190,8 @@ def set_nav_menu_id(page_id: PageID, nav_menu_id: NavMenuID | None) -> None:
     db_page.nav_menu_id = nav_menu_id
     db.session.commit()
 
+    _routing_table_cache.invalidate()
+
 
 def find_page(page_id: PageID) -> Page | None:
     """Return the page, or `None` if not found."""
@@ -291,29 +310,45 @@ def find_current_version_for_name(
     ).scalar_one_or_none()
 
 
-def find_current_version_for_url_path(
+def find_route_for_url_path(
     site_id: SiteID, url_path: str, language_code: str
-) -> DbPageVersion | None:
-    """Return the current version of the page with that URL path and
-    language code for that site.
+) -> PageRoute | None:
+    """Return the route to the current version of the page with that
+    URL path and language code for that site.
     """
-    return db.session.execute(
-        select(DbPageVersion)
-        .join(DbCurrentPageVersionAssociation)
-        .join(DbPage)
-        .filter(DbPage.site_id == site_id)
-        .filter(DbPage.language_code == language_code)
-        .filter(DbPage.url_path == url_path)
-    ).scalar_one_or_none()
+    routing_table = get_routing_table(site_id)
+    return routing_table.routes_by_url_path.get((language_code, url_path))
 
 
 def get_url_paths_by_page_name_for_site(site_id: SiteID) -> dict[str, str]:
     """Return mapping from page names to URL paths for that site."""
+    return get_routing_table(site_id).url_paths_by_page_name
+
+
+def get_routing_table(site_id: SiteID) -> PageRoutingTable:
+    """Return the routing table for that site's pages."""
+    return _routing_table_cache.get_or_load(site_id, _load_routing_table)
+
+
+def _load_routing_table(site_id: SiteID) -> PageRoutingTable:
     rows = db.session.execute(
-        select(DbPage.name, DbPage.url_path).filter_by(site_id=site_id)
+        select(DbPage, DbCurrentPageVersionAssociation.version_id)
+        .join(DbCurrentPageVersionAssociation)
+        .filter(DbPage.site_id == site_id)
     ).all()
 
-    return dict(rows)
+    routes_by_url_path = {}
+    url_paths_by_page_name = {}
+    for db_page, current_version_id in rows:
+        page = _db_entity_to_page(db_page)
+        route = PageRoute(page=page, current_version_id=current_version_id)
+        routes_by_url_path[page.language_code, page.url_path] = route
+        url_paths_by_page_name[page.name] = page.url_path
+
+    return PageRoutingTable(
+        routes_by_url_path=routes_by_url_path,
+        url_paths_by_page_name=url_paths_by_page_name,
+    )
 
 
 def get_pages_for_site(site_id: SiteID) -> Sequence[Page]:
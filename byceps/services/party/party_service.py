@@ -8,8 +8,10 @@ byceps.services.party.party_service
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 import dataclasses
 from datetime import date, datetime, timedelta
+from operator import attrgetter
 from typing import Callable
 
 from sqlalchemy import delete, select
@@ -18,7 +20,9 @@ from byceps.database import db, paginate, Pagination
 from byceps.services.brand import brand_service
 from byceps.services.brand.dbmodels.brand import DbBrand
 from byceps.typing import BrandID, PartyID
+from byceps.util.dataloader import DataLoader
 
+from . import party_setting_service
 from .dbmodels.party import DbParty
 from .dbmodels.setting import DbSetting
 from .models import Party, PartyWithBrand
@@ -85,6 +89,8 @@ def update_party(
 
     db.session.commit()
 
+    _party_loader.clear()
+
     return _db_entity_to_party(db_party)
 
 
@@ -94,6 +100,10 @@ def delete_party(party_id: PartyID) -> None:
     db.session.execute(delete(DbParty).where(DbParty.id == party_id))
     db.session.commit()
 
+    _party_loader.clear()
+
+    party_setting_service.invalidate_cached_settings(party_id)
+
 
 def count_parties() -> int:
     """Return the number of parties (of all brands)."""
@@ -202,6 +212,25 @@ def get_parties(party_ids: set[PartyID]) -> list[Party]:
     return [_db_entity_to_party(db_party) for db_party in db_parties]
 
 
+def index_parties_by_id(parties: Iterable[Party]) -> dict[PartyID, Party]:
+    """Map the parties' IDs to the corresponding party objects."""
+    return {party.id: party for party in parties}
+
+
+def load_parties(party_ids: set[PartyID]) -> dict[PartyID, Party]:
+    """Return the parties with those IDs, indexed by ID.
+
+    Parties already loaded this way during the current request are
+    not fetched again.
+    """
+    return _party_loader.get_many(party_ids)
+
+
+_party_loader: DataLoader[PartyID, Party] = DataLoader(
+    'party', get_parties, attrgetter('id')
+)
+
+
 def get_parties_for_brand(brand_id: BrandID) -> list[Party]:
     """Return the parties for that brand."""
     db_parties = db.session.scalars(
@@ -12,11 +12,16 @@ from sqlalchemy import delete, select
 
 from byceps.database import db, upsert
 from byceps.typing import PartyID
+from byceps.util.caching import Cache
 
 from .dbmodels.setting import DbSetting
 from .models import PartySetting
 
 
+# Settings are read several times per request, but rarely change.
+_cache: Cache[PartyID, dict[str, str]] = Cache('party_settings')
+
+
 def create_setting(party_id: PartyID, name: str, value: str) -> PartySetting:
     """Create a setting for that party."""
     db_setting = DbSetting(party_id, name, value)
@@ -24,6 +29,8 @@ def create_setting(party_id: PartyID, name: str, value: str) -> PartySetting:
     db.session.add(db_setting)
     db.session.commit()
 
+    _cache.invalidate_keys([party_id])
+
     return _db_entity_to_party_setting(db_setting)
 
 
@@ -44,6 +51,8 @@ def create_or_update_setting(
 
     upsert(table, identifier, replacement)
 
+    _cache.invalidate_keys([party_id])
+
     return find_setting(party_id, name)
 
 
@@ -59,42 +68,59 @@ def remove_setting(party_id: PartyID, name: str) -> None:
     )
     db.session.commit()
 
+    _cache.invalidate_keys([party_id])
+
 
 def find_setting(party_id: PartyID, name: str) -> PartySetting | None:
     """Return the setting for that party and with that name, or `None`
     if not found.
     """
-    db_setting = db.session.get(DbSetting, (party_id, name))
+    value = find_setting_value(party_id, name)
 
-    if db_setting is None:
+    if value is None:
         return None
 
-    return _db_entity_to_party_setting(db_setting)
+    return PartySetting(party_id, name, value)
 
 
 def find_setting_value(party_id: PartyID, name: str) -> str | None:
     """Return the value of the setting for that party and with that
     name, or `None` if not found.
     """
-    setting = find_setting(party_id, name)
-
-    if setting is None:
-        return None
-
-    return setting.value
+    return _get_values_by_name(party_id).get(name)
 
 
 def get_settings(party_id: PartyID) -> set[PartySetting]:
     """Return all settings for that party."""
-    db_settings = db.session.scalars(
-        select(DbSetting).filter_by(party_id=party_id)
-    ).all()
-
     return {
-        _db_entity_to_party_setting(db_setting) for db_setting in db_settings
+        PartySetting(party_id, name, value)
+        for name, value in _get_values_by_name(party_id).items()
     }
 
 
+def _get_values_by_name(party_id: PartyID) -> dict[str, str]:
+    """Return the party's setting values by name, from the cache if
+    available.
+    """
+    return _cache.get_or_load(party_id, _load_values_by_name)
+
+
+def _load_values_by_name(party_id: PartyID) -> dict[str, str]:
+    rows = db.session.execute(
+        select(DbSetting.name, DbSetting.value).filter_by(party_id=party_id)
+    ).all()
+    return dict(rows)
+
+
+def invalidate_cached_settings(party_id: PartyID) -> None:
+    """Drop the party's cached settings (in all processes).
+
+    To be called after settings have been changed other than through
+    this module.
+    """
+    _cache.invalidate_keys([party_id])
+
+
 def _db_entity_to_party_setting(db_setting: DbSetting) -> PartySetting:
     return PartySetting(
         db_setting.party_id,
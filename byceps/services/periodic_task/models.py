@@ -0,0 +1,71 @@
+"""
+byceps.services.periodic_task.models
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Union
+
+
+EPOCH = datetime(1970, 1, 1)
+
+
+@dataclass(frozen=True)
+class DailyAt:
+    """Run once a day at the given time (UTC)."""
+
+    hour: int
+    minute: int = 0
+
+    def get_next_run(self, after: datetime) -> datetime:
+        run = after.replace(
+            hour=self.hour, minute=self.minute, second=0, microsecond=0
+        )
+        if run <= after:
+            run += timedelta(days=1)
+        return run
+
+    def describe(self) -> str:
+        return f'daily at {self.hour:02d}:{self.minute:02d} UTC'
+
+
+@dataclass(frozen=True)
+class Every:
+    """Run repeatedly, separated by the given interval.
+
+    Runs are aligned to multiples of the interval (since the epoch), so
+    that every worker arrives at the same points in time.
+    """
+
+    interval: timedelta
+
+    def get_next_run(self, after: datetime) -> datetime:
+        elapsed_intervals = (after - EPOCH) // self.interval
+        return EPOCH + (elapsed_intervals + 1) * self.interval
+
+    def describe(self) -> str:
+        return f'every {self.interval}'
+
+
+Schedule = Union[DailyAt, Every]
+
+
+@dataclass(frozen=True)
+class PeriodicTask:
+    name: str
+    func: Callable[[], Any]
+    schedule: Schedule
+    description: str
+
+
+@dataclass(frozen=True)
+class PeriodicTaskRun:
+    started_at: datetime
+    duration: timedelta
+    succeeded: bool
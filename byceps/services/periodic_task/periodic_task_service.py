@@ -0,0 +1,193 @@
+"""
+byceps.services.periodic_task.periodic_task_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Run tasks periodically via the job queue's scheduler.
+
+On start, each worker schedules the next run of every task. The job
+for a run is identified by task and time, so workers scheduling the
+same run do not produce duplicates. After a run, the next one is
+scheduled.
+
+A lock ensures that only one worker runs a task at a time, and that
+each scheduled run is executed only once.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from time import monotonic
+
+from flask import current_app
+import structlog
+
+from byceps.util.jobqueue import BULK_QUEUE_NAME, enqueue_at
+
+from .models import PeriodicTask, PeriodicTaskRun
+from .tasks import PERIODIC_TASKS
+
+
+log = structlog.get_logger()
+
+
+LOCK_TIMEOUT = timedelta(hours=1)
+
+
+def get_tasks() -> list[PeriodicTask]:
+    """Return all periodic tasks."""
+    return PERIODIC_TASKS
+
+
+def find_task(name: str) -> PeriodicTask | None:
+    """Return the periodic task with that name, or `None` if not found."""
+    for task in PERIODIC_TASKS:
+        if task.name == name:
+            return task
+
+    return None
+
+
+def schedule_tasks(*, now: datetime | None = None) -> None:
+    """Schedule the next run of every periodic task."""
+    if now is None:
+        now = datetime.utcnow()
+
+    for task in PERIODIC_TASKS:
+        _schedule_next_run(task, now)
+
+
+def _schedule_next_run(task: PeriodicTask, after: datetime) -> None:
+    scheduled_for = task.schedule.get_next_run(after)
+    job_id = f'periodic-task:{task.name}:{scheduled_for:%Y%m%dT%H%M%S}'
+
+    enqueue_at(
+        scheduled_for,
+        run_task,
+        task.name,
+        scheduled_for,
+        job_id=job_id,
+        queue=BULK_QUEUE_NAME,
+    )
+
+
+def run_task(name: str, scheduled_for: datetime) -> None:
+    """Run the scheduled task, unless it is already running or the run
+    has already been executed. Then schedule the next run.
+    """
+    task = find_task(name)
+    if task is None:
+        log.warning('Unknown periodic task', task=name)
+        return
+
+    try:
+        if not _acquire_lock(task, scheduled_for):
+            log.info('Periodic task already running', task=name)
+            return
+
+        try:
+            if _has_run(task, scheduled_for):
+                return
+
+            _run_task(task, scheduled_for)
+        finally:
+            _release_lock(task, scheduled_for)
+    finally:
+        # Do not try to catch up on runs missed while no worker was
+        # running.
+        now = datetime.utcnow()
+        _schedule_next_run(task, max(scheduled_for, now))
+
+
+def _run_task(task: PeriodicTask, scheduled_for: datetime) -> None:
+    started_at = datetime.utcnow()
+    start = monotonic()
+    succeeded = False
+
+    try:
+        task.func()
+        succeeded = True
+    except Exception:
+        log.exception('Periodic task failed', task=task.name)
+    finally:
+        duration = timedelta(seconds=monotonic() - start)
+        run = PeriodicTaskRun(
+            started_at=started_at, duration=duration, succeeded=succeeded
+        )
+        _store_last_run(task, scheduled_for, run)
+
+    log.info(
+        'Periodic task run',
+        task=task.name,
+        duration=duration.total_seconds(),
+        succeeded=succeeded,
+    )
+
+
+def _acquire_lock(task: PeriodicTask, scheduled_for: datetime) -> bool:
+    return bool(
+        current_app.redis_client.set(
+            _get_lock_key(task),
+            scheduled_for.isoformat(),
+            nx=True,
+            ex=LOCK_TIMEOUT,
+        )
+    )
+
+
+def _release_lock(task: PeriodicTask, scheduled_for: datetime) -> None:
+    key = _get_lock_key(task)
+    value = current_app.redis_client.get(key)
+    if (value is not None) and (value.decode() == scheduled_for.isoformat()):
+        current_app.redis_client.delete(key)
+
+
+def _get_lock_key(task: PeriodicTask) -> str:
+    return f'byceps:periodic_tasks:{task.name}:lock'
+
+
+def _has_run(task: PeriodicTask, scheduled_for: datetime) -> bool:
+    last_scheduled_for = current_app.redis_client.hget(
+        _get_last_run_key(task), 'scheduled_for'
+    )
+    return (last_scheduled_for is not None) and (
+        last_scheduled_for.decode() == scheduled_for.isoformat()
+    )
+
+
+def _store_last_run(
+    task: PeriodicTask, scheduled_for: datetime, run: PeriodicTaskRun
+) -> None:
+    current_app.redis_client.hset(
+        _get_last_run_key(task),
+        mapping={
+            'scheduled_for': scheduled_for.isoformat(),
+            'started_at': run.started_at.isoformat(),
+            'duration': run.duration.total_seconds(),
+            'succeeded': int(run.succeeded),
+        },
+    )
+
+
+def get_last_runs() -> dict[str, PeriodicTaskRun | None]:
+    """Return the last run of each periodic task, if any."""
+    return {task.name: find_last_run(task) for task in PERIODIC_TASKS}
+
+
+def find_last_run(task: PeriodicTask) -> PeriodicTaskRun | None:
+    """Return the last run of the periodic task, if any."""
+    values = current_app.redis_client.hgetall(_get_last_run_key(task))
+    if not values:
+        return None
+
+    return PeriodicTaskRun(
+        started_at=datetime.fromisoformat(values[b'started_at'].decode()),
+        duration=timedelta(seconds=float(values[b'duration'])),
+        succeeded=values[b'succeeded'] == b'1',
+    )
+
+
+def _get_last_run_key(task: PeriodicTask) -> str:
+    return f'byceps:periodic_tasks:{task.name}:last_run'
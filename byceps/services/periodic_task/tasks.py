@@ -0,0 +1,77 @@
+"""
+byceps.services.periodic_task.tasks
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+The periodic tasks run by the job queue workers.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import structlog
+
+from byceps.services.log_retention import log_retention_service
+from byceps.services.verification_token import verification_token_service
+from byceps.util import upload
+
+from .models import DailyAt, PeriodicTask
+
+
+log = structlog.get_logger()
+
+
+VERIFICATION_TOKEN_MINIMUM_AGE = timedelta(days=7)
+
+
+def delete_old_verification_tokens() -> None:
+    created_before = datetime.utcnow() - VERIFICATION_TOKEN_MINIMUM_AGE
+    num_deleted = verification_token_service.delete_old_tokens(created_before)
+    log.info('Old verification tokens deleted', num_deleted=num_deleted)
+
+
+def maintain_log_partitions() -> None:
+    log_retention_service.create_upcoming_partitions()
+
+    num_deleted_by_table_name = log_retention_service.apply_retention_policies()
+    for table_name, num_deleted in num_deleted_by_table_name.items():
+        log.info(
+            'Old log entries deleted', table=table_name, num_deleted=num_deleted
+        )
+
+
+def sweep_blobs() -> None:
+    report = upload.sweep_blobs()
+    log.info(
+        'Unreferenced blobs deleted',
+        num_deleted=report.num_deleted,
+        bytes_reclaimed=report.bytes_reclaimed,
+    )
+
+
+PERIODIC_TASKS = [
+    PeriodicTask(
+        name='delete-old-verification-tokens',
+        func=delete_old_verification_tokens,
+        schedule=DailyAt(hour=3, minute=30),
+        description='Delete verification tokens older than 7 days.',
+    ),
+    PeriodicTask(
+        name='maintain-log-partitions',
+        func=maintain_log_partitions,
+        schedule=DailyAt(hour=3),
+        description=(
+            'Create upcoming log partitions and delete log entries '
+            'beyond their retention period.'
+        ),
+    ),
+    PeriodicTask(
+        name='sweep-blobs',
+        func=sweep_blobs,
+        schedule=DailyAt(hour=4),
+        description='Delete uploaded files that are no longer referenced.',
+    ),
+]
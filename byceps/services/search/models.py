@@ -0,0 +1,31 @@
+"""
+byceps.services.search.models
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from uuid import UUID
+
+
+SearchResultType = Enum(
+    'SearchResultType',
+    [
+        'order',
+        'ticket',
+        'user',
+    ],
+)
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    type: SearchResultType
+    id: UUID
+    label: str | None
+    score: float
@@ -0,0 +1,152 @@
+"""
+byceps.services.search.search_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Search across users, tickets, and orders in a single database query.
+
+Matching relies on trigram indexes (provided by PostgreSQL's `pg_trgm`
+extension) on the searched columns, and results are ranked by trigram
+similarity.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import literal, select, union_all
+from sqlalchemy.sql import Select
+
+from byceps.database import db
+from byceps.services.shop.order.dbmodels.order import DbOrder
+from byceps.services.shop.shop.models import ShopID
+from byceps.services.ticketing.dbmodels.ticket import DbTicket
+from byceps.services.user.dbmodels.detail import DbUserDetail
+from byceps.services.user.dbmodels.user import DbUser
+from byceps.typing import PartyID
+
+from .models import SearchResult, SearchResultType
+
+
+DEFAULT_LIMIT = 10
+
+
+def search(
+    search_term: str,
+    *,
+    party_id: PartyID | None = None,
+    shop_id: ShopID | None = None,
+    limit: int = DEFAULT_LIMIT,
+) -> list[SearchResult]:
+    """Return the best matches for the search term, best first.
+
+    Users are always searched. Tickets are only searched if a party is
+    given, orders only if a shop is given.
+
+    Deleted user accounts are excluded.
+    """
+    search_term = search_term.strip()
+    if not search_term:
+        return []
+
+    stmts = [_build_user_stmt(search_term)]
+
+    if party_id is not None:
+        stmts.append(_build_ticket_stmt(search_term, party_id))
+
+    if shop_id is not None:
+        stmts.append(_build_order_stmt(search_term, shop_id))
+
+    hits = union_all(*stmts).subquery()
+
+    rows = db.session.execute(
+        select(hits.c.type, hits.c.id, hits.c.label, hits.c.score)
+        .order_by(hits.c.score.desc(), hits.c.label)
+        .limit(limit)
+    ).all()
+
+    return [
+        SearchResult(
+            type=SearchResultType[type_name],
+            id=id,
+            label=label,
+            score=score,
+        )
+        for type_name, id, label, score in rows
+    ]
+
+
+def _build_user_stmt(search_term: str) -> Select:
+    full_name = db.func.concat_ws(
+        ' ', DbUserDetail.first_name, DbUserDetail.last_name
+    )
+
+    score = db.func.greatest(
+        _similarity(DbUser.screen_name, search_term),
+        _similarity(DbUser.email_address, search_term),
+        _similarity(full_name, search_term),
+    )
+
+    # Every word has to match at least one of the columns.
+    words = search_term.split()
+    clauses = [_generate_user_clause_for_word(word) for word in words]
+
+    return (
+        select(
+            literal(SearchResultType.user.name).label('type'),
+            DbUser.id.label('id'),
+            DbUser.screen_name.label('label'),
+            score.label('score'),
+        )
+        .outerjoin(DbUserDetail)
+        .filter(DbUser.deleted == False)  # noqa: E712
+        .filter(db.and_(*clauses))
+    )
+
+
+def _generate_user_clause_for_word(word: str):
+    ilike_pattern = f'%{word}%'
+
+    return db.or_(
+        DbUser.email_address.ilike(ilike_pattern),
+        DbUser.screen_name.ilike(ilike_pattern),
+        DbUserDetail.first_name.ilike(ilike_pattern),
+        DbUserDetail.last_name.ilike(ilike_pattern),
+    )
+
+
+def _build_ticket_stmt(search_term: str, party_id: PartyID) -> Select:
+    ilike_pattern = f'%{search_term}%'
+
+    return (
+        select(
+            literal(SearchResultType.ticket.name).label('type'),
+            DbTicket.id.label('id'),
+            DbTicket.code.label('label'),
+            _similarity(DbTicket.code, search_term).label('score'),
+        )
+        .filter(DbTicket.party_id == party_id)
+        .filter(DbTicket.code.ilike(ilike_pattern))
+    )
+
+
+def _build_order_stmt(search_term: str, shop_id: ShopID) -> Select:
+    ilike_pattern = f'%{search_term}%'
+
+    return (
+        select(
+            literal(SearchResultType.order.name).label('type'),
+            DbOrder.id.label('id'),
+            DbOrder.order_number.label('label'),
+            _similarity(DbOrder.order_number, search_term).label('score'),
+        )
+        .filter(DbOrder.shop_id == shop_id)
+        .filter(DbOrder.order_number.ilike(ilike_pattern))
+    )
+
+
+def _similarity(column, search_term: str):
+    """Return the trigram similarity of the column's value to the
+    search term, or zero if the value is `NULL`.
+    """
+    return db.func.coalesce(db.func.similarity(column, search_term), 0)
@@ -12,6 +12,7 @@ from collections import defaultdict
 from collections.abc import Iterable
 from datetime import datetime
 from decimal import Decimal
+from operator import attrgetter
 
 from moneyed import Money
 from sqlalchemy import delete, select, update
@@ -24,6 +25,7 @@ from byceps.services.shop.order.dbmodels.order import DbOrder
 from byceps.services.shop.order.models.order import PaymentState
 from byceps.services.shop.shop.models import ShopID
 from byceps.services.ticketing.models.ticket import TicketCategoryID
+from byceps.util.dataloader import DataLoader
 
 from .dbmodels.article import DbArticle
 from .dbmodels.attached_article import DbAttachedArticle
@@ -192,6 +194,8 @@ def update_article(
 
     db.session.commit()
 
+    _article_loader.clear()
+
     return _db_entity_to_article(db_article)
 
 
@@ -230,6 +234,8 @@ def increase_quantity(
     if commit:
         db.session.commit()
 
+    _article_loader.clear()
+
 
 def decrease_quantity(
     article_id: ArticleID, quantity_to_decrease_by: int, *, commit: bool = True
@@ -244,12 +250,16 @@ def decrease_quantity(
     if commit:
         db.session.commit()
 
+    _article_loader.clear()
+
 
 def delete_article(article_id: ArticleID) -> None:
     """Delete an article."""
     db.session.execute(delete(DbArticle).filter_by(id=article_id))
     db.session.commit()
 
+    _article_loader.clear()
+
 
 def find_article(article_id: ArticleID) -> Article | None:
     """Return the article with that ID, or `None` if not found."""
@@ -364,6 +374,27 @@ def get_articles(article_ids: set[ArticleID]) -> list[Article]:
     return [_db_entity_to_article(db_article) for db_article in db_articles]
 
 
+def index_articles_by_id(
+    articles: Iterable[Article],
+) -> dict[ArticleID, Article]:
+    """Map the articles' IDs to the corresponding article objects."""
+    return {article.id: article for article in articles}
+
+
+def load_articles(article_ids: set[ArticleID]) -> dict[ArticleID, Article]:
+    """Return the articles with those IDs, indexed by ID.
+
+    Articles already loaded this way during the current request are
+    not fetched again.
+    """
+    return _article_loader.get_many(article_ids)
+
+
+_article_loader: DataLoader[ArticleID, Article] = DataLoader(
+    'shop_article', get_articles, attrgetter('id')
+)
+
+
 def get_articles_for_shop(shop_id: ShopID) -> list[Article]:
     """Return all articles for that shop, ordered by article number."""
     db_articles = db.session.scalars(
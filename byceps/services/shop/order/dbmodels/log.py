@@ -9,6 +9,8 @@ byceps.services.shop.order.dbmodels.log
 from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import DDL, event
+
 from byceps.database import db
 from byceps.services.shop.order.models.log import OrderLogEntryData
 from byceps.services.shop.order.models.order import OrderID
@@ -16,12 +18,25 @@ from byceps.util.instances import ReprBuilder
 
 
 class DbOrderLogEntry(db.Model):
-    """A log entry regarding an order."""
+    """A log entry regarding an order.
+
+    The table is partitioned by month.
+    """
 
     __tablename__ = 'shop_order_log_entries'
+    __table_args__ = (
+        db.Index(
+            'ix_shop_order_log_entries_initiator_id',
+            db.text("(data ->> 'initiator_id')"),
+        ),
+        {'postgresql_partition_by': 'RANGE (occurred_at)'},
+    )
+    # The partition key has to be part of the primary key, but entries
+    # are still identified by their ID alone.
+    __mapper_args__ = {'primary_key': ['id']}
 
     id = db.Column(db.Uuid, primary_key=True)
-    occurred_at = db.Column(db.DateTime, nullable=False)
+    occurred_at = db.Column(db.DateTime, primary_key=True)
     event_type = db.Column(db.UnicodeText, index=True, nullable=False)
     order_id = db.Column(
         db.Uuid, db.ForeignKey('shop_orders.id'), index=True, nullable=False
@@ -50,3 +65,15 @@ class DbOrderLogEntry(db.Model):
             .add_with_lookup('data')
             .build()
         )
+
+
+event.listen(
+    DbOrderLogEntry.__table__,
+    'after_create',
+    DDL(
+        '''
+        CREATE TABLE shop_order_log_entries_default
+            PARTITION OF shop_order_log_entries DEFAULT;
+        '''
+    ),
+)
@@ -33,6 +33,14 @@ class DbOrder(db.Model):
     """An order for articles, placed by a user."""
 
     __tablename__ = 'shop_orders'
+    __table_args__ = (
+        db.Index(
+            'ix_shop_orders_order_number_trgm',
+            'order_number',
+            postgresql_using='gin',
+            postgresql_ops={'order_number': 'gin_trgm_ops'},
+        ),
+    )
 
     id = db.Column(db.Uuid, default=generate_uuid7, primary_key=True)
     created_at = db.Column(db.DateTime, nullable=False)
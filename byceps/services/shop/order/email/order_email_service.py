@@ -8,11 +8,15 @@ Notification e-mails about shop orders
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
+
+from collections.abc import Iterable
 from dataclasses import dataclass
-from functools import partial
+from functools import cache, partial
 from typing import Callable
 
 from flask_babel import force_locale, format_date, gettext
+import structlog
 
 from byceps.services.email import (
     email_config_service,
@@ -26,9 +30,13 @@ from byceps.services.shop.shop import shop_service
 from byceps.services.user import user_service
 from byceps.services.user.models.user import User
 from byceps.typing import BrandID
+from byceps.util.jobqueue import enqueue
 from byceps.util.l10n import format_money, get_user_locale
 
 
+log = structlog.get_logger()
+
+
 @dataclass(frozen=True)
 class OrderEmailData:
     sender: NameAndAddress
@@ -71,6 +79,187 @@ def send_email_for_paid_order_to_orderer(order_id: OrderID) -> None:
     _send_email(message)
 
 
+# -------------------------------------------------------------------- #
+# batches
+
+
+def enqueue_emails_for_incoming_orders_to_orderers(
+    order_ids: Iterable[OrderID],
+) -> None:
+    """Have the e-mails for these incoming orders be assembled and sent
+    in the background, by a single job.
+    """
+    _enqueue_emails(send_emails_for_incoming_orders_to_orderers, order_ids)
+
+
+def enqueue_emails_for_canceled_orders_to_orderers(
+    order_ids: Iterable[OrderID],
+) -> None:
+    """Have the e-mails for these canceled orders be assembled and sent
+    in the background, by a single job.
+    """
+    _enqueue_emails(send_emails_for_canceled_orders_to_orderers, order_ids)
+
+
+def enqueue_emails_for_paid_orders_to_orderers(
+    order_ids: Iterable[OrderID],
+) -> None:
+    """Have the e-mails for these paid orders be assembled and sent in
+    the background, by a single job.
+    """
+    _enqueue_emails(send_emails_for_paid_orders_to_orderers, order_ids)
+
+
+def _enqueue_emails(
+    func: Callable[[set[OrderID]], None], order_ids: Iterable[OrderID]
+) -> None:
+    order_ids = set(order_ids)
+    if not order_ids:
+        return
+
+    enqueue(func, order_ids)
+
+
+def send_emails_for_incoming_orders_to_orderers(
+    order_ids: set[OrderID],
+) -> None:
+    """Assemble the e-mails for the incoming orders, and enqueue them
+    at once.
+
+    Payment instruction templates are loaded only once per shop and
+    language.
+    """
+    get_payment_instructions_template = cache(
+        order_payment_service.get_email_payment_instructions_template
+    )
+
+    def assemble(
+        data: OrderEmailData, language_code: str, footer: str
+    ) -> Message:
+        template = get_payment_instructions_template(
+            data.order.shop_id, language_code
+        )
+        payment_instructions = (
+            order_payment_service.render_email_payment_instructions(
+                template, data.order
+            )
+        )
+
+        return _assemble_email(
+            data,
+            language_code,
+            footer,
+            partial(
+                assemble_text_for_incoming_order_to_orderer,
+                payment_instructions=payment_instructions,
+            ),
+        )
+
+    _send_emails_for_orders(order_ids, assemble)
+
+
+def send_emails_for_canceled_orders_to_orderers(
+    order_ids: set[OrderID],
+) -> None:
+    """Assemble the e-mails for the canceled orders, and enqueue them
+    at once.
+    """
+    assemble = partial(
+        _assemble_email, func=assemble_text_for_canceled_order_to_orderer
+    )
+    _send_emails_for_orders(order_ids, assemble)
+
+
+def send_emails_for_paid_orders_to_orderers(order_ids: set[OrderID]) -> None:
+    """Assemble the e-mails for the paid orders, and enqueue them at
+    once.
+    """
+    assemble = partial(
+        _assemble_email, func=assemble_text_for_paid_order_to_orderer
+    )
+    _send_emails_for_orders(order_ids, assemble)
+
+
+def _send_emails_for_orders(
+    order_ids: set[OrderID],
+    assemble: Callable[[OrderEmailData, str, str], Message],
+) -> None:
+    """Assemble the e-mails for the orders, and enqueue them at once.
+
+    Footers are loaded only once per brand and language.
+
+    An order whose e-mail cannot be assembled is logged and skipped, so
+    that the other orderers are notified nonetheless.
+    """
+    get_footer = cache(email_footer_service.get_footer)
+
+    messages = []
+    for data in _get_order_email_data_for_orders(order_ids):
+        try:
+            language_code = get_user_locale(data.orderer)
+            footer = get_footer(data.brand_id, language_code)
+            message = assemble(data, language_code, footer)
+        except Exception:
+            log.exception(
+                'Could not assemble order email',
+                order_number=data.order.order_number,
+            )
+            continue
+
+        messages.append(message)
+
+    email_service.enqueue_messages(messages)
+
+
+def _get_order_email_data_for_orders(
+    order_ids: set[OrderID],
+) -> list[OrderEmailData]:
+    """Collect data required for order e-mail templates."""
+    orders = order_service.get_orders(frozenset(order_ids))
+    orders.sort(key=lambda order: order.created_at)
+
+    get_shop = cache(shop_service.get_shop)
+    get_email_config = cache(email_config_service.get_config)
+
+    orderer_ids = {order.placed_by_id for order in orders}
+    orderers_by_id = {
+        user.id: user for user in user_service.get_users(orderer_ids)
+    }
+    email_addresses_by_user_id = dict(
+        user_service.get_email_addresses(orderer_ids)
+    )
+
+    data = []
+    for order in orders:
+        orderer_id = order.placed_by_id
+
+        email_address = email_addresses_by_user_id.get(orderer_id)
+        if email_address is None:
+            log.warning(
+                'Orderer has no email address, not sending order email',
+                order_number=order.order_number,
+            )
+            continue
+
+        shop = get_shop(order.shop_id)
+        email_config = get_email_config(shop.brand_id)
+
+        data.append(
+            OrderEmailData(
+                sender=email_config.sender,
+                order=order,
+                brand_id=shop.brand_id,
+                orderer=orderers_by_id[orderer_id],
+                orderer_email_address=email_address,
+            )
+        )
+
+    return data
+
+
+# -------------------------------------------------------------------- #
+
+
 def assemble_email_for_incoming_order_to_orderer(
     data: OrderEmailData,
     language_code: str,
@@ -99,20 +99,35 @@ def get_entries_of_type_for_order(
     return [_db_entity_to_entry(db_entry) for db_entry in db_entries]
 
 
-def get_entries_by_initiator(
-    initiator_id: UserID, event_types: frozenset[str]
+def get_latest_entries_by_initiator(
+    initiator_id: UserID,
+    event_types: frozenset[str],
+    limit: int,
+    *,
+    before: datetime | None = None,
 ) -> list[OrderLogEntry]:
-    """Return the log entries of these types initiated by the user."""
+    """Return the most recent log entries of these types initiated by
+    the user.
+
+    If `before` is given, only entries that occurred before then are
+    returned.
+    """
     if not event_types:
         return []
 
-    db_entries = db.session.scalars(
+    stmt = (
         select(DbOrderLogEntry)
         .filter(DbOrderLogEntry.event_type.in_(event_types))
         .filter(
             DbOrderLogEntry.data['initiator_id'].astext == str(initiator_id)
         )
-        .order_by(DbOrderLogEntry.occurred_at)
+    )
+
+    if before is not None:
+        stmt = stmt.filter(DbOrderLogEntry.occurred_at < before)
+
+    db_entries = db.session.scalars(
+        stmt.order_by(DbOrderLogEntry.occurred_at.desc()).limit(limit)
     ).all()
 
     return [_db_entity_to_entry(db_entry) for db_entry in db_entries]
@@ -9,6 +9,7 @@ byceps.services.shop.order.order_payment_service
 from copy import deepcopy
 from datetime import datetime
 
+from jinja2 import Template
 from moneyed import Money
 from sqlalchemy import delete, select
 
@@ -145,12 +146,31 @@ def get_email_payment_instructions(order: Order, language_code: str) -> str:
 
     Raise error if not found.
     """
-    scope = _build_shop_snippet_scope(order.shop_id)
+    template = get_email_payment_instructions_template(
+        order.shop_id, language_code
+    )
+
+    return render_email_payment_instructions(template, order)
+
+
+def get_email_payment_instructions_template(
+    shop_id: ShopID, language_code: str
+) -> Template:
+    """Return the template of the email payment instructions for that
+    shop and language.
+
+    Raise error if not found.
+    """
+    scope = _build_shop_snippet_scope(shop_id)
     snippet_content = snippet_service.get_snippet_body(
         scope, 'email_payment_instructions', language_code
     )
 
-    template = load_template(snippet_content)
+    return load_template(snippet_content)
+
+
+def render_email_payment_instructions(template: Template, order: Order) -> str:
+    """Render the email payment instructions for that order."""
     return template.render(
         order_id=order.id,
         order_number=order.order_number,
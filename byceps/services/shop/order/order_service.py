@@ -259,35 +259,43 @@ def _execute_article_creation_actions(
     order: Order, initiator_id: UserID
 ) -> None:
     # based on article type
-    for line_item in order.line_items:
-        if line_item.article_type in (
-            ArticleType.ticket,
-            ArticleType.ticket_bundle,
-        ):
-            article = article_service.get_article(line_item.article_id)
+    ticket_line_items = [
+        line_item
+        for line_item in order.line_items
+        if line_item.article_type
+        in (ArticleType.ticket, ArticleType.ticket_bundle)
+    ]
 
-            ticket_category_id = TicketCategoryID(
-                UUID(str(article.type_params['ticket_category_id']))
-            )
+    article_ids = {line_item.article_id for line_item in ticket_line_items}
+    articles_by_id = article_service.index_articles_by_id(
+        article_service.get_articles(article_ids)
+    )
 
-            if line_item.article_type == ArticleType.ticket:
-                ticket_actions.create_tickets(
-                    order,
-                    line_item,
-                    ticket_category_id,
-                    initiator_id,
-                )
-            elif line_item.article_type == ArticleType.ticket_bundle:
-                ticket_quantity_per_bundle = int(
-                    article.type_params['ticket_quantity']
-                )
-                ticket_bundle_actions.create_ticket_bundles(
-                    order,
-                    line_item,
-                    ticket_category_id,
-                    ticket_quantity_per_bundle,
-                    initiator_id,
-                )
+    for line_item in ticket_line_items:
+        article = articles_by_id[line_item.article_id]
+
+        ticket_category_id = TicketCategoryID(
+            UUID(str(article.type_params['ticket_category_id']))
+        )
+
+        if line_item.article_type == ArticleType.ticket:
+            ticket_actions.create_tickets(
+                order,
+                line_item,
+                ticket_category_id,
+                initiator_id,
+            )
+        elif line_item.article_type == ArticleType.ticket_bundle:
+            ticket_quantity_per_bundle = int(
+                article.type_params['ticket_quantity']
+            )
+            ticket_bundle_actions.create_ticket_bundles(
+                order,
+                line_item,
+                ticket_category_id,
+                ticket_quantity_per_bundle,
+                initiator_id,
+            )
 
     # based on order action registered for article number
     order_action_service.execute_creation_actions(order, initiator_id)
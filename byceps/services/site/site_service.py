@@ -8,7 +8,9 @@ byceps.services.site.site_service
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 import dataclasses
+from operator import attrgetter
 from typing import Callable
 
 from sqlalchemy import delete, select
@@ -20,7 +22,9 @@ from byceps.services.news import news_channel_service
 from byceps.services.news.models import NewsChannelID
 from byceps.services.shop.storefront.models import StorefrontID
 from byceps.typing import BrandID, PartyID
+from byceps.util.dataloader import DataLoader
 
+from . import site_setting_service
 from .dbmodels.setting import DbSetting
 from .dbmodels.site import DbSite
 from .models import Site, SiteID, SiteWithBrand
@@ -100,6 +104,8 @@ def update_site(
 
     db.session.commit()
 
+    _site_loader.clear()
+
     return _db_entity_to_site(db_site)
 
 
@@ -109,6 +115,10 @@ def delete_site(site_id: SiteID) -> None:
     db.session.execute(delete(DbSite).filter_by(id=site_id))
     db.session.commit()
 
+    _site_loader.clear()
+
+    site_setting_service.invalidate_cached_settings(site_id)
+
 
 def _find_db_site(site_id: SiteID) -> DbSite | None:
     return db.session.get(DbSite, site_id)
@@ -158,6 +168,25 @@ def get_sites(site_ids: set[SiteID]) -> list[Site]:
     return [_db_entity_to_site(db_site) for db_site in db_sites]
 
 
+def index_sites_by_id(sites: Iterable[Site]) -> dict[SiteID, Site]:
+    """Map the sites' IDs to the corresponding site objects."""
+    return {site.id: site for site in sites}
+
+
+def load_sites(site_ids: set[SiteID]) -> dict[SiteID, Site]:
+    """Return the sites with those IDs, indexed by ID.
+
+    Sites already loaded this way during the current request are
+    not fetched again.
+    """
+    return _site_loader.get_many(site_ids)
+
+
+_site_loader: DataLoader[SiteID, Site] = DataLoader(
+    'site', get_sites, attrgetter('id')
+)
+
+
 def get_sites_for_brand(brand_id: BrandID) -> set[Site]:
     """Return the sites for that brand."""
     db_sites = db.session.scalars(
@@ -233,6 +262,8 @@ def add_news_channel(site_id: SiteID, news_channel_id: NewsChannelID) -> None:
     db_site.news_channels.append(news_channel)
     db.session.commit()
 
+    _site_loader.clear()
+
 
 def remove_news_channel(
     site_id: SiteID, news_channel_id: NewsChannelID
@@ -243,3 +274,5 @@ def remove_news_channel(
 
     db_site.news_channels.remove(news_channel)
     db.session.commit()
+
+    _site_loader.clear()
@@ -11,11 +11,16 @@ from __future__ import annotations
 from sqlalchemy import delete, select
 
 from byceps.database import db, upsert
+from byceps.util.caching import Cache
 
 from .dbmodels.setting import DbSetting
 from .models import SiteID, SiteSetting
 
 
+# Settings are read several times per request, but rarely change.
+_cache: Cache[SiteID, dict[str, str]] = Cache('site_settings')
+
+
 def create_setting(site_id: SiteID, name: str, value: str) -> SiteSetting:
     """Create a setting for that site."""
     db_setting = DbSetting(site_id, name, value)
@@ -23,6 +28,8 @@ def create_setting(site_id: SiteID, name: str, value: str) -> SiteSetting:
     db.session.add(db_setting)
     db.session.commit()
 
+    _cache.invalidate_keys([site_id])
+
     return _db_entity_to_site_setting(db_setting)
 
 
@@ -43,6 +50,8 @@ def create_or_update_setting(
 
     upsert(table, identifier, replacement)
 
+    _cache.invalidate_keys([site_id])
+
     return find_setting(site_id, name)
 
 
@@ -58,42 +67,59 @@ def remove_setting(site_id: SiteID, name: str) -> None:
     )
     db.session.commit()
 
+    _cache.invalidate_keys([site_id])
+
 
 def find_setting(site_id: SiteID, name: str) -> SiteSetting | None:
     """Return the setting for that site and with that name, or `None`
     if not found.
     """
-    db_setting = db.session.get(DbSetting, (site_id, name))
+    value = find_setting_value(site_id, name)
 
-    if db_setting is None:
+    if value is None:
         return None
 
-    return _db_entity_to_site_setting(db_setting)
+    return SiteSetting(site_id, name, value)
 
 
 def find_setting_value(site_id: SiteID, name: str) -> str | None:
     """Return the value of the setting for that site and with that
     name, or `None` if not found.
     """
-    setting = find_setting(site_id, name)
-
-    if setting is None:
-        return None
-
-    return setting.value
+    return _get_values_by_name(site_id).get(name)
 
 
 def get_settings(site_id: SiteID) -> set[SiteSetting]:
     """Return all settings for that site."""
-    db_settings = db.session.scalars(
-        select(DbSetting).filter_by(site_id=site_id)
-    ).all()
-
     return {
-        _db_entity_to_site_setting(db_setting) for db_setting in db_settings
+        SiteSetting(site_id, name, value)
+        for name, value in _get_values_by_name(site_id).items()
     }
 
 
+def _get_values_by_name(site_id: SiteID) -> dict[str, str]:
+    """Return the site's setting values by name, from the cache if
+    available.
+    """
+    return _cache.get_or_load(site_id, _load_values_by_name)
+
+
+def _load_values_by_name(site_id: SiteID) -> dict[str, str]:
+    rows = db.session.execute(
+        select(DbSetting.name, DbSetting.value).filter_by(site_id=site_id)
+    ).all()
+    return dict(rows)
+
+
+def invalidate_cached_settings(site_id: SiteID) -> None:
+    """Drop the site's cached settings (in all processes).
+
+    To be called after settings have been changed other than through
+    this module.
+    """
+    _cache.invalidate_keys([site_id])
+
+
 def _db_entity_to_site_setting(db_setting: DbSetting) -> SiteSetting:
     return SiteSetting(
         db_setting.site_id,
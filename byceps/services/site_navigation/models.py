@@ -95,3 +95,17 @@ _VIEW_TYPES = [
 class NavMenuTree:
     menu: NavMenu
     submenus: list[NavMenu]
+
+
+@dataclass(frozen=True)
+class SiteNavigation:
+    """A site's navigation, prepared for rendering."""
+
+    menu_trees: list[NavMenuTree]
+    # Only visible items of visible menus, ordered by position
+    items_by_menu_id: dict[NavMenuID, list[NavItem]]
+    # Keys are language code and menu name.
+    menu_ids_by_name: dict[tuple[str, str], NavMenuID]
+    # Keys are language code and page/view name.
+    submenu_ids_by_page_name: dict[tuple[str, str], NavMenuID]
+    submenu_ids_by_view_name: dict[tuple[str, str], NavMenuID]
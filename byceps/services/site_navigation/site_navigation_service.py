@@ -14,6 +14,7 @@ from sqlalchemy import delete, select
 
 from byceps.database import db
 from byceps.services.site.models import SiteID
+from byceps.util.caching import Cache
 from byceps.util.iterables import find, index_of
 from byceps.util.result import Err, Ok, Result
 
@@ -27,10 +28,17 @@ from .models import (
     NavMenuAggregate,
     NavMenuID,
     NavMenuTree,
+    SiteNavigation,
     ViewType,
 )
 
 
+# Navigations rarely change, but are needed to render almost every page.
+# Entries expire as a safeguard against changes that do not invalidate
+# the cache (e.g. made directly in the database).
+_cache: Cache[SiteID, SiteNavigation] = Cache('site_navigation', ttl=3600)
+
+
 def create_menu(
     site_id: SiteID,
     name: str,
@@ -46,6 +54,8 @@ def create_menu(
     db.session.add(db_menu)
     db.session.commit()
 
+    _cache.invalidate()
+
     return _db_entity_to_menu(db_menu)
 
 
@@ -64,6 +74,8 @@ def update_menu(
 
         db.session.commit()
 
+        _cache.invalidate()
+
         return db_menu
 
     return _get_db_menu(menu_id).map(_update_menu).map(_db_entity_to_menu)
@@ -94,6 +106,8 @@ def create_item(
         db_menu.items.append(db_item)
         db.session.commit()
 
+        _cache.invalidate()
+
         return db_item
 
     return _get_db_menu(menu_id).map(_create_item).map(_db_entity_to_item)
@@ -118,6 +132,8 @@ def update_item(
 
         db.session.commit()
 
+        _cache.invalidate()
+
         return db_item
 
     return _get_db_item(item_id).map(_update_item).map(_db_entity_to_item)
@@ -130,6 +146,8 @@ def delete_item(item_id: NavItemID) -> Result[None, str]:
         db.session.execute(delete(DbNavItem).where(DbNavItem.id == db_item.id))
         db.session.commit()
 
+        _cache.invalidate()
+
     return _get_db_item(item_id).map(_delete_item)
 
 
@@ -141,18 +159,8 @@ def find_submenu_id_for_page(
     If the page is referenced from multiple submenus, the one whose name
     comes first in alphabetical order is chosen.
     """
-    return db.session.scalars(
-        select(DbNavItem.menu_id)
-        .join(DbNavMenu)
-        .filter(DbNavMenu.site_id == site_id)
-        .filter(DbNavMenu.language_code == language_code)
-        .filter(DbNavMenu.hidden == False)  # noqa: E712
-        .filter(DbNavMenu.parent_menu_id.is_not(None))  # submenus only
-        .filter(DbNavItem._target_type == NavItemTargetType.page.name)
-        .filter(DbNavItem.target == page_name)
-        .filter(DbNavItem.hidden == False)  # noqa: E712
-        .order_by(DbNavMenu.name)
-    ).first()
+    navigation = get_site_navigation(site_id)
+    return navigation.submenu_ids_by_page_name.get((language_code, page_name))
 
 
 def find_submenu_id_for_view(
@@ -163,18 +171,8 @@ def find_submenu_id_for_view(
     If the view is referenced from multiple submenus, the one whose name
     comes first in alphabetical order is chosen.
     """
-    return db.session.scalars(
-        select(DbNavItem.menu_id)
-        .join(DbNavMenu)
-        .filter(DbNavMenu.site_id == site_id)
-        .filter(DbNavMenu.language_code == language_code)
-        .filter(DbNavMenu.hidden == False)  # noqa: E712
-        .filter(DbNavMenu.parent_menu_id.is_not(None))  # submenus only
-        .filter(DbNavItem._target_type == NavItemTargetType.view.name)
-        .filter(DbNavItem.target == view_name)
-        .filter(DbNavItem.hidden == False)  # noqa: E712
-        .order_by(DbNavMenu.name)
-    ).first()
+    navigation = get_site_navigation(site_id)
+    return navigation.submenu_ids_by_view_name.get((language_code, view_name))
 
 
 def find_menu(menu_id: NavMenuID) -> NavMenu | None:
@@ -237,8 +235,77 @@ def get_menus(site_id: SiteID) -> list[NavMenu]:
 
 def get_menu_trees(site_id: SiteID) -> list[NavMenuTree]:
     """Return the menu trees for this site."""
+    return get_site_navigation(site_id).menu_trees
+
+
+def get_site_navigation(site_id: SiteID) -> SiteNavigation:
+    """Return the site's navigation.
+
+    It is cached in each process until menus or items are changed.
+    """
+    return _cache.get_or_load(site_id, _load_site_navigation)
+
+
+def _load_site_navigation(site_id: SiteID) -> SiteNavigation:
     menus = get_menus(site_id)
 
+    db_items = db.session.scalars(
+        select(DbNavItem).join(DbNavMenu).filter(DbNavMenu.site_id == site_id)
+    )
+    items = [_db_entity_to_item(db_item) for db_item in db_items]
+
+    return _build_site_navigation(menus, items)
+
+
+def _build_site_navigation(
+    menus: list[NavMenu], items: list[NavItem]
+) -> SiteNavigation:
+    menu_trees = _build_menu_trees(menus)
+
+    visible_menus_by_id = {menu.id: menu for menu in menus if not menu.hidden}
+
+    items_by_menu_id: dict[NavMenuID, list[NavItem]] = {
+        menu_id: [] for menu_id in visible_menus_by_id
+    }
+    for item in sorted(items, key=lambda item: item.position):
+        if (item.menu_id in items_by_menu_id) and not item.hidden:
+            items_by_menu_id[item.menu_id].append(item)
+
+    menu_ids_by_name = {
+        (menu.language_code, menu.name): menu.id
+        for menu in visible_menus_by_id.values()
+    }
+
+    submenu_ids_by_page_name: dict[tuple[str, str], NavMenuID] = {}
+    submenu_ids_by_view_name: dict[tuple[str, str], NavMenuID] = {}
+    submenus = sorted(
+        (menu for menu in visible_menus_by_id.values() if menu.parent_menu_id),
+        key=lambda menu: menu.name,
+    )
+    for submenu in submenus:
+        for item in items_by_menu_id[submenu.id]:
+            if item.target_type == NavItemTargetType.page:
+                submenu_ids_by_name = submenu_ids_by_page_name
+            elif item.target_type == NavItemTargetType.view:
+                submenu_ids_by_name = submenu_ids_by_view_name
+            else:
+                continue
+
+            # Prefer the submenu whose name comes first.
+            submenu_ids_by_name.setdefault(
+                (submenu.language_code, item.target), submenu.id
+            )
+
+    return SiteNavigation(
+        menu_trees=menu_trees,
+        items_by_menu_id=items_by_menu_id,
+        menu_ids_by_name=menu_ids_by_name,
+        submenu_ids_by_page_name=submenu_ids_by_page_name,
+        submenu_ids_by_view_name=submenu_ids_by_view_name,
+    )
+
+
+def _build_menu_trees(menus: list[NavMenu]) -> list[NavMenuTree]:
     trees = []
 
     root_menus = [menu for menu in menus if not menu.parent_menu_id]
@@ -282,21 +349,14 @@ def _get_db_item(item_id: NavItemID) -> Result[DbNavItem, str]:
     return Ok(db_item)
 
 
-def get_items_for_menu_id(menu_id: NavMenuID) -> list[NavItem]:
-    """Return the items of a menu.
+def get_items_for_menu_id(site_id: SiteID, menu_id: NavMenuID) -> list[NavItem]:
+    """Return the items of a menu of the site.
 
     An empty list is returned if the menu does not exist, is hidden, or
     contains no visible items.
     """
-    db_items = db.session.scalars(
-        select(DbNavItem)
-        .join(DbNavMenu)
-        .filter(DbNavMenu.id == menu_id)
-        .filter(DbNavMenu.hidden == False)  # noqa: E712
-        .filter(DbNavItem.hidden == False)  # noqa: E712
-    )
-
-    return _db_entities_to_items(db_items)
+    navigation = get_site_navigation(site_id)
+    return navigation.items_by_menu_id.get(menu_id, [])
 
 
 def get_items_for_menu(
@@ -307,17 +367,13 @@ def get_items_for_menu(
     An empty list is returned if the menu does not exist, is hidden, or
     contains no visible items.
     """
-    db_items = db.session.scalars(
-        select(DbNavItem)
-        .join(DbNavMenu)
-        .filter(DbNavMenu.site_id == site_id)
-        .filter(DbNavMenu.name == name)
-        .filter(DbNavMenu.language_code == language_code)
-        .filter(DbNavMenu.hidden == False)  # noqa: E712
-        .filter(DbNavItem.hidden == False)  # noqa: E712
-    )
+    navigation = get_site_navigation(site_id)
+
+    menu_id = navigation.menu_ids_by_name.get((language_code, name))
+    if menu_id is None:
+        return []
 
-    return _db_entities_to_items(db_items)
+    return navigation.items_by_menu_id[menu_id]
 
 
 def move_item_up(item_id: NavItemID) -> Result[NavItem, str]:
@@ -334,6 +390,8 @@ def move_item_up(item_id: NavItemID) -> Result[NavItem, str]:
 
         db.session.commit()
 
+        _cache.invalidate()
+
         return Ok(db_item)
 
     return _get_db_item(item_id).and_then(_move_item_up).map(_db_entity_to_item)
@@ -354,6 +412,8 @@ def move_item_down(item_id: NavItemID) -> Result[NavItem, str]:
 
         db.session.commit()
 
+        _cache.invalidate()
+
         return Ok(db_item)
 
     return (
@@ -6,12 +6,19 @@ byceps.services.text_markup.text_markup_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
+
+from functools import cache
 from html import escape
+from typing import TYPE_CHECKING
 
-from bbcode import Parser
 from flask_babel import gettext
 
 
+if TYPE_CHECKING:
+    from bbcode import Parser
+
+
 try:
     from .smileys import get_smileys
 except ModuleNotFoundError:
@@ -28,8 +35,11 @@ except ModuleNotFoundError:
         return text
 
 
-def _create_parser() -> Parser:
-    """Create a customized BBcode parser."""
+@cache
+def _get_parser() -> Parser:
+    """Create a customized BBcode parser (on first use)."""
+    from bbcode import Parser
+
     parser = Parser(replace_cosmetic=False)
 
     _add_code_formatter(parser)
@@ -77,11 +87,8 @@ def _add_quote_formatter(parser: Parser) -> None:
     parser.add_formatter('quote', render_quote, strip=True)
 
 
-_PARSER = _create_parser()
-
-
 def render_html(value: str) -> str:
     """Render text as HTML, interpreting BBcode."""
-    html = _PARSER.format(value)
+    html = _get_parser().format(value)
     html = _replace_smileys(html)
     return html
@@ -10,7 +10,10 @@ This implementation only supports code set B.
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from jinja2 import Template
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
 
 
 # As seen on https://en.wikipedia.org/wiki/Code_128#Bar_code_widths
@@ -131,22 +134,78 @@ VALUES_TO_WIDTHS = {value: width for value, _, width in VALUES_CHARS_WIDTHS}
 CHARS_TO_VALUES = {char: value for value, char, _ in VALUES_CHARS_WIDTHS}
 
 
-SVG_TEMPLATE = Template(
-    '''
-<svg xmlns="http://www.w3.org/2000/svg" width="{{ image_width }}" height="{{ image_height }}" viewBox="0 0 {{ image_width }} {{ image_height }}">
-  <rect width="{{ image_width }}" height="{{ image_height }}" fill="white"/>
-  {%- for bar_x, bar_width in bars %}
-  <rect x="{{ bar_x }}" width="{{ bar_width }}" height="{{ image_height }}"/>
-  {%- endfor %}
-</svg>
-'''.strip()
+def _calculate_bar_positions_and_widths(start_x, bar_widths):
+    """Yield a (horizontal position, width) pair for each bar."""
+    x = start_x
+
+    draw_bar = True
+    for width in bar_widths:
+        if draw_bar:
+            yield x, width
+
+        draw_bar = not draw_bar
+        x += width
+
+
+def _calculate_symbol_bars(
+    widths: str,
+) -> tuple[int, tuple[tuple[int, int], ...]]:
+    """Return the total width of the symbol and a (relative horizontal
+    position, width) pair for each of its bars, in modules.
+    """
+    positions_and_widths = tuple(
+        _calculate_bar_positions_and_widths(0, list(map(int, widths)))
+    )
+    total_width = sum(map(int, widths))
+    return total_width, positions_and_widths
+
+
+# Bars are precomputed per symbol so that rendering a barcode only
+# requires offsetting and scaling them.
+VALUES_TO_SYMBOL_BARS = {
+    value: _calculate_symbol_bars(widths)
+    for value, widths in VALUES_TO_WIDTHS.items()
+}
+
+
+SVG_HEAD_TEMPLATE = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="{image_width}" height="{image_height}" viewBox="0 0 {image_width} {image_height}">\n'
+    '  <rect width="{image_width}" height="{image_height}" fill="white"/>'
 )
+SVG_BAR_TEMPLATE = '\n  <rect x="{x}" width="{width}" height="{image_height}"/>'
+SVG_TAIL = '\n</svg>'
+
 
+@lru_cache(maxsize=10_000)
+def render_svg(text: str, *, thickness: int = 3) -> str:
+    """Render the text as Code 128 barcode in SVG format.
 
-def render_svg(text, *, thickness=3):
+    Rendered barcodes are memoized.
+    """
     values = list(_generate_values(text))
-    bar_widths = list(_generate_bars(values, thickness))
-    return _generate_svg(bar_widths)
+    return _generate_svg(values, thickness)
+
+
+def render_svgs(texts: Iterable[str], *, thickness: int = 3) -> dict[str, str]:
+    """Render each of the texts as Code 128 barcode in SVG format."""
+    return {text: render_svg(text, thickness=thickness) for text in texts}
+
+
+def encode_svg_for_data_uri(svg: str) -> str:
+    """Encode SVG to be used inline as part of a data URI.
+
+    Replacements are not complete, but sufficient for barcodes.
+
+    See https://codepen.io/tigt/post/optimizing-svgs-in-data-uris
+    for details.
+    """
+    return (
+        svg.replace('\n', '%0A')
+        .replace('#', '%23')
+        .replace('<', '%3C')
+        .replace('>', '%3E')
+        .replace('"', "'")
+    )
 
 
 def _generate_values(text):
@@ -186,39 +245,31 @@ def _calculate_check_digit_value(values):
     return symbol_products_sum % 103
 
 
-def _generate_bars(values, thickness):
-    for value in values:
-        for width in VALUES_TO_WIDTHS[value]:
-            bar_width = int(width) * thickness
-            yield bar_width
-
+def _generate_svg(values, thickness, *, image_height=100):
+    """Assemble the SVG document from the precomputed bars of the
+    symbols.
+    """
+    bar_elements = []
 
-def _generate_svg(bar_widths, *, image_height=100):
-    image_width = sum(bar_widths)
-    x = 0
-
-    # Calculate where the individual bars are positioned
-    # horizontally and how wide they are.
-    bar_positions_and_widths = list(
-        _calculate_bar_positions_and_widths(x, bar_widths)
-    )
-
-    # Render template.
-    return SVG_TEMPLATE.render(
-        image_width=image_width,
-        image_height=image_height,
-        bars=bar_positions_and_widths,
+    # Offset the symbols' bars by the symbols' positions, and scale
+    # them by thickness.
+    symbol_x = 0
+    for value in values:
+        symbol_width, bars = VALUES_TO_SYMBOL_BARS[value]
+        for bar_x, bar_width in bars:
+            bar_elements.append(
+                SVG_BAR_TEMPLATE.format(
+                    x=(symbol_x + bar_x) * thickness,
+                    width=bar_width * thickness,
+                    image_height=image_height,
+                )
+            )
+        symbol_x += symbol_width
+
+    image_width = symbol_x * thickness
+
+    head = SVG_HEAD_TEMPLATE.format(
+        image_width=image_width, image_height=image_height
     )
 
-
-def _calculate_bar_positions_and_widths(start_x, bar_widths):
-    """Yield a (horizontal position, width) pair for each bar."""
-    x = start_x
-
-    draw_bar = True
-    for width in bar_widths:
-        if draw_bar:
-            yield x, width
-
-        draw_bar = not draw_bar
-        x += width
+    return head + ''.join(bar_elements) + SVG_TAIL
@@ -9,6 +9,8 @@ byceps.services.ticketing.dbmodels.log
 from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import DDL, event
+
 from byceps.database import db
 from byceps.services.ticketing.models.log import TicketLogEntryData
 from byceps.services.ticketing.models.ticket import TicketID
@@ -16,12 +18,19 @@ from byceps.util.instances import ReprBuilder
 
 
 class DbTicketLogEntry(db.Model):
-    """A log entry regarding a ticket."""
+    """A log entry regarding a ticket.
+
+    The table is partitioned by month.
+    """
 
     __tablename__ = 'ticket_log_entries'
+    __table_args__ = ({'postgresql_partition_by': 'RANGE (occurred_at)'},)
+    # The partition key has to be part of the primary key, but entries
+    # are still identified by their ID alone.
+    __mapper_args__ = {'primary_key': ['id']}
 
     id = db.Column(db.Uuid, primary_key=True)
-    occurred_at = db.Column(db.DateTime, nullable=False)
+    occurred_at = db.Column(db.DateTime, primary_key=True)
     event_type = db.Column(db.UnicodeText, index=True, nullable=False)
     ticket_id = db.Column(
         db.Uuid, db.ForeignKey('tickets.id'), index=True, nullable=False
@@ -50,3 +59,15 @@ class DbTicketLogEntry(db.Model):
             .add_with_lookup('data')
             .build()
         )
+
+
+event.listen(
+    DbTicketLogEntry.__table__,
+    'after_create',
+    DDL(
+        '''
+        CREATE TABLE ticket_log_entries_default
+            PARTITION OF ticket_log_entries DEFAULT;
+        '''
+    ),
+)
@@ -33,7 +33,15 @@ class DbTicket(db.Model):
     """
 
     __tablename__ = 'tickets'
-    __table_args__ = (db.UniqueConstraint('party_id', 'code'),)
+    __table_args__ = (
+        db.UniqueConstraint('party_id', 'code'),
+        db.Index(
+            'ix_tickets_code_trgm',
+            'code',
+            postgresql_using='gin',
+            postgresql_ops={'code': 'gin_trgm_ops'},
+        ),
+    )
 
     id = db.Column(db.Uuid, default=generate_uuid7, primary_key=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
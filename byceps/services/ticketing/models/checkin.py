@@ -44,3 +44,14 @@ class TicketCheckIn:
     occurred_at: datetime
     ticket_id: TicketID
     initiator_id: UserID
+
+
+@dataclass(frozen=True)
+class TicketCodeIndexEntry:
+    ticket_id: TicketID
+    code: TicketCode
+    category_title: str
+    used_by_id: UserID | None
+    used_by_screen_name: str | None
+    revoked: bool
+    user_checked_in: bool
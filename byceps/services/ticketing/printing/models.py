@@ -0,0 +1,32 @@
+"""
+byceps.services.ticketing.printing.models
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from byceps.services.ticketing.models.ticket import TicketCode
+
+
+@dataclass(frozen=True)
+class PrintableTicket:
+    code: TicketCode
+    category_title: str
+    owner_screen_name: str | None
+    owner_full_name: str | None
+    user_screen_name: str | None
+    user_full_name: str | None
+    seat_label: str | None
+
+
+@dataclass(frozen=True)
+class TicketSheetFile:
+    filename: str
+    created_at: datetime
+    size: int
@@ -0,0 +1,225 @@
+"""
+byceps.services.ticketing.printing.ticket_printing_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Generate printable sheets with many tickets (with barcodes) per page.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from flask import current_app
+from sqlalchemy import select
+
+from byceps.database import db
+from byceps.services.party import party_service
+from byceps.services.party.models import Party
+from byceps.services.seating.dbmodels.seat import DbSeat
+from byceps.services.ticketing import barcode_service
+from byceps.services.ticketing.dbmodels.category import DbTicketCategory
+from byceps.services.ticketing.dbmodels.ticket import DbTicket
+from byceps.services.user.dbmodels.detail import DbUserDetail
+from byceps.services.user.dbmodels.user import DbUser
+from byceps.typing import PartyID
+from byceps.util.iterables import chunked
+from byceps.util.jobqueue import BULK_QUEUE_NAME, enqueue
+from byceps.util.templating import load_template
+
+from .models import PrintableTicket, TicketSheetFile
+
+
+DEFAULT_TICKETS_PER_PAGE = 4
+
+FILENAME_DATETIME_FORMAT = '%Y-%m-%d_%H-%M-%S'
+FILENAME_SUFFIX = '.html'
+
+
+def get_printable_tickets_for_party(party_id: PartyID) -> list[PrintableTicket]:
+    """Return all tickets for the party that have not been revoked,
+    with everything needed to print them, using a single query.
+    """
+    db_owner = db.aliased(DbUser)
+    db_owner_detail = db.aliased(DbUserDetail)
+    db_user = db.aliased(DbUser)
+    db_user_detail = db.aliased(DbUserDetail)
+
+    rows = db.session.execute(
+        select(
+            DbTicket.code,
+            DbTicketCategory.title,
+            db_owner.screen_name,
+            db_owner_detail.first_name,
+            db_owner_detail.last_name,
+            db_user.screen_name,
+            db_user_detail.first_name,
+            db_user_detail.last_name,
+            DbSeat.label,
+        )
+        .join(DbTicketCategory, DbTicket.category_id == DbTicketCategory.id)
+        .join(db_owner, DbTicket.owned_by_id == db_owner.id)
+        .outerjoin(db_owner_detail, db_owner.id == db_owner_detail.user_id)
+        .outerjoin(db_user, DbTicket.used_by_id == db_user.id)
+        .outerjoin(db_user_detail, db_user.id == db_user_detail.user_id)
+        .outerjoin(DbSeat, DbTicket.occupied_seat_id == DbSeat.id)
+        .filter(DbTicket.party_id == party_id)
+        .filter(DbTicket.revoked == False)  # noqa: E712
+        .order_by(DbTicketCategory.title, DbTicket.code)
+    ).all()
+
+    return [
+        PrintableTicket(
+            code=code,
+            category_title=category_title,
+            owner_screen_name=owner_screen_name,
+            owner_full_name=_to_full_name(owner_first_name, owner_last_name),
+            user_screen_name=user_screen_name,
+            user_full_name=_to_full_name(user_first_name, user_last_name),
+            seat_label=seat_label,
+        )
+        for (
+            code,
+            category_title,
+            owner_screen_name,
+            owner_first_name,
+            owner_last_name,
+            user_screen_name,
+            user_first_name,
+            user_last_name,
+            seat_label,
+        ) in rows
+    ]
+
+
+def _to_full_name(first_name: str | None, last_name: str | None) -> str | None:
+    names = [first_name, last_name]
+    return ' '.join(filter(None, names)) or None
+
+
+def render_ticket_sheets(
+    party: Party,
+    tickets: list[PrintableTicket],
+    *,
+    tickets_per_page: int = DEFAULT_TICKETS_PER_PAGE,
+) -> str:
+    """Render the tickets as HTML document, laid out in pages."""
+    barcode_svgs = barcode_service.render_svgs(
+        ticket.code for ticket in tickets
+    )
+    barcodes_inline = {
+        code: barcode_service.encode_svg_for_data_uri(svg)
+        for code, svg in barcode_svgs.items()
+    }
+
+    pages = list(chunked(tickets, tickets_per_page))
+
+    context = {
+        'party_title': party.title,
+        'pages': pages,
+        'barcodes_inline': barcodes_inline,
+    }
+
+    return _render_template(context)
+
+
+def _render_template(context: dict[str, Any]) -> str:
+    """Load and render sheets template."""
+    path = 'services/ticketing/printing/templates/ticket_sheets.html'
+    with current_app.open_resource(path, 'r') as f:
+        source = f.read()
+
+    template = load_template(source)
+    return template.render(**context)
+
+
+# -------------------------------------------------------------------- #
+# files
+
+
+def enqueue_ticket_sheets_creation(
+    party_id: PartyID, *, tickets_per_page: int = DEFAULT_TICKETS_PER_PAGE
+) -> None:
+    """Have the ticket sheets for the party be created in the
+    background.
+    """
+    enqueue(
+        create_ticket_sheets_file,
+        party_id,
+        tickets_per_page=tickets_per_page,
+        queue=BULK_QUEUE_NAME,
+    )
+
+
+def create_ticket_sheets_file(
+    party_id: PartyID, *, tickets_per_page: int = DEFAULT_TICKETS_PER_PAGE
+) -> Path:
+    """Render the sheets for all tickets of the party and store them
+    as a file.
+    """
+    party = party_service.get_party(party_id)
+    tickets = get_printable_tickets_for_party(party.id)
+
+    html = render_ticket_sheets(
+        party, tickets, tickets_per_page=tickets_per_page
+    )
+
+    now = datetime.utcnow()
+    filename = now.strftime(FILENAME_DATETIME_FORMAT) + FILENAME_SUFFIX
+    path = _get_sheets_path(party_id) / filename
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(html, encoding='utf-8')
+
+    return path
+
+
+def get_ticket_sheets_files(party_id: PartyID) -> list[TicketSheetFile]:
+    """Return the ticket sheets files created for the party, latest
+    first.
+    """
+    path = _get_sheets_path(party_id)
+    if not path.is_dir():
+        return []
+
+    files = []
+    for file_path in path.glob('*' + FILENAME_SUFFIX):
+        try:
+            created_at = datetime.strptime(
+                file_path.stem, FILENAME_DATETIME_FORMAT
+            )
+        except ValueError:
+            continue
+
+        files.append(
+            TicketSheetFile(
+                filename=file_path.name,
+                created_at=created_at,
+                size=file_path.stat().st_size,
+            )
+        )
+
+    files.sort(key=lambda file: file.created_at, reverse=True)
+
+    return files
+
+
+def find_ticket_sheets_file_path(
+    party_id: PartyID, filename: str
+) -> Path | None:
+    """Return the path of the ticket sheets file, if it exists."""
+    filenames = {file.filename for file in get_ticket_sheets_files(party_id)}
+    if filename not in filenames:
+        return None
+
+    return _get_sheets_path(party_id) / filename
+
+
+def _get_sheets_path(party_id: PartyID) -> Path:
+    return (
+        current_app.config['PATH_DATA'] / 'parties' / party_id / 'ticket_sheets'
+    )
@@ -18,6 +18,7 @@ from byceps.services.seating import seat_group_service
 from byceps.services.shop.order.models.number import OrderNumber
 from byceps.typing import PartyID, UserID
 
+from . import ticket_code_index_service
 from .dbmodels.category import DbTicketCategory
 from .dbmodels.ticket import DbTicket
 from .dbmodels.ticket_bundle import DbTicketBundle
@@ -65,6 +66,8 @@ def create_bundle(
 
     db.session.commit()
 
+    ticket_code_index_service.invalidate_index(party_id)
+
     return db_bundle
 
 
@@ -95,15 +98,20 @@ def revoke_bundle(
 
     db.session.commit()
 
+    ticket_code_index_service.invalidate_index(db_bundle.party_id)
+
 
 def delete_bundle(bundle_id: TicketBundleID) -> None:
     """Delete a bundle and the tickets assigned to it."""
     db_bundle = get_bundle(bundle_id)
+    party_id = db_bundle.party_id
 
     db.session.execute(delete(DbTicket).filter_by(bundle_id=db_bundle.id))
     db.session.execute(delete(DbTicketBundle).filter_by(id=db_bundle.id))
     db.session.commit()
 
+    ticket_code_index_service.invalidate_index(party_id)
+
 
 def find_bundle(bundle_id: TicketBundleID) -> DbTicketBundle | None:
     """Return the ticket bundle with that id, or `None` if not found."""
@@ -8,10 +8,14 @@ byceps.services.ticketing.ticket_category_service
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from operator import attrgetter
+
 from sqlalchemy import delete, select
 
 from byceps.database import db
 from byceps.typing import PartyID
+from byceps.util.dataloader import DataLoader
 
 from .dbmodels.category import DbTicketCategory
 from .dbmodels.ticket import DbTicket
@@ -41,6 +45,8 @@ def update_category(
 
     db.session.commit()
 
+    _category_loader.clear()
+
     return _db_entity_to_category(db_category)
 
 
@@ -49,6 +55,8 @@ def delete_category(category_id: TicketCategoryID) -> None:
     db.session.execute(delete(DbTicketCategory).filter_by(id=category_id))
     db.session.commit()
 
+    _category_loader.clear()
+
 
 def count_categories_for_party(party_id: PartyID) -> int:
     """Return the number of categories for that party."""
@@ -77,6 +85,45 @@ def get_category(category_id: TicketCategoryID) -> TicketCategory:
     return category
 
 
+def get_categories(
+    category_ids: set[TicketCategoryID],
+) -> list[TicketCategory]:
+    """Return the categories with those IDs."""
+    if not category_ids:
+        return []
+
+    db_categories = db.session.scalars(
+        select(DbTicketCategory).filter(DbTicketCategory.id.in_(category_ids))
+    ).all()
+
+    return [
+        _db_entity_to_category(db_category) for db_category in db_categories
+    ]
+
+
+def index_categories_by_id(
+    categories: Iterable[TicketCategory],
+) -> dict[TicketCategoryID, TicketCategory]:
+    """Map the categories' IDs to the corresponding category objects."""
+    return {category.id: category for category in categories}
+
+
+def load_categories(
+    category_ids: set[TicketCategoryID],
+) -> dict[TicketCategoryID, TicketCategory]:
+    """Return the categories with those IDs, indexed by ID.
+
+    Categories already loaded this way during the current request are
+    not fetched again.
+    """
+    return _category_loader.get_many(category_ids)
+
+
+_category_loader: DataLoader[TicketCategoryID, TicketCategory] = DataLoader(
+    'ticket_category', get_categories, attrgetter('id')
+)
+
+
 def find_category_by_title(
     party_id: PartyID, title: str
 ) -> TicketCategory | None:
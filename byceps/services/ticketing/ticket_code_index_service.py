@@ -0,0 +1,184 @@
+"""
+byceps.services.ticketing.ticket_code_index_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+An index of a party's tickets by code, held in each process' memory
+to quickly look up scanned ticket codes during check-in.
+
+The index is loaded with a single query. Changes to tickets invalidate
+the index of the tickets' party in all processes.
+
+Whether a ticket's user has been checked in is not part of the cached
+index but looked up on each access, so that check-ins (which happen in
+rapid succession during the admission rush) do not invalidate the
+index.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sqlalchemy import select
+
+from byceps.database import db
+from byceps.services.user.dbmodels.user import DbUser
+from byceps.typing import PartyID, UserID
+from byceps.util.caching import Cache
+
+from .dbmodels.category import DbTicketCategory
+from .dbmodels.ticket import DbTicket
+from .models.checkin import TicketCodeIndexEntry
+from .models.ticket import TicketCode, TicketID
+
+
+TicketCodeIndex = dict[TicketCode, TicketCodeIndexEntry]
+
+
+@dataclass(frozen=True)
+class _IndexedTicket:
+    ticket_id: TicketID
+    code: TicketCode
+    category_title: str
+    used_by_id: UserID | None
+    used_by_screen_name: str | None
+    revoked: bool
+
+
+# Changes that are not signaled (like suspended user accounts) only
+# affect presentation; check-ins themselves always verify the ticket
+# against the database. Nonetheless, refresh from time to time.
+_cache: Cache[PartyID, dict[TicketCode, _IndexedTicket]] = Cache(
+    'ticket_code_index', ttl=300
+)
+
+
+def find_entry(party_id: PartyID, code: str) -> TicketCodeIndexEntry | None:
+    """Return the index entry for the ticket with that code, if it
+    exists.
+    """
+    return find_entries(party_id, [code]).get(code)
+
+
+def find_entries(
+    party_id: PartyID, codes: Iterable[str]
+) -> dict[str, TicketCodeIndexEntry | None]:
+    """Return the index entries for the tickets with those codes, by
+    code (as given).
+    """
+    indexed_tickets = _get_indexed_tickets(party_id)
+
+    indexed_tickets_by_code = {
+        code: indexed_tickets.get(TicketCode(code.strip())) for code in codes
+    }
+
+    ticket_ids = {
+        indexed_ticket.ticket_id
+        for indexed_ticket in indexed_tickets_by_code.values()
+        if indexed_ticket is not None
+    }
+    checked_in_ticket_ids = _get_checked_in_ticket_ids(
+        party_id, ticket_ids=ticket_ids
+    )
+
+    return {
+        code: _to_entry(indexed_ticket, checked_in_ticket_ids)
+        if (indexed_ticket is not None)
+        else None
+        for code, indexed_ticket in indexed_tickets_by_code.items()
+    }
+
+
+def get_index(party_id: PartyID) -> TicketCodeIndex:
+    """Return the index of the party's tickets by code."""
+    indexed_tickets = _get_indexed_tickets(party_id)
+    checked_in_ticket_ids = _get_checked_in_ticket_ids(party_id)
+
+    return {
+        code: _to_entry(indexed_ticket, checked_in_ticket_ids)
+        for code, indexed_ticket in indexed_tickets.items()
+    }
+
+
+def invalidate_index(party_id: PartyID) -> None:
+    """Discard the party's index, in all processes."""
+    _cache.invalidate_keys([party_id])
+
+
+def _get_indexed_tickets(party_id: PartyID) -> dict[TicketCode, _IndexedTicket]:
+    return _cache.get_or_load(party_id, _load_indexed_tickets)
+
+
+def _load_indexed_tickets(
+    party_id: PartyID,
+) -> dict[TicketCode, _IndexedTicket]:
+    rows = db.session.execute(
+        select(
+            DbTicket.id,
+            DbTicket.code,
+            DbTicketCategory.title,
+            DbTicket.used_by_id,
+            DbUser.screen_name,
+            DbTicket.revoked,
+        )
+        .join(DbTicketCategory, DbTicket.category_id == DbTicketCategory.id)
+        .outerjoin(DbUser, DbTicket.used_by_id == DbUser.id)
+        .filter(DbTicket.party_id == party_id)
+    ).all()
+
+    return {
+        code: _IndexedTicket(
+            ticket_id=ticket_id,
+            code=code,
+            category_title=category_title,
+            used_by_id=used_by_id,
+            used_by_screen_name=used_by_screen_name,
+            revoked=revoked,
+        )
+        for (
+            ticket_id,
+            code,
+            category_title,
+            used_by_id,
+            used_by_screen_name,
+            revoked,
+        ) in rows
+    }
+
+
+def _get_checked_in_ticket_ids(
+    party_id: PartyID, *, ticket_ids: set[TicketID] | None = None
+) -> set[TicketID]:
+    """Return the IDs of the party's tickets (optionally limited to
+    those given) whose users have been checked in.
+    """
+    stmt = (
+        select(DbTicket.id)
+        .filter(DbTicket.party_id == party_id)
+        .filter(DbTicket.user_checked_in == True)  # noqa: E712
+    )
+
+    if ticket_ids is not None:
+        if not ticket_ids:
+            return set()
+
+        stmt = stmt.filter(DbTicket.id.in_(ticket_ids))
+
+    return set(db.session.scalars(stmt).all())
+
+
+def _to_entry(
+    indexed_ticket: _IndexedTicket, checked_in_ticket_ids: set[TicketID]
+) -> TicketCodeIndexEntry:
+    return TicketCodeIndexEntry(
+        ticket_id=indexed_ticket.ticket_id,
+        code=indexed_ticket.code,
+        category_title=indexed_ticket.category_title,
+        used_by_id=indexed_ticket.used_by_id,
+        used_by_screen_name=indexed_ticket.used_by_screen_name,
+        revoked=indexed_ticket.revoked,
+        user_checked_in=indexed_ticket.ticket_id in checked_in_ticket_ids,
+    )
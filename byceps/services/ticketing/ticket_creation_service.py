@@ -17,7 +17,7 @@ from byceps.database import db
 from byceps.services.shop.order.models.number import OrderNumber
 from byceps.typing import PartyID, UserID
 
-from . import ticket_code_service
+from . import ticket_code_index_service, ticket_code_service
 from .dbmodels.ticket import DbTicket
 from .dbmodels.ticket_bundle import DbTicketBundle
 from .models.ticket import TicketCategoryID
@@ -90,6 +90,8 @@ def create_tickets(
         db.session.rollback()
         raise TicketCreationFailedWithConflictError(exc) from exc
 
+    ticket_code_index_service.invalidate_index(party_id)
+
     return db_tickets
 
 
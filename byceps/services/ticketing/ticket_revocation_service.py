@@ -11,7 +11,12 @@ from __future__ import annotations
 from byceps.database import db
 from byceps.typing import UserID
 
-from . import ticket_log_service, ticket_seat_management_service, ticket_service
+from . import (
+    ticket_code_index_service,
+    ticket_log_service,
+    ticket_seat_management_service,
+    ticket_service,
+)
 from .dbmodels.log import DbTicketLogEntry
 from .models.ticket import TicketID
 
@@ -37,6 +42,8 @@ def revoke_ticket(
 
     db.session.commit()
 
+    ticket_code_index_service.invalidate_index(db_ticket.party_id)
+
 
 def revoke_tickets(
     ticket_ids: set[TicketID],
@@ -64,6 +71,9 @@ def revoke_tickets(
 
     db.session.commit()
 
+    for party_id in {db_ticket.party_id for db_ticket in db_tickets}:
+        ticket_code_index_service.invalidate_index(party_id)
+
 
 def build_ticket_revoked_log_entry(
     ticket_id: TicketID, initiator_id: UserID, reason: str | None = None
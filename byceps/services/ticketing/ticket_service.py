@@ -21,7 +21,11 @@ from byceps.services.shop.order.models.number import OrderNumber
 from byceps.services.user.dbmodels.user import DbUser
 from byceps.typing import PartyID, UserID
 
-from . import ticket_code_service, ticket_log_service
+from . import (
+    ticket_code_index_service,
+    ticket_code_service,
+    ticket_log_service,
+)
 from .dbmodels.category import DbTicketCategory
 from .dbmodels.log import DbTicketLogEntry
 from .dbmodels.ticket import DbTicket
@@ -59,13 +63,19 @@ def update_ticket_code(
 
     db.session.commit()
 
+    ticket_code_index_service.invalidate_index(db_ticket.party_id)
+
 
 def delete_ticket(ticket_id: TicketID) -> None:
     """Delete a ticket and its log entries."""
+    party_id = get_ticket(ticket_id).party_id
+
     db.session.execute(delete(DbTicketLogEntry).filter_by(ticket_id=ticket_id))
     db.session.execute(delete(DbTicket).filter_by(id=ticket_id))
     db.session.commit()
 
+    ticket_code_index_service.invalidate_index(party_id)
+
 
 def find_ticket(ticket_id: TicketID) -> DbTicket | None:
     """Return the ticket with that id, or `None` if not found."""
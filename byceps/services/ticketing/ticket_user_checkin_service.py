@@ -14,6 +14,7 @@ from byceps.database import db
 from byceps.events.ticketing import TicketCheckedInEvent
 from byceps.services.ticketing.dbmodels.checkin import DbTicketCheckIn
 from byceps.services.user import user_service
+from byceps.services.user.models.user import User
 from byceps.typing import PartyID, UserID
 from byceps.util.result import Err, Ok, Result
 
@@ -41,6 +42,76 @@ def check_in_user(
         if used_by is None:
             return Err(UserIdUnknownError(f"Unknown user ID '{used_by_id}'"))
 
+    check_in_result = _check_in_user(party_id, db_ticket, used_by, initiator)
+
+    if check_in_result.is_ok():
+        db.session.commit()
+
+    return check_in_result
+
+
+def check_in_users(
+    party_id: PartyID, ticket_ids: list[TicketID], initiator_id: UserID
+) -> dict[TicketID, Result[TicketCheckedInEvent, TicketingError]]:
+    """Record that the tickets were used to check in their users.
+
+    The tickets and their users are loaded in bulk, and all successful
+    check-ins are persisted together.
+    """
+    db_tickets_by_id = {
+        db_ticket.id: db_ticket
+        for db_ticket in ticket_service.get_tickets(set(ticket_ids))
+    }
+
+    initiator = user_service.get_user(initiator_id)
+
+    used_by_ids = {
+        db_ticket.used_by_id
+        for db_ticket in db_tickets_by_id.values()
+        if db_ticket.used_by_id is not None
+    }
+    users_by_id = user_service.index_users_by_id(
+        user_service.get_users(used_by_ids)
+    )
+
+    results: dict[TicketID, Result[TicketCheckedInEvent, TicketingError]] = {}
+    # Check in each ticket only once, even if contained more than once.
+    for ticket_id in dict.fromkeys(ticket_ids):
+        db_ticket = db_tickets_by_id.get(ticket_id)
+        if db_ticket is None:
+            results[ticket_id] = Err(
+                TicketingError(f"Unknown ticket ID '{ticket_id}'")
+            )
+            continue
+
+        used_by_id = db_ticket.used_by_id
+        if used_by_id is None:
+            used_by = None
+        else:
+            used_by = users_by_id.get(used_by_id)
+            if used_by is None:
+                results[ticket_id] = Err(
+                    UserIdUnknownError(f"Unknown user ID '{used_by_id}'")
+                )
+                continue
+
+        results[ticket_id] = _check_in_user(
+            party_id, db_ticket, used_by, initiator
+        )
+
+    if any(result.is_ok() for result in results.values()):
+        db.session.commit()
+
+    return results
+
+
+def _check_in_user(
+    party_id: PartyID,
+    db_ticket: DbTicket,
+    used_by: User | None,
+    initiator: User,
+) -> Result[TicketCheckedInEvent, TicketingError]:
+    """Check in the ticket's user, if permitted, but do not commit."""
     ticket_for_check_in = TicketForCheckIn(
         id=db_ticket.id,
         party_id=db_ticket.party_id,
@@ -81,8 +152,6 @@ def _persist_check_in(
     db_log_entry = ticket_log_service.to_db_entry(log_entry)
     db.session.add(db_log_entry)
 
-    db.session.commit()
-
 
 def revert_user_check_in(ticket_id: TicketID, initiator_id: UserID) -> None:
     """Revert a user check-in that was done by mistake."""
@@ -11,7 +11,7 @@ from byceps.services.user import user_service
 from byceps.typing import UserID
 from byceps.util.result import Err, Ok, Result
 
-from . import ticket_log_service, ticket_service
+from . import ticket_code_index_service, ticket_log_service, ticket_service
 from .errors import (
     TicketingError,
     TicketIsRevokedError,
@@ -120,6 +120,8 @@ def appoint_user(
 
     db.session.commit()
 
+    ticket_code_index_service.invalidate_index(db_ticket.party_id)
+
     return Ok(None)
 
 
@@ -154,4 +156,6 @@ def withdraw_user(
 
     db.session.commit()
 
+    ticket_code_index_service.invalidate_index(db_ticket.party_id)
+
     return Ok(None)
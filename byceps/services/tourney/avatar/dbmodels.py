@@ -73,6 +73,11 @@ class DbTourneyAvatar(db.Model):
         )
         return path / self.filename
 
+    @property
+    def upload_path(self) -> Path:
+        """Where the uploaded image is kept until it has been processed."""
+        return self.path.with_suffix('.upload')
+
     @property
     def url_path(self) -> str:
         return f'/data/parties/{self.party_id}/tourney/avatars/{self.filename}'
@@ -6,19 +6,27 @@ byceps.services.tourney.avatar.tourney_avatars_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
+
 from typing import BinaryIO
 from uuid import UUID
 
+from sqlalchemy import select
+import structlog
+
 from byceps.database import db
 from byceps.services.image import image_service
 from byceps.services.user import user_service
 from byceps.typing import PartyID, UserID
 from byceps.util import upload
-from byceps.util.image import create_thumbnail
 from byceps.util.image.models import Dimensions, ImageType
+from byceps.util.jobqueue import enqueue
 from byceps.util.result import Err, Ok, Result
 
-from .dbmodels import DbTourneyAvatar
+from .dbmodels import AvatarID, DbTourneyAvatar
+
+
+log = structlog.get_logger()
 
 
 MAXIMUM_DIMENSIONS = Dimensions(512, 512)
@@ -44,34 +52,81 @@ def create_avatar_image(
         return Err(image_type_result.unwrap_err())
 
     image_type = image_type_result.unwrap()
-    image_dimensions = image_service.determine_dimensions(stream)
 
-    image_too_large = image_dimensions > maximum_dimensions
-    if image_too_large or not image_dimensions.is_square:
-        stream = create_thumbnail(
-            stream, image_type.name, maximum_dimensions, force_square=True
-        )
+    check_result = image_service.check_image(stream)
+    if check_result.is_err():
+        return Err(check_result.unwrap_err())
 
     avatar = DbTourneyAvatar(party_id, creator_id, image_type)
     db.session.add(avatar)
     db.session.commit()
 
     # Might raise `FileExistsError`.
-    upload.store(stream, avatar.path, create_parent_path_if_nonexistent=True)
+    upload.store(
+        stream, avatar.upload_path, create_parent_path_if_nonexistent=True
+    )
+
+    enqueue(_process_avatar_image, avatar.id, maximum_dimensions)
 
     return Ok(avatar)
 
 
+def _process_avatar_image(
+    avatar_id: AvatarID, maximum_dimensions: Dimensions
+) -> None:
+    """Create the variants of the uploaded avatar image.
+
+    If the image cannot be processed, the avatar is deleted.
+    """
+    avatar = _get_db_avatar(avatar_id)
+
+    try:
+        image_service.store_square_variants(
+            avatar.upload_path,
+            avatar.path,
+            avatar.image_type,
+            maximum_dimensions,
+        )
+    except Exception:
+        log.exception(
+            'Could not process tourney avatar image', avatar_id=str(avatar_id)
+        )
+        delete_avatar_image(avatar.id)
+        raise
+
+    # The original might contain metadata (e.g. the location) that
+    # should not be exposed.
+    upload.delete(avatar.upload_path)
+
+
+def find_avatar(avatar_id: UUID) -> DbTourneyAvatar | None:
+    """Return the avatar with that ID, or `None` if not found."""
+    return db.session.get(DbTourneyAvatar, avatar_id)
+
+
+def is_avatar_image_ready(avatar: DbTourneyAvatar) -> bool:
+    """Return `True` if the uploaded image has been processed and can
+    be served.
+    """
+    return avatar.path.exists()
+
+
 def delete_avatar_image(avatar_id: UUID) -> None:
     """Delete the avatar image."""
-    avatar = db.session.get(DbTourneyAvatar, avatar_id)
+    avatar = find_avatar(avatar_id)
 
     if avatar is None:
         raise ValueError('Unknown avatar ID')
 
-    # Delete file.
-    upload.delete(avatar.path)
+    # Delete files.
+    image_service.delete_square_variants(avatar.path)
 
     # Delete database record.
     db.session.delete(avatar)
     db.session.commit()
+
+
+def _get_db_avatar(avatar_id: AvatarID) -> DbTourneyAvatar:
+    return db.session.execute(
+        select(DbTourneyAvatar).filter_by(id=avatar_id)
+    ).scalar_one()
@@ -59,6 +59,11 @@ class DbUserAvatar(db.Model):
         path = current_app.config['PATH_DATA'] / 'global' / 'users' / 'avatars'
         return path / self.filename
 
+    @property
+    def upload_path(self) -> Path:
+        """Where the uploaded image is kept until it has been processed."""
+        return self.path.with_suffix('.upload')
+
     @property
     def url(self) -> str:
         return get_absolute_url_path(str(self.filename))
@@ -9,6 +9,8 @@ byceps.services.user.dbmodels.log
 from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import DDL, event
+
 from byceps.database import db
 from byceps.services.user.models.log import UserLogEntryData
 from byceps.typing import UserID
@@ -16,13 +18,33 @@ from byceps.util.instances import ReprBuilder
 
 
 class DbUserLogEntry(db.Model):
-    """A log entry regarding a user."""
+    """A log entry regarding a user.
+
+    The table is partitioned by event type. Login entries, which make up
+    the bulk of all entries, are kept in a partition of their own, which
+    in turn is partitioned by month. This way, old login entries can be
+    dropped by the month.
+    """
 
     __tablename__ = 'user_log_entries'
+    __table_args__ = (
+        db.Index(
+            'ix_user_log_entries_user_id_occurred_at', 'user_id', 'occurred_at'
+        ),
+        db.Index(
+            'ix_user_log_entries_ip_address',
+            db.text("(data ->> 'ip_address')"),
+            postgresql_where=db.text("event_type = 'user-logged-in'"),
+        ),
+        {'postgresql_partition_by': 'LIST (event_type)'},
+    )
+    # Partition keys have to be part of the primary key, but entries
+    # are still identified by their ID alone.
+    __mapper_args__ = {'primary_key': ['id']}
 
     id = db.Column(db.Uuid, primary_key=True)
-    occurred_at = db.Column(db.DateTime, nullable=False)
-    event_type = db.Column(db.UnicodeText, index=True, nullable=False)
+    occurred_at = db.Column(db.DateTime, primary_key=True)
+    event_type = db.Column(db.UnicodeText, index=True, primary_key=True)
     user_id = db.Column(
         db.Uuid, db.ForeignKey('users.id'), index=True, nullable=False
     )
@@ -50,3 +72,24 @@ class DbUserLogEntry(db.Model):
             .add_with_lookup('data')
             .build()
         )
+
+
+LOGIN_LOG_ENTRIES_TABLE_NAME = 'user_log_entries_logins'
+
+
+event.listen(
+    DbUserLogEntry.__table__,
+    'after_create',
+    DDL(
+        f'''
+        CREATE TABLE {LOGIN_LOG_ENTRIES_TABLE_NAME}
+            PARTITION OF user_log_entries
+            FOR VALUES IN ('user-logged-in')
+            PARTITION BY RANGE (occurred_at);
+        CREATE TABLE {LOGIN_LOG_ENTRIES_TABLE_NAME}_default
+            PARTITION OF {LOGIN_LOG_ENTRIES_TABLE_NAME} DEFAULT;
+        CREATE TABLE user_log_entries_default
+            PARTITION OF user_log_entries DEFAULT;
+        '''
+    ),
+)
@@ -20,6 +20,20 @@ class DbUser(db.Model):
     """A user."""
 
     __tablename__ = 'users'
+    __table_args__ = (
+        db.Index(
+            'ix_users_screen_name_trgm',
+            'screen_name',
+            postgresql_using='gin',
+            postgresql_ops={'screen_name': 'gin_trgm_ops'},
+        ),
+        db.Index(
+            'ix_users_email_address_trgm',
+            'email_address',
+            postgresql_using='gin',
+            postgresql_ops={'email_address': 'gin_trgm_ops'},
+        ),
+    )
 
     id = db.Column(db.Uuid, default=generate_uuid4, primary_key=True)
     created_at = db.Column(db.DateTime, nullable=False)
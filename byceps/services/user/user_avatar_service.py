@@ -11,13 +11,15 @@ from __future__ import annotations
 from typing import BinaryIO
 
 from sqlalchemy import select
+import structlog
 
 from byceps.database import db
 from byceps.services.image import image_service
+from byceps.signals import user as user_signals
 from byceps.typing import UserID
 from byceps.util import upload
-from byceps.util.image import create_thumbnail
 from byceps.util.image.models import Dimensions, ImageType
+from byceps.util.jobqueue import enqueue
 from byceps.util.result import Err, Ok, Result
 
 from . import user_log_service, user_service
@@ -26,6 +28,9 @@ from .dbmodels.user import DbUser
 from .models.user import UserAvatarID
 
 
+log = structlog.get_logger()
+
+
 MAXIMUM_DIMENSIONS = Dimensions(512, 512)
 
 
@@ -37,7 +42,11 @@ def update_avatar_image(
     *,
     maximum_dimensions: Dimensions = MAXIMUM_DIMENSIONS,
 ) -> Result[UserAvatarID, str]:
-    """Set a new avatar image for the user."""
+    """Set a new avatar image for the user.
+
+    The uploaded image is only stored here. Resizing it and making it
+    the user's current avatar is done in the background.
+    """
     user = user_service.get_db_user(user_id)
 
     image_type_result = image_service.determine_image_type(
@@ -47,20 +56,67 @@ def update_avatar_image(
         return Err(image_type_result.unwrap_err())
 
     image_type = image_type_result.unwrap()
-    image_dimensions = image_service.determine_dimensions(stream)
 
-    image_too_large = image_dimensions > maximum_dimensions
-    if image_too_large or not image_dimensions.is_square:
-        stream = create_thumbnail(
-            stream, image_type.name, maximum_dimensions, force_square=True
-        )
+    check_result = image_service.check_image(stream)
+    if check_result.is_err():
+        return Err(check_result.unwrap_err())
 
     avatar = DbUserAvatar(image_type)
     db.session.add(avatar)
     db.session.commit()
 
     # Might raise `FileExistsError`.
-    upload.store(stream, avatar.path, create_parent_path_if_nonexistent=True)
+    upload.store(
+        stream, avatar.upload_path, create_parent_path_if_nonexistent=True
+    )
+
+    enqueue(
+        _process_avatar_image,
+        avatar.id,
+        user.id,
+        initiator_id,
+        maximum_dimensions,
+    )
+
+    return Ok(avatar.id)
+
+
+def _process_avatar_image(
+    avatar_id: UserAvatarID,
+    user_id: UserID,
+    initiator_id: UserID,
+    maximum_dimensions: Dimensions,
+) -> None:
+    """Create the variants of the uploaded avatar image, then make it
+    the user's current avatar.
+
+    If the image cannot be processed, the avatar is discarded.
+    """
+    avatar = get_db_avatar(avatar_id)
+
+    try:
+        image_service.store_square_variants(
+            avatar.upload_path,
+            avatar.path,
+            avatar.image_type,
+            maximum_dimensions,
+        )
+    except Exception:
+        log.exception(
+            'Could not process avatar image',
+            avatar_id=str(avatar_id),
+            user_id=str(user_id),
+        )
+        _discard_avatar(avatar)
+        raise
+
+    # The original might contain metadata (e.g. the location) that
+    # should not be exposed.
+    upload.delete(avatar.upload_path)
+
+    user = user_service.get_db_user(user_id)
+
+    previous_avatar = user.avatar
 
     user.avatar_id = avatar.id
 
@@ -77,18 +133,35 @@ def update_avatar_image(
 
     db.session.commit()
 
-    return Ok(avatar.id)
+    user_service.invalidate_cached_user(user.id)
+
+    if (previous_avatar is not None) and (previous_avatar.id != avatar.id):
+        image_service.delete_square_variants(previous_avatar.path)
+
+    user_signals.avatar_updated.send(None, user_id=user.id)
+
+
+def _discard_avatar(avatar: DbUserAvatar) -> None:
+    """Delete an avatar that has not been put to use, including the
+    uploaded image.
+    """
+    # The variants' pattern matches the uploaded image, too.
+    image_service.delete_square_variants(avatar.path)
+
+    db.session.delete(avatar)
+    db.session.commit()
 
 
 def remove_avatar_image(user_id: UserID, initiator_id: UserID) -> None:
     """Remove the user's avatar image.
 
-    The avatar will be unlinked from the user, but the database record
-    as well as the image file itself won't be removed, though.
+    The avatar will be unlinked from the user and its image files will
+    be deleted, but the database record won't be removed, though.
     """
     user = user_service.get_db_user(user_id)
 
-    if user.avatar_id is None:
+    avatar = user.avatar
+    if avatar is None:
         return
 
     log_entry = user_log_service.build_entry(
@@ -107,6 +180,12 @@ def remove_avatar_image(user_id: UserID, initiator_id: UserID) -> None:
 
     db.session.commit()
 
+    user_service.invalidate_cached_user(user.id)
+
+    image_service.delete_square_variants(avatar.path)
+
+    user_signals.avatar_removed.send(None, user_id=user.id)
+
 
 def get_db_avatar(avatar_id: UserAvatarID) -> DbUserAvatar:
     """Return the avatar with that ID, or raise exception if not found."""
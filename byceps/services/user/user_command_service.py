@@ -112,6 +112,8 @@ def suspend_account(
 
     db.session.commit()
 
+    user_service.invalidate_cached_user(db_user.id)
+
     return UserAccountSuspendedEvent(
         occurred_at=occurred_at,
         initiator_id=initiator.id,
@@ -144,6 +146,8 @@ def unsuspend_account(
 
     db.session.commit()
 
+    user_service.invalidate_cached_user(db_user.id)
+
     return UserAccountUnsuspendedEvent(
         occurred_at=occurred_at,
         initiator_id=initiator.id,
@@ -187,6 +191,8 @@ def change_screen_name(
 
     db.session.commit()
 
+    user_service.invalidate_cached_user(db_user.id)
+
     return UserScreenNameChangedEvent(
         occurred_at=occurred_at,
         initiator_id=initiator.id,
@@ -249,6 +255,8 @@ def update_locale(user_id: UserID, locale: Locale | None) -> None:
     db_user.locale = locale.language if (locale is not None) else None
     db.session.commit()
 
+    user_service.invalidate_cached_user(db_user.id)
+
 
 def update_user_details(
     user_id: UserID,
@@ -49,6 +49,8 @@ def delete_account(
 
     db.session.commit()
 
+    user_service.invalidate_cached_user(user.id)
+
     authn_session_service.delete_session_tokens_for_user(user.id)
     authn_password_service.delete_password_hash(user.id)
     verification_token_service.delete_tokens_for_user(user.id)
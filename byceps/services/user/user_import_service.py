@@ -8,19 +8,31 @@ byceps.services.user.user_import_service
 
 from __future__ import annotations
 
-from collections.abc import Iterator
-from datetime import date
+from collections.abc import Iterator, Sequence
+from datetime import date, datetime
 from io import TextIOBase
 import json
 import secrets
 from typing import Optional
 
 from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert
 
-from . import user_creation_service
+from byceps.database import db, generate_uuid4, generate_uuid7
+from byceps.services.authentication.password import authn_password_service
+from byceps.services.authentication.password.dbmodels import DbCredential
+from byceps.util.iterables import chunked
+
+from . import user_creation_service, user_service
+from .dbmodels.detail import DbUserDetail
+from .dbmodels.log import DbUserLogEntry
+from .dbmodels.user import DbUser
 from .models.user import User
 
 
+DEFAULT_BULK_CHUNK_SIZE = 1000
+
+
 class UserToImport(BaseModel):
     screen_name: str
     # Use `Optional` instead of `| None` for pydantic on Python 3.9.
@@ -72,3 +84,192 @@ def import_user(user_to_import: UserToImport) -> User:
     ).unwrap()
 
     return user
+
+
+def validate_users_to_import(
+    users_to_import: Sequence[UserToImport],
+) -> dict[int, str]:
+    """Check the users to import as a whole, before any of them is
+    imported.
+
+    Screen names and email addresses have to be well-formed, unique
+    within the batch, and not yet assigned to existing users (compared
+    case-insensitively).
+
+    Return error messages by (0-based) index of the affected user.
+    """
+    errors: dict[int, str] = {}
+
+    indexes_by_screen_name: dict[str, int] = {}
+    indexes_by_email_address: dict[str, int] = {}
+
+    for index, user_to_import in enumerate(users_to_import):
+        try:
+            screen_name, email_address = _normalize(user_to_import)
+        except ValueError as e:
+            errors[index] = str(e)
+            continue
+
+        screen_name_key = screen_name.lower()
+        if screen_name_key in indexes_by_screen_name:
+            errors[index] = f"Duplicate screen name: '{screen_name}'"
+            continue
+
+        if email_address is not None:
+            if email_address in indexes_by_email_address:
+                errors[index] = f"Duplicate email address: '{email_address}'"
+                continue
+
+            indexes_by_email_address[email_address] = index
+
+        indexes_by_screen_name[screen_name_key] = index
+
+    for screen_name in user_service.find_assigned_screen_names(
+        set(indexes_by_screen_name)
+    ):
+        index = indexes_by_screen_name[screen_name]
+        errors.setdefault(
+            index, f"Screen name already assigned: '{screen_name}'"
+        )
+
+    for email_address in user_service.find_assigned_email_addresses(
+        set(indexes_by_email_address)
+    ):
+        index = indexes_by_email_address[email_address]
+        errors.setdefault(
+            index, f"Email address already assigned: '{email_address}'"
+        )
+
+    return dict(sorted(errors.items()))
+
+
+def import_users(
+    users_to_import: Sequence[UserToImport],
+    *,
+    chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    max_hashing_workers: int | None = None,
+) -> list[User]:
+    """Import many users at once.
+
+    The users are expected to have been checked with
+    `validate_users_to_import` beforehand.
+
+    Password hashes are generated in parallel processes. Users, their
+    details, credentials, and log entries are then inserted in chunks
+    using multi-row statements, committing each chunk on its own.
+    """
+    passwords = [secrets.token_urlsafe(24) for _ in users_to_import]
+    password_hashes = authn_password_service.generate_password_hashes(
+        passwords, max_workers=max_hashing_workers
+    )
+
+    created_at = datetime.utcnow()
+
+    users = []
+
+    for chunk in chunked(zip(users_to_import, password_hashes), chunk_size):
+        users.extend(_insert_users(chunk, created_at))
+
+    return users
+
+
+def _insert_users(
+    users_to_import_and_password_hashes: list[tuple[UserToImport, str]],
+    created_at: datetime,
+) -> list[User]:
+    user_rows = []
+    detail_rows = []
+    credential_rows = []
+    log_entry_rows = []
+    users = []
+
+    for user_to_import, password_hash in users_to_import_and_password_hashes:
+        user_id = generate_uuid4()
+        screen_name, email_address = _normalize(user_to_import)
+
+        user_rows.append(
+            {
+                'id': user_id,
+                'created_at': created_at,
+                'screen_name': screen_name,
+                'email_address': email_address,
+                'email_address_verified': False,
+                'initialized': False,
+                'suspended': False,
+                'deleted': False,
+                'locale': None,
+                'legacy_id': user_to_import.legacy_id,
+            }
+        )
+
+        detail_rows.append(
+            {
+                'user_id': user_id,
+                'first_name': user_to_import.first_name,
+                'last_name': user_to_import.last_name,
+                'date_of_birth': user_to_import.date_of_birth,
+                'country': user_to_import.country,
+                'zip_code': user_to_import.zip_code,
+                'city': user_to_import.city,
+                'street': user_to_import.street,
+                'phone_number': user_to_import.phone_number,
+                'internal_comment': user_to_import.internal_comment,
+                'extras': None,
+            }
+        )
+
+        credential_rows.append(
+            {
+                'user_id': user_id,
+                'password_hash': password_hash,
+                'updated_at': created_at,
+            }
+        )
+
+        log_entry_rows.append(
+            {
+                'id': generate_uuid7(),
+                'occurred_at': created_at,
+                'event_type': 'user-created',
+                'user_id': user_id,
+                'data': {'creation_method': 'import'},
+            }
+        )
+
+        users.append(
+            User(
+                id=user_id,
+                screen_name=screen_name,
+                suspended=False,
+                deleted=False,
+                locale=None,
+                avatar_url=None,
+            )
+        )
+
+    db.session.execute(insert(DbUser), user_rows)
+    db.session.execute(insert(DbUserDetail), detail_rows)
+    db.session.execute(insert(DbCredential), credential_rows)
+    db.session.execute(insert(DbUserLogEntry), log_entry_rows)
+    db.session.commit()
+
+    return users
+
+
+def _normalize(user_to_import: UserToImport) -> tuple[str, str | None]:
+    """Return normalized screen name and email address, or raise an
+    exception if either is invalid.
+    """
+    screen_name = user_creation_service._normalize_screen_name(
+        user_to_import.screen_name
+    )
+
+    email_address: str | None
+    if user_to_import.email_address is not None:
+        email_address = user_creation_service._normalize_email_address(
+            user_to_import.email_address
+        )
+    else:
+        email_address = None
+
+    return screen_name, email_address
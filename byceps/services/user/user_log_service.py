@@ -10,12 +10,13 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import delete, select
+from sqlalchemy import select, Select
 
 from byceps.database import db, generate_uuid7
+from byceps.services.log_retention import log_retention_service
 from byceps.typing import UserID
 
-from .dbmodels.log import DbUserLogEntry
+from .dbmodels.log import DbUserLogEntry, LOGIN_LOG_ENTRIES_TABLE_NAME
 from .models.log import UserLogEntry, UserLogEntryData
 
 
@@ -60,25 +61,88 @@ def to_db_entry(entry: UserLogEntry) -> DbUserLogEntry:
     )
 
 
-def get_entries_for_user(user_id: UserID) -> list[UserLogEntry]:
-    """Return the log entries for that user."""
-    db_entries = db.session.scalars(
-        select(DbUserLogEntry)
-        .filter_by(user_id=user_id)
-        .order_by(DbUserLogEntry.occurred_at)
-    ).all()
+def get_entries_for_user(
+    user_id: UserID,
+    *,
+    include_event_types: set[str] | None = None,
+    exclude_event_types: set[str] | None = None,
+) -> list[UserLogEntry]:
+    """Return the log entries for that user.
+
+    Entries can be limited to, or exclude, certain event types.
+    """
+    stmt = _select_entries_for_user(
+        user_id,
+        include_event_types=include_event_types,
+        exclude_event_types=exclude_event_types,
+    )
+
+    db_entries = db.session.scalars(stmt).all()
 
     return [_db_entity_to_entry(db_entry) for db_entry in db_entries]
 
 
+def get_latest_entries_for_user(
+    user_id: UserID,
+    limit: int,
+    *,
+    before: datetime | None = None,
+    exclude_event_types: set[str] | None = None,
+) -> list[UserLogEntry]:
+    """Return the most recent log entries for that user.
+
+    If `before` is given, only entries that occurred before then are
+    returned.
+    """
+    stmt = _select_entries_for_user(
+        user_id, exclude_event_types=exclude_event_types, latest_first=True
+    )
+
+    if before is not None:
+        stmt = stmt.filter(DbUserLogEntry.occurred_at < before)
+
+    db_entries = db.session.scalars(stmt.limit(limit)).all()
+
+    return [_db_entity_to_entry(db_entry) for db_entry in db_entries]
+
+
+def _select_entries_for_user(
+    user_id: UserID,
+    *,
+    include_event_types: set[str] | None = None,
+    exclude_event_types: set[str] | None = None,
+    latest_first: bool = False,
+) -> Select:
+    stmt = select(DbUserLogEntry).filter_by(user_id=user_id)
+
+    # Filtering by event type allows the database to skip partitions.
+    if include_event_types is not None:
+        stmt = stmt.filter(DbUserLogEntry.event_type.in_(include_event_types))
+
+    if exclude_event_types:
+        stmt = stmt.filter(
+            DbUserLogEntry.event_type.not_in(exclude_event_types)
+        )
+
+    if latest_first:
+        return stmt.order_by(DbUserLogEntry.occurred_at.desc())
+    else:
+        return stmt.order_by(DbUserLogEntry.occurred_at)
+
+
 def get_entries_of_type_for_user(
     user_id: UserID, event_type: str
 ) -> list[UserLogEntry]:
     """Return the log entries of that type for that user."""
+    return get_entries_for_user(user_id, include_event_types={event_type})
+
+
+def get_login_entries_for_ip_address(ip_address: str) -> list[UserLogEntry]:
+    """Return the login log entries for that IP address."""
     db_entries = db.session.scalars(
         select(DbUserLogEntry)
-        .filter_by(user_id=user_id)
-        .filter_by(event_type=event_type)
+        .filter_by(event_type='user-logged-in')
+        .filter(DbUserLogEntry.data['ip_address'].astext == ip_address)
         .order_by(DbUserLogEntry.occurred_at)
     ).all()
 
@@ -88,17 +152,14 @@ def get_entries_of_type_for_user(
 def delete_login_entries(occurred_before: datetime) -> int:
     """Delete login log entries which occurred before the given date.
 
+    Monthly partitions of login entries are dropped as a whole where
+    possible.
+
     Return the number of deleted log entries.
     """
-    result = db.session.execute(
-        delete(DbUserLogEntry)
-        .filter_by(event_type='user-logged-in')
-        .filter(DbUserLogEntry.occurred_at < occurred_before)
+    return log_retention_service.delete_entries(
+        LOGIN_LOG_ENTRIES_TABLE_NAME, occurred_before
     )
-    db.session.commit()
-
-    num_deleted = result.rowcount
-    return num_deleted
 
 
 def _db_entity_to_entry(db_entry: DbUserLogEntry) -> UserLogEntry:
@@ -8,6 +8,7 @@ byceps.services.user.user_service
 
 from __future__ import annotations
 
+import dataclasses
 from datetime import datetime, timedelta
 
 from sqlalchemy import select
@@ -15,6 +16,7 @@ from sqlalchemy.sql import Select
 
 from byceps.database import db, paginate, Pagination
 from byceps.typing import UserID
+from byceps.util.caching import Cache
 
 from .dbmodels.avatar import DbUserAvatar
 from .dbmodels.detail import DbUserDetail
@@ -29,6 +31,12 @@ from .models.user import (
 )
 
 
+# The same users are shown on almost every page (as authors of board
+# postings and comments, as orga team members, etc.). Entries expire as
+# a safeguard against changes that do not invalidate the cache.
+_user_cache: Cache[UserID, User] = Cache('users', ttl=600)
+
+
 class UserIdRejectedError(Exception):
     """Indicate that the given user ID is not accepted.
 
@@ -113,17 +121,42 @@ def get_users(
     if not user_ids:
         return set()
 
+    users_by_id = _user_cache.get_many_or_load(user_ids, _load_users_by_id)
+
+    users = set(users_by_id.values())
+
+    if not include_avatars:
+        users = {
+            dataclasses.replace(user, avatar_url=None)
+            if (user.avatar_url is not None)
+            else user
+            for user in users
+        }
+
+    return users
+
+
+def _load_users_by_id(user_ids: set[UserID]) -> dict[UserID, User]:
     rows = (
         db.session.execute(
-            _get_user_stmt(include_avatars).filter(
-                DbUser.id.in_(frozenset(user_ids))
-            )
+            _get_user_stmt(True).filter(DbUser.id.in_(frozenset(user_ids)))
         )
         .tuples()
         .all()
     )
 
-    return {_user_row_to_dto(row) for row in rows}
+    users = [_user_row_to_dto(row) for row in rows]
+
+    return {user.id: user for user in users}
+
+
+def invalidate_cached_user(user_id: UserID) -> None:
+    """Drop the cached user (in all processes).
+
+    To be called after a change to a user's screen name, suspension
+    or deletion state, locale, or avatar.
+    """
+    _user_cache.invalidate_keys([user_id])
 
 
 def _get_user_stmt(include_avatar: bool) -> Select:
@@ -428,6 +461,42 @@ def _do_users_matching_filter_exist(
     )
 
 
+def find_assigned_screen_names(screen_names: set[str]) -> set[str]:
+    """Return those of the screen names that are already assigned.
+
+    Comparison is done case-insensitively. Matches are returned in
+    lowercase.
+    """
+    return _find_assigned_values(DbUser.screen_name, screen_names)
+
+
+def find_assigned_email_addresses(email_addresses: set[str]) -> set[str]:
+    """Return those of the email addresses that are already assigned.
+
+    Comparison is done case-insensitively. Matches are returned in
+    lowercase.
+    """
+    return _find_assigned_values(DbUser.email_address, email_addresses)
+
+
+def _find_assigned_values(
+    model_attribute: str, search_values: set[str]
+) -> set[str]:
+    if not search_values:
+        return set()
+
+    lowercased_values = {value.lower() for value in search_values}
+    lowercased_attribute = db.func.lower(model_attribute)
+
+    return set(
+        db.session.scalars(
+            select(lowercased_attribute).filter(
+                lowercased_attribute.in_(lowercased_values)
+            )
+        ).all()
+    )
+
+
 def get_users_created_since(
     delta: timedelta, limit: int | None = None
 ) -> list[UserForAdmin]:
@@ -8,10 +8,14 @@ byceps.services.user_badge.user_badge_service
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from operator import attrgetter
+
 from sqlalchemy import delete, select
 
 from byceps.database import db
 from byceps.typing import BrandID
+from byceps.util.dataloader import DataLoader
 
 from .dbmodels.badge import DbBadge
 from .models import Badge, BadgeID
@@ -65,6 +69,8 @@ def update_badge(
 
     db.session.commit()
 
+    _badge_loader.clear()
+
     return _db_entity_to_badge(badge)
 
 
@@ -73,6 +79,8 @@ def delete_badge(badge_id: BadgeID) -> None:
     db.session.execute(delete(DbBadge).filter_by(id=badge_id))
     db.session.commit()
 
+    _badge_loader.clear()
+
 
 def find_badge(badge_id: BadgeID) -> Badge | None:
     """Return the badge with that id, or `None` if not found."""
@@ -126,6 +134,25 @@ def get_badges(
     return {_db_entity_to_badge(badge) for badge in badges}
 
 
+def index_badges_by_id(badges: Iterable[Badge]) -> dict[BadgeID, Badge]:
+    """Map the badges' IDs to the corresponding badge objects."""
+    return {badge.id: badge for badge in badges}
+
+
+def load_badges(badge_ids: set[BadgeID]) -> dict[BadgeID, Badge]:
+    """Return the badges with those IDs, indexed by ID.
+
+    Badges already loaded this way during the current request are
+    not fetched again.
+    """
+    return _badge_loader.get_many(badge_ids)
+
+
+_badge_loader: DataLoader[BadgeID, Badge] = DataLoader(
+    'user_badge', get_badges, attrgetter('id')
+)
+
+
 def get_all_badges() -> set[Badge]:
     """Return all badges."""
     badges = db.session.scalars(select(DbBadge)).all()
@@ -0,0 +1,222 @@
+"""
+byceps.util.blobstore
+~~~~~~~~~~~~~~~~~~~~~
+
+Store files under the hash of their content, so that identical files
+are kept only once.
+
+A blob is published at any number of paths by hard-linking it there.
+The file system's link count thus doubles as the blob's reference
+count: a blob that is linked only from the store itself is no longer
+referenced and can be swept.
+
+Files derived from a blob (e.g. resized versions of an image) are kept
+by the blob's digest as well, so that they are created only once, and
+are published and swept the same way.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+import hashlib
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from time import time
+from typing import Any, IO
+
+
+CHUNK_SIZE = 64 * 1024
+
+# Files that have just been added have not been published yet, so
+# they must not be swept right away.
+MINIMUM_AGE_FOR_SWEEP = timedelta(hours=1)
+
+
+@dataclass(frozen=True)
+class Blob:
+    digest: str
+    path: Path
+    size: int  # in bytes
+
+
+@dataclass(frozen=True)
+class SweepReport:
+    num_deleted: int
+    bytes_reclaimed: int
+
+
+class BlobStore:
+    def __init__(self, root_path: Path) -> None:
+        self.root_path = root_path
+
+    def get_path(self, digest: str) -> Path:
+        """Return the path of the blob with that digest."""
+        return self.root_path / digest[:2] / digest[2:]
+
+    def get_derived_path(self, digest: str, name: str) -> Path:
+        """Return the path of the file with that name derived from the
+        blob with that digest.
+        """
+        return self.root_path / 'derived' / digest[:2] / digest[2:] / name
+
+    def add(self, source: IO[Any]) -> Blob:
+        """Store the source's content as a blob, unless a blob with
+        identical content already exists.
+        """
+        temporary_path, digest, size = self._write_temporary_file(source)
+
+        try:
+            path = self.get_path(digest)
+
+            if not _touch(path):
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temporary_path.replace(path)
+        finally:
+            temporary_path.unlink(missing_ok=True)
+
+        return Blob(digest, path, size)
+
+    def _write_temporary_file(self, source: IO[Any]) -> tuple[Path, str, int]:
+        """Copy the source to a temporary file, and return its path as
+        well as the content's SHA-256 digest and size.
+        """
+        temporary_files_path = self._get_temporary_files_path()
+        temporary_files_path.mkdir(parents=True, exist_ok=True)
+
+        fd, filename = tempfile.mkstemp(dir=temporary_files_path)
+        path = Path(filename)
+
+        # Published files have to be readable by the web server.
+        path.chmod(0o644)
+
+        with os.fdopen(fd, 'wb') as f:
+            digest, size = _copy_and_hash(source, f)
+
+        return path, digest, size
+
+    def _get_temporary_files_path(self) -> Path:
+        return self.root_path / 'tmp'
+
+    def publish(self, blob: Blob, target_path: Path) -> None:
+        """Make the blob available at the target path.
+
+        The blob is hard-linked. If that is not possible (e.g. because
+        the target path is on another file system), it is copied
+        instead. A copy does not count as reference to the blob.
+        """
+        _link(blob.path, target_path)
+
+    def publish_derived(
+        self,
+        source: IO[Any],
+        target_paths_by_name: dict[str, Path],
+        create: Callable[[dict[str, Path]], None],
+    ) -> None:
+        """Make files derived from the source's content available at
+        the target paths, by name.
+
+        Derived files that do not exist yet for that content are
+        created by calling `create` with the paths (by name) to write
+        them to.
+        """
+        digest, _ = _copy_and_hash(source, None)
+
+        derived_paths_by_name = {
+            name: self.get_derived_path(digest, name)
+            for name in target_paths_by_name
+        }
+
+        missing_paths_by_name = {
+            name: path
+            for name, path in derived_paths_by_name.items()
+            if not _touch(path)
+        }
+        if missing_paths_by_name:
+            for path in missing_paths_by_name.values():
+                path.parent.mkdir(parents=True, exist_ok=True)
+            create(missing_paths_by_name)
+
+        for name, target_path in target_paths_by_name.items():
+            _link(derived_paths_by_name[name], target_path)
+
+    def sweep(self, *, now: float | None = None) -> SweepReport:
+        """Delete blobs that are not published anywhere (anymore), as
+        well as temporary files left behind by aborted uploads.
+        """
+        if now is None:
+            now = time()
+
+        modified_before = now - MINIMUM_AGE_FOR_SWEEP.total_seconds()
+
+        num_deleted = 0
+        bytes_reclaimed = 0
+
+        for path in self._get_sweepable_paths():
+            stat = path.stat()
+            if (stat.st_nlink > 1) or (stat.st_mtime >= modified_before):
+                continue
+
+            path.unlink()
+            num_deleted += 1
+            bytes_reclaimed += stat.st_size
+
+        return SweepReport(num_deleted, bytes_reclaimed)
+
+    def _get_sweepable_paths(self) -> list[Path]:
+        blob_paths = self.root_path.glob('??/*')
+        derived_paths = self.root_path.glob('derived/??/*/*')
+        temporary_paths = self._get_temporary_files_path().glob('*')
+        return [*blob_paths, *derived_paths, *temporary_paths]
+
+
+def _copy_and_hash(source: IO[Any], target: IO[Any] | None) -> tuple[str, int]:
+    """Return the SHA-256 digest and size of the source's content,
+    copying it to the target (if given) along the way.
+    """
+    hash = hashlib.sha256()
+    size = 0
+
+    while chunk := source.read(CHUNK_SIZE):
+        hash.update(chunk)
+        if target is not None:
+            target.write(chunk)
+        size += len(chunk)
+
+    return hash.hexdigest(), size
+
+
+def _touch(path: Path) -> bool:
+    """Update the file's modification time, if it exists.
+
+    This keeps the file from being swept before it is published.
+    """
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return False
+
+    return True
+
+
+def _link(path: Path, target_path: Path) -> None:
+    """Hard-link the file to the target path.
+
+    If that is not possible (e.g. because the target path is on another
+    file system), copy it instead.
+    """
+    if target_path.exists():
+        raise FileExistsError
+
+    try:
+        os.link(path, target_path)
+    except FileExistsError:
+        raise
+    except OSError:
+        shutil.copyfile(path, target_path)
@@ -0,0 +1,301 @@
+"""
+byceps.util.caching
+~~~~~~~~~~~~~~~~~~~
+
+In-process caching, kept consistent across processes via Redis.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from threading import Lock
+from time import monotonic, time_ns
+from typing import Generic, TypeVar
+
+from flask import current_app, g, has_request_context
+
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+# Processes that have fallen behind by more key invalidations than are
+# logged drop all entries of the cache instead.
+MAX_LOGGED_KEY_INVALIDATIONS = 1000
+
+
+class Cache(Generic[K, V]):
+    """A cache held in process memory, shared by all threads of the
+    process.
+
+    Entries optionally expire after a time-to-live (in seconds).
+
+    To keep the caches of multiple processes consistent, a revision
+    number per cache is stored in Redis. Invalidating a cache increments
+    the revision, which makes every process drop its entries of that
+    cache on its next access. Invalidating only some keys additionally
+    logs them for that revision, so that other processes drop just
+    their entries for those keys. The revision is fetched from Redis at most
+    once per request.
+
+    Values are only cached through `get_or_load`/`get_many_or_load`,
+    which discard a loaded value if the cache has been invalidated while
+    it was being loaded (as it might already be outdated then).
+    """
+
+    def __init__(self, name: str, *, ttl: float | None = None) -> None:
+        self.name = name
+        self.ttl = ttl
+        self._entries: dict[K, tuple[V, float | None]] = {}
+        self._revision: int | None = None
+        self._lock = Lock()
+
+    def get(self, key: K) -> V | None:
+        """Return the value for the key, or `None` if not cached."""
+        self._sync_revision()
+        return self._get(key, monotonic())
+
+    def get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """Return the values for those of the keys that are cached."""
+        self._sync_revision()
+        return self._get_many(keys)
+
+    def _get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        now = monotonic()
+
+        values = {}
+        for key in keys:
+            value = self._get(key, now)
+            if value is not None:
+                values[key] = value
+
+        return values
+
+    def _get(self, key: K, now: float) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if (expires_at is not None) and (expires_at <= now):
+            self._entries.pop(key, None)
+            return None
+
+        return value
+
+    def get_or_load(self, key: K, load: Callable[[K], V]) -> V:
+        """Return the value for the key, loading it if not cached."""
+        values = self.get_many_or_load([key], lambda _: {key: load(key)})
+        return values[key]
+
+    def get_many_or_load(
+        self,
+        keys: Iterable[K],
+        load_many: Callable[[set[K]], dict[K, V]],
+    ) -> dict[K, V]:
+        """Return the values for the keys, loading those not cached.
+
+        Keys for which no value is loaded are omitted.
+        """
+        self._sync_revision()
+        revision_before_loading = self._revision
+
+        keys = set(keys)
+        values = self._get_many(keys)
+
+        missing_keys = keys - values.keys()
+        if missing_keys:
+            loaded_values = load_many(missing_keys)
+            self._set_many(loaded_values, revision_before_loading)
+            values.update(loaded_values)
+
+        return values
+
+    def _set_many(
+        self, values_by_key: dict[K, V], revision_before_loading: int | None
+    ) -> None:
+        """Cache the values for their keys, unless the cache has been
+        invalidated since before they were loaded.
+        """
+        if not values_by_key:
+            return
+
+        # Check with Redis directly: The revision synced at the
+        # beginning of the request might be outdated by now.
+        revision = get_revision(self.name)
+        self._apply_revision(revision)
+        if revision != revision_before_loading:
+            return
+
+        expires_at = (
+            (monotonic() + self.ttl) if (self.ttl is not None) else None
+        )
+
+        with self._lock:
+            # Another thread might have synced a newer revision.
+            if self._revision != revision_before_loading:
+                return
+
+            for key, value in values_by_key.items():
+                self._entries[key] = value, expires_at
+
+    def discard(self, key: K) -> None:
+        """Remove the key, if cached, in this process only."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries in this process only."""
+        with self._lock:
+            self._entries.clear()
+
+    def invalidate(self) -> None:
+        """Remove all entries, in this and in all other processes."""
+        revision = increment_revision(self.name)
+
+        with self._lock:
+            self._entries.clear()
+            self._revision = revision
+
+    def invalidate_keys(self, keys: Iterable[K]) -> None:
+        """Remove the keys, in this and in all other processes."""
+        keys = set(keys)
+        if not keys:
+            return
+
+        revision = increment_revision(self.name)
+        _log_invalidated_keys(self.name, revision, {str(key) for key in keys})
+        self._apply_revision(revision)
+
+    def _sync_revision(self) -> None:
+        """Drop outdated entries if the cache has been invalidated by
+        another process.
+
+        Within a request, this is only checked on first access.
+        """
+        if has_request_context():
+            synced_cache_names = g.setdefault('_synced_cache_names', set())
+            if self.name in synced_cache_names:
+                return
+
+            synced_cache_names.add(self.name)
+
+        self._apply_revision(get_revision(self.name))
+
+    def _apply_revision(self, revision: int) -> None:
+        previous_revision = self._revision
+        if revision == previous_revision:
+            return
+
+        invalidated_keys = None
+        if (previous_revision is not None) and (revision > previous_revision):
+            invalidated_keys = _get_invalidated_keys(
+                self.name, previous_revision, revision
+            )
+
+        with self._lock:
+            if (invalidated_keys is None) or (
+                self._revision != previous_revision
+            ):
+                self._entries.clear()
+            else:
+                for key in list(self._entries):
+                    if str(key) in invalidated_keys:
+                        del self._entries[key]
+
+            self._revision = revision
+
+
+def get_revision(name: str) -> int:
+    """Return the current revision number for that name.
+
+    Revisions start at 0.
+    """
+    value = _get_redis_client().get(_get_revision_key(name))
+    return int(value) if (value is not None) else 0
+
+
+def increment_revision(name: str) -> int:
+    """Increment the revision number for that name and return the new
+    revision number.
+    """
+    return _get_redis_client().incr(_get_revision_key(name))
+
+
+def get_expiring_revision(name: str, ttl: int) -> int:
+    """Return the current revision number for that name.
+
+    The revision expires after the time-to-live (in seconds) unless it
+    is incremented before. It is (re)initialized from the current time
+    so that no revision number is handed out again after an earlier
+    one has expired.
+    """
+    redis_client = _get_redis_client()
+    key = _get_revision_key(name)
+
+    redis_client.set(key, time_ns(), nx=True, ex=ttl)
+    value = redis_client.get(key)
+    return int(value) if (value is not None) else 0
+
+
+def increment_expiring_revision(name: str, ttl: int) -> int:
+    """Increment the expiring revision number for that name, reset its
+    time-to-live (in seconds), and return the new revision number.
+    """
+    redis_client = _get_redis_client()
+    key = _get_revision_key(name)
+
+    redis_client.set(key, time_ns(), nx=True, ex=ttl)
+    revision = redis_client.incr(key)
+    redis_client.expire(key, ttl)
+    return revision
+
+
+def _get_revision_key(name: str) -> str:
+    return f'byceps:cache:{name}:revision'
+
+
+def _log_invalidated_keys(name: str, revision: int, keys: set[str]) -> None:
+    """Log the keys as invalidated in that revision."""
+    redis_client = _get_redis_client()
+    log_key = _get_invalidated_keys_log_key(name)
+
+    redis_client.zadd(log_key, {f'{revision}:{key}': revision for key in keys})
+    redis_client.zremrangebyscore(
+        log_key, '-inf', revision - MAX_LOGGED_KEY_INVALIDATIONS
+    )
+
+
+def _get_invalidated_keys(
+    name: str, after_revision: int, up_to_revision: int
+) -> set[str] | None:
+    """Return the keys invalidated in the range of revisions, or `None`
+    if all keys have to be considered invalidated.
+    """
+    members = _get_redis_client().zrangebyscore(
+        _get_invalidated_keys_log_key(name), after_revision + 1, up_to_revision
+    )
+
+    revisions = set()
+    keys = set()
+    for member in members:
+        revision, _, key = member.decode('utf-8').partition(':')
+        revisions.add(int(revision))
+        keys.add(key)
+
+    # Revisions without logged keys stem from invalidations of the whole
+    # cache, or their keys have been dropped from the log already.
+    if len(revisions) < up_to_revision - after_revision:
+        return None
+
+    return keys
+
+
+def _get_invalidated_keys_log_key(name: str) -> str:
+    return f'byceps:cache:{name}:invalidated_keys'
+
+
+def _get_redis_client():
+    return current_app.redis_client
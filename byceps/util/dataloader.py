@@ -0,0 +1,88 @@
+"""
+byceps.util.dataloader
+~~~~~~~~~~~~~~~~~~~~~~
+
+Load entities by ID in bulk, and remember them for the rest of the
+request.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Callable, Generic, TypeVar
+
+from flask import has_request_context, request
+
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+_ENVIRON_KEY = 'byceps.dataloader.identity_maps'
+
+
+class DataLoader(Generic[K, V]):
+    """Load entities by ID, fetching only those not loaded yet during
+    the current request.
+
+    Repeated lookups of the same IDs within one request are answered
+    from a request-scoped identity map. IDs looked up together are
+    fetched with a single call to the bulk loading function.
+
+    Outside of a request, every lookup is passed on to the bulk loading
+    function.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        load_many: Callable[[set[K]], Iterable[V]],
+        get_key: Callable[[V], K],
+    ) -> None:
+        self.name = name
+        self._load_many = load_many
+        self._get_key = get_key
+
+    def get(self, key: K) -> V | None:
+        """Return the entity with that ID, or `None` if not found."""
+        return self.get_many({key}).get(key)
+
+    def get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """Return the entities with those IDs, indexed by ID.
+
+        IDs for which no entity exists are left out.
+        """
+        keys = set(keys)
+        identity_map = self._get_identity_map()
+
+        missing_keys = keys - identity_map.keys()
+        if missing_keys:
+            # Absent entities are not remembered as they might be
+            # created later on during the request.
+            for value in self._load_many(missing_keys):
+                identity_map[self._get_key(value)] = value
+
+        return {key: identity_map[key] for key in keys if key in identity_map}
+
+    def prime(self, values: Iterable[V]) -> None:
+        """Add already loaded entities to the identity map."""
+        identity_map = self._get_identity_map()
+        for value in values:
+            identity_map[self._get_key(value)] = value
+
+    def clear(self) -> None:
+        """Forget the entities loaded during the current request.
+
+        To be called after changing or deleting entities.
+        """
+        self._get_identity_map().clear()
+
+    def _get_identity_map(self) -> dict[K, V]:
+        if not has_request_context():
+            return {}
+
+        identity_maps = request.environ.setdefault(_ENVIRON_KEY, {})
+        return identity_maps.setdefault(self.name, {})
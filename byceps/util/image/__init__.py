@@ -6,12 +6,18 @@ byceps.util.image
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
+
+from collections.abc import Iterable
 from io import BytesIO
-from typing import BinaryIO, Union
+from pathlib import Path
+from typing import BinaryIO, TYPE_CHECKING, Union
+
+from .models import Dimensions, ImageVariant
 
-from PIL import Image, ImageFile
 
-from .models import Dimensions
+if TYPE_CHECKING:
+    from PIL import Image
 
 
 FilenameOrStream = Union[str, BinaryIO]
@@ -19,10 +25,24 @@ FilenameOrStream = Union[str, BinaryIO]
 
 def read_dimensions(filename_or_stream: FilenameOrStream) -> Dimensions:
     """Return the dimensions of the image."""
+    # Imported on first use as it takes a while to load.
+    from PIL import Image
+
     image = Image.open(filename_or_stream)
     return Dimensions(*image.size)
 
 
+def verify(filename_or_stream: FilenameOrStream) -> None:
+    """Check the image for being broken, without decoding it.
+
+    Raise an exception if it is.
+    """
+    from PIL import Image
+
+    with Image.open(filename_or_stream) as image:
+        image.verify()
+
+
 def create_thumbnail(
     filename_or_stream: FilenameOrStream,
     image_type: str,
@@ -31,6 +51,8 @@ def create_thumbnail(
     force_square: bool = False,
 ) -> BinaryIO:
     """Create a thumbnail from the given image and return the result stream."""
+    from PIL import Image
+
     output_stream = BytesIO()
 
     image = Image.open(filename_or_stream)
@@ -46,7 +68,39 @@ def create_thumbnail(
     return output_stream
 
 
-def _crop_to_square(image: ImageFile) -> ImageFile:
+def create_square_variants(
+    filename_or_stream: FilenameOrStream, variants: Iterable[ImageVariant]
+) -> None:
+    """Crop the image to be square and save it in the variants' sizes
+    and formats.
+
+    Each variant is written to a temporary file first and then moved
+    into place, so it never appears partially written.
+    """
+    from PIL import Image
+
+    with Image.open(filename_or_stream) as image:
+        square_image = _crop_to_square(image)
+
+        for variant in variants:
+            variant_image = square_image.copy()
+            variant_image.thumbnail(
+                variant.dimensions, resample=Image.Resampling.LANCZOS
+            )
+            _save_atomically(
+                variant_image, variant.path, variant.image_type.name
+            )
+
+
+def _save_atomically(image: Image.Image, path: Path, format: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    temporary_path = path.with_name(f'.{path.name}.tmp')
+    image.save(temporary_path, format=format)
+    temporary_path.replace(path)
+
+
+def _crop_to_square(image: Image.Image) -> Image.Image:
     """Crop image to be square."""
     dimensions = Dimensions(*image.size)
 
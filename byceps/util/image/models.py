@@ -7,7 +7,9 @@ byceps.util.image.models
 """
 
 from collections import namedtuple
+from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
 
 
 class Dimensions(namedtuple('Dimensions', ['width', 'height'])):
@@ -21,3 +23,12 @@ class Dimensions(namedtuple('Dimensions', ['width', 'height'])):
 
 
 ImageType = Enum('ImageType', ['gif', 'jpeg', 'png', 'svg', 'webp'])
+
+
+@dataclass(frozen=True)
+class ImageVariant:
+    """A version of an image in a specific size and format."""
+
+    dimensions: Dimensions
+    image_type: ImageType
+    path: Path
@@ -9,7 +9,7 @@ byceps.util.iterables
 from __future__ import annotations
 
 from collections.abc import Iterable, Iterator
-from itertools import tee
+from itertools import islice, tee
 from typing import Callable, TypeVar
 
 
@@ -18,6 +18,20 @@ T = TypeVar('T')
 Predicate = Callable[[T], bool]
 
 
+def chunked(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Split the iterable into lists of (at most) `size` elements each.
+
+    Example:
+        chunked([1, 2, 3, 4, 5], 2) -> [1, 2], [3, 4], [5]
+    """
+    if size < 1:
+        raise ValueError('Chunk size must be at least 1.')
+
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
 def find(iterable: Iterable[T], predicate: Predicate) -> T | None:
     """Return the first element in the iterable that matches the
     predicate.
@@ -11,12 +11,50 @@ An asynchronously processed job queue based on Redis_ and RQ_.
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
+
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Callable
 
 from flask import current_app
 from rq import Connection, Queue
+from rq.exceptions import NoSuchJobError
+from rq.job import Job
+
+
+# jobs somebody is waiting for right now (e.g. at the entrance)
+CRITICAL_QUEUE_NAME = 'critical'
+
+# e-mails
+MAIL_QUEUE_NAME = 'mail'
+
+# webhook announcements
+ANNOUNCE_QUEUE_NAME = 'announce'
+
+DEFAULT_QUEUE_NAME = 'default'
+
+# long-running jobs and maintenance tasks
+BULK_QUEUE_NAME = 'bulk'
+
+# in order of priority, highest first
+QUEUE_NAMES = [
+    CRITICAL_QUEUE_NAME,
+    MAIL_QUEUE_NAME,
+    ANNOUNCE_QUEUE_NAME,
+    DEFAULT_QUEUE_NAME,
+    BULK_QUEUE_NAME,
+]
+
+
+@dataclass(frozen=True)
+class QueueStats:
+    name: str
+    length: int
+    oldest_job_age: float  # in seconds, 0 if empty
+    started_count: int
+    failed_count: int
 
 
 @contextmanager
@@ -25,19 +63,25 @@ def connection():
         yield
 
 
-def get_queue(app):
+def get_queue(app, name: str = DEFAULT_QUEUE_NAME):
     is_async = app.config['JOBS_ASYNC']
-    return Queue(is_async=is_async)
+    return Queue(name, is_async=is_async)
 
 
-def enqueue(func: Callable, *args, **kwargs):
+def enqueue(func: Callable, *args, queue: str = DEFAULT_QUEUE_NAME, **kwargs):
     """Add the function call to the queue as a job."""
     with connection():
-        queue = get_queue(current_app)
-        queue.enqueue(func, *args, **kwargs)
+        rq_queue = get_queue(current_app, queue)
+        rq_queue.enqueue(func, *args, **kwargs)
 
 
-def enqueue_at(dt: datetime, func: Callable, *args, **kwargs):
+def enqueue_at(
+    dt: datetime,
+    func: Callable,
+    *args,
+    queue: str = DEFAULT_QUEUE_NAME,
+    **kwargs,
+):
     """Add the function call to the queue as a job to be executed at the
     specific time.
     """
@@ -47,5 +91,47 @@ def enqueue_at(dt: datetime, func: Callable, *args, **kwargs):
         dt = dt.replace(tzinfo=timezone.utc)
 
     with connection():
-        queue = get_queue(current_app)
-        queue.enqueue_at(dt, func, *args, **kwargs)
+        rq_queue = get_queue(current_app, queue)
+        rq_queue.enqueue_at(dt, func, *args, **kwargs)
+
+
+def get_queue_stats(app, *, now: datetime | None = None) -> list[QueueStats]:
+    """Return the number of jobs waiting in each queue, and for how long
+    the oldest of them has been waiting.
+    """
+    if now is None:
+        now = datetime.utcnow()
+
+    with connection():
+        return [
+            _get_stats_for_queue(get_queue(app, name), now)
+            for name in QUEUE_NAMES
+        ]
+
+
+def _get_stats_for_queue(queue: Queue, now: datetime) -> QueueStats:
+    return QueueStats(
+        name=queue.name,
+        length=queue.count,
+        oldest_job_age=_get_oldest_job_age(queue, now),
+        started_count=queue.started_job_registry.count,
+        failed_count=queue.failed_job_registry.count,
+    )
+
+
+def _get_oldest_job_age(queue: Queue, now: datetime) -> float:
+    job_ids = queue.get_job_ids(0, 1)
+    if not job_ids:
+        return 0.0
+
+    try:
+        job = Job.fetch(job_ids[0], connection=queue.connection)
+    except NoSuchJobError:
+        # The job has been taken off the queue in the meantime.
+        return 0.0
+
+    if job.enqueued_at is None:
+        return 0.0
+
+    enqueued_at = job.enqueued_at.replace(tzinfo=None)
+    return max((now - enqueued_at).total_seconds(), 0.0)
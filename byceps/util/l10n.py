@@ -14,7 +14,7 @@ from collections.abc import Iterator
 from contextlib import contextmanager
 
 from babel import Locale
-from flask import current_app, g, request
+from flask import current_app, Flask, g, request
 from flask_babel import force_locale, format_currency, get_locale
 from moneyed import Money
 from wtforms import Form
@@ -31,8 +31,7 @@ def get_current_user_locale() -> str | None:
 
     if request:
         # Try to match user agent's accepted languages.
-        languages = [locale.language for locale in g.locales]
-        return request.accept_languages.best_match(languages)
+        return request.accept_languages.best_match(current_app.locale_languages)
 
     return None
 
@@ -62,9 +61,23 @@ def get_user_locale(user: User) -> str:
 BASE_LOCALE = Locale('en')
 
 
+def load_locales(app: Flask) -> None:
+    """Determine the available locales and keep them on the app.
+
+    Listing the translations scans the translation directories, so do
+    it once instead of per request. Call again to pick up translations
+    that have been added since.
+    """
+    with app.app_context():
+        locales = [BASE_LOCALE] + app.babel_instance.list_translations()
+
+    app.locales = locales
+    app.locale_languages = [locale.language for locale in locales]
+
+
 def get_locales() -> list[Locale]:
     """List available locales."""
-    return [BASE_LOCALE] + current_app.babel_instance.list_translations()
+    return current_app.locales
 
 
 def get_locale_str() -> str | None:
@@ -0,0 +1,131 @@
+"""
+byceps.util.query_instrumentation
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Track the SQL statements executed per request to log slow requests,
+enforce a query budget, and have metrics recorded.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from contextlib import ExitStack
+from time import perf_counter
+
+from blinker import Namespace
+from flask import (
+    current_app,
+    Flask,
+    g,
+    request,
+    request_finished,
+    request_started,
+    request_tearing_down,
+)
+import structlog
+
+from .query_stats import collect_query_stats, QueryStats
+
+
+log = structlog.get_logger()
+
+
+_signals = Namespace()
+
+# Sent with the endpoint and the collected statistics after each
+# request, e.g. to record metrics.
+request_queries_collected = _signals.signal('request-queries-collected')
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def init_app(app: Flask) -> None:
+    """Track the statements executed per request, if configured."""
+    if not _is_enabled(app):
+        return
+
+    request_started.connect(_start_tracking, app)
+    request_finished.connect(_enforce_budget, app)
+    request_tearing_down.connect(_stop_tracking, app)
+
+    log.info('Query instrumentation enabled')
+
+
+def _is_enabled(app: Flask) -> bool:
+    return (
+        app.config['QUERY_METRICS_ENABLED']
+        or (app.config['QUERY_BUDGET'] is not None)
+        or (app.config['SLOW_REQUEST_THRESHOLD'] is not None)
+    )
+
+
+def _start_tracking(sender: Flask, **extra) -> None:
+    exit_stack = ExitStack()
+    g.query_stats = exit_stack.enter_context(collect_query_stats())
+    g.query_stats_exit_stack = exit_stack
+    g.request_started_at = perf_counter()
+
+
+def _enforce_budget(sender: Flask, **extra) -> None:
+    stats = g.get('query_stats')
+    budget = sender.config['QUERY_BUDGET']
+    if (stats is None) or (budget is None) or (stats.query_count <= budget):
+        return
+
+    top_statements = '\n\n'.join(
+        f'{totals.count}x: {statement}'
+        for statement, totals in stats.get_slowest_statements(5)
+    )
+    raise QueryBudgetExceeded(
+        f'{request.method} {request.full_path} executed '
+        f'{stats.query_count} SQL statements, but the budget is {budget}.'
+        f'\n\n{top_statements}'
+    )
+
+
+def _stop_tracking(sender: Flask, **extra) -> None:
+    exit_stack = g.pop('query_stats_exit_stack', None)
+    if exit_stack is None:
+        return
+
+    exit_stack.close()
+
+    stats = g.pop('query_stats')
+    duration = perf_counter() - g.pop('request_started_at')
+    endpoint = request.endpoint or 'unknown'
+
+    request_queries_collected.send(sender, endpoint=endpoint, stats=stats)
+
+    threshold = sender.config['SLOW_REQUEST_THRESHOLD']
+    if (threshold is not None) and (duration >= threshold):
+        _log_slow_request(endpoint, duration, stats)
+
+
+def _log_slow_request(
+    endpoint: str, duration: float, stats: QueryStats
+) -> None:
+    limit = current_app.config['SLOW_REQUEST_LOGGED_STATEMENTS']
+
+    top_statements = [
+        {
+            'statement': ' '.join(statement.split()),
+            'count': totals.count,
+            'duration_ms': round(totals.duration * 1000, 1),
+        }
+        for statement, totals in stats.get_slowest_statements(limit)
+    ]
+
+    log.warning(
+        'Slow request',
+        method=request.method,
+        path=request.path,
+        endpoint=endpoint,
+        duration_ms=round(duration * 1000, 1),
+        query_count=stats.query_count,
+        query_duration_ms=round(stats.duration * 1000, 1),
+        top_statements=top_statements,
+    )
@@ -0,0 +1,134 @@
+"""
+byceps.util.query_stats
+~~~~~~~~~~~~~~~~~~~~~~~
+
+Count the SQL statements executed and measure the time spent on them.
+
+Statements are attributed to the innermost public function of a
+service module (`byceps.services.*`) they were issued from.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import sys
+from time import perf_counter
+from types import FrameType
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+SERVICE_MODULE_PREFIX = 'byceps.services.'
+
+UNKNOWN_FUNCTION = 'unknown'
+
+
+@dataclass
+class Totals:
+    count: int = 0
+    duration: float = 0.0  # in seconds
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+
+
+@dataclass
+class QueryStats:
+    query_count: int = 0
+    duration: float = 0.0  # in seconds
+    totals_by_function: dict[str, Totals] = field(default_factory=dict)
+    totals_by_statement: dict[str, Totals] = field(default_factory=dict)
+
+    def add(self, statement: str, function: str, duration: float) -> None:
+        self.query_count += 1
+        self.duration += duration
+        self.totals_by_function.setdefault(function, Totals()).add(duration)
+        self.totals_by_statement.setdefault(statement, Totals()).add(duration)
+
+    def get_slowest_statements(self, limit: int) -> list[tuple[str, Totals]]:
+        """Return the statements that took the most time in total."""
+        return sorted(
+            self.totals_by_statement.items(),
+            key=lambda item: item[1].duration,
+            reverse=True,
+        )[:limit]
+
+
+_active_stats: ContextVar[tuple[QueryStats, ...]] = ContextVar(
+    'query_stats', default=()
+)
+
+
+@contextmanager
+def collect_query_stats() -> Iterator[QueryStats]:
+    """Collect statistics on the statements executed within the block.
+
+    Blocks can be nested; a statement is recorded in each enclosing
+    block.
+    """
+    enable_query_tracking()
+
+    stats = QueryStats()
+    token = _active_stats.set(_active_stats.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active_stats.reset(token)
+
+
+def enable_query_tracking() -> None:
+    """Register the statement execution listeners (once)."""
+    if event.contains(Engine, 'before_cursor_execute', _before_execute):
+        return
+
+    event.listen(Engine, 'before_cursor_execute', _before_execute)
+    event.listen(Engine, 'after_cursor_execute', _after_execute)
+
+
+def _before_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    if not _active_stats.get():
+        return
+
+    conn.info.setdefault('query_start_times', []).append(perf_counter())
+
+
+def _after_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    active_stats = _active_stats.get()
+    start_times = conn.info.get('query_start_times')
+    if not active_stats or not start_times:
+        return
+
+    duration = perf_counter() - start_times.pop()
+    function = _find_service_function(sys._getframe(1))
+
+    for stats in active_stats:
+        stats.add(statement, function, duration)
+
+
+def _find_service_function(frame: FrameType | None) -> str:
+    """Return the qualified name of the innermost public service
+    function on the stack.
+    """
+    while frame is not None:
+        module_name = frame.f_globals.get('__name__', '')
+        function_name = frame.f_code.co_name
+        if module_name.startswith(SERVICE_MODULE_PREFIX) and not (
+            function_name.startswith(('_', '<'))
+        ):
+            return f'{module_name}.{function_name}'
+
+        frame = frame.f_back
+
+    return UNKNOWN_FUNCTION
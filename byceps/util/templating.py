@@ -11,18 +11,24 @@ Templating utilities
 from __future__ import annotations
 
 from pathlib import Path
+from threading import Lock
+from time import perf_counter
 from typing import Any, Callable
 
-from flask import g
+from flask import Flask, g
 from jinja2 import (
     BaseLoader,
     Environment,
-    FileSystemLoader,
     FunctionLoader,
     Template,
     TemplateNotFound,
+    TemplateSyntaxError,
 )
 from jinja2.sandbox import ImmutableSandboxedEnvironment
+import structlog
+
+
+log = structlog.get_logger()
 
 
 SITES_PATH = Path('sites')
@@ -51,45 +57,151 @@ def create_sandboxed_environment(
     return ImmutableSandboxedEnvironment(loader=loader, autoescape=autoescape)
 
 
-class SiteTemplateOverridesLoader(BaseLoader):
-    """Look for site-specific template overrides."""
+class TemplateIndexLoader(BaseLoader):
+    """Look up templates in an index of the template folders of the
+    app and its blueprints.
+
+    Unlike Flask's default loader, this does not probe every
+    blueprint's template folder in turn for each template that is not
+    yet cached.
 
-    def __init__(self) -> None:
-        self._loaders_by_site_id: dict[str, BaseLoader] = {}
+    If enabled, site-specific template overrides take precedence.
+
+    The indexes are built on first use. Templates added later are only
+    found after a restart.
+    """
+
+    def __init__(self, app: Flask, *, site_overrides: bool = False) -> None:
+        self.app = app
+        self.site_overrides = site_overrides
+        self._paths_by_name: dict[str, Path] | None = None
+        self._override_paths_by_name_by_site_id: dict[str, dict[str, Path]] = {}
+        self._lock = Lock()
 
     def get_source(
         self, environment: Environment, template: str
     ) -> tuple[str, str | None, Callable[[], bool] | None]:
-        site_id = getattr(g, 'site_id', None)
-        if site_id is None:
-            # Site could not be determined. Thus, no site-specific
-            # template loader is available.
+        path = self._find_path(template)
+        if path is None:
             raise TemplateNotFound(template)
 
-        loader = self._get_loader(site_id)
+        return _load_source(path, template)
 
-        try:
-            return loader.get_source(environment, template)
-        except TemplateNotFound:
-            pass
+    def list_templates(self) -> list[str]:
+        names = set(self._get_paths_by_name())
 
-        # Site does not override template.
-        raise TemplateNotFound(template)
+        site_id = self._get_site_id()
+        if site_id is not None:
+            names.update(self._get_override_paths_by_name(site_id))
 
-    def _get_loader(self, site_id: str) -> BaseLoader:
-        """Look up site-specific loader.
+        return sorted(names)
 
-        Create if not available.
+    def _find_path(self, template: str) -> Path | None:
+        site_id = self._get_site_id()
+        if site_id is not None:
+            path = self._get_override_paths_by_name(site_id).get(template)
+            if path is not None:
+                return path
+
+        return self._get_paths_by_name().get(template)
+
+    def _get_site_id(self) -> str | None:
+        """Return the ID of the site whose template overrides apply,
+        if any.
         """
-        loader = self._loaders_by_site_id.get(site_id)
+        if not self.site_overrides:
+            return None
+
+        return getattr(g, 'site_id', None)
+
+    def _get_paths_by_name(self) -> dict[str, Path]:
+        if self._paths_by_name is None:
+            with self._lock:
+                if self._paths_by_name is None:
+                    self._paths_by_name = self._build_index()
+
+        return self._paths_by_name
 
-        if loader is None:
-            loader = self._create_loader(site_id)
-            self._loaders_by_site_id[site_id] = loader
+    def _build_index(self) -> dict[str, Path]:
+        # Same precedence as Flask's loader: the app's own template
+        # folder first, then those of the blueprints in the order of
+        # their registration.
+        paths_by_name: dict[str, Path] = {}
 
-        return loader
+        for scaffold in [self.app, *self.app.iter_blueprints()]:
+            if scaffold.template_folder is None:
+                continue
 
-    def _create_loader(self, site_id: str) -> BaseLoader:
-        """Create file system loader for site-specific search path."""
-        search_path = SITES_PATH / site_id / 'template_overrides'
-        return FileSystemLoader(search_path)
+            search_path = Path(scaffold.root_path) / scaffold.template_folder
+            for name, path in _index_folder(search_path).items():
+                paths_by_name.setdefault(name, path)
+
+        return paths_by_name
+
+    def _get_override_paths_by_name(self, site_id: str) -> dict[str, Path]:
+        paths_by_name = self._override_paths_by_name_by_site_id.get(site_id)
+
+        if paths_by_name is None:
+            search_path = SITES_PATH / site_id / 'template_overrides'
+            paths_by_name = _index_folder(search_path)
+            self._override_paths_by_name_by_site_id[site_id] = paths_by_name
+
+        return paths_by_name
+
+
+def _index_folder(search_path: Path) -> dict[str, Path]:
+    """Map the names of the templates in the folder to their paths."""
+    if not search_path.is_dir():
+        return {}
+
+    return {
+        path.relative_to(search_path).as_posix(): path
+        for path in search_path.rglob('*')
+        if path.is_file()
+    }
+
+
+def _load_source(
+    path: Path, template: str
+) -> tuple[str, str, Callable[[], bool]]:
+    try:
+        mtime = path.stat().st_mtime
+        source = path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        raise TemplateNotFound(template) from None
+
+    def uptodate() -> bool:
+        try:
+            return path.stat().st_mtime == mtime
+        except OSError:
+            return False
+
+    return source, str(path), uptodate
+
+
+def warm_up_templates(app: Flask) -> None:
+    """Load and compile all templates so that requests do not have to."""
+    started_at = perf_counter()
+    compiled_count = 0
+
+    with app.app_context():
+        if app.byceps_app_mode.is_site():
+            # Include the site's template overrides.
+            g.site_id = app.config['SITE_ID']
+
+        for name in app.jinja_env.list_templates():
+            try:
+                app.jinja_env.get_template(name)
+            except TemplateSyntaxError as e:
+                log.warning(
+                    'Could not compile template', template=name, error=str(e)
+                )
+                continue
+
+            compiled_count += 1
+
+    log.info(
+        'Templates compiled',
+        count=compiled_count,
+        duration_ms=round((perf_counter() - started_at) * 1000),
+    )
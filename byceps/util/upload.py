@@ -2,14 +2,25 @@
 byceps.util.upload
 ~~~~~~~~~~~~~~~~~~
 
+Within an application context, uploaded files (as well as files
+derived from them) are kept in the blob store (below the data path), so
+that identical files are stored (and processed) only once.
+
 :Copyright: 2014-2023 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
+
+from collections.abc import Callable
 from pathlib import Path
 from shutil import copyfileobj
 from typing import Any, IO
 
+from flask import current_app, has_app_context
+
+from .blobstore import BlobStore, SweepReport
+
 
 def store(
     source: IO[Any],
@@ -23,19 +34,76 @@ def store(
 
     if create_parent_path_if_nonexistent:
         _create_path_if_nonexistent(target_path.parent)
+    elif not target_path.parent.exists():
+        raise FileNotFoundError(target_path.parent)
+
+    blob_store = _find_blob_store()
+    if blob_store is None:
+        with target_path.open('wb') as f:
+            copyfileobj(source, f)
+        return
+
+    blob = blob_store.add(source)
+    blob_store.publish(blob, target_path)
+
+
+def store_derived(
+    source_path: Path,
+    target_paths_by_name: dict[str, Path],
+    create: Callable[[dict[str, Path]], None],
+) -> None:
+    """Store files derived from the source file (e.g. resized versions
+    of an image) at the target paths, by name.
+
+    `create` is called with the paths (by name) to write the derived
+    files to. With the blob store, that only happens for derived files
+    that do not exist yet for the source file's content.
 
-    with target_path.open('wb') as f:
-        copyfileobj(source, f)
+    Files at the target paths are replaced.
+    """
+    for target_path in target_paths_by_name.values():
+        delete(target_path)
+
+    blob_store = _find_blob_store()
+    if blob_store is None:
+        create(target_paths_by_name)
+        return
+
+    with source_path.open('rb') as source:
+        blob_store.publish_derived(source, target_paths_by_name, create)
 
 
 def delete(path: Path) -> None:
-    """Delete the path."""
+    """Delete the path.
+
+    The blob stored for it is left to be swept.
+    """
     try:
         path.unlink()
     except OSError:
         pass
 
 
+def sweep_blobs() -> SweepReport:
+    """Delete stored blobs that are no longer referenced."""
+    blob_store = _find_blob_store()
+    if blob_store is None:
+        raise RuntimeError('No data path configured for the blob store.')
+
+    return blob_store.sweep()
+
+
+def _find_blob_store() -> BlobStore | None:
+    if not has_app_context():
+        return None
+
+    data_path = current_app.config.get('PATH_DATA')
+    if data_path is None:
+        return None
+
+    return BlobStore(data_path / 'blobs')
+
+
 def _create_path_if_nonexistent(path: Path) -> None:
     """Create the path (and its parent paths) if it does not exist."""
     if not path.exists():
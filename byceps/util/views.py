@@ -99,6 +99,22 @@ def respond_created(f):
     return wrapper
 
 
+def respond_accepted(f):
+    """Send a ``202 Accepted`` response.
+
+    The decorated callable is expected to return the URL of a resource
+    that reports on the progress of the processing.  That URL is then
+    added to the response as ``Location:`` header.
+    """
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        url = f(*args, **kwargs)
+        return Response(status=202, headers=[('Location', url)])
+
+    return wrapper
+
+
 def respond_no_content(f):
     """Send a ``204 No Content`` response.
 
@@ -9,11 +9,8 @@
 from datetime import datetime
 
 import click
-from sqlalchemy import select
 
-from byceps.database import db
-from byceps.services.user import user_service
-from byceps.services.user.dbmodels.log import DbUserLogEntry
+from byceps.services.user import user_log_service, user_service
 from byceps.services.user.models.user import User
 from byceps.typing import UserID
 
@@ -36,15 +33,9 @@ def execute(ip_address: str) -> None:
 
 
 def find_log_entries(ip_address: str) -> list[tuple[datetime, UserID]]:
-    return db.session.execute(
-        select(
-            DbUserLogEntry.occurred_at,
-            DbUserLogEntry.user_id,
-        )
-        .filter_by(event_type='user-logged-in')
-        .filter(DbUserLogEntry.data['ip_address'].astext == ip_address)
-        .order_by(DbUserLogEntry.occurred_at)
-    ).all()
+    log_entries = user_log_service.get_login_entries_for_ip_address(ip_address)
+
+    return [(entry.occurred_at, entry.user_id) for entry in log_entries]
 
 
 def get_users_by_id(
@@ -8,7 +8,7 @@ tests.helpers
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
 from datetime import date, datetime
 from pathlib import Path
@@ -37,6 +37,7 @@ from byceps.services.site.models import SiteID
 from byceps.services.user import user_creation_service, user_service
 from byceps.services.user.models.user import User
 from byceps.typing import BrandID, PartyID, UserID
+from byceps.util.query_stats import collect_query_stats, QueryStats
 
 
 CONFIG_FILENAME_TESTING = Path('..') / 'config' / 'testing.toml'
@@ -247,6 +248,20 @@ def _add_user_credentials_to_session(client, user_id: UserID) -> None:
         session['user_auth_token'] = str(session_token.token)
 
 
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryStats]:
+    """Fail if more SQL statements than allowed are executed within the
+    block.
+    """
+    with collect_query_stats() as stats:
+        yield stats
+
+    assert stats.query_count <= max_queries, (
+        f'{stats.query_count} SQL statements executed, '
+        f'but the budget is {max_queries}'
+    )
+
+
 def log_in_user(user_id: UserID) -> None:
     """Authenticate the user to create a session."""
     authn_session_service.get_session_token(user_id)
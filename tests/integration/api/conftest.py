@@ -24,11 +24,18 @@ def api_client(api_app):
 
 
 @pytest.fixture(scope='package')
-def api_token(admin_user) -> ApiToken:
+def api_token_and_token(admin_user) -> tuple[ApiToken, str]:
     permissions: set[PermissionID] = set()
     return authn_api_service.create_api_token(admin_user.id, permissions)
 
 
 @pytest.fixture(scope='package')
-def api_client_authz_header(api_token: ApiToken):
-    return 'Authorization', f'Bearer {api_token.token}'
+def api_token(api_token_and_token) -> ApiToken:
+    api_token, _ = api_token_and_token
+    return api_token
+
+
+@pytest.fixture(scope='package')
+def api_client_authz_header(api_token_and_token):
+    _, token = api_token_and_token
+    return 'Authorization', f'Bearer {token}'
@@ -3,6 +3,7 @@
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from io import BytesIO
 from pathlib import Path
 
 from byceps.services.tourney.avatar import tourney_avatar_service
@@ -13,11 +14,36 @@ def test_create(api_client, api_client_authz_header, party, user):
         api_client, api_client_authz_header, party.id, user.id
     )
 
-    assert response.status_code == 201
+    assert response.status_code == 202
+
+    # Jobs are run synchronously in tests, so the image has already
+    # been processed.
+    state_response = api_client.get(
+        response.location, headers=[api_client_authz_header]
+    )
+    assert state_response.status_code == 200
+    assert state_response.json['ready']
 
     tear_down_avatar(response)
 
 
+def test_create_fails_with_broken_image(
+    api_client, api_client_authz_header, party, user
+):
+    with Path('tests/fixtures/images/image.png').open('rb') as f:
+        truncated_data = f.read()[:-20]
+
+    response = send_request(
+        api_client,
+        api_client_authz_header,
+        party.id,
+        user.id,
+        image_file=(BytesIO(truncated_data), 'image.png'),
+    )
+
+    assert response.status_code == 400
+
+
 def test_create_fails_with_unknown_user_id(
     api_client, api_client_authz_header, party
 ):
@@ -66,18 +92,23 @@ def test_create_fails_with_deleted_user(
 # helpers
 
 
-def send_request(api_client, api_client_authz_header, party_id, creator_id):
+def send_request(
+    api_client, api_client_authz_header, party_id, creator_id, image_file=None
+):
+    if image_file is None:
+        with Path('tests/fixtures/images/image.png').open('rb') as f:
+            image_file = (BytesIO(f.read()), 'image.png')
+
     url = '/api/v1/tourney/avatars'
 
     headers = [api_client_authz_header]
-    with Path('tests/fixtures/images/image.png').open('rb') as image_file:
-        form_data = {
-            'image': image_file,
-            'party_id': party_id,
-            'creator_id': creator_id,
-        }
+    form_data = {
+        'image': image_file,
+        'party_id': party_id,
+        'creator_id': creator_id,
+    }
 
-        return api_client.post(url, headers=headers, data=form_data)
+    return api_client.post(url, headers=headers, data=form_data)
 
 
 def tear_down_avatar(response):
@@ -86,5 +117,4 @@ def tear_down_avatar(response):
 
 
 def extract_avatar_id(response) -> str:
-    filename = response.location.rsplit('/', 1)[1]
-    return filename.split('.')[0]
+    return response.location.rsplit('/', 1)[1]
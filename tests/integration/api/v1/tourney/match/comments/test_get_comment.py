@@ -114,6 +114,18 @@ def test_get_comment_with_edited_comment(
 # helpers
 
 
+def test_get_comment_not_modified(api_client, api_client_authz_header, comment):
+    url = f'/api/v1/tourney/match_comments/{comment.id}'
+    headers = [api_client_authz_header]
+
+    response1 = api_client.get(url, headers=headers)
+    assert response1.status_code == 200
+    etag = response1.headers['ETag']
+
+    response2 = api_client.get(url, headers=[*headers, ('If-None-Match', etag)])
+    assert response2.status_code == 304
+
+
 @pytest.fixture()
 def match(api_app):
     return tourney_match_service.create_match()
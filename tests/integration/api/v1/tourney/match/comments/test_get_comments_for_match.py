@@ -126,6 +126,20 @@ def test_get_comments_for_match_with_edited_comment(
 # helpers
 
 
+def test_get_comments_for_match_not_modified(
+    api_client, api_client_authz_header, match, comment
+):
+    url = f'/api/v1/tourney/matches/{match.id}/comments'
+    headers = [api_client_authz_header]
+
+    response1 = api_client.get(url, headers=headers)
+    assert response1.status_code == 200
+    etag = response1.headers['ETag']
+
+    response2 = api_client.get(url, headers=[*headers, ('If-None-Match', etag)])
+    assert response2.status_code == 304
+
+
 @pytest.fixture()
 def match(api_app):
     return tourney_match_service.create_match()
@@ -3,6 +3,12 @@
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from pathlib import Path
+
+from byceps.services.user import user_avatar_service
+from byceps.util.image.models import ImageType
+
+
 CONTENT_TYPE_JSON = 'application/json'
 
 
@@ -19,6 +25,38 @@ def test_with_existent_user(api_client, user):
     assert response_data['avatar_url'] is None
 
 
+def test_with_existent_user_not_modified(api_client, user):
+    response1 = send_request(api_client, user.id)
+    assert response1.status_code == 200
+    assert response1.headers['Cache-Control'] == 'public, max-age=60'
+    etag = response1.headers['ETag']
+
+    response2 = api_client.get(
+        f'/api/v1/users/{user.id}/profile', headers={'If-None-Match': etag}
+    )
+    assert response2.status_code == 304
+
+
+def test_with_existent_user_modified_by_avatar_removal(api_client, user):
+    with Path('tests/fixtures/images/image.jpeg').open('rb') as f:
+        user_avatar_service.update_avatar_image(
+            user.id, f, {ImageType.jpeg}, user.id
+        ).unwrap()
+
+    response1 = send_request(api_client, user.id)
+    assert response1.status_code == 200
+    assert response1.json['avatar_url'] is not None
+    etag = response1.headers['ETag']
+
+    user_avatar_service.remove_avatar_image(user.id, user.id)
+
+    response2 = api_client.get(
+        f'/api/v1/users/{user.id}/profile', headers={'If-None-Match': etag}
+    )
+    assert response2.status_code == 200
+    assert response2.json['avatar_url'] is None
+
+
 def test_with_not_uninitialized_user(api_client, uninitialized_user):
     user = uninitialized_user
 
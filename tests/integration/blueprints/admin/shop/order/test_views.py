@@ -244,6 +244,95 @@ def test_mark_order_as_paid(
     order_paid_signal_send_mock.assert_called_once_with(None, event=event)
 
 
+@patch('byceps.signals.shop.order_paid.send')
+@patch('byceps.blueprints.admin.shop.order.views.order_email_service')
+def test_mark_orders_as_paid(
+    order_email_service_mock,
+    order_paid_signal_send_mock,
+    shop: Shop,
+    storefront: Storefront,
+    shop_order_admin: User,
+    orderer: Orderer,
+    shop_order_admin_client,
+):
+    placed_orders = [place_order(storefront.id, orderer, []) for _ in range(2)]
+    unknown_order_number = 'XX-99999'
+
+    url = f'/admin/shop/orders/for_shop/{shop.id}/mark_as_paid'
+    form_data = {
+        'order_numbers': '\n'.join(
+            [
+                placed_orders[0].order_number,
+                unknown_order_number,
+                placed_orders[1].order_number,
+            ]
+        ),
+        'payment_method': 'bank_transfer',
+    }
+    response = shop_order_admin_client.post(url, data=form_data)
+
+    assert response.status_code == 302
+
+    for placed_order in placed_orders:
+        assert_payment(
+            get_order(placed_order.id),
+            'bank_transfer',
+            PaymentState.paid,
+            shop_order_admin.id,
+        )
+
+    # The e-mails are sent by a single job.
+    order_email_service_mock.enqueue_emails_for_paid_orders_to_orderers.assert_called_once_with(
+        {placed_order.id for placed_order in placed_orders}
+    )
+
+    assert order_paid_signal_send_mock.call_count == 2
+
+
+@patch('byceps.signals.shop.order_canceled.send')
+@patch('byceps.blueprints.admin.shop.order.views.order_email_service')
+def test_cancel_orders(
+    order_email_service_mock,
+    order_canceled_signal_send_mock,
+    shop: Shop,
+    storefront: Storefront,
+    shop_order_admin: User,
+    orderer: Orderer,
+    shop_order_admin_client,
+):
+    placed_orders = [place_order(storefront.id, orderer, []) for _ in range(2)]
+    unknown_order_number = 'XX-99999'
+
+    url = f'/admin/shop/orders/for_shop/{shop.id}/cancel'
+    form_data = {
+        'order_numbers': '\n'.join(
+            [
+                placed_orders[0].order_number,
+                unknown_order_number,
+                placed_orders[1].order_number,
+                placed_orders[0].order_number,
+            ]
+        ),
+        'reason': 'Event has been called off.',
+        'send_email': 'y',
+    }
+    response = shop_order_admin_client.post(url, data=form_data)
+
+    assert response.status_code == 302
+
+    for placed_order in placed_orders:
+        order = get_order(placed_order.id)
+        assert order.payment_state == PaymentState.canceled_before_paid
+        assert order.cancelation_reason == 'Event has been called off.'
+
+    # The e-mails are sent by a single job.
+    order_email_service_mock.enqueue_emails_for_canceled_orders_to_orderers.assert_called_once_with(
+        {placed_order.id for placed_order in placed_orders}
+    )
+
+    assert order_canceled_signal_send_mock.call_count == 2
+
+
 @patch('byceps.signals.shop.order_canceled.send')
 @patch('byceps.signals.shop.order_paid.send')
 @patch('byceps.blueprints.admin.shop.order.views.order_email_service')
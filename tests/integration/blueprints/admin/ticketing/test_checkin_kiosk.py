@@ -0,0 +1,106 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from unittest.mock import patch
+
+from byceps.services.ticketing import (
+    ticket_creation_service,
+    ticket_user_management_service,
+)
+
+
+def test_scans_without_check_in(party, ticket, ticketing_admin_client):
+    url = f'/admin/ticketing/checkin/for_party/{party.id}/scans'
+    payload = {'codes': [ticket.code, 'NOSUCH'], 'check_in': False}
+
+    response = ticketing_admin_client.post(url, json=payload)
+
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert results[0]['code'] == ticket.code
+    assert results[0]['ticket_id'] == str(ticket.id)
+    assert results[0]['status'] == 'no_user'
+    assert results[1] == {'code': 'NOSUCH', 'status': 'unknown'}
+
+
+def test_scans_with_check_in(
+    party, category, ticket_owner, ticketing_admin, ticketing_admin_client
+):
+    ticket = ticket_creation_service.create_ticket(
+        party.id, category.id, ticket_owner.id
+    )
+    ticket_user_management_service.appoint_user(
+        ticket.id, ticket_owner.id, ticketing_admin.id
+    ).unwrap()
+
+    url = f'/admin/ticketing/checkin/for_party/{party.id}/scans'
+
+    response = ticketing_admin_client.post(url, json={'codes': [ticket.code]})
+
+    assert response.status_code == 200
+    result = response.get_json()['results'][0]
+    assert result['status'] == 'checked_in'
+    assert result['user'] == {
+        'id': str(ticket_owner.id),
+        'screen_name': ticket_owner.screen_name,
+    }
+
+    response = ticketing_admin_client.post(url, json={'codes': [ticket.code]})
+
+    result = response.get_json()['results'][0]
+    assert result['status'] == 'already_checked_in'
+
+
+@patch('byceps.signals.ticketing.ticket_checked_in.send')
+def test_scans_with_repeated_code(
+    ticket_checked_in_signal_send_mock,
+    party,
+    category,
+    ticket_owner,
+    ticketing_admin,
+    ticketing_admin_client,
+):
+    ticket = ticket_creation_service.create_ticket(
+        party.id, category.id, ticket_owner.id
+    )
+    ticket_user_management_service.appoint_user(
+        ticket.id, ticket_owner.id, ticketing_admin.id
+    ).unwrap()
+
+    url = f'/admin/ticketing/checkin/for_party/{party.id}/scans'
+    codes = [ticket.code, 'NOSUCH', ticket.code, f' {ticket.code} ']
+
+    response = ticketing_admin_client.post(url, json={'codes': codes})
+
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [result['status'] for result in results] == [
+        'checked_in',
+        'unknown',
+        'already_checked_in',
+        'already_checked_in',
+    ]
+
+    ticket_checked_in_signal_send_mock.assert_called_once()
+
+
+def test_scans_without_codes(party, ticketing_admin_client):
+    url = f'/admin/ticketing/checkin/for_party/{party.id}/scans'
+
+    response = ticketing_admin_client.post(url, json={'codes': []})
+
+    assert response.status_code == 400
+
+
+def test_snapshot(party, ticket, ticketing_admin_client):
+    url = f'/admin/ticketing/checkin/for_party/{party.id}/tickets/snapshot.json'
+
+    response = ticketing_admin_client.get(url)
+
+    assert response.status_code == 200
+    assert response.headers['Content-Disposition'].startswith('attachment;')
+    data = response.get_json()
+    assert data['party_id'] == party.id
+    assert ticket.code in {entry['code'] for entry in data['tickets']}
@@ -96,3 +96,15 @@ def test_view_events(user_admin_client, user):
     url = f'/admin/users/{user.id}/events'
     response = user_admin_client.get(url)
     assert response.status_code == 200
+
+
+def test_view_events_before(user_admin_client, user):
+    url = f'/admin/users/{user.id}/events?before=2023-09-15T12:00:00'
+    response = user_admin_client.get(url)
+    assert response.status_code == 200
+
+
+def test_view_events_with_invalid_before(user_admin_client, user):
+    url = f'/admin/users/{user.id}/events?before=yesterday'
+    response = user_admin_client.get(url)
+    assert response.status_code == 400
@@ -5,7 +5,7 @@
 
 import pytest
 
-from tests.helpers import log_in_user
+from tests.helpers import log_in_user, query_budget
 
 
 @pytest.fixture(scope='package')
@@ -69,5 +69,7 @@ def test_topic_view_logged_in(site_app, logged_in_client, topic):
 
 
 def assert_success_response(client, url):
-    response = client.get(url)
+    with query_budget(50):
+        response = client.get(url)
+
     assert response.status_code == 200
@@ -4,8 +4,11 @@
 """
 
 import pytest
+from sqlalchemy import update
 
+from byceps.database import db
 from byceps.services.brand import brand_setting_service
+from byceps.services.brand.dbmodels.setting import DbSetting
 from byceps.services.brand.models import BrandSetting
 
 
@@ -128,6 +131,29 @@ def test_get_settings(brand):
     }
 
 
+def test_settings_are_cached_until_invalidated(brand):
+    brand_id = BRAND_ID
+    name = 'name7'
+
+    brand_setting_service.create_setting(brand_id, name, 'value7a')
+    assert brand_setting_service.find_setting_value(brand_id, name) == 'value7a'
+
+    # Change the value other than through the service.
+    db.session.execute(
+        update(DbSetting)
+        .where(DbSetting.brand_id == brand_id)
+        .where(DbSetting.name == name)
+        .values(value='value7b')
+    )
+    db.session.commit()
+
+    assert brand_setting_service.find_setting_value(brand_id, name) == 'value7a'
+
+    brand_setting_service.invalidate_cached_settings(brand_id)
+
+    assert brand_setting_service.find_setting_value(brand_id, name) == 'value7b'
+
+
 def teardown_function(func):
     if func is test_create:
         brand_setting_service.remove_setting(BRAND_ID, 'name1')
@@ -140,3 +166,5 @@ def teardown_function(func):
     elif func is test_get_settings:
         for name in 'name6a', 'name6b', 'name6c':
             brand_setting_service.remove_setting(BRAND_ID, name)
+    elif func is test_settings_are_cached_until_invalidated:
+        brand_setting_service.remove_setting(BRAND_ID, 'name7')
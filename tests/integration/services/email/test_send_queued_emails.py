@@ -0,0 +1,170 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import json
+from smtplib import SMTPRecipientsRefused, SMTPServerDisconnected
+from unittest.mock import patch
+
+from flask import current_app
+import pytest
+
+from byceps.services.email import email_service
+from byceps.services.email.models import NameAndAddress
+
+
+SENDER = NameAndAddress('ACME Entertainment Convention', 'noreply@acmecon.test')
+
+
+@pytest.fixture()
+def outbox(admin_app):
+    redis_client = current_app.redis_client
+    keys = [email_service._OUTBOX_KEY, email_service._PROCESSING_KEY]
+
+    redis_client.delete(*keys)
+    yield
+    redis_client.delete(*keys)
+
+
+@patch('byceps.services.email.email_service.send')
+def test_enqueued_emails_are_sent(send_mock, outbox):
+    stats_before = email_service.get_delivery_stats()
+
+    # Jobs are run synchronously in tests, so each e-mail is sent right
+    # away.
+    for recipient in ['alice@users.test', 'bob@users.test']:
+        email_service.enqueue_email(SENDER, [recipient], 'Hello', 'Hi there!')
+
+    assert send_mock.call_count == 2
+    send_mock.assert_called_with(
+        'ACME Entertainment Convention <noreply@acmecon.test>',
+        ['bob@users.test'],
+        'Hello',
+        'Hi there!',
+    )
+
+    stats_after = email_service.get_delivery_stats()
+    assert stats_after.sent_count == stats_before.sent_count + 2
+    assert stats_after.outbox_length == 0
+    assert get_processing_length() == 0
+
+
+@patch('byceps.services.email.email_service.send')
+def test_failing_emails_do_not_hold_up_others(send_mock, outbox):
+    send_mock.side_effect = [
+        ValueError('Header values may not contain linefeed'),
+        SMTPRecipientsRefused({}),
+        None,
+    ]
+    stats_before = email_service.get_delivery_stats()
+
+    add_to_outbox(
+        ['bad\nheader@users.test', 'refused@users.test', 'bob@users.test']
+    )
+
+    email_service.send_queued_emails()
+
+    assert send_mock.call_count == 3
+
+    stats_after = email_service.get_delivery_stats()
+    assert stats_after.sent_count == stats_before.sent_count + 1
+    assert stats_after.failed_count == stats_before.failed_count + 2
+    assert stats_after.outbox_length == 0
+    assert get_processing_length() == 0
+
+
+@patch('byceps.services.email.email_service.enqueue_at')
+@patch('byceps.services.email.email_service.send')
+def test_emails_are_kept_on_connection_error(
+    send_mock, enqueue_at_mock, outbox
+):
+    send_mock.side_effect = [None, SMTPServerDisconnected(), None]
+
+    add_to_outbox(['alice@users.test', 'bob@users.test', 'carol@users.test'])
+
+    with pytest.raises(SMTPServerDisconnected):
+        email_service.send_queued_emails()
+
+    # The first e-mail has been sent. The one that failed and the one
+    # that has not been attempted are back in the outbox, in order.
+    assert send_mock.call_count == 2
+    assert get_outbox_recipients() == [
+        ['bob@users.test'],
+        ['carol@users.test'],
+    ]
+    assert get_processing_length() == 0
+    assert enqueue_at_mock.call_count == 1
+
+    # The retry sends the remaining e-mails.
+    send_mock.side_effect = None
+    email_service.send_queued_emails()
+
+    assert send_mock.call_count == 4
+    assert get_outbox_recipients() == []
+
+
+@patch('byceps.services.email.email_service.enqueue_at')
+@patch('byceps.services.email.email_service.send')
+def test_email_is_given_up_on_after_max_attempts(
+    send_mock, enqueue_at_mock, outbox
+):
+    send_mock.side_effect = SMTPServerDisconnected()
+    stats_before = email_service.get_delivery_stats()
+
+    add_to_outbox(['alice@users.test', 'bob@users.test'])
+
+    for _ in range(email_service.MAX_DELIVERY_ATTEMPTS):
+        with pytest.raises(SMTPServerDisconnected):
+            email_service.send_queued_emails()
+
+    # Only the e-mail at the front of the outbox has been attempted (and
+    # eventually given up on).
+    assert send_mock.call_count == email_service.MAX_DELIVERY_ATTEMPTS
+    assert get_outbox_recipients() == [['bob@users.test']]
+
+    stats_after = email_service.get_delivery_stats()
+    assert stats_after.failed_count == stats_before.failed_count + 1
+
+
+@patch('byceps.services.email.email_service.send')
+def test_emails_left_behind_by_crashed_job_are_sent(send_mock, outbox):
+    redis_client = current_app.redis_client
+    redis_client.rpush(
+        email_service._PROCESSING_KEY, serialize('alice@users.test')
+    )
+
+    email_service.send_queued_emails()
+
+    send_mock.assert_called_once()
+    assert get_processing_length() == 0
+
+
+# helpers
+
+
+def add_to_outbox(recipients: list[str]) -> None:
+    # Keep a job from sending them right away.
+    with patch('byceps.services.email.email_service._request_flush'):
+        for recipient in recipients:
+            email_service.enqueue_email(SENDER, [recipient], 'Hi', 'Hi!')
+
+
+def serialize(recipient: str) -> str:
+    return json.dumps(
+        {
+            'sender': SENDER.format(),
+            'recipients': [recipient],
+            'subject': 'Hi',
+            'body': 'Hi!',
+        }
+    )
+
+
+def get_outbox_recipients() -> list[list[str]]:
+    items = current_app.redis_client.lrange(email_service._OUTBOX_KEY, 0, -1)
+    return [json.loads(item)['recipients'] for item in items]
+
+
+def get_processing_length() -> int:
+    return current_app.redis_client.llen(email_service._PROCESSING_KEY)
@@ -0,0 +1,82 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+
+import pytest
+
+from byceps.services.log_retention import log_retention_service, partitioning
+from byceps.services.user import user_log_service
+from byceps.services.user.dbmodels.log import LOGIN_LOG_ENTRIES_TABLE_NAME
+
+
+NOW = datetime(2023, 9, 15, 12, 0, 0)
+
+
+@pytest.fixture(scope='module')
+def user(make_user):
+    return make_user()
+
+
+def test_create_upcoming_partitions(admin_app):
+    created_partition_names = log_retention_service.create_upcoming_partitions(
+        now=NOW, months_ahead=1
+    )
+
+    assert set(created_partition_names) == {
+        'shop_order_log_entries_y2023m09',
+        'shop_order_log_entries_y2023m10',
+        'ticket_log_entries_y2023m09',
+        'ticket_log_entries_y2023m10',
+        'user_log_entries_logins_y2023m09',
+        'user_log_entries_logins_y2023m10',
+    }
+
+    # Partitions that already exist are skipped.
+    assert (
+        log_retention_service.create_upcoming_partitions(
+            now=NOW, months_ahead=1
+        )
+        == []
+    )
+
+
+def test_delete_login_entries(admin_app, user):
+    for month in 7, 8:
+        partitioning.create_monthly_partition(
+            LOGIN_LOG_ENTRIES_TABLE_NAME, datetime(2023, month, 1)
+        )
+
+    for occurred_at in [
+        datetime(2023, 6, 20, 10, 0, 0),  # default partition
+        datetime(2023, 7, 10, 10, 0, 0),
+        datetime(2023, 7, 20, 10, 0, 0),
+        datetime(2023, 8, 10, 10, 0, 0),
+        datetime(2023, 8, 20, 10, 0, 0),
+    ]:
+        user_log_service.create_entry(
+            'user-logged-in',
+            user.id,
+            {'ip_address': '10.0.0.1'},
+            occurred_at=occurred_at,
+        )
+
+    num_deleted = user_log_service.delete_login_entries(datetime(2023, 8, 15))
+
+    assert num_deleted == 4
+
+    partition_names = {
+        partition.name
+        for partition in partitioning.get_monthly_partitions(
+            LOGIN_LOG_ENTRIES_TABLE_NAME
+        )
+    }
+    assert 'user_log_entries_logins_y2023m07' not in partition_names
+    assert 'user_log_entries_logins_y2023m08' in partition_names
+
+    log_entries = user_log_service.get_login_entries_for_ip_address('10.0.0.1')
+    assert [entry.occurred_at for entry in log_entries] == [
+        datetime(2023, 8, 20, 10, 0, 0)
+    ]
@@ -0,0 +1,52 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.page import page_service
+
+from tests.helpers import generate_token
+
+
+def test_routing_table_follows_changes(admin_app, site, admin_user):
+    name = generate_token()
+    url_path = f'/page-{name}'
+
+    assert page_service.find_route_for_url_path(site.id, url_path, 'en') is None
+
+    version1, event = page_service.create_page(
+        site.id, name, 'en', url_path, admin_user.id, 'Title', 'Body v1'
+    )
+    page_id = event.page_id
+
+    route = page_service.find_route_for_url_path(site.id, url_path, 'en')
+    assert route is not None
+    assert route.page.id == page_id
+    assert route.current_version_id == version1.id
+    assert page_service.find_route_for_url_path(site.id, url_path, 'de') is None
+    assert (
+        page_service.get_url_paths_by_page_name_for_site(site.id)[name]
+        == url_path
+    )
+
+    new_url_path = url_path + '-moved'
+    version2, _ = page_service.update_page(
+        page_id, 'en', new_url_path, admin_user.id, 'Title', None, 'Body v2'
+    )
+
+    assert page_service.find_route_for_url_path(site.id, url_path, 'en') is None
+    route = page_service.find_route_for_url_path(site.id, new_url_path, 'en')
+    assert route is not None
+    assert route.current_version_id == version2.id
+    assert (
+        page_service.get_url_paths_by_page_name_for_site(site.id)[name]
+        == new_url_path
+    )
+
+    page_service.delete_page(page_id)
+
+    assert (
+        page_service.find_route_for_url_path(site.id, new_url_path, 'en')
+        is None
+    )
+    assert name not in page_service.get_url_paths_by_page_name_for_site(site.id)
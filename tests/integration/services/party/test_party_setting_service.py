@@ -4,8 +4,11 @@
 """
 
 import pytest
+from sqlalchemy import update
 
+from byceps.database import db
 from byceps.services.party import party_setting_service
+from byceps.services.party.dbmodels.setting import DbSetting
 from byceps.services.party.models import PartySetting
 
 
@@ -128,6 +131,29 @@ def test_get_settings(party):
     }
 
 
+def test_settings_are_cached_until_invalidated(party):
+    party_id = PARTY_ID
+    name = 'name7'
+
+    party_setting_service.create_setting(party_id, name, 'value7a')
+    assert party_setting_service.find_setting_value(party_id, name) == 'value7a'
+
+    # Change the value other than through the service.
+    db.session.execute(
+        update(DbSetting)
+        .where(DbSetting.party_id == party_id)
+        .where(DbSetting.name == name)
+        .values(value='value7b')
+    )
+    db.session.commit()
+
+    assert party_setting_service.find_setting_value(party_id, name) == 'value7a'
+
+    party_setting_service.invalidate_cached_settings(party_id)
+
+    assert party_setting_service.find_setting_value(party_id, name) == 'value7b'
+
+
 def teardown_function(func):
     if func is test_create:
         party_setting_service.remove_setting(PARTY_ID, 'name1')
@@ -140,3 +166,5 @@ def teardown_function(func):
     elif func is test_get_settings:
         for name in 'name6a', 'name6b', 'name6c':
             party_setting_service.remove_setting(PARTY_ID, name)
+    elif func is test_settings_are_cached_until_invalidated:
+        party_setting_service.remove_setting(PARTY_ID, 'name7')
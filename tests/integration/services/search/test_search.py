@@ -0,0 +1,63 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.search import search_service
+from byceps.services.search.models import SearchResultType
+from byceps.services.ticketing import ticket_creation_service
+
+
+@pytest.fixture(scope='module')
+def searched_user(make_user):
+    return make_user('TrigramTom', email_address='tom@search.test')
+
+
+@pytest.fixture(scope='module')
+def searched_deleted_user(make_user):
+    return make_user('TrigramTim', deleted=True)
+
+
+@pytest.fixture(scope='module')
+def category(make_ticket_category, party):
+    return make_ticket_category(party.id, 'Search Test')
+
+
+@pytest.fixture(scope='module')
+def ticket(category, searched_user):
+    return ticket_creation_service.create_ticket(
+        category.party_id, category.id, searched_user.id
+    )
+
+
+def test_search_users(admin_app, searched_user, searched_deleted_user):
+    results = search_service.search('trigram')
+
+    assert [(r.type, r.id) for r in results] == [
+        (SearchResultType.user, searched_user.id)
+    ]
+
+
+def test_search_users_by_email_address(admin_app, searched_user):
+    results = search_service.search('tom@search')
+
+    assert [(r.type, r.id) for r in results] == [
+        (SearchResultType.user, searched_user.id)
+    ]
+
+
+def test_search_tickets_only_with_party(admin_app, party, ticket):
+    assert search_service.search(ticket.code) == []
+
+    results = search_service.search(ticket.code, party_id=party.id)
+
+    assert len(results) == 1
+    assert results[0].type == SearchResultType.ticket
+    assert results[0].id == ticket.id
+    assert results[0].label == ticket.code
+
+
+def test_search_empty_term(admin_app):
+    assert search_service.search('  ') == []
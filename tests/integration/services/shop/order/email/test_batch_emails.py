@@ -0,0 +1,112 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from byceps.services.shop.order import order_checkout_service
+from byceps.services.shop.order.email import order_email_service
+
+
+@pytest.fixture()
+def orders(admin_app, storefront, make_user, make_orderer, empty_cart):
+    orders = []
+    for _ in range(3):
+        orderer = make_orderer(make_user().id)
+        order, _ = order_checkout_service.place_order(
+            storefront.id, orderer, empty_cart
+        ).unwrap()
+        orders.append(order)
+    return orders
+
+
+@patch('byceps.services.email.email_service.enqueue_messages')
+@patch('byceps.services.email.email_footer_service.get_footer')
+def test_send_emails_for_incoming_orders_to_orderers(
+    get_footer_mock,
+    enqueue_messages_mock,
+    admin_app,
+    shop,
+    email_payment_instructions_snippets,
+    orders,
+):
+    get_footer_mock.return_value = 'Cheers, the team'
+
+    # Jobs are run synchronously in tests.
+    order_email_service.enqueue_emails_for_incoming_orders_to_orderers(
+        {order.id for order in orders}
+    )
+
+    # All orderers share brand and language, so the footer is only
+    # fetched once.
+    get_footer_mock.assert_called_once()
+
+    # All messages are enqueued at once.
+    enqueue_messages_mock.assert_called_once()
+    messages = enqueue_messages_mock.call_args.args[0]
+    assert len(messages) == 3
+
+    for order in orders:
+        assert any(order.order_number in m.subject for m in messages)
+
+    for message in messages:
+        assert message.body.endswith('Cheers, the team')
+
+
+@patch('byceps.services.email.email_service.enqueue_messages')
+@patch('byceps.services.email.email_footer_service.get_footer')
+def test_send_emails_for_paid_orders_to_orderers(
+    get_footer_mock, enqueue_messages_mock, admin_app, shop, orders
+):
+    get_footer_mock.return_value = 'Cheers, the team'
+
+    # Jobs are run synchronously in tests.
+    order_email_service.enqueue_emails_for_paid_orders_to_orderers(
+        {order.id for order in orders}
+    )
+
+    # All orderers share brand and language, so the footer is only
+    # fetched once.
+    get_footer_mock.assert_called_once()
+
+    # All messages are enqueued at once.
+    enqueue_messages_mock.assert_called_once()
+    messages = enqueue_messages_mock.call_args.args[0]
+    assert len(messages) == 3
+
+    for order in orders:
+        assert any(order.order_number in m.subject for m in messages)
+
+    for message in messages:
+        assert message.body.endswith('Cheers, the team')
+
+
+@patch('byceps.services.email.email_service.enqueue_messages')
+@patch('byceps.services.email.email_footer_service.get_footer')
+def test_send_emails_for_paid_orders_to_orderers_skips_failing_order(
+    get_footer_mock, enqueue_messages_mock, admin_app, shop, orders
+):
+    get_footer_mock.return_value = 'Cheers, the team'
+
+    failing_order = orders[1]
+    assemble_text = order_email_service.assemble_text_for_paid_order_to_orderer
+
+    def assemble_text_or_fail(order):
+        if order.id == failing_order.id:
+            raise ValueError('Broken template')
+        return assemble_text(order)
+
+    with patch(
+        'byceps.services.shop.order.email.order_email_service.assemble_text_for_paid_order_to_orderer',
+        side_effect=assemble_text_or_fail,
+    ):
+        order_email_service.send_emails_for_paid_orders_to_orderers(
+            {order.id for order in orders}
+        )
+
+    messages = enqueue_messages_mock.call_args.args[0]
+    assert len(messages) == 2
+    assert not any(failing_order.order_number in m.subject for m in messages)
@@ -4,8 +4,11 @@
 """
 
 import pytest
+from sqlalchemy import update
 
+from byceps.database import db
 from byceps.services.site import site_service, site_setting_service
+from byceps.services.site.dbmodels.setting import DbSetting
 from byceps.services.site.models import SiteSetting
 
 from tests.helpers import create_site
@@ -133,6 +136,29 @@ def test_get_settings(site):
     }
 
 
+def test_settings_are_cached_until_invalidated(site):
+    site_id = SITE_ID
+    name = 'name7'
+
+    site_setting_service.create_setting(site_id, name, 'value7a')
+    assert site_setting_service.find_setting_value(site_id, name) == 'value7a'
+
+    # Change the value other than through the service.
+    db.session.execute(
+        update(DbSetting)
+        .where(DbSetting.site_id == site_id)
+        .where(DbSetting.name == name)
+        .values(value='value7b')
+    )
+    db.session.commit()
+
+    assert site_setting_service.find_setting_value(site_id, name) == 'value7a'
+
+    site_setting_service.invalidate_cached_settings(site_id)
+
+    assert site_setting_service.find_setting_value(site_id, name) == 'value7b'
+
+
 def teardown_function(func):
     if func is test_create:
         site_setting_service.remove_setting(SITE_ID, 'name1')
@@ -145,3 +171,5 @@ def teardown_function(func):
     elif func is test_get_settings:
         for name in 'name6a', 'name6b', 'name6c':
             site_setting_service.remove_setting(SITE_ID, name)
+    elif func is test_settings_are_cached_until_invalidated:
+        site_setting_service.remove_setting(SITE_ID, 'name7')
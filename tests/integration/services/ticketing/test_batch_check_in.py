@@ -0,0 +1,88 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.database import db
+from byceps.services.ticketing import (
+    errors as ticketing_errors,
+    ticket_code_index_service,
+    ticket_creation_service,
+    ticket_service,
+    ticket_user_checkin_service,
+)
+
+
+def test_index_and_check_in_users(
+    admin_app, party, category, ticket_owner, ticketing_admin, make_user
+):
+    ticket_user = make_user()
+
+    (
+        ticket_with_user,
+        ticket_without_user,
+    ) = ticket_creation_service.create_tickets(
+        party.id, category.id, ticket_owner.id, 2
+    )
+    ticket_with_user.used_by_id = ticket_user.id
+    db.session.commit()
+    ticket_code_index_service.invalidate_index(party.id)
+
+    entry = ticket_code_index_service.find_entry(
+        party.id, ticket_with_user.code
+    )
+    assert entry is not None
+    assert entry.ticket_id == ticket_with_user.id
+    assert entry.category_title == category.title
+    assert entry.used_by_id == ticket_user.id
+    assert entry.used_by_screen_name == ticket_user.screen_name
+    assert not entry.revoked
+    assert not entry.user_checked_in
+
+    assert ticket_code_index_service.find_entry(party.id, 'NOSUCH') is None
+
+    # -------------------------------- #
+
+    results = ticket_user_checkin_service.check_in_users(
+        party.id,
+        [ticket_with_user.id, ticket_without_user.id],
+        ticketing_admin.id,
+    )
+
+    assert results[ticket_with_user.id].is_ok()
+    assert isinstance(
+        results[ticket_without_user.id].unwrap_err(),
+        ticketing_errors.TicketLacksUserError,
+    )
+
+    assert ticket_service.get_ticket(ticket_with_user.id).user_checked_in
+
+    # The check-in is reflected by the index.
+    entry = ticket_code_index_service.find_entry(
+        party.id, ticket_with_user.code
+    )
+    assert entry.user_checked_in
+
+    # A second check-in is denied.
+    results = ticket_user_checkin_service.check_in_users(
+        party.id, [ticket_with_user.id], ticketing_admin.id
+    )
+    assert isinstance(
+        results[ticket_with_user.id].unwrap_err(),
+        ticketing_errors.UserAlreadyCheckedInError,
+    )
+
+
+def test_check_in_users_with_repeated_ticket(
+    admin_app, party, category, ticket_owner, ticketing_admin
+):
+    ticket = ticket_creation_service.create_ticket(
+        party.id, category.id, ticket_owner.id, used_by_id=ticket_owner.id
+    )
+
+    results = ticket_user_checkin_service.check_in_users(
+        party.id, [ticket.id, ticket.id], ticketing_admin.id
+    )
+
+    assert list(results) == [ticket.id]
+    assert results[ticket.id].is_ok()
@@ -0,0 +1,88 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.ticketing import (
+    ticket_creation_service,
+    ticket_revocation_service,
+)
+from byceps.services.ticketing.printing import ticket_printing_service
+
+
+def test_get_printable_tickets_for_party(
+    admin_app, printing_party, printing_category, ticket_owner, tickets
+):
+    actual = ticket_printing_service.get_printable_tickets_for_party(
+        printing_party.id
+    )
+
+    # Revoked ticket is excluded.
+    assert len(actual) == 2
+
+    ticket_codes = {ticket.code for ticket in actual}
+    assert ticket_codes == {tickets[0].code, tickets[1].code}
+
+    for ticket in actual:
+        assert ticket.category_title == 'Printable'
+        assert ticket.owner_screen_name == ticket_owner.screen_name
+        assert ticket.seat_label is None
+
+
+def test_create_ticket_sheets_file(
+    admin_app, printing_party, tickets, monkeypatch, tmp_path
+):
+    monkeypatch.setitem(admin_app.config, 'PATH_DATA', tmp_path)
+
+    path = ticket_printing_service.create_ticket_sheets_file(
+        printing_party.id, tickets_per_page=1
+    )
+
+    assert path.parent == (
+        tmp_path / 'parties' / printing_party.id / 'ticket_sheets'
+    )
+
+    html = path.read_text()
+    assert html.count('<div class="page">') == 2
+    assert f'Ticket {tickets[0].code}' in html
+    assert f'Ticket {tickets[2].code}' not in html
+
+    files = ticket_printing_service.get_ticket_sheets_files(printing_party.id)
+    assert path.name in {file.filename for file in files}
+
+    assert (
+        ticket_printing_service.find_ticket_sheets_file_path(
+            printing_party.id, path.name
+        )
+        == path
+    )
+    assert (
+        ticket_printing_service.find_ticket_sheets_file_path(
+            printing_party.id, '../../../secrets.html'
+        )
+        is None
+    )
+
+
+@pytest.fixture(scope='module')
+def printing_party(brand, make_party):
+    party_id = 'printing-party'
+    return make_party(brand.id, party_id, title=party_id)
+
+
+@pytest.fixture(scope='module')
+def printing_category(make_ticket_category, printing_party):
+    return make_ticket_category(printing_party.id, 'Printable')
+
+
+@pytest.fixture(scope='module')
+def tickets(printing_party, printing_category, ticket_owner, ticketing_admin):
+    tickets = ticket_creation_service.create_tickets(
+        printing_party.id, printing_category.id, ticket_owner.id, 3
+    )
+
+    ticket_revocation_service.revoke_ticket(tickets[2].id, ticketing_admin.id)
+
+    return tickets
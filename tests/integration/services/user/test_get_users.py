@@ -0,0 +1,38 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.user import user_command_service, user_service
+
+
+def test_get_users(admin_app, make_user):
+    user1 = make_user()
+    user2 = make_user()
+
+    actual = user_service.get_users({user1.id, user2.id})
+
+    assert {user.id for user in actual} == {user1.id, user2.id}
+
+
+def test_get_users_without_ids(admin_app):
+    assert user_service.get_users(set()) == set()
+
+
+def test_get_users_reflects_changes(admin_app, make_user, admin_user):
+    user = make_user('Cache_Me_If_You_Can')
+
+    # Put the user in the cache.
+    user_service.get_users({user.id})
+
+    user_command_service.change_screen_name(
+        user.id, 'Cached_No_More', admin_user.id
+    )
+    user_command_service.suspend_account(user.id, admin_user.id, 'Spam')
+
+    actual = user_service.get_users({user.id})
+
+    assert len(actual) == 1
+    actual_user = actual.pop()
+    assert actual_user.screen_name == 'Cached_No_More'
+    assert actual_user.suspended
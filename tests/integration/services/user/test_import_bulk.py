@@ -0,0 +1,55 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.authentication.password import authn_password_service
+from byceps.services.user import user_import_service, user_service
+from byceps.services.user.user_import_service import UserToImport
+
+
+def test_validate_users_to_import(admin_app, make_user):
+    make_user('BulkTaken', email_address='bulk-taken@users.test')
+
+    users_to_import = [
+        UserToImport(screen_name='BulkOne', email_address='one@users.test'),
+        UserToImport(screen_name='bulkone'),
+        UserToImport(screen_name='BulkTwo', email_address='ONE@users.test'),
+        UserToImport(screen_name='bulktaken'),
+        UserToImport(screen_name='Bulk Three'),
+        UserToImport(
+            screen_name='BulkFour', email_address='bulk-taken@users.test'
+        ),
+        UserToImport(screen_name='BulkFive'),
+    ]
+
+    errors = user_import_service.validate_users_to_import(users_to_import)
+
+    assert set(errors) == {1, 2, 3, 4, 5}
+
+
+def test_import_users(admin_app):
+    users_to_import = [
+        UserToImport(
+            screen_name=f'BulkImported{i}',
+            email_address=f'bulk-imported{i}@users.test',
+            first_name='Bulk',
+            last_name=f'User {i}',
+        )
+        for i in range(5)
+    ]
+
+    users = user_import_service.import_users(
+        users_to_import, chunk_size=2, max_hashing_workers=1
+    )
+
+    assert [user.screen_name for user in users] == [
+        f'BulkImported{i}' for i in range(5)
+    ]
+
+    for user in users:
+        assert user_service.find_user(user.id) == user
+        assert user_service.get_detail(user.id).first_name == 'Bulk'
+        assert not authn_password_service.is_password_valid_for_user(
+            user.id, ''
+        )
@@ -3,11 +3,15 @@
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from io import BytesIO
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from byceps.services.user import user_avatar_service
+from byceps.database import db
+from byceps.services.user import user_avatar_service, user_service
+from byceps.services.user.dbmodels.avatar import DbUserAvatar
 from byceps.util.image.models import ImageType
 
 
@@ -29,3 +33,81 @@ def test_path(data_path, site_app, user, image_extension, image_type):
     expected = data_path / 'global' / 'users' / 'avatars' / expected_filename
 
     assert avatar.path == expected
+
+
+def test_variants_are_created(data_path, site_app, user):
+    with Path('tests/fixtures/images/image.png').open('rb') as f:
+        avatar_id = user_avatar_service.update_avatar_image(
+            user.id, f, {ImageType.png}, user.id
+        ).unwrap()
+
+    # Jobs are run synchronously in tests, so the image has already
+    # been processed.
+    assert user_service.get_db_user(user.id).avatar_id == avatar_id
+
+    path = data_path / 'global' / 'users' / 'avatars'
+    for filename in [
+        f'{avatar_id}.png',
+        f'{avatar_id}.webp',
+        f'{avatar_id}_256.png',
+        f'{avatar_id}_256.webp',
+        f'{avatar_id}_64.png',
+        f'{avatar_id}_64.webp',
+    ]:
+        assert (path / filename).exists()
+
+    assert not (path / f'{avatar_id}.upload').exists()
+
+
+def test_files_of_replaced_avatar_are_deleted(data_path, site_app, user):
+    avatar_ids = []
+    for _ in range(2):
+        with Path('tests/fixtures/images/image.png').open('rb') as f:
+            avatar_id = user_avatar_service.update_avatar_image(
+                user.id, f, {ImageType.png}, user.id
+            ).unwrap()
+            avatar_ids.append(avatar_id)
+
+    previous_avatar_id, current_avatar_id = avatar_ids
+
+    path = data_path / 'global' / 'users' / 'avatars'
+    assert not list(path.glob(f'{previous_avatar_id}*'))
+    assert (path / f'{current_avatar_id}.png').exists()
+
+    # Both uploads are identical, so the files are shared.
+    assert (path / f'{current_avatar_id}.png').stat().st_nlink == 2
+
+    user_avatar_service.remove_avatar_image(user.id, user.id)
+
+    assert not list(path.glob(f'{current_avatar_id}*'))
+
+
+def test_broken_image_is_rejected(data_path, site_app, user):
+    with Path('tests/fixtures/images/image.png').open('rb') as f:
+        truncated_data = f.read()[:-20]
+
+    result = user_avatar_service.update_avatar_image(
+        user.id, BytesIO(truncated_data), {ImageType.png}, user.id
+    )
+
+    assert result.is_err()
+    assert user_service.get_db_user(user.id).avatar_id is None
+
+
+@patch(
+    'byceps.services.image.image_service.create_square_variants',
+    side_effect=OSError,
+)
+def test_avatar_is_discarded_if_processing_fails(
+    create_square_variants_mock, data_path, site_app, user
+):
+    with Path('tests/fixtures/images/image.png').open('rb') as f:
+        avatar_id = user_avatar_service.update_avatar_image(
+            user.id, f, {ImageType.png}, user.id
+        ).unwrap()
+
+    assert user_service.get_db_user(user.id).avatar_id is None
+    assert db.session.get(DbUserAvatar, avatar_id) is None
+
+    path = data_path / 'global' / 'users' / 'avatars'
+    assert not list(path.glob(f'{avatar_id}*'))
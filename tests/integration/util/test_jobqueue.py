@@ -0,0 +1,16 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.util.jobqueue import get_queue_stats, QUEUE_NAMES
+
+
+def test_get_queue_stats(admin_app):
+    # Jobs are run synchronously in tests, so no job is left waiting.
+    stats = get_queue_stats(admin_app)
+
+    assert [queue_stats.name for queue_stats in stats] == QUEUE_NAMES
+    for queue_stats in stats:
+        assert queue_stats.length == 0
+        assert queue_stats.oldest_job_age == 0.0
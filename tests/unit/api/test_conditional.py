@@ -0,0 +1,93 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from flask import Flask, jsonify
+import pytest
+
+from byceps.blueprints.api.decorators import conditional
+
+
+def test_versioned_response_has_etag_and_cache_control(client):
+    response = client.get('/versioned/1')
+
+    assert response.status_code == 200
+    assert response.headers['ETag']
+    assert response.headers['Cache-Control'] == 'public, max-age=60'
+
+
+def test_versioned_response_not_modified(app, client):
+    etag = client.get('/versioned/1').headers['ETag']
+    calls_before = app.view_calls
+
+    response = client.get('/versioned/1', headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+    assert app.view_calls == calls_before  # View has not been called.
+
+
+def test_versioned_response_modified(app, client):
+    etag = client.get('/versioned/1').headers['ETag']
+
+    app.version += 1
+
+    response = client.get('/versioned/1', headers={'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_etag_differs_per_resource(client):
+    etag1 = client.get('/versioned/1').headers['ETag']
+    etag2 = client.get('/versioned/2').headers['ETag']
+
+    assert etag1 != etag2
+
+
+def test_unversioned_response_not_modified(client):
+    response1 = client.get('/unversioned')
+
+    assert response1.status_code == 200
+    assert response1.headers['Cache-Control'] == 'public, no-cache'
+    etag = response1.headers['ETag']
+
+    response2 = client.get('/unversioned', headers={'If-None-Match': etag})
+
+    assert response2.status_code == 304
+
+
+def test_error_response_is_left_alone(client):
+    response = client.get('/versioned/404')
+
+    assert response.status_code == 404
+    assert 'ETag' not in response.headers
+    assert 'Cache-Control' not in response.headers
+
+
+@pytest.fixture()
+def app() -> Flask:
+    app = Flask('byceps')
+    app.version = 1
+    app.view_calls = 0
+
+    @app.get('/versioned/<int:item_id>')
+    @conditional(lambda item_id: app.version, max_age=60)
+    def versioned(item_id):
+        app.view_calls += 1
+        if item_id == 404:
+            return jsonify({}), 404
+        return jsonify({'id': item_id, 'version': app.version})
+
+    @app.get('/unversioned')
+    @conditional()
+    def unversioned():
+        return jsonify({'answer': 42})
+
+    return app
+
+
+@pytest.fixture()
+def client(app):
+    return app.test_client()
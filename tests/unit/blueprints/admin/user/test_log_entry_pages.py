@@ -0,0 +1,58 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from byceps.blueprints.admin.user.service import _select_latest, _take_page
+from byceps.services.user.models.log import UserLogEntry
+from byceps.typing import UserID
+
+
+USER_ID = UserID(UUID('a2a8fa96-3a61-4c7c-9b7a-2bb3a1a8b5c5'))
+
+
+def test_take_page():
+    entries = [
+        create_entry(datetime(2023, 9, 15, 12, 0, 0)),
+        create_entry(datetime(2023, 9, 14, 12, 0, 0)),
+        create_entry(datetime(2023, 9, 13, 12, 0, 0)),
+    ]
+
+    assert _take_page(entries, 2) == entries[:2]
+
+
+def test_take_page_includes_entries_that_occurred_simultaneously():
+    entries = [
+        create_entry(datetime(2023, 9, 15, 12, 0, 0)),
+        create_entry(datetime(2023, 9, 14, 12, 0, 0)),
+        create_entry(datetime(2023, 9, 14, 12, 0, 0)),
+        create_entry(datetime(2023, 9, 13, 12, 0, 0)),
+    ]
+
+    assert _take_page(entries, 2) == entries[:3]
+
+
+def test_select_latest():
+    entry1 = create_entry(datetime(2023, 9, 13, 12, 0, 0))
+    entry2 = create_entry(datetime(2023, 9, 15, 12, 0, 0))
+    entry3 = create_entry(datetime(2023, 9, 14, 12, 0, 0))
+    entry4 = create_entry(datetime(2023, 9, 12, 12, 0, 0))
+
+    actual = _select_latest(
+        [entry1, entry2, entry3, entry4], datetime(2023, 9, 15, 0, 0, 0), 2
+    )
+
+    assert actual == [entry3, entry1]
+
+
+def create_entry(occurred_at: datetime) -> UserLogEntry:
+    return UserLogEntry(
+        id=UUID('00000000-0000-0000-0000-000000000001'),
+        occurred_at=occurred_at,
+        event_type='user-logged-in',
+        user_id=USER_ID,
+        data={},
+    )
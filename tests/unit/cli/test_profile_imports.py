@@ -0,0 +1,67 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.cli.commands.profile_imports import (
+    get_subsystem_name,
+    group_by_subsystem,
+    ImportTime,
+    parse_import_times,
+    SubsystemImportTime,
+)
+
+
+OUTPUT = '''\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2000 |       2500 |     sqlalchemy.sql
+import time:       500 |       3000 |   sqlalchemy
+Some other output
+import time:       300 |        300 |       byceps.services.shop.order.order_service
+import time:       100 |        400 |     byceps.services.shop.order
+import time:       700 |        700 |   byceps.services.user.user_service
+'''
+
+
+def test_parse_import_times():
+    actual = list(parse_import_times(OUTPUT.splitlines()))
+
+    assert actual == [
+        ImportTime('_io', 120, 120),
+        ImportTime('sqlalchemy.sql', 2000, 2500),
+        ImportTime('sqlalchemy', 500, 3000),
+        ImportTime('byceps.services.shop.order.order_service', 300, 300),
+        ImportTime('byceps.services.shop.order', 100, 400),
+        ImportTime('byceps.services.user.user_service', 700, 700),
+    ]
+
+
+def test_group_by_subsystem():
+    import_times = parse_import_times(OUTPUT.splitlines())
+
+    actual = group_by_subsystem(import_times)
+
+    assert actual == [
+        SubsystemImportTime('sqlalchemy', 2500, 2),
+        SubsystemImportTime('byceps.services.user', 700, 1),
+        SubsystemImportTime('byceps.services.shop', 400, 2),
+        SubsystemImportTime('_io', 120, 1),
+    ]
+
+
+@pytest.mark.parametrize(
+    ('module_name', 'expected'),
+    [
+        ('byceps', 'byceps'),
+        ('byceps.application', 'byceps.application'),
+        ('byceps.blueprints.admin.shop.views', 'byceps.blueprints.admin'),
+        ('byceps.services.board.board_service', 'byceps.services.board'),
+        ('flask', 'flask'),
+        ('sqlalchemy.orm.session', 'sqlalchemy'),
+    ],
+)
+def test_get_subsystem_name(module_name, expected):
+    assert get_subsystem_name(module_name) == expected
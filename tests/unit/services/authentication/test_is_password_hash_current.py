@@ -8,6 +8,9 @@ import pytest
 from byceps.services.authentication.password import authn_password_service
 
 
+METHOD = 'pbkdf2:sha256:600000'
+
+
 @pytest.mark.parametrize(
     ('password_hash', 'expected'),
     [
@@ -40,6 +43,8 @@ from byceps.services.authentication.password import authn_password_service
 )
 def test_is_password_hash_current(password_hash, expected):
     assert (
-        authn_password_service.is_password_hash_current(password_hash)
+        authn_password_service.is_password_hash_current(
+            password_hash, method=METHOD
+        )
         == expected
     )
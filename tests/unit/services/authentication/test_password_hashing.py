@@ -0,0 +1,78 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.authentication.password import password_hashing
+
+
+ARGON2_HASH = '$argon2id$v=19$m=65536,t=3,p=4$c2FsdHNhbHRzYWx0$KsC5Ew6Hg3dQwOB1eiqGX8cDRBDCTmBg7Vf4dvVIIrI'
+
+
+@pytest.mark.parametrize(
+    ('method', 'expected'),
+    [
+        ('pbkdf2', 'pbkdf2:sha256:600000'),
+        ('pbkdf2:sha512', 'pbkdf2:sha512:600000'),
+        ('pbkdf2:sha256:700000', 'pbkdf2:sha256:700000'),
+        ('scrypt', 'scrypt:32768:8:1'),
+        ('scrypt:16384', 'scrypt:16384:8:1'),
+        ('argon2id', 'argon2id:3:65536:4'),
+        ('argon2id:2:19456:1', 'argon2id:2:19456:1'),
+    ],
+)
+def test_normalize_method(method, expected):
+    assert password_hashing.normalize_method(method) == expected
+
+
+@pytest.mark.parametrize(
+    'method',
+    [
+        'md5',
+        'scrypt:32768:8:1:1',
+    ],
+)
+def test_normalize_method_rejects_invalid_method(method):
+    with pytest.raises(ValueError):
+        password_hashing.normalize_method(method)
+
+
+@pytest.mark.parametrize(
+    ('password_hash', 'method', 'expected'),
+    [
+        ('scrypt:32768:8:1$salt$hash', 'scrypt', True),
+        ('scrypt:16384:8:1$salt$hash', 'scrypt', False),
+        ('pbkdf2:sha256:600000$salt$hash', 'scrypt', False),
+        (ARGON2_HASH, 'argon2id', True),
+        (ARGON2_HASH, 'argon2id:3:65536:4', True),
+        (ARGON2_HASH, 'argon2id:2:65536:4', False),
+        (ARGON2_HASH, 'pbkdf2', False),
+        ('pbkdf2:sha256:600000$salt$hash', 'argon2id', False),
+        ('$argon2id$garbage', 'argon2id', False),
+    ],
+)
+def test_is_hash_current(password_hash, method, expected):
+    assert password_hashing.is_hash_current(password_hash, method) == expected
+
+
+@pytest.mark.parametrize('method', ['pbkdf2:sha256:1000', 'scrypt:1024:8:1'])
+def test_generate_and_check_hash(method):
+    password_hash = password_hashing.generate_hash('hunter2', method)
+
+    assert password_hashing.is_hash_current(password_hash, method)
+    assert password_hashing.check_hash(password_hash, 'hunter2')
+    assert not password_hashing.check_hash(password_hash, 'hunter3')
+
+
+def test_generate_and_check_argon2_hash():
+    pytest.importorskip('argon2')
+
+    method = 'argon2id:1:1024:1'
+
+    password_hash = password_hashing.generate_hash('hunter2', method)
+
+    assert password_hashing.is_hash_current(password_hash, method)
+    assert password_hashing.check_hash(password_hash, 'hunter2')
+    assert not password_hashing.check_hash(password_hash, 'hunter3')
@@ -0,0 +1,84 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from email.message import EmailMessage
+
+import pytest
+
+from byceps.services.email.smtp import SmtpConfig, SmtpConnection
+
+
+aiosmtpd_controller = pytest.importorskip('aiosmtpd.controller')
+
+
+class RecordingHandler:
+    def __init__(self) -> None:
+        self.session_count = 0
+        self.messages: list[bytes] = []
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        self.session_count += 1
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope.content)
+        return '250 OK'
+
+
+@pytest.fixture()
+def handler():
+    return RecordingHandler()
+
+
+@pytest.fixture()
+def smtp_server(handler):
+    controller = aiosmtpd_controller.Controller(
+        handler, hostname='127.0.0.1', port=0
+    )
+    controller.start()
+    yield controller
+    controller.stop()
+
+
+@pytest.fixture()
+def connection(smtp_server):
+    config = SmtpConfig(
+        host=smtp_server.hostname,
+        port=smtp_server.server.sockets[0].getsockname()[1],
+        starttls=False,
+        use_ssl=False,
+        username=None,
+        password=None,
+    )
+    connection = SmtpConnection(config)
+    yield connection
+    connection.close()
+
+
+def test_messages_are_sent_over_a_single_session(handler, connection):
+    for number in range(1, 4):
+        connection.send(build_message(f'Message #{number}'))
+
+    assert len(handler.messages) == 3
+    assert handler.session_count == 1
+
+
+def test_reconnect_after_close(handler, connection):
+    connection.send(build_message('Before'))
+    connection.close()
+    connection.send(build_message('After'))
+
+    assert len(handler.messages) == 2
+    assert handler.session_count == 2
+
+
+def build_message(subject: str) -> EmailMessage:
+    message = EmailMessage()
+    message['From'] = 'noreply@acmecon.test'
+    message['To'] = 'user@users.test'
+    message['Subject'] = subject
+    message.set_content('Hi there!')
+    return message
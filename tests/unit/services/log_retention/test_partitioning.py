@@ -0,0 +1,53 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import date, datetime
+
+import pytest
+
+from byceps.services.log_retention.partitioning import (
+    get_default_partition_name,
+    get_month_start,
+    get_next_month_start,
+    get_partition_name,
+)
+
+
+@pytest.mark.parametrize(
+    ('dt', 'expected'),
+    [
+        (date(2023, 9, 1), datetime(2023, 9, 1)),
+        (date(2023, 9, 30), datetime(2023, 9, 1)),
+        (datetime(2023, 12, 31, 23, 59, 59), datetime(2023, 12, 1)),
+    ],
+)
+def test_get_month_start(dt, expected):
+    assert get_month_start(dt) == expected
+
+
+@pytest.mark.parametrize(
+    ('dt', 'expected'),
+    [
+        (date(2023, 9, 1), datetime(2023, 10, 1)),
+        (datetime(2023, 11, 15, 12, 0, 0), datetime(2023, 12, 1)),
+        (date(2023, 12, 31), datetime(2024, 1, 1)),
+    ],
+)
+def test_get_next_month_start(dt, expected):
+    assert get_next_month_start(dt) == expected
+
+
+def test_get_partition_name():
+    assert (
+        get_partition_name('ticket_log_entries', date(2023, 9, 1))
+        == 'ticket_log_entries_y2023m09'
+    )
+
+
+def test_get_default_partition_name():
+    assert (
+        get_default_partition_name('ticket_log_entries')
+        == 'ticket_log_entries_default'
+    )
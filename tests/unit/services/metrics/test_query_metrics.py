@@ -0,0 +1,119 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from flask import Flask
+import pytest
+
+from byceps.services.metrics import query_metrics_service
+from byceps.util.query_stats import QueryStats
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+
+    def pipeline(self, *, transaction: bool = True):
+        return self
+
+    def execute(self) -> None:
+        pass
+
+    def hincrby(self, key: str, field: str, amount: int) -> None:
+        self._increment(key, field, amount)
+
+    def hincrbyfloat(self, key: str, field: str, amount: float) -> None:
+        self._increment(key, field, amount)
+
+    def _increment(self, key: str, field: str, amount: float) -> None:
+        hash_ = self.hashes.setdefault(key, {})
+        value = float(hash_.get(field.encode(), 0)) + amount
+        hash_[field.encode()] = str(value).encode()
+
+    def hgetall(self, key: str) -> dict[bytes, bytes]:
+        return self.hashes.get(key, {})
+
+
+@pytest.fixture()
+def app():
+    app = Flask(__name__)
+    app.redis_client = FakeRedis()
+    with app.app_context():
+        yield app
+
+
+def test_request_histograms(app):
+    query_metrics_service.observe_request('board.topic_view', stats(3, 0.02))
+    query_metrics_service.observe_request('board.topic_view', stats(12, 0.2))
+
+    lines = serialize_metrics()
+
+    assert (
+        'http_request_db_queries_bucket{endpoint="board.topic_view", le="2"} 0'
+        in lines
+    )
+    assert (
+        'http_request_db_queries_bucket{endpoint="board.topic_view", le="5"} 1'
+        in lines
+    )
+    assert (
+        'http_request_db_queries_bucket{endpoint="board.topic_view", le="20"} 2'
+        in lines
+    )
+    assert (
+        'http_request_db_queries_bucket{endpoint="board.topic_view", le="+Inf"} 2'
+        in lines
+    )
+    assert (
+        'http_request_db_queries_sum{endpoint="board.topic_view"} 15.0' in lines
+    )
+    assert (
+        'http_request_db_queries_count{endpoint="board.topic_view"} 2' in lines
+    )
+    assert (
+        'http_request_db_duration_seconds_bucket{endpoint="board.topic_view", le="0.025"} 1'
+        in lines
+    )
+    assert (
+        'http_request_db_duration_seconds_bucket{endpoint="board.topic_view", le="0.25"} 2'
+        in lines
+    )
+
+
+def test_service_function_histograms(app):
+    query_stats = QueryStats()
+    query_stats.add('SELECT 1', 'byceps.services.board.get_topic', 0.001)
+    query_stats.add('SELECT 2', 'byceps.services.board.get_topic', 0.002)
+    query_stats.add('SELECT 3', 'byceps.services.user.get_users', 0.003)
+
+    query_metrics_service.observe_request('board.topic_view', query_stats)
+
+    lines = serialize_metrics()
+
+    assert (
+        'service_function_db_queries_count{function="byceps.services.board.get_topic"} 1'
+        in lines
+    )
+    assert (
+        'service_function_db_queries_sum{function="byceps.services.board.get_topic"} 2.0'
+        in lines
+    )
+    assert (
+        'service_function_db_queries_sum{function="byceps.services.user.get_users"} 1.0'
+        in lines
+    )
+
+
+def test_no_observations(app):
+    assert serialize_metrics() == []
+
+
+def stats(query_count: int, duration: float) -> QueryStats:
+    return QueryStats(query_count=query_count, duration=duration)
+
+
+def serialize_metrics() -> list[str]:
+    return [
+        metric.serialize() for metric in query_metrics_service.collect_metrics()
+    ]
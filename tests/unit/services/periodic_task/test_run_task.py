@@ -0,0 +1,138 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from flask import Flask
+import pytest
+
+from byceps.services.periodic_task import periodic_task_service
+from byceps.services.periodic_task.models import DailyAt, PeriodicTask
+
+
+SCHEDULED_FOR = datetime(2023, 9, 15, 3, 0, 0)
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+
+    def set(self, key: str, value: str, *, nx: bool = False, ex=None):
+        if nx and (key in self.values):
+            return None
+        self.values[key] = value.encode()
+        return True
+
+    def get(self, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+
+    def hset(self, key: str, *, mapping) -> None:
+        self.hashes.setdefault(key, {}).update(
+            {k.encode(): str(v).encode() for k, v in mapping.items()}
+        )
+
+    def hget(self, key: str, field: str) -> bytes | None:
+        return self.hashes.get(key, {}).get(field.encode())
+
+    def hgetall(self, key: str) -> dict[bytes, bytes]:
+        return self.hashes.get(key, {})
+
+
+class Calls:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self) -> None:
+        self.count += 1
+
+
+@pytest.fixture()
+def app():
+    app = Flask(__name__)
+    app.redis_client = FakeRedis()
+    with app.app_context():
+        yield app
+
+
+@pytest.fixture()
+def calls():
+    return Calls()
+
+
+@pytest.fixture()
+def task(calls):
+    return PeriodicTask(
+        name='count',
+        func=calls,
+        schedule=DailyAt(hour=3),
+        description='Count calls.',
+    )
+
+
+@patch('byceps.services.periodic_task.periodic_task_service.enqueue_at')
+def test_run_task(enqueue_at_mock, app, calls, task):
+    with patch.object(periodic_task_service, 'PERIODIC_TASKS', [task]):
+        periodic_task_service.run_task('count', SCHEDULED_FOR)
+
+        last_run = periodic_task_service.find_last_run(task)
+
+    assert calls.count == 1
+
+    assert last_run is not None
+    assert last_run.succeeded
+
+    # The next run has been scheduled.
+    enqueue_at_mock.assert_called_once()
+    assert enqueue_at_mock.call_args.kwargs['job_id'].startswith(
+        'periodic-task:count:'
+    )
+
+
+@patch('byceps.services.periodic_task.periodic_task_service.enqueue_at')
+def test_run_task_only_once_per_scheduled_run(
+    enqueue_at_mock, app, calls, task
+):
+    with patch.object(periodic_task_service, 'PERIODIC_TASKS', [task]):
+        periodic_task_service.run_task('count', SCHEDULED_FOR)
+        periodic_task_service.run_task('count', SCHEDULED_FOR)
+
+    assert calls.count == 1
+
+
+@patch('byceps.services.periodic_task.periodic_task_service.enqueue_at')
+def test_run_task_skipped_while_locked(enqueue_at_mock, app, calls, task):
+    app.redis_client.set('byceps:periodic_tasks:count:lock', 'other run')
+
+    with patch.object(periodic_task_service, 'PERIODIC_TASKS', [task]):
+        periodic_task_service.run_task('count', SCHEDULED_FOR)
+
+    assert calls.count == 0
+
+    # The next run is scheduled nonetheless.
+    enqueue_at_mock.assert_called_once()
+
+
+@patch('byceps.services.periodic_task.periodic_task_service.enqueue_at')
+def test_run_failing_task(enqueue_at_mock, app, task):
+    def fail() -> None:
+        raise Exception('Boom!')
+
+    failing_task = PeriodicTask(
+        name='count', func=fail, schedule=task.schedule, description=''
+    )
+
+    with patch.object(periodic_task_service, 'PERIODIC_TASKS', [failing_task]):
+        periodic_task_service.run_task('count', SCHEDULED_FOR)
+
+        last_run = periodic_task_service.find_last_run(failing_task)
+
+    assert last_run is not None
+    assert not last_run.succeeded
+    enqueue_at_mock.assert_called_once()
@@ -0,0 +1,38 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from byceps.services.periodic_task.models import DailyAt, Every
+
+
+@pytest.mark.parametrize(
+    ('after', 'expected'),
+    [
+        (datetime(2023, 9, 15, 2, 59, 59), datetime(2023, 9, 15, 3, 30, 0)),
+        (datetime(2023, 9, 15, 3, 30, 0), datetime(2023, 9, 16, 3, 30, 0)),
+        (datetime(2023, 12, 31, 18, 0, 0), datetime(2024, 1, 1, 3, 30, 0)),
+    ],
+)
+def test_daily_at_get_next_run(after, expected):
+    schedule = DailyAt(hour=3, minute=30)
+
+    assert schedule.get_next_run(after) == expected
+
+
+@pytest.mark.parametrize(
+    ('after', 'expected'),
+    [
+        (datetime(2023, 9, 15, 12, 0, 0), datetime(2023, 9, 15, 12, 15, 0)),
+        (datetime(2023, 9, 15, 12, 7, 12), datetime(2023, 9, 15, 12, 15, 0)),
+        (datetime(2023, 9, 15, 23, 59, 0), datetime(2023, 9, 16, 0, 0, 0)),
+    ],
+)
+def test_every_get_next_run(after, expected):
+    schedule = Every(timedelta(minutes=15))
+
+    assert schedule.get_next_run(after) == expected
@@ -0,0 +1,132 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from byceps.services.site.models import SiteID
+from byceps.services.site_navigation import site_navigation_service
+from byceps.services.site_navigation.models import (
+    NavItem,
+    NavItemID,
+    NavItemTargetType,
+    NavMenu,
+    NavMenuID,
+)
+
+from tests.helpers import generate_uuid
+
+
+SITE_ID = SiteID('acmecon-2014-website')
+
+
+MAIN_MENU = NavMenu(
+    id=NavMenuID(generate_uuid()),
+    site_id=SITE_ID,
+    name='main',
+    language_code='en',
+    hidden=False,
+    parent_menu_id=None,
+)
+
+
+def test_items_are_visible_only_and_ordered():
+    items = [
+        build_item(MAIN_MENU, 2, NavItemTargetType.page, 'imprint'),
+        build_item(MAIN_MENU, 1, NavItemTargetType.view, 'news'),
+        build_item(MAIN_MENU, 3, NavItemTargetType.page, 'faq', hidden=True),
+    ]
+
+    navigation = build([MAIN_MENU], items)
+
+    assert navigation.items_by_menu_id[MAIN_MENU.id] == [items[1], items[0]]
+    assert navigation.menu_ids_by_name == {('en', 'main'): MAIN_MENU.id}
+
+
+def test_hidden_menus_are_excluded():
+    hidden_menu = build_menu('footer', hidden=True)
+    item = build_item(hidden_menu, 1, NavItemTargetType.page, 'imprint')
+
+    navigation = build([MAIN_MENU, hidden_menu], [item])
+
+    assert hidden_menu.id not in navigation.items_by_menu_id
+    assert ('en', 'footer') not in navigation.menu_ids_by_name
+
+
+def test_menu_trees():
+    submenu = build_menu('party', parent_menu=MAIN_MENU)
+
+    navigation = build([MAIN_MENU, submenu], [])
+
+    assert len(navigation.menu_trees) == 1
+    assert navigation.menu_trees[0].menu == MAIN_MENU
+    assert navigation.menu_trees[0].submenus == [submenu]
+
+
+def test_submenu_for_page_and_view():
+    submenu_b = build_menu('b-party', parent_menu=MAIN_MENU)
+    submenu_a = build_menu('a-community', parent_menu=MAIN_MENU)
+    submenu_de = build_menu('party', parent_menu=MAIN_MENU, language_code='de')
+
+    items = [
+        build_item(MAIN_MENU, 1, NavItemTargetType.page, 'rules'),
+        build_item(submenu_b, 1, NavItemTargetType.page, 'rules'),
+        build_item(submenu_b, 2, NavItemTargetType.view, 'seating_plan'),
+        build_item(submenu_a, 1, NavItemTargetType.page, 'rules'),
+        build_item(submenu_a, 2, NavItemTargetType.page, 'faq', hidden=True),
+        build_item(submenu_de, 1, NavItemTargetType.page, 'rules'),
+    ]
+
+    navigation = build([MAIN_MENU, submenu_b, submenu_a, submenu_de], items)
+
+    # The submenu whose name comes first is preferred. Root menus and
+    # hidden items are ignored.
+    assert navigation.submenu_ids_by_page_name == {
+        ('en', 'rules'): submenu_a.id,
+        ('de', 'rules'): submenu_de.id,
+    }
+    assert navigation.submenu_ids_by_view_name == {
+        ('en', 'seating_plan'): submenu_b.id,
+    }
+
+
+def build(menus: list[NavMenu], items: list[NavItem]):
+    return site_navigation_service._build_site_navigation(menus, items)
+
+
+def build_menu(
+    name: str,
+    *,
+    language_code: str = 'en',
+    hidden: bool = False,
+    parent_menu: NavMenu | None = None,
+) -> NavMenu:
+    return NavMenu(
+        id=NavMenuID(generate_uuid()),
+        site_id=SITE_ID,
+        name=name,
+        language_code=language_code,
+        hidden=hidden,
+        parent_menu_id=parent_menu.id if (parent_menu is not None) else None,
+    )
+
+
+def build_item(
+    menu: NavMenu,
+    position: int,
+    target_type: NavItemTargetType,
+    target: str,
+    *,
+    hidden: bool = False,
+) -> NavItem:
+    return NavItem(
+        id=NavItemID(generate_uuid()),
+        menu_id=menu.id,
+        position=position,
+        target_type=target_type,
+        target=target,
+        label=target.title(),
+        current_page_id=target,
+        hidden=hidden,
+    )
@@ -0,0 +1,57 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.ticketing import barcode_service
+
+
+EXPECTED_SVG = '''\
+<svg xmlns="http://www.w3.org/2000/svg" width="171" height="100" viewBox="0 0 171 100">
+  <rect width="171" height="100" fill="white"/>
+  <rect x="0" width="6" height="100"/>
+  <rect x="9" width="3" height="100"/>
+  <rect x="18" width="3" height="100"/>
+  <rect x="33" width="3" height="100"/>
+  <rect x="39" width="3" height="100"/>
+  <rect x="51" width="6" height="100"/>
+  <rect x="66" width="3" height="100"/>
+  <rect x="78" width="3" height="100"/>
+  <rect x="84" width="6" height="100"/>
+  <rect x="99" width="12" height="100"/>
+  <rect x="114" width="3" height="100"/>
+  <rect x="120" width="9" height="100"/>
+  <rect x="132" width="6" height="100"/>
+  <rect x="147" width="9" height="100"/>
+  <rect x="159" width="3" height="100"/>
+  <rect x="165" width="6" height="100"/>
+</svg>'''
+
+
+def test_render_svg():
+    assert barcode_service.render_svg('AB') == EXPECTED_SVG
+
+
+def test_render_svg_with_thickness():
+    actual = barcode_service.render_svg('AB', thickness=1)
+
+    assert actual.startswith(
+        '<svg xmlns="http://www.w3.org/2000/svg" width="57" height="100"'
+    )
+    assert '<rect x="55" width="2" height="100"/>' in actual
+
+
+def test_render_svgs():
+    actual = barcode_service.render_svgs(['AB', 'XYZ'])
+
+    assert set(actual.keys()) == {'AB', 'XYZ'}
+    assert actual['AB'] == EXPECTED_SVG
+    assert actual['XYZ'] == barcode_service.render_svg('XYZ')
+
+
+def test_encode_svg_for_data_uri():
+    svg = '<svg fill="#fff">\n</svg>'
+
+    actual = barcode_service.encode_svg_for_data_uri(svg)
+
+    assert actual == "%3Csvg fill='%23fff'%3E%0A%3C/svg%3E"
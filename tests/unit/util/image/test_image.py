@@ -3,12 +3,17 @@
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from io import BytesIO
 from pathlib import Path
 
 import pytest
 
-from byceps.util.image import read_dimensions
-from byceps.util.image.models import Dimensions, ImageType
+from byceps.util.image import (
+    create_square_variants,
+    read_dimensions,
+    verify,
+)
+from byceps.util.image.models import Dimensions, ImageType, ImageVariant
 from byceps.util.image.typeguess import guess_type
 
 
@@ -53,6 +58,40 @@ def test_read_dimensions(filename_suffix, expected_width, expected_height):
     assert actual == expected
 
 
+def test_verify():
+    with open_image('image.png') as f:
+        verify(f)
+
+
+def test_verify_fails_with_broken_image():
+    with open_image('image.png') as f:
+        truncated_data = f.read()[:-20]
+
+    with pytest.raises(OSError):
+        verify(BytesIO(truncated_data))
+
+
+def test_create_square_variants(tmp_path):
+    variants = [
+        ImageVariant(Dimensions(8, 8), ImageType.png, tmp_path / 'large.png'),
+        ImageVariant(Dimensions(4, 4), ImageType.webp, tmp_path / 'small.webp'),
+    ]
+
+    with open_image('image.png') as f:
+        create_square_variants(f, variants)
+
+    for variant in variants:
+        with variant.path.open('rb') as f:
+            assert guess_type(f) == variant.image_type
+            assert read_dimensions(f) == variant.dimensions
+
+    # No temporary files should be left behind.
+    assert {path.name for path in tmp_path.iterdir()} == {
+        'large.png',
+        'small.webp',
+    }
+
+
 def open_image_with_suffix(suffix):
     filename = Path('image').with_suffix('.' + suffix)
     return open_image(filename)
@@ -0,0 +1,17 @@
+"""
+Stands in for a service module to test the attribution of statements.
+
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from sqlalchemy import text
+
+
+def get_items(engine) -> None:
+    _fetch(engine)
+
+
+def _fetch(engine) -> None:
+    with engine.connect() as conn:
+        conn.execute(text('SELECT 1'))
@@ -0,0 +1,112 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from io import BytesIO
+from time import time
+
+import pytest
+
+from byceps.util.blobstore import BlobStore, MINIMUM_AGE_FOR_SWEEP
+
+
+CONTENT = b'\x04\x08\x15\x16\x23\x42'
+
+
+@pytest.fixture()
+def blob_store(tmp_path):
+    return BlobStore(tmp_path / 'blobs')
+
+
+def test_identical_content_is_stored_once(blob_store):
+    blob1 = blob_store.add(BytesIO(CONTENT))
+    blob2 = blob_store.add(BytesIO(CONTENT))
+    blob3 = blob_store.add(BytesIO(b'something else'))
+
+    assert blob1 == blob2
+    assert blob1.size == len(CONTENT)
+    assert blob1.path.read_bytes() == CONTENT
+    assert blob3.digest != blob1.digest
+
+
+def test_publish(tmp_path, blob_store):
+    blob = blob_store.add(BytesIO(CONTENT))
+    target_path1 = tmp_path / 'one.bin'
+    target_path2 = tmp_path / 'two.bin'
+
+    blob_store.publish(blob, target_path1)
+    blob_store.publish(blob, target_path2)
+
+    assert target_path1.read_bytes() == CONTENT
+    assert blob.path.stat().st_nlink == 3
+
+    with pytest.raises(FileExistsError):
+        blob_store.publish(blob, target_path1)
+
+
+def test_sweep(tmp_path, blob_store):
+    published_blob = blob_store.add(BytesIO(CONTENT))
+    blob_store.publish(published_blob, tmp_path / 'published.bin')
+
+    unpublished_blob = blob_store.add(BytesIO(b'no longer needed'))
+
+    # Recently added blobs are kept.
+    report = blob_store.sweep()
+    assert report.num_deleted == 0
+
+    later = time() + MINIMUM_AGE_FOR_SWEEP.total_seconds() + 1
+    report = blob_store.sweep(now=later)
+
+    assert report.num_deleted == 1
+    assert report.bytes_reclaimed == unpublished_blob.size
+    assert published_blob.path.exists()
+    assert not unpublished_blob.path.exists()
+
+
+def test_publish_derived(tmp_path, blob_store):
+    created_names = []
+
+    def create(paths_by_name):
+        for name, path in paths_by_name.items():
+            created_names.append(name)
+            path.write_bytes(name.encode())
+
+    target_paths_by_name1 = {
+        'small': tmp_path / 'one_small.bin',
+        'large': tmp_path / 'one_large.bin',
+    }
+    blob_store.publish_derived(BytesIO(CONTENT), target_paths_by_name1, create)
+
+    target_paths_by_name2 = {
+        'small': tmp_path / 'two_small.bin',
+        'large': tmp_path / 'two_large.bin',
+    }
+    blob_store.publish_derived(BytesIO(CONTENT), target_paths_by_name2, create)
+
+    # Derived files are only created once for the same content.
+    assert sorted(created_names) == ['large', 'small']
+
+    for target_paths_by_name in target_paths_by_name1, target_paths_by_name2:
+        for name, path in target_paths_by_name.items():
+            assert path.read_bytes() == name.encode()
+            assert path.stat().st_nlink == 3
+
+
+def test_sweep_derived(tmp_path, blob_store):
+    def create(paths_by_name):
+        for path in paths_by_name.values():
+            path.write_bytes(b'derived')
+
+    target_path = tmp_path / 'derived.bin'
+    blob_store.publish_derived(BytesIO(CONTENT), {'name': target_path}, create)
+
+    later = time() + MINIMUM_AGE_FOR_SWEEP.total_seconds() + 1
+
+    report = blob_store.sweep(now=later)
+    assert report.num_deleted == 0
+
+    target_path.unlink()
+
+    report = blob_store.sweep(now=later)
+    assert report.num_deleted == 1
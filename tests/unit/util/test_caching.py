@@ -0,0 +1,240 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+
+from flask import Flask
+from freezegun import freeze_time
+import pytest
+
+from byceps.util.caching import (
+    Cache,
+    get_expiring_revision,
+    increment_expiring_revision,
+)
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, int] = {}
+        self.sorted_sets: dict[str, dict[str, float]] = {}
+        self.ttls: dict[str, int] = {}
+        self.num_gets = 0
+
+    def get(self, key: str) -> bytes | None:
+        self.num_gets += 1
+        value = self.values.get(key)
+        return str(value).encode() if (value is not None) else None
+
+    def set(self, key: str, value: int, nx: bool, ex: int) -> None:
+        if nx and (key in self.values):
+            return
+        self.values[key] = value
+        self.ttls[key] = ex
+
+    def expire(self, key: str, ttl: int) -> None:
+        self.ttls[key] = ttl
+
+    def expire_now(self, key: str) -> None:
+        del self.values[key]
+        del self.ttls[key]
+
+    def incr(self, key: str) -> int:
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+    def zadd(self, key: str, mapping: dict[str, float]) -> None:
+        self.sorted_sets.setdefault(key, {}).update(mapping)
+
+    def zrangebyscore(self, key: str, min: float, max: float) -> list[bytes]:
+        members = self.sorted_sets.get(key, {})
+        return [
+            member.encode()
+            for member, score in sorted(members.items(), key=lambda x: x[1])
+            if min <= score <= max
+        ]
+
+    def zremrangebyscore(self, key: str, min: str, max: float) -> None:
+        members = self.sorted_sets.get(key, {})
+        for member, score in list(members.items()):
+            if score <= max:
+                del members[member]
+
+
+@pytest.fixture()
+def app_without_context():
+    app = Flask(__name__)
+    app.redis_client = FakeRedis()
+    return app
+
+
+@pytest.fixture()
+def app(app_without_context):
+    with app_without_context.app_context():
+        yield app_without_context
+
+
+@pytest.fixture()
+def load():
+    return Loader()
+
+
+class Loader:
+    def __init__(self) -> None:
+        self.values = {'one': 1, 'two': 2}
+        self.loaded_keys: list[str] = []
+
+    def __call__(self, key: str) -> int:
+        self.loaded_keys.append(key)
+        return self.values[key]
+
+    def load_many(self, keys: set[str]) -> dict[str, int]:
+        self.loaded_keys.extend(keys)
+        return {key: self.values[key] for key in keys if key in self.values}
+
+
+def test_get_or_load(app, load):
+    cache: Cache[str, int] = Cache('numbers')
+
+    assert cache.get('one') is None
+
+    assert cache.get_or_load('one', load) == 1
+    assert cache.get_or_load('one', load) == 1
+
+    assert cache.get('one') == 1
+    assert load.loaded_keys == ['one']
+
+
+def test_get_many_or_load(app, load):
+    cache: Cache[str, int] = Cache('numbers')
+    cache.get_or_load('one', load)
+
+    actual = cache.get_many_or_load(['one', 'two', 'three'], load.load_many)
+
+    assert actual == {'one': 1, 'two': 2}
+    assert sorted(load.loaded_keys) == ['one', 'three', 'two']
+    assert cache.get_many(['one', 'two', 'three']) == {'one': 1, 'two': 2}
+
+
+def test_discard(app, load):
+    cache: Cache[str, int] = Cache('numbers')
+    cache.get_many_or_load(['one', 'two'], load.load_many)
+
+    cache.discard('one')
+
+    assert cache.get_many(['one', 'two']) == {'two': 2}
+
+
+def test_ttl(app, load):
+    cache: Cache[str, int] = Cache('numbers', ttl=60)
+
+    with freeze_time(datetime(2023, 5, 1, 12, 0, 0)):
+        cache.get_or_load('one', load)
+
+    with freeze_time(datetime(2023, 5, 1, 12, 0, 59)):
+        assert cache.get('one') == 1
+
+    with freeze_time(datetime(2023, 5, 1, 12, 1, 0)):
+        assert cache.get('one') is None
+
+
+def test_invalidate_by_other_process(app, load):
+    cache_in_this_process: Cache[str, int] = Cache('numbers')
+    cache_in_other_process: Cache[str, int] = Cache('numbers')
+
+    cache_in_this_process.get_or_load('one', load)
+    cache_in_other_process.get_or_load('one', load)
+
+    cache_in_other_process.invalidate()
+
+    assert cache_in_other_process.get('one') is None
+    assert cache_in_this_process.get('one') is None
+
+    # Entries added after the invalidation are kept.
+    cache_in_this_process.get_or_load('one', load)
+    assert cache_in_this_process.get('one') == 1
+
+
+def test_invalidate_keys_by_other_process(app, load):
+    cache_in_this_process: Cache[str, int] = Cache('numbers')
+    cache_in_other_process: Cache[str, int] = Cache('numbers')
+
+    cache_in_this_process.get_many_or_load(['one', 'two'], load.load_many)
+    cache_in_other_process.get_many_or_load(['one', 'two'], load.load_many)
+
+    cache_in_other_process.invalidate_keys(['one'])
+
+    assert cache_in_other_process.get_many(['one', 'two']) == {'two': 2}
+    assert cache_in_this_process.get_many(['one', 'two']) == {'two': 2}
+
+
+def test_invalidate_keys_and_all_by_other_process(app, load):
+    cache_in_this_process: Cache[str, int] = Cache('numbers')
+    cache_in_other_process: Cache[str, int] = Cache('numbers')
+
+    cache_in_this_process.get_many_or_load(['one', 'two'], load.load_many)
+
+    cache_in_other_process.invalidate_keys(['one'])
+    cache_in_other_process.invalidate()
+
+    assert cache_in_this_process.get_many(['one', 'two']) == {}
+
+
+def test_value_loaded_during_invalidation_is_not_cached(app):
+    cache_in_this_process: Cache[str, int] = Cache('numbers')
+    cache_in_other_process: Cache[str, int] = Cache('numbers')
+
+    def load_while_other_process_invalidates(key: str) -> int:
+        cache_in_other_process.invalidate()
+        return 1
+
+    value = cache_in_this_process.get_or_load(
+        'one', load_while_other_process_invalidates
+    )
+
+    assert value == 1
+    assert cache_in_this_process.get('one') is None
+
+
+def test_revision_is_fetched_once_per_request(app_without_context, load):
+    app = app_without_context
+    cache: Cache[str, int] = Cache('numbers')
+
+    with app.test_request_context():
+        cache.get('one')
+        cache.get_or_load('one', load)
+        cache.get('one')
+
+    # Once to sync, once to check before caching the loaded value.
+    assert app.redis_client.num_gets == 2
+
+    with app.test_request_context():
+        cache.get('one')
+        cache.get('two')
+
+    assert app.redis_client.num_gets == 3
+
+
+def test_expiring_revision_has_ttl(app):
+    key = 'byceps:cache:profile:revision'
+
+    revision = get_expiring_revision('profile', 60)
+
+    assert get_expiring_revision('profile', 60) == revision
+    assert app.redis_client.ttls[key] == 60
+
+    app.redis_client.ttls[key] = 5
+    assert increment_expiring_revision('profile', 60) == revision + 1
+    assert app.redis_client.ttls[key] == 60
+
+
+def test_expiring_revision_is_not_reused_after_expiry(app):
+    key = 'byceps:cache:profile:revision'
+
+    revision_before = increment_expiring_revision('profile', 60)
+    app.redis_client.expire_now(key)
+    revision_after = get_expiring_revision('profile', 60)
+
+    assert revision_after > revision_before
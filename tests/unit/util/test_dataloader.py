@@ -0,0 +1,101 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from dataclasses import dataclass
+from operator import attrgetter
+
+from flask import Flask
+import pytest
+
+from byceps.util.dataloader import DataLoader
+
+
+@dataclass(frozen=True)
+class Item:
+    id: int
+    title: str
+
+
+ITEMS = {
+    1: Item(1, 'one'),
+    2: Item(2, 'two'),
+    3: Item(3, 'three'),
+}
+
+
+class ItemRepository:
+    def __init__(self) -> None:
+        self.requested_ids: list[set[int]] = []
+
+    def get_items(self, item_ids: set[int]) -> list[Item]:
+        self.requested_ids.append(set(item_ids))
+        return [ITEMS[item_id] for item_id in item_ids if item_id in ITEMS]
+
+
+@pytest.fixture()
+def app():
+    return Flask(__name__)
+
+
+@pytest.fixture()
+def repository():
+    return ItemRepository()
+
+
+@pytest.fixture()
+def loader(repository):
+    return DataLoader('items', repository.get_items, attrgetter('id'))
+
+
+def test_get_many_fetches_only_missing_items(app, repository, loader):
+    with app.test_request_context():
+        assert loader.get_many({1, 2}) == {1: ITEMS[1], 2: ITEMS[2]}
+        assert loader.get_many({2, 3}) == {2: ITEMS[2], 3: ITEMS[3]}
+        assert loader.get(1) == ITEMS[1]
+
+    assert repository.requested_ids == [{1, 2}, {3}]
+
+
+def test_absent_items_are_not_remembered(app, repository, loader):
+    with app.test_request_context():
+        assert loader.get(4) is None
+        assert loader.get_many({1, 4}) == {1: ITEMS[1]}
+
+    assert repository.requested_ids == [{4}, {1, 4}]
+
+
+def test_items_are_not_shared_across_requests(app, repository, loader):
+    with app.test_request_context():
+        loader.get(1)
+
+    with app.test_request_context():
+        loader.get(1)
+
+    assert repository.requested_ids == [{1}, {1}]
+
+
+def test_nothing_is_remembered_outside_of_request(repository, loader):
+    loader.get(1)
+    loader.get(1)
+
+    assert repository.requested_ids == [{1}, {1}]
+
+
+def test_prime(app, repository, loader):
+    with app.test_request_context():
+        loader.prime([ITEMS[1]])
+
+        assert loader.get(1) == ITEMS[1]
+
+    assert repository.requested_ids == []
+
+
+def test_clear(app, repository, loader):
+    with app.test_request_context():
+        loader.get(1)
+        loader.clear()
+        loader.get(1)
+
+    assert repository.requested_ids == [{1}, {1}]
@@ -0,0 +1,67 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from unittest.mock import patch
+
+from babel import Locale
+from flask import Flask, g
+from flask_babel import Babel
+import pytest
+
+from byceps.util.l10n import get_current_user_locale, get_locales, load_locales
+
+
+def test_locales_are_listed_once(app):
+    with patch.object(app.babel_instance, 'list_translations') as list_mock:
+        with app.test_request_context():
+            get_locales()
+            get_locales()
+
+    list_mock.assert_not_called()
+
+
+def test_reload_locales(app):
+    with app.test_request_context():
+        assert get_locales() == [Locale('en'), Locale('de')]
+
+    with patch.object(
+        app.babel_instance,
+        'list_translations',
+        return_value=[Locale('de'), Locale('fr')],
+    ):
+        load_locales(app)
+
+    with app.test_request_context():
+        assert get_locales() == [Locale('en'), Locale('de'), Locale('fr')]
+
+
+@pytest.mark.parametrize(
+    ('accept_language', 'expected'),
+    [
+        ('de-DE,de;q=0.9,en;q=0.8', 'de'),
+        ('fr-FR,en;q=0.5', 'en'),
+        ('fr-FR', None),
+    ],
+)
+def test_current_user_locale_from_accept_language(
+    app, accept_language, expected
+):
+    with app.test_request_context(headers={'Accept-Language': accept_language}):
+        g.user = None
+
+        assert get_current_user_locale() == expected
+
+
+@pytest.fixture()
+def app():
+    app = Flask('byceps')
+    app.babel_instance = Babel(app)
+
+    with patch.object(
+        app.babel_instance, 'list_translations', return_value=[Locale('de')]
+    ):
+        load_locales(app)
+
+    return app
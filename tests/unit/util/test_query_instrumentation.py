@@ -0,0 +1,85 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from unittest.mock import patch
+
+from flask import Flask
+import pytest
+from sqlalchemy import create_engine, text
+
+from byceps.util import query_instrumentation
+from byceps.util.query_instrumentation import QueryBudgetExceeded
+
+
+def test_request_within_budget(client):
+    response = client.get('/items/3')
+
+    assert response.status_code == 200
+
+
+def test_request_exceeding_budget(client):
+    with pytest.raises(QueryBudgetExceeded):
+        client.get('/items/4')
+
+
+@patch('byceps.util.query_instrumentation.log')
+def test_slow_request_is_logged(log_mock, app, client):
+    app.config['SLOW_REQUEST_THRESHOLD'] = 0
+
+    client.get('/items/2')
+
+    assert log_mock.warning.call_count == 1
+    args, kwargs = log_mock.warning.call_args
+    assert args == ('Slow request',)
+    assert kwargs['endpoint'] == 'items'
+    assert kwargs['query_count'] == 2
+    assert kwargs['top_statements'][0]['statement'] == 'SELECT 1'
+    assert kwargs['top_statements'][0]['count'] == 2
+
+
+def test_collected_queries_are_signaled(app, client):
+    observations = []
+
+    def observe(sender, *, endpoint, stats):
+        observations.append((endpoint, stats.query_count))
+
+    with query_instrumentation.request_queries_collected.connected_to(
+        observe, app
+    ):
+        client.get('/items/2')
+
+    assert observations == [('items', 2)]
+
+
+@pytest.fixture()
+def app():
+    app = Flask(__name__)
+    app.config.update(
+        {
+            'TESTING': True,
+            'QUERY_METRICS_ENABLED': False,
+            'QUERY_BUDGET': 3,
+            'SLOW_REQUEST_THRESHOLD': None,
+            'SLOW_REQUEST_LOGGED_STATEMENTS': 5,
+        }
+    )
+
+    engine = create_engine('sqlite://')
+
+    @app.get('/items/<int:query_count>', endpoint='items')
+    def items(query_count):
+        with engine.connect() as conn:
+            for _ in range(query_count):
+                conn.execute(text('SELECT 1'))
+        return 'ok'
+
+    query_instrumentation.init_app(app)
+
+    return app
+
+
+@pytest.fixture()
+def client(app):
+    return app.test_client()
@@ -0,0 +1,83 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from sqlalchemy import create_engine, text
+import pytest
+
+from byceps.util import query_stats
+from byceps.util.query_stats import collect_query_stats, UNKNOWN_FUNCTION
+
+from . import query_stats_example_service as example_service
+
+
+def test_statements_are_counted(engine):
+    with collect_query_stats() as stats:
+        execute(engine, 'SELECT 1')
+        execute(engine, 'SELECT 1')
+        execute(engine, 'SELECT 2')
+
+    assert stats.query_count == 3
+    assert stats.duration > 0
+    assert stats.totals_by_statement['SELECT 1'].count == 2
+    assert stats.totals_by_statement['SELECT 2'].count == 1
+
+
+def test_statements_outside_of_block_are_not_counted(engine):
+    with collect_query_stats() as stats:
+        execute(engine, 'SELECT 1')
+
+    execute(engine, 'SELECT 1')
+
+    assert stats.query_count == 1
+
+
+def test_nested_blocks(engine):
+    with collect_query_stats() as outer_stats:
+        execute(engine, 'SELECT 1')
+
+        with collect_query_stats() as inner_stats:
+            execute(engine, 'SELECT 2')
+
+    assert outer_stats.query_count == 2
+    assert inner_stats.query_count == 1
+
+
+def test_statements_are_attributed_to_service_function(engine, monkeypatch):
+    monkeypatch.setattr(
+        query_stats, 'SERVICE_MODULE_PREFIX', example_service.__name__
+    )
+
+    with collect_query_stats() as stats:
+        example_service.get_items(engine)
+        execute(engine, 'SELECT 2')
+
+    assert set(stats.totals_by_function) == {
+        f'{example_service.__name__}.get_items',
+        UNKNOWN_FUNCTION,
+    }
+
+
+def test_get_slowest_statements(engine):
+    with collect_query_stats() as stats:
+        execute(engine, 'SELECT 1')
+        execute(engine, 'SELECT 2')
+        execute(engine, 'SELECT 3')
+
+    stats.totals_by_statement['SELECT 2'].duration = 10.0
+
+    slowest_statements = stats.get_slowest_statements(2)
+
+    assert len(slowest_statements) == 2
+    assert slowest_statements[0][0] == 'SELECT 2'
+
+
+@pytest.fixture()
+def engine():
+    return create_engine('sqlite://')
+
+
+def execute(engine, statement: str) -> None:
+    with engine.connect() as conn:
+        conn.execute(text(statement))
@@ -0,0 +1,99 @@
+"""
+:Copyright: 2014-2023 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import os
+from pathlib import Path
+
+from flask import Blueprint, Flask, g, render_template
+from jinja2 import TemplateNotFound
+import pytest
+
+from byceps.util import templating
+from byceps.util.templating import TemplateIndexLoader
+
+
+def test_template_from_blueprint(app):
+    with app.app_context():
+        assert render_template('first/index.html') == 'first index'
+
+
+def test_earlier_blueprint_takes_precedence(app):
+    with app.app_context():
+        assert render_template('shared.html') == 'shared from first'
+
+
+def test_unknown_template(app):
+    with app.app_context(), pytest.raises(TemplateNotFound):
+        render_template('unknown.html')
+
+
+def test_site_override_takes_precedence(app):
+    with app.app_context():
+        g.site_id = 'acmecon'
+
+        assert render_template('shared.html') == 'shared from site'
+        assert render_template('first/index.html') == 'first index'
+
+
+def test_list_templates_includes_site_overrides(app):
+    with app.app_context():
+        assert app.jinja_env.list_templates() == [
+            'first/index.html',
+            'second/index.html',
+            'shared.html',
+        ]
+
+        g.site_id = 'acmecon'
+
+        assert 'site_only.html' in app.jinja_env.list_templates()
+
+
+def test_uptodate(app, tmp_path):
+    with app.app_context():
+        _, _, uptodate = app.jinja_env.loader.get_source(
+            app.jinja_env, 'first/index.html'
+        )
+        assert uptodate()
+
+        path = tmp_path / 'first/templates/first/index.html'
+        mtime = path.stat().st_mtime + 10
+        os.utime(path, (mtime, mtime))
+
+        assert not uptodate()
+
+
+@pytest.fixture()
+def app(tmp_path, monkeypatch):
+    write(tmp_path / 'first/templates/first/index.html', 'first index')
+    write(tmp_path / 'first/templates/shared.html', 'shared from first')
+    write(tmp_path / 'second/templates/second/index.html', 'second index')
+    write(tmp_path / 'second/templates/shared.html', 'shared from second')
+
+    sites_path = tmp_path / 'sites'
+    write(
+        sites_path / 'acmecon/template_overrides/shared.html',
+        'shared from site',
+    )
+    write(sites_path / 'acmecon/template_overrides/site_only.html', 'site only')
+    monkeypatch.setattr(templating, 'SITES_PATH', sites_path)
+
+    app = Flask('byceps', root_path=str(tmp_path))
+    app.jinja_options['loader'] = TemplateIndexLoader(app, site_overrides=True)
+
+    for name in 'first', 'second':
+        blueprint = Blueprint(
+            name,
+            __name__,
+            root_path=str(tmp_path / name),
+            template_folder='templates',
+        )
+        app.register_blueprint(blueprint)
+
+    return app
+
+
+def write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
@@ -1,25 +1,111 @@
 #!/usr/bin/env python
-"""Run a worker for the job queue.
+"""Run workers for the job queues.
+
+By default, a single worker process handles all queues, in order of
+priority. To keep jobs of some queues from waiting behind those of
+others, run separate pools of worker processes for chosen queues, e.g.:
+
+    ./worker.py --queues critical,mail --processes 2
+    ./worker.py --queues announce,default,bulk
 
 :Copyright: 2014-2023 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
+
+from multiprocessing import Process
+import os
+import signal
+
+import click
+from flask import Flask
 from rq import Worker
 
 from byceps.application import create_worker_app
-from byceps.util.jobqueue import connection, get_queue
+from byceps.services.periodic_task import periodic_task_service
+from byceps.util.jobqueue import connection, get_queue, QUEUE_NAMES
 from byceps.util.sentry import configure_sentry_from_env
 
 
-if __name__ == '__main__':
+def _parse_queue_names(ctx, param, value: str) -> list[str]:
+    names = [name.strip() for name in value.split(',') if name.strip()]
+
+    unknown_names = [name for name in names if name not in QUEUE_NAMES]
+    if unknown_names:
+        raise click.BadParameter(
+            f'Unknown queue(s): {", ".join(unknown_names)} '
+            f'(available: {", ".join(QUEUE_NAMES)})'
+        )
+
+    return names
+
+
+@click.command()
+@click.option(
+    '--queues',
+    'queue_names',
+    default=','.join(QUEUE_NAMES),
+    show_default=True,
+    callback=_parse_queue_names,
+    help='Comma-separated names of the queues to process, in order of priority',
+)
+@click.option(
+    '--processes',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='Number of worker processes',
+)
+def main(queue_names: list[str], processes: int) -> None:
     configure_sentry_from_env()
 
     app = create_worker_app()
 
     with app.app_context():
-        with connection():
-            queues = [get_queue(app)]
+        periodic_task_service.schedule_tasks()
+
+    if processes == 1:
+        _work(app, queue_names)
+    else:
+        _run_processes(queue_names, processes)
+
+
+def _run_processes(queue_names: list[str], processes: int) -> None:
+    children = [
+        Process(target=_create_app_and_work, args=(queue_names,))
+        for _ in range(processes)
+    ]
 
-            worker = Worker(queues)
-            worker.work(with_scheduler=True)
+    for child in children:
+        child.start()
+
+    def forward_signal(signum, frame) -> None:
+        for child in children:
+            if child.is_alive() and (child.pid is not None):
+                os.kill(child.pid, signum)
+
+    signal.signal(signal.SIGTERM, forward_signal)
+    # On Ctrl-C, the children receive the interrupt themselves and
+    # shut down once their current job is done.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    for child in children:
+        child.join()
+
+
+def _create_app_and_work(queue_names: list[str]) -> None:
+    app = create_worker_app()
+    _work(app, queue_names)
+
+
+def _work(app: Flask, queue_names: list[str]) -> None:
+    with app.app_context(), connection():
+        queues = [get_queue(app, name) for name in queue_names]
+
+        worker = Worker(queues)
+        worker.work(with_scheduler=True)
+
+
+if __name__ == '__main__':
+    main()